@@ -3,8 +3,15 @@ import random
 import sys
 import math
 import os
+import numpy as np
 from pygame import mixer
 
+# The leaderboard store, timer wheel and pipe sprite cache are shared across the collection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from score_store import ScoreStore
+from timer_wheel import TimerWheel
+from pipe_sprites import PipeSpriteCache
+
 # Initialize Pygame
 pygame.init()
 mixer.init()
@@ -22,6 +29,11 @@ PIPE_SPEED = 4
 PIPE_GAP = 220
 PIPE_WIDTH = 80
 BIRD_SIZE = 35
+FPS = 60
+LEADERBOARD = "flappy_adventure"  # This game's name in the shared score store
+
+# Game-time timers
+COLLISION_COOLDOWN = 30  # Frames after a hit before the bird can be hit again
 
 # Colors
 WHITE = (255, 255, 255)
@@ -409,225 +421,317 @@ class Bird:
     def get_rect(self):
         return self.rect
 
-class Background:
-    def __init__(self):
-        self.current_theme = "city"
-        self.themes = ["city", "forest", "mountains", "desert", "space", "ocean", "sunset", "winter", "volcano", "neon_city", "candy_land", "underwater", "cyberpunk", "fantasy", "steampunk", "apocalypse"]
-        self.theme_index = 0
-        self.clouds = []
-        self.buildings = []
-        self.trees = []
-        self.mountains = []
-        self.stars = []
-        self.bubbles = []
-        self.snowflakes = []
-        self.lava_particles = []
-        self.neon_lights = []
-        self.candy_elements = []
-        self.seaweed = []
-        self.cyber_effects = []
-        self.magical_particles = []
-        self.steam_clouds = []
-        self.dust_particles = []
-        self.score_threshold = 8  # Reduced to cycle through themes faster
-
-        # Initialize clouds
-        for _ in range(5):
-            self.clouds.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(50, 200),
-                'size': random.randint(30, 80)
-            })
-
-        # Initialize buildings for city
-        self.generate_buildings()
-
-        # Initialize trees for forest
-        self.generate_trees()
+# Background layers drawn by each theme; only these are updated while the theme is active
+THEME_LAYERS = {
+    "city": ("buildings", "clouds"),
+    "forest": ("trees", "clouds"),
+    "mountains": ("mountains", "clouds"),
+    "desert": (),
+    "space": ("stars",),
+    "ocean": ("bubbles",),
+    "sunset": ("mountains", "clouds"),
+    "winter": ("snowflakes", "mountains", "clouds"),
+    "volcano": ("lava_particles", "mountains", "clouds"),
+    "neon_city": ("neon_lights", "buildings", "clouds"),
+    "candy_land": ("candy_elements", "mountains", "clouds"),
+    "underwater": ("seaweed", "bubbles"),
+    "cyberpunk": ("cyber_effects", "buildings"),
+    "fantasy": ("magical_particles", "mountains"),
+    "steampunk": ("steam_clouds", "buildings"),
+    "apocalypse": ("dust_particles", "buildings"),
+}
+
+BUILDING_COLORS = [DARK_GRAY, GRAY, LIGHT_GRAY]
+CANDY_TYPES = ['heart', 'star', 'diamond', 'candy_cane']
+CANDY_COLORS = [RED, YELLOW, PURPLE, GOLD]
+CYBER_TYPES = ['glitch', 'data_stream', 'hologram']
+MAGICAL_COLORS = [(255, 0, 255), (0, 255, 255), (255, 255, 0), (255, 0, 128)]
+
+# Width of baked scenery strips; a multiple of the building, tree and mountain spacing
+SCENERY_STRIP_WIDTH = 1200
+
+class BackgroundLayer:
+    """One kind of background element stored as parallel NumPy arrays.
+
+    Each column holds one attribute for every element of the layer, so the
+    whole layer scrolls, drifts, animates and wraps in a few array operations.
+    """
+
+    def __init__(self, rng, columns, scroll_divisor=0, wrap_axis='x', margin=0,
+                 respawn=None, phase_step=0, phase_period=None):
+        self.rng = rng
+        self.columns = columns
+        self.scroll_divisor = scroll_divisor  # x moves by pipe_speed // scroll_divisor
+        self.wrap_axis = wrap_axis  # 'x', 'y' or None for layers that never wrap
+        self.margin = margin  # number, or name of a column (e.g. 'size')
+        self.respawn = respawn or {}  # column -> (low, high) re-rolled on wrap
+        self.phase_step = phase_step
+        self.phase_period = phase_period
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def rows(self, *names):
+        """Iterate the given columns element by element as plain Python values"""
+        return zip(*(self.columns[name].tolist() for name in names))
 
-        # Initialize mountains
-        self.generate_mountains()
+    def update(self, pipe_speed):
+        columns = self.columns
+        if self.scroll_divisor:
+            columns['x'] -= pipe_speed // self.scroll_divisor
+        if 'vx' in columns:
+            columns['x'] += columns['vx']
+        if 'vy' in columns:
+            columns['y'] += columns['vy']
+
+        if self.phase_step:
+            columns['phase'] += self.phase_step
+            if self.phase_period:
+                np.mod(columns['phase'], self.phase_period, out=columns['phase'])
+
+        if self.wrap_axis is None:
+            return
+
+        # Elements that left the screen come back on the opposite side
+        position = columns[self.wrap_axis]
+        margin = columns[self.margin] if isinstance(self.margin, str) else self.margin
+        margin = np.broadcast_to(margin, position.shape)
+        wrapped = position < -margin
+        count = np.count_nonzero(wrapped)
+        if count:
+            extent = SCREEN_WIDTH if self.wrap_axis == 'x' else SCREEN_HEIGHT
+            position[wrapped] = extent + margin[wrapped]
+            for name, (low, high) in self.respawn.items():
+                columns[name][wrapped] = self.rng.integers(low, high, count, endpoint=True)
+
+class SceneryStrip:
+    """Scenery elements (buildings, trees, mountains) laid out on a tileable strip.
+
+    Each theme bakes the strip into a Surface once; scrolling only moves the
+    offset at which that Surface is blitted, so the cost of a frame does not
+    depend on how detailed the scenery is.
+    """
+
+    def __init__(self, rng, spacing, height_range, scroll_divisor, width=SCENERY_STRIP_WIDTH):
+        low, high = height_range
+        self.width = width
+        self.scroll_divisor = scroll_divisor
+        self.offset = 0
+        self.x = np.arange(0, width, spacing)
+        self.height = rng.integers(low, high, len(self.x), endpoint=True)
+        self.seed = rng.integers(0, 2**31, len(self.x))  # Per-element windows, colors and damage
+
+    def elements(self):
+        return zip(self.x.tolist(), self.height.tolist(), self.seed.tolist())
 
-        # Initialize stars for space
-        self.generate_stars()
+    def update(self, pipe_speed):
+        self.offset = (self.offset + pipe_speed // self.scroll_divisor) % self.width
 
-        # Initialize bubbles for ocean
-        self.generate_bubbles()
+    def blit(self, screen, surface):
+        screen.blit(surface, (-self.offset, 0))
+        screen.blit(surface, (self.width - self.offset, 0))
 
-        # Initialize snowflakes for winter
-        self.generate_snowflakes()
+class ThemeRenderer:
+    """Draws one theme from its baked backdrop, baked scenery and dynamic layers"""
 
-        # Initialize lava particles for volcano
-        self.generate_lava_particles()
+    def __init__(self, backdrop, scenery=None, scenery_surface=None, behind=(), in_front=()):
+        self.backdrop = backdrop.convert()  # Sky, ground and fixed props
+        self.scenery = scenery
+        self.scenery_surface = scenery_surface
+        self.behind = behind  # Dynamic layers drawn behind the scenery
+        self.in_front = in_front
 
-        # Initialize neon lights for neon city
-        self.generate_neon_lights()
+    def draw(self, screen):
+        screen.blit(self.backdrop, (0, 0))
+        for draw_layer in self.behind:
+            draw_layer(screen)
+        if self.scenery:
+            self.scenery.blit(screen, self.scenery_surface)
+        for draw_layer in self.in_front:
+            draw_layer(screen)
 
-        # Initialize candy elements for candy land
-        self.generate_candy_elements()
+class Background:
+    def __init__(self):
+        self.current_theme = "city"
+        self.themes = ["city", "forest", "mountains", "desert", "space", "ocean", "sunset", "winter", "volcano", "neon_city", "candy_land", "underwater", "cyberpunk", "fantasy", "steampunk", "apocalypse"]
+        self.theme_index = 0
+        self.score_threshold = 8  # Reduced to cycle through themes faster
+        self.rng = np.random.default_rng()
+
+        self.layers = {
+            'clouds': self.generate_clouds(),
+            'buildings': self.generate_buildings(),          # city
+            'trees': self.generate_trees(),                  # forest
+            'mountains': self.generate_mountains(),
+            'stars': self.generate_stars(),                  # space
+            'bubbles': self.generate_bubbles(),              # ocean
+            'snowflakes': self.generate_snowflakes(),        # winter
+            'lava_particles': self.generate_lava_particles(),  # volcano
+            'neon_lights': self.generate_neon_lights(),      # neon city
+            'candy_elements': self.generate_candy_elements(),  # candy land
+            'seaweed': self.generate_seaweed(),              # underwater
+            'cyber_effects': self.generate_cyber_effects(),  # cyberpunk
+            'magical_particles': self.generate_magical_particles(),  # fantasy
+            'steam_clouds': self.generate_steam_clouds(),    # steampunk
+            'dust_particles': self.generate_dust_particles(),  # apocalypse
+        }
 
-        # Initialize seaweed for underwater
-        self.generate_seaweed()
+        # Theme renderer registry; each builder bakes its theme the first time it is drawn
+        self.theme_builders = {
+            "city": self.build_city,
+            "forest": self.build_forest,
+            "mountains": self.build_mountains,
+            "desert": self.build_desert,
+            "space": self.build_space,
+            "ocean": self.build_ocean,
+            "sunset": self.build_sunset,
+            "winter": self.build_winter,
+            "volcano": self.build_volcano,
+            "neon_city": self.build_neon_city,
+            "candy_land": self.build_candy_land,
+            "underwater": self.build_underwater,
+            "cyberpunk": self.build_cyberpunk,
+            "fantasy": self.build_fantasy,
+            "steampunk": self.build_steampunk,
+            "apocalypse": self.build_apocalypse,
+        }
+        self.renderers = {}
+        self.particle_sprites = {}  # (size, color) -> circle sprite, blitted with a per-element alpha
 
-        # Initialize cyber effects for cyberpunk
-        self.generate_cyber_effects()
+    def reset(self):
+        """Back to the first theme for a new run; layers and baked themes are kept"""
+        self.current_theme = self.themes[0]
+        self.theme_index = 0
 
-        # Initialize magical particles for fantasy
-        self.generate_magical_particles()
+    def randint(self, low, high, count):
+        """Vectorized random.randint: integers in [low, high] as floats"""
+        return self.rng.integers(low, high, count, endpoint=True).astype(float)
 
-        # Initialize steam clouds for steampunk
-        self.generate_steam_clouds()
+    def uniform(self, low, high, count):
+        return self.rng.uniform(low, high, count)
 
-        # Initialize dust particles for apocalypse
-        self.generate_dust_particles()
+    def generate_clouds(self):
+        count = 5
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(50, 200, count),
+            'size': self.rng.integers(30, 80, count, endpoint=True)
+        }, scroll_divisor=2, margin=100, respawn={'y': (50, 200)})
 
     def generate_buildings(self):
-        self.buildings = []
-        for i in range(0, SCREEN_WIDTH + 100, 80):
-            height = random.randint(100, 300)
-            self.buildings.append({
-                'x': i,
-                'height': height,
-                'color': random.choice([DARK_GRAY, GRAY, LIGHT_GRAY])
-            })
+        return SceneryStrip(self.rng, spacing=80, height_range=(100, 300), scroll_divisor=3)
 
     def generate_trees(self):
-        self.trees = []
-        for i in range(0, SCREEN_WIDTH + 100, 60):
-            height = random.randint(80, 150)
-            self.trees.append({
-                'x': i,
-                'height': height,
-                'trunk_color': BROWN,
-                'leaves_color': DARK_GREEN
-            })
+        return SceneryStrip(self.rng, spacing=60, height_range=(80, 150), scroll_divisor=3)
 
     def generate_mountains(self):
-        self.mountains = []
-        for i in range(0, SCREEN_WIDTH + 200, 150):
-            height = random.randint(150, 250)
-            self.mountains.append({
-                'x': i,
-                'height': height,
-                'color': DARK_GRAY
-            })
+        return SceneryStrip(self.rng, spacing=150, height_range=(150, 250), scroll_divisor=4)
 
     def generate_stars(self):
-        self.stars = []
-        for _ in range(100):
-            self.stars.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'size': random.randint(1, 3),
-                'twinkle': random.randint(0, 100)
-            })
+        count = 100
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'size': self.rng.integers(1, 3, count, endpoint=True),
+            'phase': self.randint(0, 100, count)  # twinkle
+        }, wrap_axis=None, phase_step=1, phase_period=200)
 
     def generate_bubbles(self):
-        self.bubbles = []
-        for _ in range(10):
-            self.bubbles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(SCREEN_HEIGHT - 100, SCREEN_HEIGHT),
-                'size': random.randint(10, 20),
-                'speed': random.uniform(0.5, 1.5)
-            })
+        count = 10
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(SCREEN_HEIGHT - 100, SCREEN_HEIGHT, count),
+            'size': self.rng.integers(10, 20, count, endpoint=True),
+            'vy': -self.uniform(0.5, 1.5, count)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_snowflakes(self):
-        self.snowflakes = []
-        for _ in range(20):
-            self.snowflakes.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'size': random.randint(5, 10),
-                'speed': random.uniform(0.3, 0.8)
-            })
+        count = 20
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'size': self.rng.integers(5, 10, count, endpoint=True),
+            'vy': -self.uniform(0.3, 0.8, count)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_lava_particles(self):
-        self.lava_particles = []
-        for _ in range(10):
-            self.lava_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(SCREEN_HEIGHT - 100, SCREEN_HEIGHT),
-                'size': random.randint(5, 15),
-                'speed': random.uniform(0.5, 1.5),
-                'color': (255, 100, 0) # Reddish lava
-            })
+        count = 10
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(SCREEN_HEIGHT - 100, SCREEN_HEIGHT, count),
+            'size': self.rng.integers(5, 15, count, endpoint=True),
+            'vy': -self.uniform(0.5, 1.5, count)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_neon_lights(self):
-        self.neon_lights = []
-        for _ in range(10):
-            self.neon_lights.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'size': random.randint(10, 20),
-                'color': (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-            })
+        count = 10
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'size': self.rng.integers(10, 20, count, endpoint=True),
+            'color': self.rng.integers(100, 255, (count, 3), endpoint=True),
+            'vy': np.full(count, -0.5)  # Slight upward movement
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_candy_elements(self):
-        self.candy_elements = []
-        for _ in range(10):
-            self.candy_elements.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'type': random.choice(['heart', 'star', 'diamond', 'candy_cane']),
-                'color': random.choice([RED, YELLOW, PURPLE, GOLD]),
-                'size': random.randint(10, 20)
-            })
+        count = 10
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'type': self.rng.integers(0, len(CANDY_TYPES), count),
+            'color': self.rng.integers(0, len(CANDY_COLORS), count),
+            'size': self.rng.integers(10, 20, count, endpoint=True),
+            'vy': np.full(count, -0.8)  # Slight upward movement
+        }, wrap_axis='y', margin=20, respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_seaweed(self):
-        self.seaweed = []
-        for _ in range(15):
-            self.seaweed.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'height': random.randint(50, 150),
-                'color': (0, 150, 0),
-                'sway': random.uniform(0, 6.28)
-            })
+        count = 15
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'height': self.rng.integers(50, 150, count, endpoint=True),
+            'phase': self.uniform(0, 6.28, count)  # sway
+        }, scroll_divisor=4, margin=50, respawn={'height': (50, 150)}, phase_step=0.02)
 
     def generate_cyber_effects(self):
-        self.cyber_effects = []
-        for _ in range(20):
-            self.cyber_effects.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'type': random.choice(['glitch', 'data_stream', 'hologram']),
-                'color': (0, 255, 255),
-                'size': random.randint(5, 15),
-                'speed': random.uniform(1, 3)
-            })
+        count = 20
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'type': self.rng.integers(0, len(CYBER_TYPES), count),
+            'size': self.rng.integers(5, 15, count, endpoint=True),
+            'vy': -self.uniform(1, 3, count)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_magical_particles(self):
-        self.magical_particles = []
-        for _ in range(25):
-            self.magical_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'color': random.choice([(255, 0, 255), (0, 255, 255), (255, 255, 0), (255, 0, 128)]),
-                'size': random.randint(3, 8),
-                'sparkle': random.randint(0, 100)
-            })
+        count = 25
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'color': self.rng.integers(0, len(MAGICAL_COLORS), count),
+            'size': self.rng.integers(3, 8, count, endpoint=True),
+            'phase': self.randint(0, 100, count),  # sparkle
+            'vy': np.full(count, -0.5)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)},
+           phase_step=1, phase_period=200)
 
     def generate_steam_clouds(self):
-        self.steam_clouds = []
-        for _ in range(12):
-            self.steam_clouds.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(SCREEN_HEIGHT - 200, SCREEN_HEIGHT - 50),
-                'size': random.randint(20, 40),
-                'opacity': random.randint(100, 200),
-                'rise_speed': random.uniform(0.5, 1.5)
-            })
+        count = 12
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(SCREEN_HEIGHT - 200, SCREEN_HEIGHT - 50, count),
+            'size': self.rng.integers(20, 40, count, endpoint=True),
+            'opacity': self.rng.integers(100, 200, count, endpoint=True),
+            'vy': -self.uniform(0.5, 1.5, count)
+        }, wrap_axis='y', margin='size', respawn={'x': (0, SCREEN_WIDTH)})
 
     def generate_dust_particles(self):
-        self.dust_particles = []
-        for _ in range(30):
-            self.dust_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - 100),
-                'size': random.randint(2, 6),
-                'drift_speed': random.uniform(0.2, 0.8),
-                'color': (139, 69, 19)
-            })
+        count = 30
+        return BackgroundLayer(self.rng, {
+            'x': self.randint(0, SCREEN_WIDTH, count),
+            'y': self.randint(0, SCREEN_HEIGHT - 100, count),
+            'size': self.rng.integers(2, 6, count, endpoint=True),
+            'vx': -self.uniform(0.2, 0.8, count)
+        }, margin='size', respawn={'y': (0, SCREEN_HEIGHT - 100)})
 
     def update_theme(self, score):
         new_theme_index = min(score // self.score_threshold, len(self.themes) - 1)
@@ -638,260 +742,270 @@ class Background:
                 theme_change_sound.play()
 
     def update(self, pipe_speed):
-        # Update clouds
-        for cloud in self.clouds:
-            cloud['x'] -= pipe_speed // 2  # Clouds move faster with speed boost
-            if cloud['x'] < -100:
-                cloud['x'] = SCREEN_WIDTH + 100
-                cloud['y'] = random.randint(50, 200)
-
-        # Update buildings (city theme)
-        for building in self.buildings:
-            building['x'] -= pipe_speed // 3
-            if building['x'] < -100:
-                building['x'] = SCREEN_WIDTH + 100
-                building['height'] = random.randint(100, 300)
-
-        # Update trees (forest theme)
-        for tree in self.trees:
-            tree['x'] -= pipe_speed // 3
-            if tree['x'] < -100:
-                tree['x'] = SCREEN_WIDTH + 100
-                tree['height'] = random.randint(80, 150)
-
-        # Update mountains
-        for mountain in self.mountains:
-            mountain['x'] -= pipe_speed // 4
-            if mountain['x'] < -200:
-                mountain['x'] = SCREEN_WIDTH + 200
-                mountain['height'] = random.randint(150, 250)
-
-        # Update stars twinkling
-        for star in self.stars:
-            star['twinkle'] = (star['twinkle'] + 1) % 200
-
-        # Update bubbles
-        for bubble in self.bubbles:
-            bubble['y'] -= bubble['speed']
-            if bubble['y'] < -bubble['size']:
-                bubble['y'] = SCREEN_HEIGHT + bubble['size']
-                bubble['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update snowflakes
-        for snowflake in self.snowflakes:
-            snowflake['y'] -= snowflake['speed']
-            if snowflake['y'] < -snowflake['size']:
-                snowflake['y'] = SCREEN_HEIGHT + snowflake['size']
-                snowflake['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update lava particles
-        for lava_particle in self.lava_particles:
-            lava_particle['y'] -= lava_particle['speed']
-            if lava_particle['y'] < -lava_particle['size']:
-                lava_particle['y'] = SCREEN_HEIGHT + lava_particle['size']
-                lava_particle['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update neon lights
-        for neon_light in self.neon_lights:
-            neon_light['y'] -= 0.5 # Slight upward movement
-            if neon_light['y'] < -neon_light['size']:
-                neon_light['y'] = SCREEN_HEIGHT + neon_light['size']
-                neon_light['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update candy elements
-        for candy_element in self.candy_elements:
-            candy_element['y'] -= 0.8 # Slight upward movement
-            if candy_element['y'] < -20:
-                candy_element['y'] = SCREEN_HEIGHT + 20
-                candy_element['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update seaweed swaying
-        for seaweed in self.seaweed:
-            seaweed['sway'] += 0.02
-            seaweed['x'] -= pipe_speed // 4
-            if seaweed['x'] < -50:
-                seaweed['x'] = SCREEN_WIDTH + 50
-                seaweed['height'] = random.randint(50, 150)
-
-        # Update cyber effects
-        for effect in self.cyber_effects:
-            effect['y'] -= effect['speed']
-            if effect['y'] < -effect['size']:
-                effect['y'] = SCREEN_HEIGHT + effect['size']
-                effect['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update magical particles
-        for particle in self.magical_particles:
-            particle['sparkle'] = (particle['sparkle'] + 1) % 200
-            particle['y'] -= 0.5
-            if particle['y'] < -particle['size']:
-                particle['y'] = SCREEN_HEIGHT + particle['size']
-                particle['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update steam clouds
-        for steam in self.steam_clouds:
-            steam['y'] -= steam['rise_speed']
-            if steam['y'] < -steam['size']:
-                steam['y'] = SCREEN_HEIGHT + steam['size']
-                steam['x'] = random.randint(0, SCREEN_WIDTH)
-
-        # Update dust particles
-        for dust in self.dust_particles:
-            dust['x'] -= dust['drift_speed']
-            if dust['x'] < -dust['size']:
-                dust['x'] = SCREEN_WIDTH + dust['size']
-                dust['y'] = random.randint(0, SCREEN_HEIGHT - 100)
+        # Only the layers of the visible theme move; the others stay frozen until needed
+        for name in THEME_LAYERS[self.current_theme]:
+            self.layers[name].update(pipe_speed)
 
     def draw(self, screen):
-        if self.current_theme == "city":
-            self.draw_city(screen)
-        elif self.current_theme == "forest":
-            self.draw_forest(screen)
-        elif self.current_theme == "mountains":
-            self.draw_mountains(screen)
-        elif self.current_theme == "desert":
-            self.draw_desert(screen)
-        elif self.current_theme == "space":
-            self.draw_space(screen)
-        elif self.current_theme == "ocean":
-            self.draw_ocean(screen)
-        elif self.current_theme == "sunset":
-            self.draw_sunset(screen)
-        elif self.current_theme == "winter":
-            self.draw_winter(screen)
-        elif self.current_theme == "volcano":
-            self.draw_volcano(screen)
-        elif self.current_theme == "neon_city":
-            self.draw_neon_city(screen)
-        elif self.current_theme == "candy_land":
-            self.draw_candy_land(screen)
-        elif self.current_theme == "underwater":
-            self.draw_underwater(screen)
-        elif self.current_theme == "cyberpunk":
-            self.draw_cyberpunk(screen)
-        elif self.current_theme == "fantasy":
-            self.draw_fantasy(screen)
-        elif self.current_theme == "steampunk":
-            self.draw_steampunk(screen)
-        elif self.current_theme == "apocalypse":
-            self.draw_apocalypse(screen)
-
-    def draw_city(self, screen):
-        # Sky gradient
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(135 + (100 - 135) * color_ratio)
-            g = int(206 + (150 - 206) * color_ratio)
-            b = int(235 + (200 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw buildings
-        for building in self.buildings:
-            pygame.draw.rect(screen, building['color'],
-                           (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                            60, building['height']))
-            pygame.draw.rect(screen, BLACK,
-                           (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                            60, building['height']), 2)
-
-            # Windows
-            for window_y in range(building['height'] - 20, 0, 30):
-                for window_x in range(10, 50, 15):
-                    if random.random() > 0.3:  # Some windows lit
-                        pygame.draw.rect(screen, YELLOW,
-                                       (building['x'] + window_x,
-                                        SCREEN_HEIGHT - 100 - building['height'] + window_y,
-                                        8, 8))
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-            pygame.draw.circle(screen, WHITE, (cloud['x'] + cloud['size']//2, cloud['y']), cloud['size']//2)
-            pygame.draw.circle(screen, WHITE, (cloud['x'] - cloud['size']//2, cloud['y']), cloud['size']//2)
-
-    def draw_forest(self, screen):
-        # Sky gradient (greener)
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(135 + (50 - 135) * color_ratio)
-            g = int(206 + (200 - 206) * color_ratio)
-            b = int(235 + (100 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw trees
-        for tree in self.trees:
-            # Tree trunk
-            pygame.draw.rect(screen, tree['trunk_color'],
-                           (tree['x'] + 20, SCREEN_HEIGHT - 100 - tree['height'],
-                            20, tree['height']))
-            # Tree leaves
-            pygame.draw.circle(screen, tree['leaves_color'],
-                             (tree['x'] + 30, SCREEN_HEIGHT - 100 - tree['height'] + 20), 40)
-            pygame.draw.circle(screen, tree['leaves_color'],
-                             (tree['x'] + 15, SCREEN_HEIGHT - 100 - tree['height'] + 40), 30)
-            pygame.draw.circle(screen, tree['leaves_color'],
-                             (tree['x'] + 45, SCREEN_HEIGHT - 100 - tree['height'] + 40), 30)
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-    def draw_mountains(self, screen):
-        # Sky gradient (purple-ish)
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(135 + (100 - 135) * color_ratio)
-            g = int(206 + (150 - 206) * color_ratio)
-            b = int(235 + (200 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_HEIGHT, y))
+        renderer = self.renderers.get(self.current_theme)
+        if renderer is None:
+            # Bake the theme the first time it is shown
+            renderer = self.theme_builders[self.current_theme]()
+            self.renderers[self.current_theme] = renderer
+        renderer.draw(screen)
+
+    def bake_backdrop(self, fill, sky=None, ground=None):
+        """Paint the sky, ground and anything else that never moves into one Surface"""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(fill)
+        if sky:
+            top, bottom = sky
+            for y in range(SCREEN_HEIGHT - 100):
+                color_ratio = y / (SCREEN_HEIGHT - 100)
+                color = [int(a + (b - a) * color_ratio) for a, b in zip(top, bottom)]
+                pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
+        if ground:
+            pygame.draw.rect(surface, ground, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
+        return surface
+
+    def bake_scenery(self, name, paint_element):
+        """Paint every element of a scenery strip once, wrapping around the strip edges"""
+        strip = self.layers[name]
+        surface = pygame.Surface((strip.width, SCREEN_HEIGHT - 100), pygame.SRCALPHA)
+        for x, height, seed in strip.elements():
+            for tile_x in (x - strip.width, x, x + strip.width):
+                paint_element(surface, tile_x, height, random.Random(seed))
+        return surface.convert_alpha()
+
+    def scenery_renderer(self, backdrop, name, paint_element, behind=(), in_front=()):
+        return ThemeRenderer(backdrop, self.layers[name], self.bake_scenery(name, paint_element),
+                             behind=behind, in_front=in_front)
+
+    def particle_sprite(self, size, color):
+        """A translucent particle's circle, baked once per size and color"""
+        sprite = self.particle_sprites.get((size, color))
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            sprite = self.particle_sprites[(size, color)] = sprite.convert_alpha()
+        return sprite
+
+    # Scenery painters, called once per element while baking a strip
+
+    def paint_lit_building(self, surface, x, height, rng):
+        top = SCREEN_HEIGHT - 100 - height
+        pygame.draw.rect(surface, rng.choice(BUILDING_COLORS), (x, top, 60, height))
+        pygame.draw.rect(surface, BLACK, (x, top, 60, height), 2)
 
-        # Draw mountains
-        for mountain in self.mountains:
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, mountain['color'], points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
+        # Windows
+        for window_y in range(20, height - 10, 30):
+            for window_x in range(10, 50, 15):
+                if rng.random() > 0.3:  # Some windows lit
+                    pygame.draw.rect(surface, YELLOW, (x + window_x, top + window_y, 8, 8))
+
+    def paint_tree(self, surface, x, height, rng):
+        top = SCREEN_HEIGHT - 100 - height
+        # Tree trunk
+        pygame.draw.rect(surface, BROWN, (x + 20, top, 20, height))
+        # Tree leaves
+        pygame.draw.circle(surface, DARK_GREEN, (x + 30, top + 20), 40)
+        pygame.draw.circle(surface, DARK_GREEN, (x + 15, top + 40), 30)
+        pygame.draw.circle(surface, DARK_GREEN, (x + 45, top + 40), 30)
+
+    def paint_mountain(self, surface, x, height, rng, color=DARK_GRAY):
+        points = [(x, SCREEN_HEIGHT - 100),
+                 (x + 75, SCREEN_HEIGHT - 100 - height),
+                 (x + 150, SCREEN_HEIGHT - 100)]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, BLACK, points, 2)
+
+    def paint_island(self, surface, x, height, rng):
+        # Floating islands with a green top
+        self.paint_mountain(surface, x, height, rng, color=(34, 139, 34))
+
+    def paint_neon_building(self, surface, x, height, rng):
+        top = SCREEN_HEIGHT - 100 - height
+        neon_color = (rng.randint(100, 255), 0, rng.randint(100, 255))
+        pygame.draw.rect(surface, (20, 20, 20), (x, top, 60, height))
+        pygame.draw.rect(surface, neon_color, (x, top, 60, height), 3)
+
+    def paint_steam_building(self, surface, x, height, rng):
+        top = SCREEN_HEIGHT - 100 - height
+        # Metal building
+        pygame.draw.rect(surface, (100, 100, 100), (x, top, 60, height))
+        pygame.draw.rect(surface, (50, 50, 50), (x, top, 60, height), 3)
+
+        # Gears and pipes
+        for i in range(3):
+            gear_y = top + 20 + i * 30
+            if gear_y < SCREEN_HEIGHT - 100:
+                pygame.draw.circle(surface, (80, 80, 80), (x + 30, gear_y), 8)
+                pygame.draw.circle(surface, (60, 60, 60), (x + 30, gear_y), 8, 2)
+
+    def paint_broken_building(self, surface, x, height, rng):
+        # Broken building
+        height -= rng.randint(0, 50)
+        top = SCREEN_HEIGHT - 100 - height
+        pygame.draw.rect(surface, (60, 60, 60), (x, top, 60, height))
+        pygame.draw.rect(surface, (30, 30, 30), (x, top, 60, height), 2)
+
+        # Broken windows
+        for i in range(2):
+            window_x = x + 15 + i * 25
+            window_y = top + 20
+            if window_y < SCREEN_HEIGHT - 100:
+                pygame.draw.rect(surface, (20, 20, 20), (window_x, window_y, 15, 12))
+                pygame.draw.rect(surface, (10, 10, 10), (window_x, window_y, 15, 12), 1)
+
+    # Dynamic layers, drawn every frame
+
+    def draw_clouds(self, screen):
+        for x, y, size in self.layers['clouds'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, WHITE, (x, y), size)
+
+    def draw_puffy_clouds(self, screen):
+        for x, y, size in self.layers['clouds'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, WHITE, (x, y), size)
+            pygame.draw.circle(screen, WHITE, (x + size//2, y), size//2)
+            pygame.draw.circle(screen, WHITE, (x - size//2, y), size//2)
+
+    def draw_stars(self, screen):
+        for x, y, size, twinkle in self.layers['stars'].rows('x', 'y', 'size', 'phase'):
+            brightness = 255 if twinkle < 100 else 128
+            color = (brightness, brightness, brightness)
+            pygame.draw.circle(screen, color, (x, y), size)
+
+    def draw_bubbles(self, screen):
+        for x, y, size in self.layers['bubbles'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, WHITE, (x, y), size)
+
+    def draw_outlined_bubbles(self, screen):
+        for x, y, size in self.layers['bubbles'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, (255, 255, 255, 100), (x, y), size)
+            pygame.draw.circle(screen, (200, 200, 255), (x, y), size, 1)
+
+    def draw_snowflakes(self, screen):
+        for x, y, size in self.layers['snowflakes'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, WHITE, (x, y), size)
+
+    def draw_lava_particles(self, screen):
+        for x, y, size in self.layers['lava_particles'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, (255, 100, 0), (x, y), size)  # Reddish lava
+
+    def draw_neon_lights(self, screen):
+        for x, y, size, color in self.layers['neon_lights'].rows('x', 'y', 'size', 'color'):
+            pygame.draw.circle(screen, color, (x, y), size)
+
+    def draw_candy_elements(self, screen):
+        candy = self.layers['candy_elements']
+        for x, y, size, kind, color in candy.rows('x', 'y', 'size', 'type', 'color'):
+            kind = CANDY_TYPES[kind]
+            color = CANDY_COLORS[color]
+            if kind == 'heart':
+                pygame.draw.circle(screen, color, (x, y), size)
+            elif kind == 'star':
+                pygame.draw.circle(screen, color, (x, y), size)
+            elif kind == 'diamond':
+                pygame.draw.rect(screen, color, (x, y, size, size))
+            elif kind == 'candy_cane':
+                pygame.draw.line(screen, color, (x, y), (x + size, y + size), 3)
+
+    def draw_seaweed(self, screen):
+        for x, height, sway in self.layers['seaweed'].rows('x', 'height', 'phase'):
+            sway_offset = math.sin(sway) * 10
+            points = [
+                (x + sway_offset, SCREEN_HEIGHT - 100),
+                (x + sway_offset + 5, SCREEN_HEIGHT - 100 - height//2),
+                (x + sway_offset, SCREEN_HEIGHT - 100 - height)
+            ]
+            pygame.draw.polygon(screen, (0, 150, 0), points)
+            pygame.draw.polygon(screen, (0, 100, 0), points, 2)
+
+    def draw_cyber_effects(self, screen):
+        color = (0, 255, 255)
+        for x, y, size, kind in self.layers['cyber_effects'].rows('x', 'y', 'size', 'type'):
+            kind = CYBER_TYPES[kind]
+            if kind == 'glitch':
+                # Glitch effect - random lines
+                for _ in range(3):
+                    x1 = x + random.randint(-size, size)
+                    y1 = y + random.randint(-size, size)
+                    x2 = x + random.randint(-size, size)
+                    y2 = y + random.randint(-size, size)
+                    pygame.draw.line(screen, color, (x1, y1), (x2, y2), 2)
+            elif kind == 'data_stream':
+                # Data stream effect
+                for i in range(5):
+                    y_offset = i * 10
+                    pygame.draw.circle(screen, color, (x, y + y_offset), 2)
+            elif kind == 'hologram':
+                # Hologram effect
+                pygame.draw.circle(screen, color, (x, y), size)
+                pygame.draw.circle(screen, (255, 255, 255), (x, y), size, 2)
+
+    def draw_magical_particles(self, screen):
+        particles = self.layers['magical_particles']
+        for x, y, size, color, sparkle in particles.rows('x', 'y', 'size', 'color', 'phase'):
+            sparkle_alpha = int(128 + 127 * math.sin(sparkle * 0.1))
+            sprite = self.particle_sprite(size, MAGICAL_COLORS[color])
+            sprite.set_alpha(sparkle_alpha)
+            screen.blit(sprite, (x - size, y - size))
+
+    def draw_steam_clouds(self, screen):
+        for x, y, size, opacity in self.layers['steam_clouds'].rows('x', 'y', 'size', 'opacity'):
+            sprite = self.particle_sprite(size, (200, 200, 200))
+            sprite.set_alpha(opacity)
+            screen.blit(sprite, (x - size, y - size))
+
+    def draw_dust_particles(self, screen):
+        for x, y, size in self.layers['dust_particles'].rows('x', 'y', 'size'):
+            pygame.draw.circle(screen, (139, 69, 19), (x, y), size)
+
+    # Theme builders, called once per theme through the renderer registry
+
+    def build_city(self):
+        backdrop = self.bake_backdrop(DARK_GRAY, sky=((135, 206, 235), (100, 150, 200)), ground=DARK_GRAY)
+        return self.scenery_renderer(backdrop, 'buildings', self.paint_lit_building,
+                                     in_front=(self.draw_puffy_clouds,))
+
+    def build_forest(self):
+        # Sky gradient (greener)
+        backdrop = self.bake_backdrop(BROWN, sky=((135, 206, 235), (50, 200, 100)), ground=BROWN)
+        # Add grass
+        for i in range(0, SCREEN_WIDTH, 20):
+            pygame.draw.line(backdrop, DARK_GREEN, (i, SCREEN_HEIGHT - 100), (i + 10, SCREEN_HEIGHT - 100), 3)
+        return self.scenery_renderer(backdrop, 'trees', self.paint_tree, in_front=(self.draw_clouds,))
 
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
+    def build_mountains(self):
+        backdrop = self.bake_backdrop(DARK_GRAY, sky=((135, 206, 235), (100, 150, 200)), ground=DARK_GRAY)
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_mountain, in_front=(self.draw_clouds,))
 
-    def draw_desert(self, screen):
+    def build_desert(self):
         # Sky gradient (orange/yellow)
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(135 + (255 - 135) * color_ratio)
-            g = int(206 + (200 - 206) * color_ratio)
-            b = int(235 + (100 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_HEIGHT, y))
+        backdrop = self.bake_backdrop(GOLD, sky=((135, 206, 235), (255, 200, 100)), ground=GOLD)
 
         # Draw sand dunes
         for i in range(0, SCREEN_WIDTH + 100, 100):
             points = [(i, SCREEN_HEIGHT - 100),
                      (i + 50, SCREEN_HEIGHT - 150),
                      (i + 100, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, GOLD, points)
-            pygame.draw.polygon(screen, BLACK, points, 1)
+            pygame.draw.polygon(backdrop, GOLD, points)
+            pygame.draw.polygon(backdrop, BLACK, points, 1)
+        return ThemeRenderer(backdrop)
 
-    def draw_space(self, screen):
+    def build_space(self):
         # Dark space background
-        screen.fill(DARK_BLUE)
-
-        # Draw stars
-        for star in self.stars:
-            brightness = 255 if star['twinkle'] < 100 else 128
-            color = (brightness, brightness, brightness)
-            pygame.draw.circle(screen, color, (star['x'], star['y']), star['size'])
+        backdrop = self.bake_backdrop(DARK_BLUE)
 
         # Draw planets
-        pygame.draw.circle(screen, PURPLE, (100, 100), 30)
-        pygame.draw.circle(screen, ORANGE, (600, 150), 25)
-        pygame.draw.circle(screen, LIGHT_BLUE, (700, 80), 20)
+        pygame.draw.circle(backdrop, PURPLE, (100, 100), 30)
+        pygame.draw.circle(backdrop, ORANGE, (600, 150), 25)
+        pygame.draw.circle(backdrop, LIGHT_BLUE, (700, 80), 20)
+        return ThemeRenderer(backdrop, in_front=(self.draw_stars,))
 
-    def draw_ocean(self, screen):
+    def build_ocean(self):
         # Blue ocean background
-        screen.fill(DARK_BLUE)
+        backdrop = self.bake_backdrop(DARK_BLUE)
 
         # Draw water gradient
         for y in range(SCREEN_HEIGHT - 100, SCREEN_HEIGHT):
@@ -899,265 +1013,186 @@ class Background:
             r = int(135 + (100 - 135) * color_ratio)
             g = int(206 + (150 - 206) * color_ratio)
             b = int(235 + (200 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw bubbles
-        for bubble in self.bubbles:
-            pygame.draw.circle(screen, WHITE, (bubble['x'], bubble['y']), bubble['size'])
+            pygame.draw.line(backdrop, (r, g, b), (0, y), (SCREEN_WIDTH, y))
 
         # Draw fish (example)
         for i in range(0, SCREEN_WIDTH, 100):
-            pygame.draw.circle(screen, WHITE, (i + 50, SCREEN_HEIGHT - 100 - 50), 20)
+            pygame.draw.circle(backdrop, WHITE, (i + 50, SCREEN_HEIGHT - 100 - 50), 20)
+        return ThemeRenderer(backdrop, in_front=(self.draw_bubbles,))
 
-    def draw_sunset(self, screen):
+    def build_sunset(self):
         # Orange sunset background
-        screen.fill(DARK_GRAY)
-
-        # Draw sky gradient
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(135 + (255 - 135) * color_ratio)
-            g = int(206 + (200 - 206) * color_ratio)
-            b = int(235 + (100 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw mountains
-        for mountain in self.mountains:
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, mountain['color'], points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-    def draw_winter(self, screen):
-        # White winter background
-        screen.fill(WHITE)
+        backdrop = self.bake_backdrop(DARK_GRAY, sky=((135, 206, 235), (255, 200, 100)), ground=DARK_GRAY)
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_mountain, in_front=(self.draw_clouds,))
 
-        # Draw snowflakes
-        for snowflake in self.snowflakes:
-            pygame.draw.circle(screen, WHITE, (snowflake['x'], snowflake['y']), snowflake['size'])
-
-        # Draw mountains
-        for mountain in self.mountains:
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, mountain['color'], points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
+    def build_winter(self):
+        # White winter background
+        backdrop = self.bake_backdrop(WHITE)
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_mountain,
+                                     behind=(self.draw_snowflakes,), in_front=(self.draw_clouds,))
 
-    def draw_volcano(self, screen):
+    def build_volcano(self):
         # Red volcanic background
-        screen.fill(RED)
+        backdrop = self.bake_backdrop(RED)
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_mountain,
+                                     behind=(self.draw_lava_particles,), in_front=(self.draw_clouds,))
 
-        # Draw lava particles
-        for lava_particle in self.lava_particles:
-            pygame.draw.circle(screen, lava_particle['color'], (lava_particle['x'], lava_particle['y']), lava_particle['size'])
-
-        # Draw mountains
-        for mountain in self.mountains:
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, mountain['color'], points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-    def draw_neon_city(self, screen):
+    def build_neon_city(self):
         # Dark blue background with neon lights
-        screen.fill(DARK_BLUE)
-
-        # Draw neon lights
-        for neon_light in self.neon_lights:
-            pygame.draw.circle(screen, neon_light['color'], (neon_light['x'], neon_light['y']), neon_light['size'])
-
-        # Draw buildings
-        for building in self.buildings:
-            pygame.draw.rect(screen, building['color'],
-                           (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                            60, building['height']))
-            pygame.draw.rect(screen, BLACK,
-                           (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                            60, building['height']), 2)
-
-            # Windows
-            for window_y in range(building['height'] - 20, 0, 30):
-                for window_x in range(10, 50, 15):
-                    if random.random() > 0.3:  # Some windows lit
-                        pygame.draw.rect(screen, YELLOW,
-                                       (building['x'] + window_x,
-                                        SCREEN_HEIGHT - 100 - building['height'] + window_y,
-                                        8, 8))
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-    def draw_candy_land(self, screen):
+        backdrop = self.bake_backdrop(DARK_BLUE)
+        return self.scenery_renderer(backdrop, 'buildings', self.paint_lit_building,
+                                     behind=(self.draw_neon_lights,), in_front=(self.draw_clouds,))
+
+    def build_candy_land(self):
         # Pink candy land background
-        screen.fill(PURPLE)
-
-        # Draw candy elements
-        for candy_element in self.candy_elements:
-            if candy_element['type'] == 'heart':
-                pygame.draw.circle(screen, candy_element['color'], (candy_element['x'], candy_element['y']), candy_element['size'])
-            elif candy_element['type'] == 'star':
-                pygame.draw.circle(screen, candy_element['color'], (candy_element['x'], candy_element['y']), candy_element['size'])
-            elif candy_element['type'] == 'diamond':
-                pygame.draw.rect(screen, candy_element['color'], (candy_element['x'], candy_element['y'], candy_element['size'], candy_element['size']))
-            elif candy_element['type'] == 'candy_cane':
-                pygame.draw.line(screen, candy_element['color'], (candy_element['x'], candy_element['y']), (candy_element['x'] + candy_element['size'], candy_element['y'] + candy_element['size']), 3)
-
-        # Draw mountains
-        for mountain in self.mountains:
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, mountain['color'], points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-        # Draw clouds
-        for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-    def draw_underwater(self, screen):
-        # Deep blue underwater background
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(0 + (0 - 0) * color_ratio)
-            g = int(50 + (100 - 50) * color_ratio)
-            b = int(150 + (255 - 150) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw seaweed
-        for seaweed in self.seaweed:
-            sway_offset = math.sin(seaweed['sway']) * 10
-            points = [
-                (seaweed['x'] + sway_offset, SCREEN_HEIGHT - 100),
-                (seaweed['x'] + sway_offset + 5, SCREEN_HEIGHT - 100 - seaweed['height']//2),
-                (seaweed['x'] + sway_offset, SCREEN_HEIGHT - 100 - seaweed['height'])
-            ]
-            pygame.draw.polygon(screen, seaweed['color'], points)
-            pygame.draw.polygon(screen, (0, 100, 0), points, 2)
+        backdrop = self.bake_backdrop(PURPLE)
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_mountain,
+                                     behind=(self.draw_candy_elements,), in_front=(self.draw_clouds,))
 
-        # Draw bubbles
-        for bubble in self.bubbles:
-            pygame.draw.circle(screen, (255, 255, 255, 100), (bubble['x'], bubble['y']), bubble['size'])
-            pygame.draw.circle(screen, (200, 200, 255), (bubble['x'], bubble['y']), bubble['size'], 1)
+    def build_underwater(self):
+        # Deep blue underwater background
+        backdrop = self.bake_backdrop((0, 100, 255), sky=((0, 50, 150), (0, 100, 255)))
+        return ThemeRenderer(backdrop, in_front=(self.draw_seaweed, self.draw_outlined_bubbles))
 
-    def draw_cyberpunk(self, screen):
+    def build_cyberpunk(self):
         # Dark purple cyberpunk background
-        screen.fill((25, 0, 50))
+        backdrop = self.bake_backdrop((25, 0, 50))
+        return self.scenery_renderer(backdrop, 'buildings', self.paint_neon_building,
+                                     behind=(self.draw_cyber_effects,))
 
-        # Draw cyber effects
-        for effect in self.cyber_effects:
-            if effect['type'] == 'glitch':
-                # Glitch effect - random lines
-                for _ in range(3):
-                    x1 = effect['x'] + random.randint(-effect['size'], effect['size'])
-                    y1 = effect['y'] + random.randint(-effect['size'], effect['size'])
-                    x2 = effect['x'] + random.randint(-effect['size'], effect['size'])
-                    y2 = effect['y'] + random.randint(-effect['size'], effect['size'])
-                    pygame.draw.line(screen, effect['color'], (x1, y1), (x2, y2), 2)
-            elif effect['type'] == 'data_stream':
-                # Data stream effect
-                for i in range(5):
-                    y_offset = i * 10
-                    pygame.draw.circle(screen, effect['color'], (effect['x'], effect['y'] + y_offset), 2)
-            elif effect['type'] == 'hologram':
-                # Hologram effect
-                pygame.draw.circle(screen, effect['color'], (effect['x'], effect['y']), effect['size'])
-                pygame.draw.circle(screen, (255, 255, 255), (effect['x'], effect['y']), effect['size'], 2)
-
-        # Draw neon buildings
-        for building in self.buildings:
-            neon_color = (random.randint(100, 255), 0, random.randint(100, 255))
-            pygame.draw.rect(screen, (20, 20, 20), (building['x'], SCREEN_HEIGHT - 100 - building['height'], 60, building['height']))
-            pygame.draw.rect(screen, neon_color, (building['x'], SCREEN_HEIGHT - 100 - building['height'], 60, building['height']), 3)
-
-    def draw_fantasy(self, screen):
+    def build_fantasy(self):
         # Magical gradient background
-        for y in range(SCREEN_HEIGHT - 100):
-            color_ratio = y / (SCREEN_HEIGHT - 100)
-            r = int(100 + (200 - 100) * color_ratio)
-            g = int(50 + (100 - 50) * color_ratio)
-            b = int(150 + (255 - 150) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        # Draw magical particles
-        for particle in self.magical_particles:
-            sparkle_alpha = int(128 + 127 * math.sin(particle['sparkle'] * 0.1))
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            particle_surface.set_alpha(sparkle_alpha)
-            pygame.draw.circle(particle_surface, particle['color'], (particle['size'], particle['size']), particle['size'])
-            screen.blit(particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size']))
-
-        # Draw floating islands (mountains)
-        for mountain in self.mountains:
-            # Island base
-            points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                     (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                     (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-            pygame.draw.polygon(screen, (139, 69, 19), points)  # Brown base
-            pygame.draw.polygon(screen, (34, 139, 34), points)  # Green top
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-    def draw_steampunk(self, screen):
+        backdrop = self.bake_backdrop((200, 100, 255), sky=((100, 50, 150), (200, 100, 255)))
+        return self.scenery_renderer(backdrop, 'mountains', self.paint_island,
+                                     behind=(self.draw_magical_particles,))
+
+    def build_steampunk(self):
         # Brown steampunk background
-        screen.fill((139, 69, 19))
-
-        # Draw steam clouds
-        for steam in self.steam_clouds:
-            steam_surface = pygame.Surface((steam['size'] * 2, steam['size'] * 2), pygame.SRCALPHA)
-            steam_surface.set_alpha(steam['opacity'])
-            pygame.draw.circle(steam_surface, (200, 200, 200), (steam['size'], steam['size']), steam['size'])
-            screen.blit(steam_surface, (steam['x'] - steam['size'], steam['y'] - steam['size']))
-
-        # Draw mechanical buildings
-        for building in self.buildings:
-            # Metal building
-            pygame.draw.rect(screen, (100, 100, 100), (building['x'], SCREEN_HEIGHT - 100 - building['height'], 60, building['height']))
-            pygame.draw.rect(screen, (50, 50, 50), (building['x'], SCREEN_HEIGHT - 100 - building['height'], 60, building['height']), 3)
-
-            # Gears and pipes
-            for i in range(3):
-                gear_y = SCREEN_HEIGHT - 100 - building['height'] + 20 + i * 30
-                if gear_y < SCREEN_HEIGHT - 100:
-                    pygame.draw.circle(screen, (80, 80, 80), (building['x'] + 30, gear_y), 8)
-                    pygame.draw.circle(screen, (60, 60, 60), (building['x'] + 30, gear_y), 8, 2)
-
-    def draw_apocalypse(self, screen):
+        backdrop = self.bake_backdrop((139, 69, 19))
+        return self.scenery_renderer(backdrop, 'buildings', self.paint_steam_building,
+                                     behind=(self.draw_steam_clouds,))
+
+    def build_apocalypse(self):
         # Dark apocalyptic background
-        screen.fill((40, 40, 40))
-
-        # Draw dust particles
-        for dust in self.dust_particles:
-            pygame.draw.circle(screen, dust['color'], (dust['x'], dust['y']), dust['size'])
-
-        # Draw destroyed buildings
-        for building in self.buildings:
-            # Broken building
-            height = building['height'] - random.randint(0, 50)
-            pygame.draw.rect(screen, (60, 60, 60), (building['x'], SCREEN_HEIGHT - 100 - height, 60, height))
-            pygame.draw.rect(screen, (30, 30, 30), (building['x'], SCREEN_HEIGHT - 100 - height, 60, height), 2)
-
-            # Broken windows
-            for i in range(2):
-                window_x = building['x'] + 15 + i * 25
-                window_y = SCREEN_HEIGHT - 100 - height + 20
-                if window_y < SCREEN_HEIGHT - 100:
-                    pygame.draw.rect(screen, (20, 20, 20), (window_x, window_y, 15, 12))
-                    pygame.draw.rect(screen, (10, 10, 10), (window_x, window_y, 15, 12), 1)
+        backdrop = self.bake_backdrop((40, 40, 40))
+        return self.scenery_renderer(backdrop, 'buildings', self.paint_broken_building,
+                                     behind=(self.draw_dust_particles,))
+
+# Pipe look per theme: body colors (one is picked per pipe), outline, repeating
+# body pattern, (top, bottom) gap-end caps and a plain band kept free of pattern
+PIPE_STYLES = {
+    "city": {'colors': [DARK_GRAY, GRAY, LIGHT_GRAY, (100, 100, 100)], 'border': BLACK,
+             'pattern': 'windows', 'band': 15},
+    "forest": {'colors': [BROWN], 'border': BLACK, 'caps': ('tree_top', 'tree_top')},
+    "mountains": {'colors': [DARK_GRAY], 'border': BLACK, 'caps': ('snow_cap', 'snow_cap')},
+    "desert": {'colors': [GOLD], 'border': BLACK, 'pattern': 'cactus'},
+    "space": {'colors': [SILVER], 'border': WHITE, 'pattern': 'lights'},
+    "ocean": {'colors': [LIGHT_BLUE], 'border': BLACK, 'caps': (None, 'fish')},
+    "sunset": {'colors': [ORANGE], 'border': BLACK, 'caps': ('sun', None)},
+    "winter": {'colors': [WHITE], 'border': BLACK, 'caps': ('snowflake', None)},
+    "volcano": {'colors': [RED], 'border': BLACK, 'caps': ('lava', 'lava')},
+    "neon_city": {'colors': [SILVER], 'border': WHITE, 'pattern': 'lights'},
+    "candy_land": {'colors': [PURPLE], 'border': WHITE, 'caps': ('candy_cane', None)},
+    "underwater": {'colors': [(255, 182, 193)], 'border': BLACK, 'pattern': 'coral'},  # Light coral
+    "cyberpunk": {'colors': [(20, 20, 20)], 'border': (0, 255, 255), 'pattern': 'circuits'},
+    "fantasy": {'colors': [(138, 43, 226)], 'border': WHITE, 'pattern': 'crystals'},  # Blue violet
+    "steampunk": {'colors': [(205, 133, 63)], 'border': (139, 69, 19), 'pattern': 'rivets'},  # Brass
+    "apocalypse": {'colors': [(139, 69, 19)], 'border': (101, 67, 33), 'pattern': 'rust'},
+}
+PIPE_VARIANTS = max(len(style['colors']) for style in PIPE_STYLES.values())
+
+# Body patterns, painted down a full-height column starting at x = 0
+def paint_windows(body, height):
+    window_colors = [YELLOW, LIGHT_BLUE, WHITE, (255, 255, 200)]
+    for row in range(3, (height - 20) // 25):
+        for col in range(2):
+            window_x = 10 + col * 25
+            window_y = 15 + row * 25
+            pygame.draw.rect(body, random.choice(window_colors), (window_x, window_y, 15, 12))
+            pygame.draw.rect(body, BLACK, (window_x, window_y, 15, 12), 1)
+
+def paint_cactus(body, height):
+    for y in range(20, height - 20, 40):
+        pygame.draw.rect(body, DARK_GREEN, (15, y, 10, 20))
+
+def paint_lights(body, height):
+    for y in range(10, height - 10, 20):
+        pygame.draw.circle(body, RED, (10, y), 3)
+        pygame.draw.circle(body, BLUE, (PIPE_WIDTH - 10, y), 3)
+
+def paint_coral(body, height):
+    for i in range(0, height - 20, 30):
+        pygame.draw.circle(body, (255, 20, 147), (20, i + 20), 8)
+        pygame.draw.circle(body, (255, 105, 180), (40, i + 30), 6)
+
+def paint_circuits(body, height):
+    for i in range(0, height - 10, 20):
+        pygame.draw.line(body, (0, 255, 255), (10, i + 10), (PIPE_WIDTH - 10, i + 10), 2)
+        pygame.draw.circle(body, (255, 0, 255), (20, i + 10), 3)
+
+def paint_crystals(body, height):
+    for i in range(0, height - 20, 25):
+        points = [(10, i + 10), (30, i + 5), (50, i + 10), (30, i + 20)]
+        pygame.draw.polygon(body, (255, 255, 255), points)
+        pygame.draw.polygon(body, (138, 43, 226), points, 2)
+
+def paint_rivets(body, height):
+    for i in range(0, height - 10, 30):
+        pygame.draw.circle(body, (139, 69, 19), (10, i + 15), 4)
+        pygame.draw.circle(body, (139, 69, 19), (PIPE_WIDTH - 10, i + 15), 4)
+        pygame.draw.circle(body, (139, 69, 19), (PIPE_WIDTH//2, i + 15), 4)
+
+def paint_rust(body, height):
+    for i in range(0, height - 10, 20):
+        rust_x = random.randint(5, PIPE_WIDTH - 15)
+        rust_y = i + random.randint(5, 15)
+        pygame.draw.circle(body, (139, 0, 0), (rust_x, rust_y), 3)
+
+# Gap-end caps, painted around a pipe end at (x, end)
+def paint_tree_top(cap, x, end):
+    pygame.draw.circle(cap, DARK_GREEN, (x + PIPE_WIDTH//2, end - 20), 30)
+
+def paint_snow_cap(cap, x, end):
+    pygame.draw.rect(cap, WHITE, (x - 5, end - 15, PIPE_WIDTH + 10, 15))
+
+def paint_lava(cap, x, end):
+    pygame.draw.rect(cap, (255, 100, 0), (x - 5, end - 15, PIPE_WIDTH + 10, 15))
+
+def paint_sun(cap, x, end):
+    pygame.draw.circle(cap, YELLOW, (x + PIPE_WIDTH//2, end - 50), 40)
+    pygame.draw.circle(cap, YELLOW, (x + PIPE_WIDTH//2, end - 50), 30)
+
+def paint_snowflake(cap, x, end):
+    pygame.draw.circle(cap, WHITE, (x + PIPE_WIDTH//2, end - 50), 20)
+
+def paint_candy_cane(cap, x, end):
+    pygame.draw.line(cap, WHITE, (x + PIPE_WIDTH//2, end - 50), (x + PIPE_WIDTH//2 + 10, end - 40), 3)
+
+def paint_fish(cap, x, end):
+    for i in range(0, PIPE_WIDTH, 10):
+        pygame.draw.circle(cap, WHITE, (x + i + 5, end - 50), 10)
+
+PIPE_PATTERNS = {
+    'windows': paint_windows,
+    'cactus': paint_cactus,
+    'lights': paint_lights,
+    'coral': paint_coral,
+    'circuits': paint_circuits,
+    'crystals': paint_crystals,
+    'rivets': paint_rivets,
+    'rust': paint_rust,
+}
+PIPE_CAPS = {
+    'tree_top': paint_tree_top,
+    'snow_cap': paint_snow_cap,
+    'lava': paint_lava,
+    'sun': paint_sun,
+    'snowflake': paint_snowflake,
+    'candy_cane': paint_candy_cane,
+    'fish': paint_fish,
+}
+
+pipe_sprites = PipeSpriteCache(PIPE_STYLES, PIPE_PATTERNS, PIPE_CAPS, PIPE_WIDTH, SCREEN_HEIGHT)
 
 class Pipe:
     def __init__(self, x, theme="city"):
@@ -1167,347 +1202,14 @@ class Pipe:
         self.top_height = self.gap_y - PIPE_GAP // 2
         self.bottom_height = SCREEN_HEIGHT - (self.gap_y + PIPE_GAP // 2)
         self.passed = False
+        self.variant = random.randrange(PIPE_VARIANTS)
 
     def update(self):
         self.x -= PIPE_SPEED
 
     def draw(self, screen, theme):
-        if theme == "city":
-            self.draw_city_pipe(screen)
-        elif theme == "forest":
-            self.draw_forest_pipe(screen)
-        elif theme == "mountains":
-            self.draw_mountain_pipe(screen)
-        elif theme == "desert":
-            self.draw_desert_pipe(screen)
-        elif theme == "space":
-            self.draw_space_pipe(screen)
-        elif theme == "ocean":
-            self.draw_ocean_pipe(screen)
-        elif theme == "sunset":
-            self.draw_sunset_pipe(screen)
-        elif theme == "winter":
-            self.draw_winter_pipe(screen)
-        elif theme == "volcano":
-            self.draw_volcano_pipe(screen)
-        elif theme == "neon_city":
-            self.draw_neon_city_pipe(screen)
-        elif theme == "candy_land":
-            self.draw_candy_land_pipe(screen)
-        elif theme == "underwater":
-            self.draw_underwater_pipe(screen)
-        elif theme == "cyberpunk":
-            self.draw_cyberpunk_pipe(screen)
-        elif theme == "fantasy":
-            self.draw_fantasy_pipe(screen)
-        elif theme == "steampunk":
-            self.draw_steampunk_pipe(screen)
-        elif theme == "apocalypse":
-            self.draw_apocalypse_pipe(screen)
-
-    def draw_city_pipe(self, screen):
-        # Building-like pipes
-        building_colors = [DARK_GRAY, GRAY, LIGHT_GRAY, (100, 100, 100)]
-        color = random.choice(building_colors)
-
-        # Top building
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom building
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Windows
-        window_colors = [YELLOW, LIGHT_BLUE, WHITE, (255, 255, 200)]
-        for row in range(3, (self.top_height - 20) // 25):
-            for col in range(2):
-                window_x = self.x + 10 + col * 25
-                window_y = 15 + row * 25
-                if window_y < self.top_height - 15:
-                    window_color = random.choice(window_colors)
-                    pygame.draw.rect(screen, window_color, (window_x, window_y, 15, 12))
-                    pygame.draw.rect(screen, BLACK, (window_x, window_y, 15, 12), 1)
-
-        for row in range(3, (self.bottom_height - 20) // 25):
-            for col in range(2):
-                window_x = self.x + 10 + col * 25
-                window_y = bottom_y + 15 + row * 25
-                if window_y < bottom_y + self.bottom_height - 15:
-                    window_color = random.choice(window_colors)
-                    pygame.draw.rect(screen, window_color, (window_x, window_y, 15, 12))
-                    pygame.draw.rect(screen, BLACK, (window_x, window_y, 15, 12), 1)
-
-    def draw_forest_pipe(self, screen):
-        # Tree-like pipes
-        pygame.draw.rect(screen, BROWN, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Tree top
-        pygame.draw.circle(screen, DARK_GREEN, (self.x + PIPE_WIDTH//2, self.top_height - 20), 30)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, BROWN, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Tree top
-        pygame.draw.circle(screen, DARK_GREEN, (self.x + PIPE_WIDTH//2, bottom_y + 20), 30)
-
-    def draw_mountain_pipe(self, screen):
-        # Rock-like pipes
-        color = DARK_GRAY
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Snow caps
-        pygame.draw.rect(screen, WHITE, (self.x - 5, self.top_height - 15, PIPE_WIDTH + 10, 15))
-        pygame.draw.rect(screen, WHITE, (self.x - 5, bottom_y, PIPE_WIDTH + 10, 15))
-
-    def draw_desert_pipe(self, screen):
-        # Sand-like pipes
-        color = GOLD
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Cactus details
-        for y in range(20, self.top_height - 20, 40):
-            pygame.draw.rect(screen, DARK_GREEN, (self.x + 15, y, 10, 20))
-        for y in range(bottom_y + 20, bottom_y + self.bottom_height - 20, 40):
-            pygame.draw.rect(screen, DARK_GREEN, (self.x + 15, y, 10, 20))
-
-    def draw_space_pipe(self, screen):
-        # Space station-like pipes
-        color = SILVER
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, WHITE, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, WHITE, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Lights
-        for y in range(10, self.top_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-        for y in range(bottom_y + 10, bottom_y + self.bottom_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-
-    def draw_ocean_pipe(self, screen):
-        # Ocean-like pipes
-        color = LIGHT_BLUE
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Fish
-        for i in range(0, PIPE_WIDTH, 10):
-            pygame.draw.circle(screen, WHITE, (self.x + i + 5, bottom_y + 50), 10)
-
-    def draw_sunset_pipe(self, screen):
-        # Sunset-like pipes
-        color = ORANGE
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Sun
-        pygame.draw.circle(screen, YELLOW, (self.x + PIPE_WIDTH//2, self.top_height - 50), 40)
-        pygame.draw.circle(screen, YELLOW, (self.x + PIPE_WIDTH//2, self.top_height - 50), 30)
-
-    def draw_winter_pipe(self, screen):
-        # Winter-like pipes
-        color = WHITE
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Snowflake
-        pygame.draw.circle(screen, WHITE, (self.x + PIPE_WIDTH//2, self.top_height - 50), 20)
-
-    def draw_volcano_pipe(self, screen):
-        # Volcano-like pipes
-        color = RED
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Lava
-        pygame.draw.rect(screen, (255, 100, 0), (self.x - 5, self.top_height - 15, PIPE_WIDTH + 10, 15))
-        pygame.draw.rect(screen, (255, 100, 0), (self.x - 5, bottom_y, PIPE_WIDTH + 10, 15))
-
-    def draw_neon_city_pipe(self, screen):
-        # Neon city-like pipes
-        color = SILVER
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, WHITE, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, WHITE, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Lights
-        for y in range(10, self.top_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-        for y in range(bottom_y + 10, bottom_y + self.bottom_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-
-    def draw_candy_land_pipe(self, screen):
-        # Candy land-like pipes
-        color = PURPLE
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, WHITE, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, WHITE, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Candy cane
-        pygame.draw.line(screen, WHITE, (self.x + PIPE_WIDTH//2, self.top_height - 50), (self.x + PIPE_WIDTH//2 + 10, self.top_height - 50 + 10), 3)
-
-    def draw_underwater_pipe(self, screen):
-        # Coral-like pipes
-        color = (255, 182, 193)  # Light coral
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Coral details
-        for i in range(0, self.top_height - 20, 30):
-            pygame.draw.circle(screen, (255, 20, 147), (self.x + 20, i + 20), 8)
-            pygame.draw.circle(screen, (255, 105, 180), (self.x + 40, i + 30), 6)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Coral details
-        for i in range(0, self.bottom_height - 20, 30):
-            pygame.draw.circle(screen, (255, 20, 147), (self.x + 20, bottom_y + i + 20), 8)
-            pygame.draw.circle(screen, (255, 105, 180), (self.x + 40, bottom_y + i + 30), 6)
-
-    def draw_cyberpunk_pipe(self, screen):
-        # Cyberpunk pipes with neon effects
-        color = (20, 20, 20)
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, (0, 255, 255), (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Circuit patterns
-        for i in range(0, self.top_height - 10, 20):
-            pygame.draw.line(screen, (0, 255, 255), (self.x + 10, i + 10), (self.x + PIPE_WIDTH - 10, i + 10), 2)
-            pygame.draw.circle(screen, (255, 0, 255), (self.x + 20, i + 10), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, (0, 255, 255), (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Circuit patterns
-        for i in range(0, self.bottom_height - 10, 20):
-            pygame.draw.line(screen, (0, 255, 255), (self.x + 10, bottom_y + i + 10), (self.x + PIPE_WIDTH - 10, bottom_y + i + 10), 2)
-            pygame.draw.circle(screen, (255, 0, 255), (self.x + 20, bottom_y + i + 10), 3)
-
-    def draw_fantasy_pipe(self, screen):
-        # Crystal-like pipes
-        color = (138, 43, 226)  # Blue violet
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, (255, 255, 255), (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Crystal facets
-        for i in range(0, self.top_height - 20, 25):
-            points = [(self.x + 10, i + 10), (self.x + 30, i + 5), (self.x + 50, i + 10), (self.x + 30, i + 20)]
-            pygame.draw.polygon(screen, (255, 255, 255), points)
-            pygame.draw.polygon(screen, (138, 43, 226), points, 2)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, (255, 255, 255), (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Crystal facets
-        for i in range(0, self.bottom_height - 20, 25):
-            points = [(self.x + 10, bottom_y + i + 10), (self.x + 30, bottom_y + i + 5), (self.x + 50, bottom_y + i + 10), (self.x + 30, bottom_y + i + 20)]
-            pygame.draw.polygon(screen, (255, 255, 255), points)
-            pygame.draw.polygon(screen, (138, 43, 226), points, 2)
-
-    def draw_steampunk_pipe(self, screen):
-        # Brass steampunk pipes
-        color = (205, 133, 63)  # Peru (brass-like)
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, (139, 69, 19), (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Rivets and bolts
-        for i in range(0, self.top_height - 10, 30):
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + 10, i + 15), 4)
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + PIPE_WIDTH - 10, i + 15), 4)
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + PIPE_WIDTH//2, i + 15), 4)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, (139, 69, 19), (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Rivets and bolts
-        for i in range(0, self.bottom_height - 10, 30):
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + 10, bottom_y + i + 15), 4)
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + PIPE_WIDTH - 10, bottom_y + i + 15), 4)
-            pygame.draw.circle(screen, (139, 69, 19), (self.x + PIPE_WIDTH//2, bottom_y + i + 15), 4)
-
-    def draw_apocalypse_pipe(self, screen):
-        # Rusty apocalyptic pipes
-        color = (139, 69, 19)  # Saddle brown
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, (101, 67, 33), (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-
-        # Rust spots
-        for i in range(0, self.top_height - 10, 20):
-            rust_x = self.x + random.randint(5, PIPE_WIDTH - 15)
-            rust_y = i + random.randint(5, 15)
-            pygame.draw.circle(screen, (139, 0, 0), (rust_x, rust_y), 3)
-
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, (101, 67, 33), (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-
-        # Rust spots
-        for i in range(0, self.bottom_height - 10, 20):
-            rust_x = self.x + random.randint(5, PIPE_WIDTH - 15)
-            rust_y = bottom_y + i + random.randint(5, 15)
-            pygame.draw.circle(screen, (139, 0, 0), (rust_x, rust_y), 3)
+        sprites = pipe_sprites.get(theme, self.variant)
+        sprites.draw(screen, self.x, self.top_height, self.gap_y + PIPE_GAP // 2)
 
     def get_rects(self):
         top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.top_height)
@@ -1568,30 +1270,53 @@ class Powerup:
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, scores=None):
+        # Session assets, created once and kept across restarts
+        self.background = Background()
+        self.scores = scores  # Shared ScoreStore, or None to keep scores for this session only
+        self.high_score = self.load_high_score()
+        self.font = pygame.font.Font(None, 74)
+        self.small_font = pygame.font.Font(None, 36)
+        self.medium_font = pygame.font.Font(None, 48)
+
+        # Invincibility shield ring, pulsed by changing its alpha each frame
+        self.shield_surface = pygame.Surface((BIRD_SIZE + 20, BIRD_SIZE + 20), pygame.SRCALPHA)
+        pygame.draw.circle(self.shield_surface, YELLOW, (BIRD_SIZE//2 + 10, BIRD_SIZE//2 + 10), BIRD_SIZE//2 + 15, 3)
+        self.shield_surface = self.shield_surface.convert_alpha()
+
+        # Full-screen dimming for the start and game over screens
+        self.start_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.start_overlay.fill(BLACK)
+        self.start_overlay.set_alpha(180)
+        self.game_over_overlay = self.start_overlay.copy()
+        self.game_over_overlay.set_alpha(128)
+
+        # Music management
+        self.theme_songs = {}  # Theme -> its song, synthesized the first time the theme plays
+        self.current_theme_song = None
+
+        self.reset()
+
+    def reset(self):
+        """Start a new run, resetting only per-run state"""
         self.bird = Bird(100, SCREEN_HEIGHT // 2)
         self.pipes = []
         self.powerups = []
-        self.background = Background()
+        self.background.reset()
         self.score = 0
-        self.high_score = self.load_high_score()
         self.lives = 3
         self.game_over = False
         self.game_started = False
-        self.font = pygame.font.Font(None, 74)
-        self.small_font = pygame.font.Font(None, 36)
-        self.medium_font = pygame.font.Font(None, 48)
 
         # Powerup effects
         self.speed_boost = False
         self.invincible = False
         self.double_points = False
-        self.powerup_timers = {}
-        self.last_collision_time = 0  # Track last collision to prevent rapid consecutive collisions
+        self.timers = TimerWheel()
+        self.powerup_timers = {}  # Effect -> the timer that ends it
+        self.recovering = False  # Briefly set after a collision to prevent rapid consecutive collisions
         self.pipe_speed = PIPE_SPEED
 
-        # Music management
-        self.current_theme_song = None
         self.change_theme_music('city')  # Start with city theme music
 
         for i in range(3):
@@ -1603,12 +1328,20 @@ class Game:
     def change_theme_music(self, theme):
         """Change the background music based on the current theme"""
         try:
+            if theme not in self.theme_songs:
+                self.theme_songs[theme] = create_theme_song(theme)
+            song = self.theme_songs[theme]
+
+            # Keep the song going if the theme hasn't changed, e.g. on a quick restart
+            if song is not None and song is self.current_theme_song:
+                return
+
             # Stop current music if playing
             if self.current_theme_song:
                 self.current_theme_song.stop()
 
-            # Create and play new theme music
-            self.current_theme_song = create_theme_song(theme)
+            # Play the new theme music
+            self.current_theme_song = song
             if self.current_theme_song:
                 self.current_theme_song.play(-1)  # Loop indefinitely
                 print(f"🎵 Now playing {theme} theme music!")
@@ -1637,6 +1370,7 @@ class Game:
         }
 
         data = powerup_data[powerup_type]
+        duration = data['duration'] * FPS // 1000
 
         if powerup_type == 'health':
             self.lives += 1  # No cap on lives
@@ -1645,62 +1379,68 @@ class Game:
         elif powerup_type == 'speed':
             self.speed_boost = True
             self.invincible = True  # Speed boost now includes invincibility
-            self.powerup_timers['speed'] = pygame.time.get_ticks() + data['duration']
-            self.powerup_timers['invincible'] = pygame.time.get_ticks() + data['duration']
+            self.start_powerup_timer('speed', duration)
+            self.start_powerup_timer('invincible', duration)
             print("⚡ Speed boost with invincibility activated!")
 
         elif powerup_type == 'invincible':
             self.invincible = True
-            self.powerup_timers['invincible'] = pygame.time.get_ticks() + data['duration']
+            self.start_powerup_timer('invincible', duration)
             print("🛡️ Invincibility activated!")
 
         elif powerup_type == 'double_points':
             self.double_points = True
-            self.powerup_timers['double_points'] = pygame.time.get_ticks() + data['duration']
+            self.start_powerup_timer('double_points', duration)
             print("2× Double points activated!")
 
         # Play powerup sound
         if score_sound:
             score_sound.play()
 
-    def update_powerup_timers(self):
-        """Update powerup timers and deactivate expired effects"""
-        current_time = pygame.time.get_ticks()
-
-        for effect, end_time in list(self.powerup_timers.items()):
-            if current_time > end_time:
-                if effect == 'speed':
-                    self.speed_boost = False
-                    # Always add 4 seconds of invincibility after speed boost ends
-                    self.invincible = True
-                    self.powerup_timers['invincible'] = current_time + 4000  # 4000ms = 4 seconds
-                    print("Speed boost ended! 4 seconds of invincibility granted!")
-                elif effect == 'invincible':
-                    self.invincible = False
-                    print("Invincible effect ended!")
-                elif effect == 'double_points':
-                    self.double_points = False
-                    print("Double_Points effect ended!")
-
-                del self.powerup_timers[effect]
-                if effect != 'invincible':  # Don't print for invincible since we handle it above
-                    print(f"{effect.title()} effect ended!")
+    def start_powerup_timer(self, effect, duration):
+        """(Re)start the timer that ends an effect after duration frames"""
+        self.timers.cancel(self.powerup_timers.get(effect))
+        self.powerup_timers[effect] = self.timers.schedule(duration, self.end_powerup, effect)
+
+    def end_powerup(self, effect):
+        """Deactivate an expired effect"""
+        del self.powerup_timers[effect]
+        if effect == 'speed':
+            self.speed_boost = False
+            # Always add 4 seconds of invincibility after speed boost ends
+            self.invincible = True
+            self.start_powerup_timer('invincible', 4 * FPS)
+            print("Speed boost ended! 4 seconds of invincibility granted!")
+        elif effect == 'invincible':
+            self.invincible = False
+            print("Invincible effect ended!")
+        elif effect == 'double_points':
+            self.double_points = False
+            print("Double_Points effect ended!")
+
+        if effect != 'invincible':  # Don't print for invincible since we handle it above
+            print(f"{effect.title()} effect ended!")
+
+    def end_recovery(self):
+        self.recovering = False
 
     def load_high_score(self):
-        """Load high score from file"""
-        try:
-            with open('high_score.txt', 'r') as f:
-                return int(f.read().strip())
-        except (FileNotFoundError, ValueError):
+        """Load the best score from the leaderboard, carrying over an old high_score.txt"""
+        if self.scores is None:
             return 0
-
-    def save_high_score(self):
-        """Save high score to file"""
-        try:
-            with open('high_score.txt', 'w') as f:
-                f.write(str(self.high_score))
-        except Exception as e:
-            print(f"Could not save high score: {e}")
+        if not self.scores.top(LEADERBOARD):
+            try:
+                with open('high_score.txt', 'r') as f:
+                    self.scores.submit(LEADERBOARD, int(f.read().strip()))
+            except (FileNotFoundError, ValueError):
+                pass
+        return self.scores.best(LEADERBOARD)
+
+    def end_run(self):
+        """Game over: the run's score goes to the leaderboard, written in the background"""
+        self.game_over = True
+        if self.scores:
+            self.scores.submit(LEADERBOARD, self.score)
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -1709,7 +1449,7 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if self.game_over:
-                        self.__init__()
+                        self.reset()
                     elif not self.game_started:
                         self.game_started = True
                         self.bird.flap()
@@ -1722,8 +1462,8 @@ class Game:
 
     def update(self):
         if not self.game_over and self.game_started:
-            # Update powerup timers
-            self.update_powerup_timers()
+            # Fire any timed effects due this frame
+            self.timers.advance()
 
             # Apply powerup effects to bird
             current_pipe_speed = self.get_pipe_speed()
@@ -1766,18 +1506,18 @@ class Game:
                         score_sound.play()
 
             # Check for collisions (only if not invincible)
-            current_time = pygame.time.get_ticks()
             collision_detected = False
 
             # Only check collisions if enough time has passed since last collision
-            if not self.invincible and (current_time - self.last_collision_time) > 500:  # 500ms delay
+            if not self.invincible and not self.recovering:
                 # Check boundary collisions first
                 if self.bird.y <= 0 or self.bird.y >= SCREEN_HEIGHT - BIRD_SIZE:
                     self.lives -= 1
                     collision_detected = True
-                    self.last_collision_time = current_time
+                    self.recovering = True
+                    self.timers.schedule(COLLISION_COOLDOWN, self.end_recovery)
                     if self.lives <= 0:
-                        self.game_over = True
+                        self.end_run()
                     else:
                         # Reset bird position and velocity
                         self.bird.x = 100
@@ -1793,9 +1533,10 @@ class Game:
                         if bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect):
                             self.lives -= 1
                             collision_detected = True
-                            self.last_collision_time = current_time
+                            self.recovering = True
+                            self.timers.schedule(COLLISION_COOLDOWN, self.end_recovery)
                             if self.lives <= 0:
-                                self.game_over = True
+                                self.end_run()
                             else:
                                 # Reset bird position and velocity
                                 self.bird.x = 100
@@ -1816,146 +1557,10 @@ class Game:
 
         if self.score > self.high_score:
             self.high_score = self.score
-            self.save_high_score()
 
     def draw(self):
         self.background.draw(screen)
 
-        # Draw ground based on theme
-        if self.background.current_theme == "city":
-            pygame.draw.rect(screen, DARK_GRAY, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-        elif self.background.current_theme == "forest":
-            pygame.draw.rect(screen, BROWN, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Add grass
-            for i in range(0, SCREEN_WIDTH, 20):
-                pygame.draw.line(screen, DARK_GREEN, (i, SCREEN_HEIGHT - 100), (i + 10, SCREEN_HEIGHT - 100), 3)
-        elif self.background.current_theme == "mountains":
-            pygame.draw.rect(screen, DARK_GRAY, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-        elif self.background.current_theme == "desert":
-            pygame.draw.rect(screen, GOLD, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-        elif self.background.current_theme == "space":
-            pygame.draw.rect(screen, DARK_BLUE, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-        elif self.background.current_theme == "ocean":
-            pygame.draw.rect(screen, DARK_BLUE, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw water gradient
-            for y in range(SCREEN_HEIGHT - 100, SCREEN_HEIGHT):
-                color_ratio = (SCREEN_HEIGHT - y) / (SCREEN_HEIGHT - (SCREEN_HEIGHT - 100))
-                r = int(135 + (100 - 135) * color_ratio)
-                g = int(206 + (150 - 206) * color_ratio)
-                b = int(235 + (200 - 235) * color_ratio)
-                pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-        elif self.background.current_theme == "sunset":
-            pygame.draw.rect(screen, DARK_GRAY, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw sky gradient
-            for y in range(SCREEN_HEIGHT - 100):
-                color_ratio = y / (SCREEN_HEIGHT - 100)
-                r = int(135 + (255 - 135) * color_ratio)
-                g = int(206 + (200 - 206) * color_ratio)
-                b = int(235 + (100 - 235) * color_ratio)
-                pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-
-            # Draw mountains
-            for mountain in self.background.mountains:
-                points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                         (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                         (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-                pygame.draw.polygon(screen, mountain['color'], points)
-                pygame.draw.polygon(screen, BLACK, points, 2)
-
-            # Draw clouds
-            for cloud in self.background.clouds:
-                pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-        elif self.background.current_theme == "winter":
-            pygame.draw.rect(screen, WHITE, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw snowflakes
-            for snowflake in self.background.snowflakes:
-                pygame.draw.circle(screen, WHITE, (snowflake['x'], snowflake['y']), snowflake['size'])
-
-            # Draw mountains
-            for mountain in self.background.mountains:
-                points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                         (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                         (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-                pygame.draw.polygon(screen, mountain['color'], points)
-                pygame.draw.polygon(screen, BLACK, points, 2)
-
-            # Draw clouds
-            for cloud in self.background.clouds:
-                pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-        elif self.background.current_theme == "volcano":
-            pygame.draw.rect(screen, RED, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw lava particles
-            for lava_particle in self.background.lava_particles:
-                pygame.draw.circle(screen, lava_particle['color'], (lava_particle['x'], lava_particle['y']), lava_particle['size'])
-
-            # Draw mountains
-            for mountain in self.background.mountains:
-                points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                         (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                         (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-                pygame.draw.polygon(screen, mountain['color'], points)
-                pygame.draw.polygon(screen, BLACK, points, 2)
-
-            # Draw clouds
-            for cloud in self.background.clouds:
-                pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-        elif self.background.current_theme == "neon_city":
-            pygame.draw.rect(screen, DARK_BLUE, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw neon lights
-            for neon_light in self.background.neon_lights:
-                pygame.draw.circle(screen, neon_light['color'], (neon_light['x'], neon_light['y']), neon_light['size'])
-
-            # Draw buildings
-            for building in self.background.buildings:
-                pygame.draw.rect(screen, building['color'],
-                               (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                                60, building['height']))
-                pygame.draw.rect(screen, BLACK,
-                               (building['x'], SCREEN_HEIGHT - 100 - building['height'],
-                                60, building['height']), 2)
-
-                # Windows
-                for window_y in range(building['height'] - 20, 0, 30):
-                    for window_x in range(10, 50, 15):
-                        if random.random() > 0.3:  # Some windows lit
-                            pygame.draw.rect(screen, YELLOW,
-                                           (building['x'] + window_x,
-                                            SCREEN_HEIGHT - 100 - building['height'] + window_y,
-                                            8, 8))
-
-            # Draw clouds
-            for cloud in self.background.clouds:
-                pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
-        elif self.background.current_theme == "candy_land":
-            pygame.draw.rect(screen, PURPLE, (0, SCREEN_HEIGHT - 100, SCREEN_WIDTH, 100))
-            # Draw candy elements
-            for candy_element in self.background.candy_elements:
-                if candy_element['type'] == 'heart':
-                    pygame.draw.circle(screen, candy_element['color'], (candy_element['x'], candy_element['y']), candy_element['size'])
-                elif candy_element['type'] == 'star':
-                    pygame.draw.circle(screen, candy_element['color'], (candy_element['x'], candy_element['y']), candy_element['size'])
-                elif candy_element['type'] == 'diamond':
-                    pygame.draw.rect(screen, candy_element['color'], (candy_element['x'], candy_element['y'], candy_element['size'], candy_element['size']))
-                elif candy_element['type'] == 'candy_cane':
-                    pygame.draw.line(screen, candy_element['color'], (candy_element['x'], candy_element['y']), (candy_element['x'] + candy_element['size'], candy_element['y'] + candy_element['size']), 3)
-
-            # Draw mountains
-            for mountain in self.background.mountains:
-                points = [(mountain['x'], SCREEN_HEIGHT - 100),
-                         (mountain['x'] + 75, SCREEN_HEIGHT - 100 - mountain['height']),
-                         (mountain['x'] + 150, SCREEN_HEIGHT - 100)]
-                pygame.draw.polygon(screen, mountain['color'], points)
-                pygame.draw.polygon(screen, BLACK, points, 2)
-
-            # Draw clouds
-            for cloud in self.background.clouds:
-                pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-
         for pipe in self.pipes:
             pipe.draw(screen, self.background.current_theme)
 
@@ -1991,8 +1596,8 @@ class Game:
 
         # Draw active powerup effects
         effect_y = 70
-        for effect, end_time in self.powerup_timers.items():
-            remaining_time = max(0, (end_time - pygame.time.get_ticks()) / 1000)
+        for effect, timer in self.powerup_timers.items():
+            remaining_time = self.timers.remaining(timer) / FPS
             if remaining_time > 0:
                 effect_symbols = {
                     'speed': '⚡',
@@ -2010,16 +1615,11 @@ class Game:
         if self.invincible:
             # Create a pulsing shield effect
             shield_alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.01))
-            shield_surface = pygame.Surface((BIRD_SIZE + 20, BIRD_SIZE + 20), pygame.SRCALPHA)
-            shield_surface.set_alpha(shield_alpha)
-            pygame.draw.circle(shield_surface, YELLOW, (BIRD_SIZE//2 + 10, BIRD_SIZE//2 + 10), BIRD_SIZE//2 + 15, 3)
-            screen.blit(shield_surface, (self.bird.x - 10, self.bird.y - 10))
+            self.shield_surface.set_alpha(shield_alpha)
+            screen.blit(self.shield_surface, (self.bird.x - 10, self.bird.y - 10))
 
         if not self.game_started and not self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            screen.blit(self.start_overlay, (0, 0))
 
             title_text = self.font.render("FLAPPY ADVENTURE", True, YELLOW)
             screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, SCREEN_HEIGHT // 2 - 120))
@@ -2037,10 +1637,7 @@ class Game:
             self.bird.draw(screen)
 
         elif self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            screen.blit(self.game_over_overlay, (0, 0))
 
             game_over_text = self.font.render("GAME OVER", True, RED)
             restart_text = self.medium_font.render("Press SPACE to restart", True, WHITE)
@@ -2060,15 +1657,20 @@ class Game:
         pygame.display.flip()
 
 def main():
-    game = Game()
+    scores = ScoreStore()
+    game = Game(scores)
     running = True
 
     while running:
         running = game.handle_events()
         game.update()
         game.draw()
-        clock.tick(60)
+        clock.tick(FPS)
 
+    # A run still in progress counts too
+    if game.game_started and not game.game_over:
+        game.end_run()
+    scores.close()
     pygame.quit()
     sys.exit()
 
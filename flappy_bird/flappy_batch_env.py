@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Flappy Bird Batch Environment
+Headless, NumPy-vectorized copy of the Flappy Bird rules for training autopilot bots.
+
+Each lane is an independent game with its own bird and pipe sequence. The physics
+mirrors Game.update() in flappy_bird.py / flappy_bird_enhanced.py step for step,
+and any lane can be drawn with the real Game.draw() code.
+
+    env = FlappyBatchEnv(4096, seed=0)
+    obs = env.reset()
+    obs, rewards, dones, info = env.step(actions)
+"""
+
+import os
+import sys
+import time
+import argparse
+import importlib
+import numpy as np
+
+BIRD_X = 100
+PIPES_PER_LANE = 3
+PIPE_SPACING = 300
+OBSERVATION_SIZE = 6
+
+
+class FlappyBatchEnv:
+    """N independent Flappy Bird games stepped together as arrays.
+
+    Observations are float32 rows of (bird y, bird velocity, next pipe x offset,
+    next pipe gap y, following pipe x offset, following pipe gap y), in pixels.
+    The reward is the number of pipes passed this step, or -1 on a crash.
+    Finished lanes are reset automatically and their final score reported in
+    info["episode_scores"].
+    """
+
+    def __init__(self, num_envs, variant="flappy_bird_enhanced", seed=None, render_mode=None):
+        # The game modules open a window and the mixer on import, so stay on SDL's
+        # dummy drivers unless a lane is going to be watched
+        if render_mode != "human":
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        self.game_module = importlib.import_module(variant)
+        self.render_mode = render_mode
+        self.game = None
+
+        # Physics constants come straight from the game being mirrored
+        module = self.game_module
+        self.gravity = module.GRAVITY
+        self.flap_strength = module.FLAP_STRENGTH
+        self.pipe_speed = module.PIPE_SPEED
+        self.pipe_gap = module.PIPE_GAP
+        self.pipe_width = module.PIPE_WIDTH
+        self.bird_size = module.BIRD_SIZE
+        self.screen_width = module.SCREEN_WIDTH
+        self.screen_height = module.SCREEN_HEIGHT
+
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+        self.bird_y = np.zeros(num_envs)
+        self.velocity = np.zeros(num_envs)
+        self.rotation = np.zeros(num_envs)
+        self.pipe_x = np.zeros((num_envs, PIPES_PER_LANE), dtype=np.int64)
+        self.gap_y = np.zeros((num_envs, PIPES_PER_LANE), dtype=np.int64)
+        self.passed = np.zeros((num_envs, PIPES_PER_LANE), dtype=bool)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.lane_index = np.arange(num_envs)
+
+    def random_gaps(self, count):
+        # Same range as Pipe.__init__: random.randint(150, SCREEN_HEIGHT - 150)
+        return self.rng.integers(150, self.screen_height - 150, size=count, endpoint=True)
+
+    def reset_lanes(self, lanes):
+        self.bird_y[lanes] = self.screen_height // 2
+        self.velocity[lanes] = 0
+        self.rotation[lanes] = 0
+        self.pipe_x[lanes] = self.screen_width + np.arange(PIPES_PER_LANE) * PIPE_SPACING
+        self.gap_y[lanes] = self.random_gaps(len(lanes) * PIPES_PER_LANE).reshape(len(lanes), PIPES_PER_LANE)
+        self.passed[lanes] = False
+        self.score[lanes] = 0
+
+    def reset(self):
+        self.reset_lanes(self.lane_index)
+        return self.observe()
+
+    def observe(self):
+        # The next two pipes whose right edge is still ahead of the bird
+        ahead = np.where(self.pipe_x + self.pipe_width > BIRD_X, self.pipe_x, np.iinfo(np.int64).max)
+        order = np.argsort(ahead, axis=1)
+        lanes = self.lane_index[:, None]
+        next_x = self.pipe_x[lanes, order[:, :2]]
+        next_gap = self.gap_y[lanes, order[:, :2]]
+        obs = np.empty((self.num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        obs[:, 0] = self.bird_y
+        obs[:, 1] = self.velocity
+        obs[:, 2] = next_x[:, 0] - BIRD_X
+        obs[:, 3] = next_gap[:, 0]
+        obs[:, 4] = next_x[:, 1] - BIRD_X
+        obs[:, 5] = next_gap[:, 1]
+        return obs
+
+    def step(self, actions):
+        """Advance every lane one frame; a truthy action flaps before the physics update"""
+        flaps = np.asarray(actions, dtype=bool)
+
+        # Bird.flap() then Bird.update()
+        self.velocity[flaps] = self.flap_strength
+        self.rotation[flaps] = -30
+        self.velocity += self.gravity
+        self.bird_y += self.velocity
+        self.rotation = np.where(self.velocity < 0, -30, np.minimum(90, self.rotation + 5))
+
+        # Pipe.update(), then pipes at x <= -PIPE_WIDTH are replaced by a new one off screen
+        self.pipe_x -= self.pipe_speed
+        gone = self.pipe_x <= -self.pipe_width
+        if gone.any():
+            self.pipe_x[gone] = self.screen_width + PIPE_SPACING
+            self.gap_y[gone] = self.random_gaps(int(gone.sum()))
+            self.passed[gone] = False
+
+        # Ground/ceiling and pipe collisions, using the same Rect overlap test as colliderect
+        # (Rect rounds the bird's float y to the nearest pixel)
+        bird_top = np.floor(self.bird_y + 0.5).astype(np.int64)[:, None]
+        bird_bottom = bird_top + self.bird_size
+        overlap_x = (self.pipe_x < BIRD_X + self.bird_size) & (BIRD_X < self.pipe_x + self.pipe_width)
+        top_height = self.gap_y - self.pipe_gap // 2
+        bottom_y = self.gap_y + self.pipe_gap // 2
+        hits_top = (top_height > 0) & (bird_top < top_height)
+        hits_bottom = (bottom_y < self.screen_height) & (bird_bottom > bottom_y)
+        crashed = ((self.bird_y <= 0) | (self.bird_y >= self.screen_height - self.bird_size) |
+                   (overlap_x & (hits_top | hits_bottom)).any(axis=1))
+
+        # Scoring
+        newly_passed = ~self.passed & (self.pipe_x < BIRD_X)
+        self.passed |= newly_passed
+        points = newly_passed.sum(axis=1)
+        self.score += points
+
+        rewards = np.where(crashed, -1.0, points.astype(np.float64))
+        episode_scores = np.where(crashed, self.score, 0)
+        if crashed.any():
+            self.reset_lanes(self.lane_index[crashed])
+        return self.observe(), rewards, crashed, {"episode_scores": episode_scores}
+
+    def render(self, lane=0):
+        """Draw one lane with the game's own Game.draw() and return the frame as an RGB array"""
+        module = self.game_module
+        if self.game is None:
+            self.game = module.Game()
+        game = self.game
+        game.bird.y = self.bird_y[lane]
+        game.bird.velocity = self.velocity[lane]
+        game.bird.rect.y = self.bird_y[lane]
+        game.bird.rotation = self.rotation[lane]
+        game.pipes = []
+        for x, gap_y, passed in zip(self.pipe_x[lane], self.gap_y[lane], self.passed[lane]):
+            pipe = module.Pipe(int(x))
+            pipe.gap_y = int(gap_y)
+            pipe.top_height = pipe.gap_y - self.pipe_gap // 2
+            pipe.bottom_height = self.screen_height - (pipe.gap_y + self.pipe_gap // 2)
+            pipe.passed = bool(passed)
+            game.pipes.append(pipe)
+        game.pipes.sort(key=lambda pipe: pipe.x)
+        game.score = int(self.score[lane])
+        game.game_over = False
+        game.draw()
+        return np.transpose(module.pygame.surfarray.array3d(module.screen), (1, 0, 2))
+
+
+def autopilot(obs):
+    """Reference bot: flap whenever the bird has sunk below the middle of the next gap"""
+    return (obs[:, 0] > obs[:, 3] + 20) & (obs[:, 1] >= 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark or watch the batch Flappy Bird environment")
+    parser.add_argument("--envs", type=int, default=4096, help="number of lanes to simulate")
+    parser.add_argument("--steps", type=int, default=1000, help="steps to run")
+    parser.add_argument("--variant", default="flappy_bird_enhanced", choices=["flappy_bird", "flappy_bird_enhanced"])
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--watch", action="store_true", help="draw lane 0 in a window at 60 FPS")
+    args = parser.parse_args()
+
+    env = FlappyBatchEnv(args.envs, args.variant, args.seed, "human" if args.watch else None)
+    obs = env.reset()
+    finished = []
+    start_time = time.perf_counter()
+    for _ in range(args.steps):
+        obs, rewards, dones, info = env.step(autopilot(obs))
+        finished.extend(info["episode_scores"][dones].tolist())
+        if args.watch:
+            for event in env.game_module.pygame.event.get():
+                if event.type == env.game_module.pygame.QUIT:
+                    return
+            env.render(0)
+            env.game_module.clock.tick(60)
+    elapsed = time.perf_counter() - start_time
+
+    total_steps = args.envs * args.steps
+    print(f"{total_steps:,} environment steps in {elapsed:.2f}s ({total_steps / elapsed * 60:,.0f} steps/minute)")
+    if finished:
+        print(f"{len(finished)} episodes finished, mean score {np.mean(finished):.1f}, best {max(finished)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ BLUE = (135, 206, 235)
 YELLOW = (255, 255, 0)
 RED = (255, 0, 0)
 GRAY = (128, 128, 128)
+ORANGE = (255, 165, 0)
 
 # Set up the display
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -184,6 +185,4 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
-    # Define ORANGE color that was missing
-    ORANGE = (255, 165, 0)
     main() 
\ No newline at end of file
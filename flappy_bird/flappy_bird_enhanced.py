@@ -2,7 +2,19 @@ import pygame
 import random
 import sys
 import math
+import os
+import time
+import struct
+import argparse
+import itertools
 from pygame import mixer
+from flappy_race import RaceClient, LinkConditions, add_link_arguments, parse_address
+
+# The leaderboard store, texture renderer and render scale are shared by every game in the collection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from score_store import ScoreStore
+from texture_renderer import TextureRenderer
+from render_scale import ScaledDisplay, render_scale
 
 # Initialize Pygame
 pygame.init()
@@ -17,6 +29,11 @@ PIPE_SPEED = 4
 PIPE_GAP = 180
 PIPE_WIDTH = 80
 BIRD_SIZE = 25
+FPS = 60
+LEADERBOARD = "flappy_bird"  # This game's name in the shared score store
+RUN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runs")  # Logs of leaderboard runs, for flappy_verify.py
+RUN_LOG_MAGIC = b"FBR1"
+RUN_NUMBERS = itertools.count(1)  # Numbers this session's run logs, so same-second runs never share a file name
 
 # Colors
 WHITE = (255, 255, 255)
@@ -35,6 +52,69 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Flappy Bird Enhanced")
 clock = pygame.time.Clock()
 
+# Sprite painters, shared by the surface renderer and the texture renderer's one-off uploads.
+# The background painters take window coordinates; scale maps them onto a render-scaled surface (see render_scale.py)
+def paint_sky(surface, scale=1.0):
+    height = int((SCREEN_HEIGHT - 50) * scale)
+    for y in range(height):
+        color_ratio = y / height
+        r = int(135 + (200 - 135) * color_ratio)
+        g = int(206 + (230 - 206) * color_ratio)
+        b = int(235 + (255 - 235) * color_ratio)
+        pygame.draw.line(surface, (r, g, b), (0, y), (int(SCREEN_WIDTH * scale), y))
+
+def paint_cloud(surface, x, y, size, scale=1.0):
+    x, y = x * scale, int(y * scale)
+    pygame.draw.circle(surface, WHITE, (int(x), y), int(size * scale))
+    pygame.draw.circle(surface, WHITE, (int(x + size//2 * scale), y), int(size//2 * scale))
+    pygame.draw.circle(surface, WHITE, (int(x - size//2 * scale), y), int(size//2 * scale))
+
+def paint_ground(surface, top, scale=1.0):
+    bottom = int((top + 50) * scale)
+    top = int(top * scale)
+    pygame.draw.rect(surface, BROWN, (0, top, int(SCREEN_WIDTH * scale), bottom - top))
+    for i in range(0, SCREEN_WIDTH, 20):
+        pygame.draw.line(surface, DARK_GREEN, (int(i * scale), top), (int((i + 10) * scale), top), max(1, int(3 * scale)))
+
+def paint_bird():
+    bird_surface = pygame.Surface((BIRD_SIZE, BIRD_SIZE), pygame.SRCALPHA)
+    
+    # Draw bird body
+    pygame.draw.circle(bird_surface, YELLOW, (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2)
+    pygame.draw.circle(bird_surface, BLACK, (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2, 2)
+    
+    # Draw bird eye
+    pygame.draw.circle(bird_surface, BLACK, (BIRD_SIZE//2 + 5, BIRD_SIZE//2 - 5), 3)
+    pygame.draw.circle(bird_surface, WHITE, (BIRD_SIZE//2 + 6, BIRD_SIZE//2 - 6), 1)
+    
+    # Draw bird wing
+    pygame.draw.ellipse(bird_surface, ORANGE, (BIRD_SIZE//2 - 15, BIRD_SIZE//2 + 5, 15, 10))
+    
+    # Draw bird beak
+    pygame.draw.polygon(bird_surface, ORANGE, [(BIRD_SIZE//2 + 10, BIRD_SIZE//2), 
+                                              (BIRD_SIZE//2 + 20, BIRD_SIZE//2 - 3),
+                                              (BIRD_SIZE//2 + 20, BIRD_SIZE//2 + 3)])
+    return bird_surface
+
+def paint_pipe_body():
+    # A full-height pipe with its border; each pipe copies the top or bottom part it needs,
+    # and the caps cover the border at its open end, as in Pipe.draw()
+    body = pygame.Surface((PIPE_WIDTH, SCREEN_HEIGHT))
+    body.fill(DARK_GREEN)
+    pygame.draw.rect(body, BLACK, (0, 0, PIPE_WIDTH, SCREEN_HEIGHT), 3)
+    return body
+
+def paint_pipe_cap():
+    cap = pygame.Surface((PIPE_WIDTH + 10, 20))
+    cap.fill(GREEN)
+    pygame.draw.rect(cap, BLACK, (0, 0, PIPE_WIDTH + 10, 20), 3)
+    return cap
+
+def paint_dot(size, color):
+    dot = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(dot, color, (size, size), size)
+    return dot
+
 class Particle:
     def __init__(self, x, y, color):
         self.x = x
@@ -51,12 +131,18 @@ class Particle:
         self.vy += 0.2
         self.life -= 1
         
-    def draw(self, screen):
+    def draw(self, screen, scale=1.0):
         alpha = int(255 * (self.life / self.max_life))
         color = (*self.color, alpha)
         size = int(3 * (self.life / self.max_life))
         if size > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+            pygame.draw.circle(screen, self.color, (int(self.x * scale), int(self.y * scale)), max(1, int(size * scale)))
+            
+    def draw_textured(self, textures):
+        size = int(3 * (self.life / self.max_life))
+        if size > 0:
+            dot = textures.sprite(("dot", size, self.color), lambda: paint_dot(size, self.color))
+            textures.copy(dot, (int(self.x) - size, int(self.y) - size))
 
 class Bird:
     def __init__(self, x, y):
@@ -90,42 +176,34 @@ class Bird:
         for particle in self.particles:
             particle.update()
         
-    def draw(self, screen):
-        # Draw particles
+    def draw_effects(self, screen, scale=1.0):
+        # Draw particles, on the render-scaled layer under the pipes
         for particle in self.particles:
-            particle.draw(screen)
+            particle.draw(screen, scale)
             
+    def draw(self, screen):
         # Create a surface for the bird to rotate
-        bird_surface = pygame.Surface((BIRD_SIZE, BIRD_SIZE), pygame.SRCALPHA)
-        
-        # Draw bird body
-        pygame.draw.circle(bird_surface, YELLOW, (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2)
-        pygame.draw.circle(bird_surface, BLACK, (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2, 2)
-        
-        # Draw bird eye
-        pygame.draw.circle(bird_surface, BLACK, (BIRD_SIZE//2 + 5, BIRD_SIZE//2 - 5), 3)
-        pygame.draw.circle(bird_surface, WHITE, (BIRD_SIZE//2 + 6, BIRD_SIZE//2 - 6), 1)
-        
-        # Draw bird wing
-        pygame.draw.ellipse(bird_surface, ORANGE, (BIRD_SIZE//2 - 15, BIRD_SIZE//2 + 5, 15, 10))
-        
-        # Draw bird beak
-        pygame.draw.polygon(bird_surface, ORANGE, [(BIRD_SIZE//2 + 10, BIRD_SIZE//2), 
-                                                  (BIRD_SIZE//2 + 20, BIRD_SIZE//2 - 3),
-                                                  (BIRD_SIZE//2 + 20, BIRD_SIZE//2 + 3)])
+        bird_surface = paint_bird()
         
         # Rotate the bird surface
         rotated_surface = pygame.transform.rotate(bird_surface, self.rotation)
         screen.blit(rotated_surface, (self.x - rotated_surface.get_width()//2 + BIRD_SIZE//2, 
                                      self.y - rotated_surface.get_height()//2 + BIRD_SIZE//2))
         
+    def draw_textured(self, textures):
+        for particle in self.particles:
+            particle.draw_textured(textures)
+            
+        # SDL rotates clockwise about the sprite's centre, pygame.transform.rotate counterclockwise
+        textures.copy(textures.sprite("bird", paint_bird), (self.x, self.y), angle=-self.rotation)
+        
     def get_rect(self):
         return self.rect
 
 class Pipe:
-    def __init__(self, x):
+    def __init__(self, x, rng=random):
         self.x = x
-        self.gap_y = random.randint(150, SCREEN_HEIGHT - 150)
+        self.gap_y = rng.randint(150, SCREEN_HEIGHT - 150)
         self.top_height = self.gap_y - PIPE_GAP // 2
         self.bottom_height = SCREEN_HEIGHT - (self.gap_y + PIPE_GAP // 2)
         self.passed = False
@@ -151,6 +229,15 @@ class Pipe:
         pygame.draw.rect(screen, GREEN, (self.x - 5, bottom_y, PIPE_WIDTH + 10, 20))
         pygame.draw.rect(screen, BLACK, (self.x - 5, bottom_y, PIPE_WIDTH + 10, 20), 3)
         
+    def draw_textured(self, textures):
+        body = textures.sprite("pipe_body", paint_pipe_body)
+        cap = textures.sprite("pipe_cap", paint_pipe_cap)
+        bottom_y = self.gap_y + PIPE_GAP // 2
+        textures.copy(body, (self.x, 0), area=(0, 0, PIPE_WIDTH, self.top_height))
+        textures.copy(cap, (self.x - 5, self.top_height - 20))
+        textures.copy(body, (self.x, bottom_y), area=(0, SCREEN_HEIGHT - self.bottom_height, PIPE_WIDTH, self.bottom_height))
+        textures.copy(cap, (self.x - 5, bottom_y))
+        
     def get_rects(self):
         top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.top_height)
         bottom_rect = pygame.Rect(self.x, self.gap_y + PIPE_GAP // 2, PIPE_WIDTH, self.bottom_height)
@@ -173,28 +260,84 @@ class Background:
                 cloud['x'] = SCREEN_WIDTH + 100
                 cloud['y'] = random.randint(50, 200)
                 
-    def draw(self, screen):
+    def draw(self, screen, scale=1.0):
         # Sky gradient
-        for y in range(SCREEN_HEIGHT - 50):
-            color_ratio = y / (SCREEN_HEIGHT - 50)
-            r = int(135 + (200 - 135) * color_ratio)
-            g = int(206 + (230 - 206) * color_ratio)
-            b = int(235 + (255 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        paint_sky(screen, scale)
             
         # Draw clouds
         for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (cloud['x'], cloud['y']), cloud['size'])
-            pygame.draw.circle(screen, WHITE, (cloud['x'] + cloud['size']//2, cloud['y']), cloud['size']//2)
-            pygame.draw.circle(screen, WHITE, (cloud['x'] - cloud['size']//2, cloud['y']), cloud['size']//2)
+            paint_cloud(screen, cloud['x'], cloud['y'], cloud['size'], scale)
+            
+    def draw_textured(self, textures):
+        textures.copy(textures.sprite("sky", self.bake_sky), (0, 0))
+        for cloud in self.clouds:
+            size = cloud['size']
+            texture = textures.sprite(("cloud", size), lambda: self.bake_cloud(size))
+            textures.copy(texture, (cloud['x'] - size, cloud['y'] - size))
+            
+    @staticmethod
+    def bake_sky():
+        sky = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - 50))
+        paint_sky(sky)
+        return sky
+        
+    @staticmethod
+    def bake_cloud(size):
+        cloud = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+        paint_cloud(cloud, size, size, size)
+        return cloud
+
+class RunLog:
+    """A recorded run: pipe seed, claimed score and one flap byte per simulated frame"""
+    HEADER = struct.Struct("<4sQII")  # magic, seed, claimed score, frame count
+    
+    def __init__(self, seed, inputs=None, score=0):
+        self.seed = seed
+        self.inputs = inputs if inputs is not None else bytearray()
+        self.score = score
+        
+    def to_bytes(self):
+        return self.HEADER.pack(RUN_LOG_MAGIC, self.seed, self.score, len(self.inputs)) + bytes(self.inputs)
+        
+    def save(self, path):
+        with open(path, "wb") as log_file:
+            log_file.write(self.to_bytes())
+            
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as log_file:
+            magic, seed, score, frames = cls.HEADER.unpack(log_file.read(cls.HEADER.size))
+            if magic != RUN_LOG_MAGIC:
+                raise ValueError(f"{path} is not a Flappy Bird run log")
+            inputs = bytearray(log_file.read(frames))
+        if len(inputs) != frames:
+            raise ValueError(f"{path} is truncated")
+        return cls(seed, inputs, score)
 
 class Game:
-    def __init__(self):
+    def __init__(self, scores=None, race=None, seed=None, textures=None, display=None):
+        self.textures = textures  # TextureRenderer to draw with, or None for the display surface
+        self.display = display  # ScaledDisplay for the background and effects, or None to draw them at full size
         self.bird = Bird(100, SCREEN_HEIGHT // 2)
         self.pipes = []
         self.background = Background()
         self.score = 0
-        self.high_score = 0
+        self.frame = 0
+        
+        # In a ghost race every run flies the server's pipe sequence
+        self.race = race
+        if race:
+            race.start_run()
+            seed = race.seed
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.pipe_rng = random.Random(seed)
+        
+        # Every run is recorded so a leaderboard score can be replayed and checked
+        self.run_log = RunLog(seed)
+        self.flapped = 0
+        self.scores = scores  # Shared ScoreStore, or None to keep no scores between games
+        self.high_score = scores.best(LEADERBOARD) if scores else 0
         self.game_over = False
         self.font = pygame.font.Font(None, 74)
         self.small_font = pygame.font.Font(None, 36)
@@ -202,7 +345,18 @@ class Game:
         
         # Add initial pipes
         for i in range(3):
-            self.pipes.append(Pipe(SCREEN_WIDTH + i * 300))
+            self.pipes.append(Pipe(SCREEN_WIDTH + i * 300, self.pipe_rng))
+        
+        self.ghost_surface = pygame.Surface((BIRD_SIZE, BIRD_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(self.ghost_surface, (255, 255, 255, 110), (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2)
+        pygame.draw.circle(self.ghost_surface, (0, 0, 0, 110), (BIRD_SIZE//2, BIRD_SIZE//2), BIRD_SIZE//2, 2)
+            
+    def flap(self):
+        self.bird.flap()
+        self.flapped = 1
+        # The flap happens before the next frame's update
+        if self.race:
+            self.race.flap(self.frame + 1)
             
     def handle_events(self):
         for event in pygame.event.get():
@@ -211,13 +365,16 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     if self.game_over:
-                        self.__init__()  # Reset game
+                        self.__init__(self.scores, self.race, textures=self.textures, display=self.display)  # Reset game
                     else:
-                        self.bird.flap()
+                        self.flap()
         return True
         
     def update(self):
         if not self.game_over:
+            self.frame += 1
+            self.run_log.inputs.append(self.flapped)
+            self.flapped = 0
             self.bird.update()
             self.background.update()
             
@@ -230,7 +387,7 @@ class Game:
             
             # Add new pipes
             if len(self.pipes) < 3:
-                self.pipes.append(Pipe(SCREEN_WIDTH + 300))
+                self.pipes.append(Pipe(SCREEN_WIDTH + 300, self.pipe_rng))
                 
             # Check collisions
             bird_rect = self.bird.get_rect()
@@ -251,23 +408,54 @@ class Game:
                     pipe.passed = True
                     self.score += 1
                     
+            # The finished run goes to the leaderboard, and a leaderboard run's log to RUN_DIR; the
+            # store's writer thread does both, so the crash frame never touches the disk
+            if self.game_over and self.scores:
+                self.run_log.score = self.score
+                if self.scores.submit(LEADERBOARD, self.score) is not None:
+                    name = f"{time.strftime('%Y%m%d_%H%M%S')}_{self.score}_{self.run_log.seed:x}_{next(RUN_NUMBERS)}.fbr"
+                    self.scores.write_file(os.path.join(RUN_DIR, name), self.run_log.to_bytes())
+                    
         # Update high score
         if self.score > self.high_score:
             self.high_score = self.score
+            
+        # Send this frame's flaps and pick up the other racers, even on the game over screen
+        if self.race:
+            self.race.update(self.frame, self.bird.y)
                     
     def draw(self):
+        if self.textures:
+            self.draw_textured(self.textures)
+            return
+            
+        # The background, ground and particles can be drawn below window resolution, then upscaled in one blit
+        world, scale = (self.display.surface, self.display.scale) if self.display else (screen, 1.0)
+        
         # Draw background
-        self.background.draw(screen)
+        self.background.draw(world, scale)
         
         # Draw ground with grass texture
-        pygame.draw.rect(screen, BROWN, (0, SCREEN_HEIGHT - 50, SCREEN_WIDTH, 50))
-        for i in range(0, SCREEN_WIDTH, 20):
-            pygame.draw.line(screen, DARK_GREEN, (i, SCREEN_HEIGHT - 50), (i + 10, SCREEN_HEIGHT - 50), 3)
+        paint_ground(world, SCREEN_HEIGHT - 50, scale)
+        
+        self.bird.draw_effects(world, scale)
+        if self.display:
+            self.display.present()
         
         # Draw pipes
         for pipe in self.pipes:
             pipe.draw(screen)
             
+        # Draw the other racers as ghosts, ahead or behind by how far along the course they are
+        if self.race:
+            for player_id, frame, y, score, alive in self.race.ghosts():
+                x = self.bird.x + (frame - self.frame) * PIPE_SPEED
+                if -BIRD_SIZE < x < SCREEN_WIDTH:
+                    screen.blit(self.ghost_surface, (x, y))
+                    label = self.small_font.render(f"P{player_id}: {score}" if alive else f"P{player_id} X", True, WHITE)
+                    label.set_alpha(150)
+                    screen.blit(label, (x + BIRD_SIZE//2 - label.get_width()//2, y - 28))
+            
         # Draw bird
         self.bird.draw(screen)
         
@@ -298,17 +486,84 @@ class Game:
             screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
             
         pygame.display.flip()
+        
+    def draw_textured(self, textures):
+        # The same scene as draw(), as copies of textures uploaded once
+        self.background.draw_textured(textures)
+        ground = textures.sprite("ground", self.bake_ground)
+        textures.copy(ground, (0, SCREEN_HEIGHT - 51))
+        
+        for pipe in self.pipes:
+            pipe.draw_textured(textures)
+            
+        if self.race:
+            ghost = textures.sprite("ghost", lambda: self.ghost_surface)
+            for player_id, frame, y, score, alive in self.race.ghosts():
+                x = self.bird.x + (frame - self.frame) * PIPE_SPEED
+                if -BIRD_SIZE < x < SCREEN_WIDTH:
+                    textures.copy(ghost, (x, y))
+                    label = textures.text(self.small_font, f"P{player_id}: {score}" if alive else f"P{player_id} X", WHITE)
+                    textures.copy(label, (x + BIRD_SIZE//2 - label.width//2, y - 28), alpha=150)
+                    
+        self.bird.draw_textured(textures)
+        
+        score_text = textures.text(self.font, str(self.score), WHITE)
+        textures.copy(score_text, (SCREEN_WIDTH // 2 - score_text.width // 2, 50), alpha=200)
+        high_score_text = textures.text(self.small_font, f"Best: {self.high_score}", WHITE)
+        textures.copy(high_score_text, (10, 10), alpha=150)
+        
+        if self.game_over:
+            textures.fill_rect((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), (*BLACK, 128))
+            game_over_text = textures.text(self.font, "GAME OVER", RED)
+            restart_text = textures.text(self.medium_font, "Press SPACE to restart", WHITE)
+            final_score_text = textures.text(self.medium_font, f"Score: {self.score}", WHITE)
+            textures.copy(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.width // 2, SCREEN_HEIGHT // 2 - 80))
+            textures.copy(final_score_text, (SCREEN_WIDTH // 2 - final_score_text.width // 2, SCREEN_HEIGHT // 2 - 20))
+            textures.copy(restart_text, (SCREEN_WIDTH // 2 - restart_text.width // 2, SCREEN_HEIGHT // 2 + 40))
+            
+        textures.present()
+        
+    @staticmethod
+    def bake_ground():
+        # One transparent row above the ground for the half of the grass lines that overhangs the sky
+        ground = pygame.Surface((SCREEN_WIDTH, 51), pygame.SRCALPHA)
+        paint_ground(ground, 1)
+        return ground
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="Flappy Bird Enhanced")
+    parser.add_argument("--race", metavar="HOST:PORT", help="race ghost birds on a flappy_race.py server")
+    parser.add_argument("--renderer", choices=["surface", "texture"], default="surface",
+                        help="draw on the display surface, or copy GPU textures with pygame._sdl2 (default: surface)")
+    parser.add_argument("--software-renderer", action="store_true",
+                        help="with --renderer texture, use SDL's software renderer even if a GPU one is available")
+    parser.add_argument("--render-scale", type=float, default=render_scale(),
+                        help="draw the background and effects at this fraction of the window's resolution, e.g. 0.5 (default: $RENDER_SCALE or 1)")
+    add_link_arguments(parser)
+    args = parser.parse_args()
+    
+    race = None
+    if args.race:
+        host, port = parse_address(args.race)
+        race = RaceClient(host, port, LinkConditions(args.latency, args.jitter, args.loss)).connect()
+    textures = display = None
+    if args.renderer == "texture":
+        textures = TextureRenderer("Flappy Bird Enhanced", (SCREEN_WIDTH, SCREEN_HEIGHT), software=args.software_renderer)
+    else:
+        display = ScaledDisplay((SCREEN_WIDTH, SCREEN_HEIGHT), args.render_scale)
+    scores = ScoreStore()
+    game = Game(scores, race, textures=textures, display=display)
     running = True
     
     while running:
         running = game.handle_events()
         game.update()
         game.draw()
-        clock.tick(60)
+        clock.tick(FPS)
         
+    scores.close()
+    if race:
+        race.close()
     pygame.quit()
     sys.exit()
 
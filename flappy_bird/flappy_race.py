@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+"""
+Flappy Bird Ghost Race
+Asyncio UDP server and client for racing other players' ghost birds over a local network.
+
+Every player flies the same seeded pipe sequence, so only birds travel over the wire.
+Clients send their flaps tagged with the frame they happened on; the server replays
+them through its own copy of each player's game, so its bird states are authoritative
+and match the player's screen frame for frame. At a fixed tick the server sends each
+client a snapshot of everyone else, delta-compressed against the last snapshot that
+client acknowledged, and clients draw the ghosts interpolated between snapshots.
+
+    python3 flappy_race.py server --port 5999
+    python3 flappy_bird_enhanced.py --race 127.0.0.1:5999
+    python3 flappy_race.py bots --count 40 --latency 80 --loss 0.05   # load test on localhost
+"""
+
+import os
+import sys
+import time
+import heapq
+import random
+import select
+import socket
+import struct
+import asyncio
+import argparse
+from collections import Counter, deque
+
+DEFAULT_PORT = 5999
+TICK_RATE = 20  # Snapshots per second
+INPUT_RATE = 30  # Input packets per second from each client
+HISTORY = 32  # Snapshots kept for delta baselines, on both ends
+INTERP_TICKS = 2  # Ghosts are drawn this many ticks behind the newest snapshot
+PLAYER_TIMEOUT = 5.0  # Seconds of silence before the server drops a player
+HELLO_INTERVAL = 0.25
+MAX_CATCHUP = 600  # Frames the server will simulate for one input packet
+MAX_FLAPS = 255
+Y_SCALE = 4  # Bird y travels in quarter pixels
+
+# Packet kinds and fixed-size headers; everything else is varints
+HELLO = b"H"
+WELCOME = b"W"
+INPUT = b"I"
+STATE = b"S"
+BYE = b"B"
+WELCOME_HEADER = struct.Struct("<HIB")  # player id, course seed, tick rate
+INPUT_HEADER = struct.Struct("<HHIIB")  # player id, run, frame, acked tick, flap count
+FLAP_OFFSET = struct.Struct("<H")  # frame - flap frame
+MAX_FLAP_AGE = 0xFFFF  # Oldest unconfirmed flap, in frames, that FLAP_OFFSET can carry
+STATE_HEADER = struct.Struct("<IIHIh")  # tick, baseline tick (0 for none), your run, your frame, your y
+BYE_HEADER = struct.Struct("<H")
+
+# A bird's state in a snapshot; a delta entry sends only the fields that changed
+FIELDS = ("run", "frame", "y", "score", "alive")
+EMPTY_FIELDS = (0,) * len(FIELDS)
+
+
+def write_uvarint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_uvarint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def write_varint(out, value):
+    # Zigzag, so small negative deltas stay one byte
+    write_uvarint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def read_varint(data, pos):
+    value, pos = read_uvarint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def quantize_y(y):
+    return max(-32768, min(32767, round(y * Y_SCALE)))
+
+
+def encode_delta(base, snapshot):
+    """Removed player ids and per-player entry bytes that turn base into snapshot"""
+    removed = [player_id for player_id in base if player_id not in snapshot]
+    entries = {}
+    for player_id, fields in snapshot.items():
+        old = base.get(player_id, EMPTY_FIELDS)
+        if fields == old:
+            continue
+        entry = bytearray()
+        write_uvarint(entry, player_id)
+        mask = 0
+        for i, (value, old_value) in enumerate(zip(fields, old)):
+            if value != old_value:
+                mask |= 1 << i
+        entry.append(mask)
+        for value, old_value in zip(fields, old):
+            if value != old_value:
+                write_varint(entry, value - old_value)
+        entries[player_id] = bytes(entry)
+    return removed, entries
+
+
+class LinkConditions:
+    """Simulated one-way latency, jitter and packet loss for outgoing packets"""
+
+    def __init__(self, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.loss = loss
+        self.rng = random.Random(seed)
+
+    def delay(self):
+        """Seconds to hold a packet back, or None to drop it"""
+        if self.loss and self.rng.random() < self.loss:
+            return None
+        if self.jitter:
+            return max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+        return self.latency
+
+
+def add_link_arguments(parser):
+    parser.add_argument("--latency", type=float, default=0, help="simulated one-way latency of sent packets, in ms")
+    parser.add_argument("--jitter", type=float, default=0, help="random +/- variation on the latency, in ms")
+    parser.add_argument("--loss", type=float, default=0, help="fraction of sent packets to drop (0-1)")
+
+
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port or DEFAULT_PORT)
+
+
+def load_game():
+    # The game opens a window and the mixer when it is imported; the server and bots never draw
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import flappy_bird_enhanced
+    return flappy_bird_enhanced
+
+
+class RacePlayer:
+    def __init__(self, player_id, addr, game):
+        self.id = player_id
+        self.addr = addr
+        self.run = 0
+        self.game = game
+        self.ack_tick = 0
+        self.last_heard = time.monotonic()
+
+    def fields(self):
+        game = self.game
+        return (self.run, game.frame, quantize_y(game.bird.y), game.score, 0 if game.game_over else 1)
+
+
+class RaceServer(asyncio.DatagramProtocol):
+    """Authoritative ghost race server; one Game per player, replayed from their flaps"""
+
+    def __init__(self, seed, tick_rate=TICK_RATE, link=None):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.link = link or LinkConditions()
+        self.game_module = load_game()
+        self.players = {}  # address -> RacePlayer
+        self.next_id = 1
+        self.tick = 0
+        self.history = {}  # tick -> {player id: fields}
+        self.transport = None
+        self.stats = Counter()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def send(self, data, addr):
+        self.stats["packets_out"] += 1
+        self.stats["bytes_out"] += len(data)
+        delay = self.link.delay()
+        if delay is None:
+            return
+        if delay:
+            asyncio.get_running_loop().call_later(delay, self.transport.sendto, data, addr)
+        else:
+            self.transport.sendto(data, addr)
+
+    def new_game(self):
+        return self.game_module.Game(seed=self.seed)
+
+    def datagram_received(self, data, addr):
+        self.stats["bytes_in"] += len(data)
+        try:
+            kind = data[:1]
+            player = self.players.get(addr)
+            if kind == HELLO:
+                if player is None:
+                    player = self.players[addr] = RacePlayer(self.next_id, addr, self.new_game())
+                    self.next_id = self.next_id % 0xFFFF + 1
+                    print(f"Player {player.id} joined from {addr[0]}:{addr[1]}")
+                # Hellos are resent until a welcome gets through
+                self.send(WELCOME + WELCOME_HEADER.pack(player.id, self.seed, self.tick_rate), addr)
+            elif kind == INPUT and player:
+                self.receive_input(player, data)
+            elif kind == BYE and player and BYE_HEADER.unpack_from(data, 1)[0] == player.id:
+                del self.players[addr]
+                print(f"Player {player.id} left")
+        except (struct.error, IndexError):
+            self.stats["bad_packets"] += 1
+
+    def receive_input(self, player, data):
+        player_id, run, frame, ack_tick, flap_count = INPUT_HEADER.unpack_from(data, 1)
+        if player_id != player.id or run < player.run:
+            return
+        player.last_heard = time.monotonic()
+        player.ack_tick = max(player.ack_tick, ack_tick)
+        self.stats["inputs"] += 1
+        if run > player.run:
+            player.run = run
+            player.game = self.new_game()
+
+        # The packet carries every flap the client has not seen confirmed, so everything
+        # up to its frame is known; packets that arrive late or twice change nothing
+        pos = 1 + INPUT_HEADER.size
+        flaps = {frame - FLAP_OFFSET.unpack_from(data, pos + i * FLAP_OFFSET.size)[0] for i in range(flap_count)}
+        game = player.game
+        target = min(frame, game.frame + MAX_CATCHUP)
+        while game.frame < target and not game.game_over:
+            if game.frame + 1 in flaps:
+                game.bird.flap()
+            game.update()
+            self.stats["frames"] += 1
+
+    def broadcast(self):
+        start_time = time.perf_counter()
+        now = time.monotonic()
+        for addr, player in list(self.players.items()):
+            if now - player.last_heard > PLAYER_TIMEOUT:
+                del self.players[addr]
+                print(f"Player {player.id} timed out")
+
+        self.tick += 1
+        snapshot = {player.id: player.fields() for player in self.players.values()}
+        self.history[self.tick] = snapshot
+        self.history.pop(self.tick - HISTORY, None)
+
+        # Clients that acknowledged the same baseline share one encoding of each entry
+        deltas = {}
+        for player in self.players.values():
+            base_tick = player.ack_tick if player.ack_tick in self.history else 0
+            if base_tick not in deltas:
+                deltas[base_tick] = encode_delta(self.history.get(base_tick, {}), snapshot)
+            removed, entries = deltas[base_tick]
+            run, frame, y = snapshot[player.id][:3]
+            packet = bytearray(STATE + STATE_HEADER.pack(self.tick, base_tick, run, frame, y))
+            # Each client's snapshots leave out its own bird
+            others = [player_id for player_id in removed if player_id != player.id]
+            write_uvarint(packet, len(others))
+            for player_id in others:
+                write_uvarint(packet, player_id)
+            write_uvarint(packet, len(entries) - (player.id in entries))
+            for player_id, entry in entries.items():
+                if player_id != player.id:
+                    packet += entry
+            self.stats["delta_states" if base_tick else "full_states"] += 1
+            self.send(bytes(packet), player.addr)
+        self.stats["ticks"] += 1
+        self.stats["tick_time"] += time.perf_counter() - start_time
+
+    async def run_ticks(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            self.broadcast()
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def report(self, every):
+        previous = Counter()
+        while True:
+            await asyncio.sleep(every)
+            stats = self.stats - previous
+            previous = Counter(self.stats)
+            ticks = stats["ticks"] or 1
+            states = stats["full_states"] + stats["delta_states"]
+            print(f"{len(self.players)} players, {stats['ticks'] / every:.1f} ticks/s "
+                  f"({stats['tick_time'] / ticks * 1000:.2f}ms each), {stats['frames'] / every:,.0f} frames/s simulated, "
+                  f"{stats['bytes_out'] / every / 1024:.1f} KiB/s out, "
+                  f"{stats['bytes_out'] / max(1, stats['packets_out']):.0f} bytes/packet, "
+                  f"{stats['delta_states'] / max(1, states):.0%} deltas")
+
+
+async def serve(host, port, seed, tick_rate, link, stats_every):
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(
+        lambda: RaceServer(seed, tick_rate, link), local_addr=(host, port))
+    print(f"Ghost race server on {host}:{port}, course seed {seed}, {tick_rate} ticks/s")
+    tasks = [asyncio.ensure_future(server.run_ticks())]
+    if stats_every:
+        tasks.append(asyncio.ensure_future(server.report(stats_every)))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        transport.close()
+
+
+class RaceClient:
+    """Ghost race connection polled from the game loop; never blocks once connected"""
+
+    def __init__(self, host, port=DEFAULT_PORT, link=None):
+        self.address = (host, port)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.link = link or LinkConditions()
+        self.outbox = []  # (due time, sequence, packet) held back by the simulated link
+        self.sent = 0
+        self.player_id = None
+        self.seed = None
+        self.tick_rate = TICK_RATE
+        self.run = 0
+        self.flaps = []  # Flap frames of this run the server has not confirmed yet
+        self.confirmed_frame = 0
+        self.recent_y = deque(maxlen=HISTORY * 8)  # (frame, y) of this run, to check the server agrees
+        self.snapshots = {}  # tick -> {player id: fields}
+        self.latest_tick = 0
+        self.latest_time = 0.0
+        self.samples = {}  # player id -> deque of (tick, fields)
+        self.next_input = 0.0
+        self.next_hello = 0.0
+        self.stats = Counter()
+
+    def send(self, data):
+        self.stats["packets_out"] += 1
+        self.stats["bytes_out"] += len(data)
+        delay = self.link.delay()
+        if delay is None:
+            return
+        self.sent += 1
+        heapq.heappush(self.outbox, (time.monotonic() + delay, self.sent, data))
+        self.flush()
+
+    def flush(self):
+        now = time.monotonic()
+        while self.outbox and self.outbox[0][0] <= now:
+            try:
+                self.socket.sendto(heapq.heappop(self.outbox)[2], self.address)
+            except OSError:
+                pass
+
+    def connect(self, timeout=5.0):
+        """Join the server and learn the course seed, blocking for up to timeout seconds"""
+        deadline = time.monotonic() + timeout
+        while self.player_id is None:
+            if time.monotonic() > deadline:
+                raise ConnectionError(f"No answer from a race server at {self.address[0]}:{self.address[1]}")
+            self.send(HELLO)
+            resend = time.monotonic() + HELLO_INTERVAL
+            while self.player_id is None and time.monotonic() < resend:
+                select.select([self.socket], [], [], 0.01)
+                self.flush()
+                self.poll()
+        return self
+
+    def start_run(self):
+        self.run += 1
+        self.flaps = []
+        self.confirmed_frame = 0
+        self.recent_y.clear()
+
+    def flap(self, frame):
+        self.flaps.append(frame)
+
+    def stalled(self, now):
+        """True once no snapshot has arrived for as long as the server waits before dropping a player"""
+        return now - self.latest_time > PLAYER_TIMEOUT
+
+    def update(self, frame, y):
+        """Called once per game frame with the frame just simulated and the bird's y"""
+        if not self.recent_y or frame > self.recent_y[-1][0]:
+            self.recent_y.append((frame, quantize_y(y)))
+        self.poll()
+        now = time.monotonic()
+        if self.stalled(now) and now >= self.next_hello:
+            # The server has dropped us or restarted; join again and keep racing
+            self.next_hello = now + HELLO_INTERVAL
+            self.stats["rejoin_hellos"] += 1
+            self.send(HELLO)
+        if now >= self.next_input:
+            self.next_input = max(self.next_input + 1 / INPUT_RATE, now - 1 / INPUT_RATE)
+            # Flaps too old for FLAP_OFFSET are past any catch-up the server will still do
+            if self.flaps and frame - self.flaps[0] > MAX_FLAP_AGE:
+                self.flaps = [flap for flap in self.flaps if frame - flap <= MAX_FLAP_AGE]
+            flaps = self.flaps[-MAX_FLAPS:]
+            packet = bytearray(INPUT + INPUT_HEADER.pack(self.player_id, self.run, frame, self.latest_tick, len(flaps)))
+            for flap in flaps:
+                packet += FLAP_OFFSET.pack(frame - flap)
+            self.send(bytes(packet))
+        self.flush()
+
+    def poll(self):
+        while True:
+            try:
+                data, addr = self.socket.recvfrom(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                # The server's port was closed; keep going, it may come back
+                continue
+            self.stats["packets_in"] += 1
+            self.stats["bytes_in"] += len(data)
+            try:
+                if data[:1] == STATE and self.player_id is not None:
+                    self.receive_state(data)
+                elif data[:1] == WELCOME and (self.player_id is None or self.stalled(time.monotonic())):
+                    self.receive_welcome(data)
+            except (struct.error, IndexError):
+                self.stats["bad_packets"] += 1
+
+    def receive_welcome(self, data):
+        self.player_id, self.seed, self.tick_rate = WELCOME_HEADER.unpack_from(data, 1)
+        # A rejoin starts from a full snapshot; a restarted server counts its ticks from 1 again
+        self.snapshots.clear()
+        self.samples.clear()
+        self.latest_tick = 0
+        self.latest_time = time.monotonic()
+
+    def receive_state(self, data):
+        tick, base_tick, run, frame, y = STATE_HEADER.unpack_from(data, 1)
+        if tick <= self.latest_tick:
+            self.stats["stale_states"] += 1
+            return
+        base = self.snapshots.get(base_tick) if base_tick else {}
+        if base is None:
+            self.stats["missing_baselines"] += 1
+            return
+        snapshot = dict(base)
+        pos = 1 + STATE_HEADER.size
+        count, pos = read_uvarint(data, pos)
+        for _ in range(count):
+            player_id, pos = read_uvarint(data, pos)
+            snapshot.pop(player_id, None)
+        count, pos = read_uvarint(data, pos)
+        for _ in range(count):
+            player_id, pos = read_uvarint(data, pos)
+            mask = data[pos]
+            pos += 1
+            fields = list(base.get(player_id, EMPTY_FIELDS))
+            for i in range(len(FIELDS)):
+                if mask & (1 << i):
+                    delta, pos = read_varint(data, pos)
+                    fields[i] += delta
+            snapshot[player_id] = tuple(fields)
+
+        self.snapshots[tick] = snapshot
+        for old_tick in [old_tick for old_tick in self.snapshots if old_tick <= tick - HISTORY]:
+            del self.snapshots[old_tick]
+        self.latest_tick = tick
+        self.latest_time = time.monotonic()
+        self.stats["delta_states" if base_tick else "full_states"] += 1
+
+        # Our own bird as the server sees it: drop confirmed flaps and check it matches ours
+        if run == self.run:
+            self.confirmed_frame = frame
+            self.flaps = [flap for flap in self.flaps if flap > frame]
+            self.stats["server_lag_frames"] += (self.recent_y[-1][0] if self.recent_y else 0) - frame
+            self.stats["own_states"] += 1
+            if frame and any(recent_frame == frame and recent_y != y for recent_frame, recent_y in self.recent_y):
+                self.stats["desyncs"] += 1
+
+        for player_id in list(self.samples):
+            if player_id not in snapshot:
+                del self.samples[player_id]
+        for player_id, fields in snapshot.items():
+            self.samples.setdefault(player_id, deque(maxlen=8)).append((tick, fields))
+
+    def ghosts(self):
+        """(player id, frame, y, score, alive) for every other racer, interpolated a little in the past"""
+        if not self.latest_tick:
+            return []
+        # Estimate the server's current tick, but never run ahead of the newest snapshot
+        server_tick = self.latest_tick + (time.monotonic() - self.latest_time) * self.tick_rate
+        render_tick = min(server_tick - INTERP_TICKS, self.latest_tick)
+        ghosts = []
+        for player_id, samples in self.samples.items():
+            before = after = None
+            for tick, fields in samples:
+                if tick <= render_tick:
+                    before = fields, tick
+                elif after is None:
+                    after = fields, tick
+            if before is None:
+                before = after
+            (run, frame, y, score, alive), tick = before
+            # Blend toward the next snapshot unless the racer restarted in between
+            if after and after[1] > tick and after[0][0] == run:
+                t = (render_tick - tick) / (after[1] - tick)
+                frame += (after[0][1] - frame) * t
+                y += (after[0][2] - y) * t
+            ghosts.append((player_id, frame, y / Y_SCALE, score, bool(alive)))
+        return ghosts
+
+    def close(self):
+        if self.player_id is not None:
+            self.send(BYE + BYE_HEADER.pack(self.player_id))
+            # Let a delayed goodbye out before the socket goes away
+            while self.outbox and self.outbox[0][0] - time.monotonic() < 1.0:
+                time.sleep(max(0.0, self.outbox[0][0] - time.monotonic()))
+                self.flush()
+        self.socket.close()
+
+
+def autopilot(module, game, offset):
+    """Bot: flap whenever the bird sinks more than offset pixels below the next gap's centre"""
+    bird = game.bird
+    ahead = [pipe for pipe in game.pipes if pipe.x + module.PIPE_WIDTH > bird.x]
+    target = min(ahead, key=lambda pipe: pipe.x).gap_y if ahead else module.SCREEN_HEIGHT // 2
+    return bird.velocity >= 0 and bird.y > target + offset
+
+
+def run_bots(address, count, seconds, latency, jitter, loss):
+    """Play count headless racers against a server and report what the clients saw"""
+    module = load_game()
+    games = []
+    for i in range(count):
+        client = RaceClient(*address, LinkConditions(latency, jitter, loss, seed=i)).connect()
+        games.append((module.Game(race=client), random.Random(i).uniform(-10, 40)))
+    game_over_frames = [0] * count
+    print(f"{count} bots joined the race at {address[0]}:{address[1]}")
+
+    frame_time = 1 / module.FPS
+    start_time = next_frame = time.monotonic()
+    frames = 0
+    while time.monotonic() - start_time < seconds:
+        for i, (game, offset) in enumerate(games):
+            if game.game_over:
+                # Sit on the game over screen for a second like a player would
+                game_over_frames[i] += 1
+                if game_over_frames[i] > module.FPS:
+                    game_over_frames[i] = 0
+                    game.__init__(race=game.race)
+            elif autopilot(module, game, offset):
+                game.flap()
+            game.update()
+        frames += 1
+        next_frame += frame_time
+        time.sleep(max(0.0, next_frame - time.monotonic()))
+    elapsed = time.monotonic() - start_time
+
+    stats = Counter()
+    for game, _ in games:
+        stats += game.race.stats
+        game.race.close()
+    states = stats["full_states"] + stats["delta_states"]
+    print(f"{frames / elapsed:.1f} frames/s per bot over {elapsed:.1f}s")
+    print(f"per bot: {stats['bytes_in'] / count / elapsed / 1024:.2f} KiB/s in, "
+          f"{stats['bytes_out'] / count / elapsed / 1024:.2f} KiB/s out, "
+          f"{states / count / elapsed:.1f} snapshots/s ({stats['delta_states'] / max(1, states):.0%} deltas, "
+          f"{stats['bytes_in'] / max(1, stats['packets_in']):.0f} bytes each)")
+    print(f"server {stats['server_lag_frames'] / max(1, stats['own_states']):.1f} frames behind on average, "
+          f"{stats['desyncs']} desyncs, {stats['missing_baselines']} undecodable and "
+          f"{stats['stale_states']} out-of-order snapshots")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ghost race server and load-test bots for Flappy Bird Enhanced")
+    commands = parser.add_subparsers(dest="command", required=True)
+    server = commands.add_parser("server", help="run a race server")
+    server.add_argument("--host", default="0.0.0.0")
+    server.add_argument("--port", type=int, default=DEFAULT_PORT)
+    server.add_argument("--seed", type=int, default=None, help="pipe sequence seed (default: random)")
+    server.add_argument("--tick-rate", type=int, default=TICK_RATE, help="snapshots per second")
+    server.add_argument("--stats-every", type=float, default=10, help="seconds between load reports (0 for none)")
+    add_link_arguments(server)
+    bots = commands.add_parser("bots", help="race headless autopilot bots against a server")
+    bots.add_argument("--server", default=f"127.0.0.1:{DEFAULT_PORT}", help="HOST:PORT")
+    bots.add_argument("--count", type=int, default=20)
+    bots.add_argument("--seconds", type=float, default=30)
+    add_link_arguments(bots)
+    args = parser.parse_args()
+
+    if args.command == "server":
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+        link = LinkConditions(args.latency, args.jitter, args.loss)
+        try:
+            asyncio.run(serve(args.host, args.port, seed, args.tick_rate, link, args.stats_every))
+        except KeyboardInterrupt:
+            pass
+    else:
+        run_bots(parse_address(args.server), args.count, args.seconds, args.latency, args.jitter, args.loss)
+
+
+if __name__ == "__main__":
+    main()
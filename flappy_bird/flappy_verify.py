@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Flappy Bird Run Verifier
+Replays recorded runs headlessly to confirm or reject the scores they claim.
+
+A run log holds the pipe seed and one flap byte per frame. Each one is replayed
+through flappy_bird_enhanced.py's own Game.update() (bird physics, pipe scrolling,
+collisions and scoring) with nothing drawn, so a run checks in a few milliseconds.
+Batches of logs are spread over a process pool for nightly leaderboard audits.
+
+    python3 flappy_verify.py runs/                      # audit every saved run
+    python3 flappy_verify.py runs/ --workers 8 --json audit.json
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+RUNS_PER_TASK = 50  # Logs handed to a worker at a time
+
+game_module = None  # Each worker process imports the game once
+
+
+def init_worker():
+    global game_module
+    # The game opens a window and the mixer when it is imported
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import flappy_bird_enhanced
+    game_module = flappy_bird_enhanced
+
+
+def verify(path):
+    """Replay one run log; the verdict is "ok" or the reason it was rejected"""
+    result = {"path": path, "claimed": None, "score": None, "frames": 0}
+    try:
+        log = game_module.RunLog.load(path)
+    except (OSError, ValueError, game_module.struct.error) as e:
+        return dict(result, verdict=f"unreadable: {e}")
+    result["claimed"] = log.score
+
+    game = game_module.Game(seed=log.seed)
+    for frame, flapped in enumerate(log.inputs, 1):
+        if game.game_over:
+            return dict(result, score=game.score, frames=frame - 1,
+                        verdict=f"inputs continue after the crash at frame {frame - 1}")
+        if flapped:
+            game.bird.flap()
+        game.update()
+    result.update(score=game.score, frames=game.frame)
+
+    # Scores are only submitted when the bird crashes, so a genuine log ends on the crash
+    if not game.game_over:
+        return dict(result, verdict=f"run is still going after its last frame ({game.frame})")
+    if game.score != log.score:
+        return dict(result, verdict=f"claims {log.score} but scores {game.score}")
+    return dict(result, verdict="ok")
+
+
+def verify_batch(paths):
+    return [verify(path) for path in paths]
+
+
+def collect(paths):
+    logs = []
+    for path in paths:
+        if os.path.isdir(path):
+            logs.extend(sorted(glob.glob(os.path.join(path, "*.fbr"))))
+        else:
+            logs.append(path)
+    return logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay Flappy Bird run logs and check their claimed scores")
+    parser.add_argument("paths", nargs="*", help="run logs or directories of them (default: the game's runs/)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--json", help="also write every verdict to this file")
+    args = parser.parse_args()
+
+    init_worker()
+    paths = collect(args.paths or [game_module.RUN_DIR])
+    if not paths:
+        print("No run logs to verify")
+        return
+    tasks = [paths[i:i + RUNS_PER_TASK] for i in range(0, len(paths), RUNS_PER_TASK)]
+
+    # A single worker or a single batch is not worth starting a pool for
+    start_time = time.perf_counter()
+    if args.workers <= 1 or len(tasks) == 1:
+        results = [result for task in tasks for result in verify_batch(task)]
+    else:
+        # Workers are spawned rather than forked so none of them inherits this process's SDL state
+        with ProcessPoolExecutor(args.workers, multiprocessing.get_context("spawn"), init_worker) as executor:
+            results = [result for batch in executor.map(verify_batch, tasks) for result in batch]
+    elapsed = time.perf_counter() - start_time
+
+    rejected = [result for result in results if result["verdict"] != "ok"]
+    for result in rejected:
+        print(f"REJECTED {result['path']}: {result['verdict']}")
+    frames = sum(result["frames"] for result in results)
+    print(f"{len(results) - len(rejected)} of {len(results)} runs verified, {len(rejected)} rejected; "
+          f"{frames:,} frames in {elapsed:.2f}s ({frames / game_module.FPS / max(elapsed, 1e-9):,.0f}x real time)")
+    if args.json:
+        with open(args.json, "w") as report_file:
+            json.dump(results, report_file, indent=2)
+    sys.exit(1 if rejected else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the ghost race wire format: varints, delta snapshots and client input packets
+"""
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import flappy_race
+from flappy_race import (FLAP_OFFSET, HELLO, INPUT, INPUT_HEADER, MAX_FLAP_AGE, PLAYER_TIMEOUT, WELCOME,
+                         WELCOME_HEADER, RaceClient, RacePlayer, RaceServer, read_uvarint, read_varint,
+                         write_uvarint, write_varint)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 16383, 16384, 2 ** 32 - 1, 2 ** 63])
+def test_uvarint_round_trip(value):
+    out = bytearray(b"x")
+    write_uvarint(out, value)
+    assert read_uvarint(bytes(out) + b"tail", 1) == (value, len(out))
+
+
+def test_varint_round_trip():
+    values = [0, 1, -1, 63, -64, 64, -65, 32767, -32768] + random.Random(1).sample(range(-10 ** 9, 10 ** 9), 200)
+    out = bytearray()
+    for value in values:
+        write_varint(out, value)
+    pos = 0
+    for value in values:
+        decoded, pos = read_varint(out, pos)
+        assert decoded == value
+    assert pos == len(out)
+    # Zigzag keeps small deltas of either sign in one byte
+    for value in (-64, 63):
+        small = bytearray()
+        write_varint(small, value)
+        assert len(small) == 1
+
+
+class StubGame:
+    def __init__(self, rng):
+        self.frame = 0
+        self.bird = SimpleNamespace(y=300.0)
+        self.score = 0
+        self.game_over = False
+        self.rng = rng
+
+    def step(self):
+        self.frame += self.rng.randrange(3)
+        self.bird.y = min(1000.0, max(-1000.0, self.bird.y + self.rng.uniform(-40, 40)))
+        self.score += self.rng.random() < 0.05
+        self.game_over = self.rng.random() < 0.02
+
+
+class FakeSocket:
+    """Non-blocking socket stand-in holding the datagrams the client will receive"""
+
+    def __init__(self, *datagrams):
+        self.datagrams = list(datagrams)
+
+    def recvfrom(self, size):
+        if not self.datagrams:
+            raise BlockingIOError
+        return self.datagrams.pop(0), ("server", 1)
+
+
+class Transport:
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, addr):
+        self.sent.append((data, addr))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    # The codec never touches the game itself, so the server runs without pygame
+    monkeypatch.setattr(flappy_race, "load_game", lambda: None)
+    server = RaceServer(seed=1)
+    server.connection_made(Transport())
+    return server
+
+
+@pytest.fixture
+def client():
+    client = RaceClient("127.0.0.1", 9)
+    yield client
+    client.socket.close()
+
+
+def test_delta_snapshots_round_trip(server, client):
+    rng = random.Random(5)
+    me = RacePlayer(1, ("me", 1), StubGame(rng))
+    server.players[me.addr] = me
+    client.player_id = me.id
+    next_id = 2
+    decoded = 0
+
+    for _ in range(400):
+        # Racers join, leave, restart and move on between ticks
+        if rng.random() < 0.15 or len(server.players) < 2:
+            player = RacePlayer(next_id, ("bot", next_id), StubGame(rng))
+            server.players[player.addr] = player
+            next_id += 1
+        if rng.random() < 0.08:
+            leaving = rng.choice([addr for addr in server.players if addr != me.addr])
+            del server.players[leaving]
+        for player in server.players.values():
+            player.last_heard = time.monotonic()
+            if rng.random() < 0.01:
+                player.run += 1
+                player.game = StubGame(rng)
+            player.game.step()
+
+        server.transport.sent.clear()
+        server.broadcast()
+        packet, addr = next((data, addr) for data, addr in server.transport.sent if addr == me.addr)
+        # Lose some snapshots; the server keeps deltas against whatever the client last acknowledged
+        if rng.random() < 0.3:
+            continue
+        client.receive_state(packet)
+        if client.latest_tick != server.tick:
+            continue  # Its baseline had already left the client's history
+        decoded += 1
+        expected = {player_id: fields for player_id, fields in server.history[server.tick].items() if player_id != me.id}
+        assert client.snapshots[server.tick] == expected
+        if rng.random() < 0.8:
+            me.ack_tick = client.latest_tick
+
+    assert decoded > 200
+    assert client.stats["delta_states"] > client.stats["full_states"]
+
+
+def test_input_packets_carry_unconfirmed_flaps(client):
+    packets = []
+    client.send = packets.append
+    client.player_id = 7
+    client.run = 2
+    client.latest_tick = 11
+    client.latest_time = time.monotonic()
+    client.flaps = [1, 50, 95]
+    client.update(100, 300.0)
+
+    (packet,) = packets
+    assert packet[:1] == INPUT
+    player_id, run, frame, ack_tick, count = INPUT_HEADER.unpack_from(packet, 1)
+    assert (player_id, run, frame, ack_tick, count) == (7, 2, 100, 11, 3)
+    offsets = [FLAP_OFFSET.unpack_from(packet, 1 + INPUT_HEADER.size + i * FLAP_OFFSET.size)[0] for i in range(count)]
+    assert [frame - offset for offset in offsets] == [1, 50, 95]
+
+
+def test_stale_flaps_are_dropped_not_packed(client):
+    packets = []
+    client.send = packets.append
+    client.player_id = 7
+    client.latest_time = time.monotonic()
+    frame = MAX_FLAP_AGE + 5000
+    client.flaps = [1, 4999, 5000, frame - 1]
+    client.update(frame, 300.0)
+
+    count = INPUT_HEADER.unpack_from(packets[0], 1)[4]
+    assert count == 2
+    assert client.flaps == [5000, frame - 1]
+
+
+def test_client_rejoins_when_snapshots_stop(client):
+    packets = []
+    client.send = packets.append
+    client.player_id = 7
+    client.latest_tick = 500
+    client.snapshots = {500: {3: (1, 2, 3, 4, 1)}}
+    client.latest_time = time.monotonic() - PLAYER_TIMEOUT - 1
+    client.update(10, 300.0)
+    assert HELLO in packets
+
+    # A stalled client takes the new welcome and starts over from a full snapshot
+    client.socket, real_socket = FakeSocket(WELCOME + WELCOME_HEADER.pack(9, 1, 20)), client.socket
+    try:
+        client.poll()
+    finally:
+        client.socket = real_socket
+    assert client.player_id == 9
+    assert client.latest_tick == 0
+    assert client.snapshots == {}
+    assert not client.stalled(time.monotonic())
+
+
+def test_connected_client_ignores_welcomes(client):
+    client.player_id = 7
+    client.latest_time = time.monotonic()
+    client.socket, real_socket = FakeSocket(WELCOME + WELCOME_HEADER.pack(9, 1, 20)), client.socket
+    try:
+        client.poll()
+    finally:
+        client.socket = real_socket
+    assert client.player_id == 7
+
+
+def test_bad_packets_are_counted_not_raised(server):
+    server.new_game = lambda: StubGame(random.Random(0))
+    server.datagram_received(INPUT + b"\x01", ("someone", 1))  # Unknown sender: ignored
+    server.datagram_received(HELLO, ("someone", 1))
+    server.datagram_received(INPUT + b"\x01", ("someone", 1))
+    assert server.stats["bad_packets"] == 1
+    assert server.transport.sent[0][0][:1] == WELCOME
@@ -4,6 +4,9 @@ import sys
 import math
 from pygame import mixer
 
+# Pipe sprite baking is shared with Flappy Adventure
+from pipe_sprites import PipeSpriteCache
+
 # Initialize Pygame
 pygame.init()
 mixer.init()
@@ -42,6 +45,10 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Flappy Bird - Realistic")
 clock = pygame.time.Clock()
 
+# Full-screen dimming buffer shared by the start and game over screens
+overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+overlay.fill(BLACK)
+
 class Particle:
     def __init__(self, x, y, color):
         self.x = x
@@ -64,51 +71,34 @@ class Particle:
         if size > 0:
             pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
 
-class RealisticBird:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.velocity = 0
-        self.rect = pygame.Rect(x, y, BIRD_SIZE, BIRD_SIZE)
-        self.rotation = 0
-        self.particles = []
-        self.wing_angle = 0
-        self.wing_direction = 1
-        
-    def flap(self):
-        self.velocity = FLAP_STRENGTH
-        self.rotation = -30
-        self.wing_angle = -20
-        # Add flap particles
-        for _ in range(8):
-            self.particles.append(Particle(self.x, self.y + BIRD_SIZE//2, (139, 69, 19)))
-        
-    def update(self):
-        self.velocity += GRAVITY
-        self.y += self.velocity
-        self.rect.y = self.y
-        
-        # Update rotation
-        if self.velocity < 0:
-            self.rotation = -30
-        else:
-            self.rotation = min(90, self.rotation + 5)
-            
-        # Update wing animation
-        self.wing_angle += 5 * self.wing_direction
-        if self.wing_angle > 15 or self.wing_angle < -20:
-            self.wing_direction *= -1
-            
-        # Update particles
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update()
+# Bird sprite atlas: every wing-flap frame, with and without feet, at each quantized rotation
+WING_ANGLES = range(-25, 21, 5)  # Wing angle moves in steps of 5 and bounces at -20/15
+ROTATION_MIN = -30
+ROTATION_MAX = 90
+ROTATION_STEP = 3
+
+class BirdSpriteAtlas:
+    def __init__(self):
+        self.frames = {}
+        for wing_angle in WING_ANGLES:
+            for feet in (False, True):
+                bird_surface = self.paint_bird(wing_angle, feet)
+                rotations = []
+                for rotation in range(ROTATION_MIN, ROTATION_MAX + 1, ROTATION_STEP):
+                    rotated_surface = pygame.transform.rotate(bird_surface, rotation).convert_alpha()
+                    # Keep the rotated bird centered on its unrotated position
+                    rotations.append((rotated_surface,
+                                      BIRD_SIZE//2 - rotated_surface.get_width()//2,
+                                      BIRD_SIZE//2 - rotated_surface.get_height()//2))
+                self.frames[(wing_angle, feet)] = rotations
+                
+    def get(self, wing_angle, feet, rotation):
+        wing_angle = min(max(wing_angle, WING_ANGLES[0]), WING_ANGLES[-1])
+        rotation = min(max(rotation, ROTATION_MIN), ROTATION_MAX)
+        rotations = self.frames[(wing_angle - wing_angle % 5, feet)]
+        return rotations[round((rotation - ROTATION_MIN) / ROTATION_STEP)]
         
-    def draw(self, screen):
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(screen)
-            
+    def paint_bird(self, wing_angle, feet):
         # Create a surface for the bird to rotate
         bird_surface = pygame.Surface((BIRD_SIZE + 20, BIRD_SIZE + 20), pygame.SRCALPHA)
         
@@ -147,11 +137,11 @@ class RealisticBird:
         # Wing feathers (animated)
         feather_x = wing_x + wing_width//2
         feather_y = wing_y + wing_height//2
-        feather_length = 15 + abs(self.wing_angle)
+        feather_length = 15 + abs(wing_angle)
         
         # Draw multiple feathers
         for i in range(3):
-            angle_offset = (i - 1) * 10 + self.wing_angle
+            angle_offset = (i - 1) * 10 + wing_angle
             end_x = feather_x + math.cos(math.radians(angle_offset)) * feather_length
             end_y = feather_y + math.sin(math.radians(angle_offset)) * feather_length
             pygame.draw.line(bird_surface, GRAY, (feather_x, feather_y), (end_x, end_y), 2)
@@ -162,16 +152,64 @@ class RealisticBird:
         pygame.draw.polygon(bird_surface, BLACK, tail_points, 1)
         
         # Bird feet (when flying)
-        if self.velocity > 0:
+        if feet:
             foot_x = BIRD_SIZE//2
             foot_y = BIRD_SIZE + 5
             pygame.draw.line(bird_surface, ORANGE, (foot_x - 3, foot_y), (foot_x - 3, foot_y + 8), 2)
             pygame.draw.line(bird_surface, ORANGE, (foot_x + 3, foot_y), (foot_x + 3, foot_y + 8), 2)
+            
+        return bird_surface
+
+bird_atlas = BirdSpriteAtlas()
+
+class RealisticBird:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.velocity = 0
+        self.rect = pygame.Rect(x, y, BIRD_SIZE, BIRD_SIZE)
+        self.rotation = 0
+        self.particles = []
+        self.wing_angle = 0
+        self.wing_direction = 1
+        
+    def flap(self):
+        self.velocity = FLAP_STRENGTH
+        self.rotation = -30
+        self.wing_angle = -20
+        # Add flap particles
+        for _ in range(8):
+            self.particles.append(Particle(self.x, self.y + BIRD_SIZE//2, (139, 69, 19)))
+        
+    def update(self):
+        self.velocity += GRAVITY
+        self.y += self.velocity
+        self.rect.y = self.y
+        
+        # Update rotation
+        if self.velocity < 0:
+            self.rotation = -30
+        else:
+            self.rotation = min(90, self.rotation + 5)
+            
+        # Update wing animation
+        self.wing_angle += 5 * self.wing_direction
+        if self.wing_angle > 15 or self.wing_angle < -20:
+            self.wing_direction *= -1
+            
+        # Update particles
+        self.particles = [p for p in self.particles if p.life > 0]
+        for particle in self.particles:
+            particle.update()
         
-        # Rotate the bird surface
-        rotated_surface = pygame.transform.rotate(bird_surface, self.rotation)
-        screen.blit(rotated_surface, (self.x - rotated_surface.get_width()//2 + BIRD_SIZE//2, 
-                                     self.y - rotated_surface.get_height()//2 + BIRD_SIZE//2))
+    def draw(self, screen):
+        # Draw particles
+        for particle in self.particles:
+            particle.draw(screen)
+            
+        # Look up the pre-rendered frame for this wing position and rotation
+        sprite, offset_x, offset_y = bird_atlas.get(self.wing_angle, self.velocity > 0, self.rotation)
+        screen.blit(sprite, (self.x + offset_x, self.y + offset_y))
         
     def get_rect(self):
         return self.rect
@@ -392,6 +430,68 @@ class DynamicBackground:
         pygame.draw.circle(screen, ORANGE, (600, 150), 25)
         pygame.draw.circle(screen, LIGHT_BLUE, (700, 80), 20)
 
+# Pipe look per theme: body colors (one is picked per pipe), outline, repeating
+# body pattern, (top, bottom) gap-end caps and a plain band kept free of pattern
+PIPE_STYLES = {
+    "city": {'colors': [DARK_GRAY, GRAY, LIGHT_GRAY, (100, 100, 100)], 'border': BLACK,
+             'pattern': 'windows', 'band': 15, 'caps': ('roof_and_entrance', 'roof')},
+    "forest": {'colors': [BROWN], 'border': BLACK, 'caps': ('tree_top', 'tree_top')},
+    "mountains": {'colors': [DARK_GRAY], 'border': BLACK, 'caps': ('snow_cap', 'snow_cap')},
+    "desert": {'colors': [GOLD], 'border': BLACK, 'pattern': 'cactus'},
+    "space": {'colors': [SILVER], 'border': WHITE, 'pattern': 'lights'},
+}
+PIPE_VARIANTS = max(len(style['colors']) for style in PIPE_STYLES.values())
+
+# Body patterns, painted down a full-height column starting at x = 0
+def paint_windows(body, height):
+    window_colors = [YELLOW, LIGHT_BLUE, WHITE, (255, 255, 200)]
+    for row in range(3, (height - 20) // 25):
+        for col in range(2):
+            window_x = 10 + col * 25
+            window_y = 15 + row * 25
+            pygame.draw.rect(body, random.choice(window_colors), (window_x, window_y, 15, 12))
+            pygame.draw.rect(body, BLACK, (window_x, window_y, 15, 12), 1)
+
+def paint_cactus(body, height):
+    for y in range(20, height - 20, 40):
+        pygame.draw.rect(body, DARK_GREEN, (15, y, 10, 20))
+
+def paint_lights(body, height):
+    for y in range(10, height - 10, 20):
+        pygame.draw.circle(body, RED, (10, y), 3)
+        pygame.draw.circle(body, BLUE, (PIPE_WIDTH - 10, y), 3)
+
+# Gap-end caps, painted around a pipe end at (x, end)
+def paint_roof(cap, x, end):
+    pygame.draw.rect(cap, BLACK, (x - 2, end - 5, PIPE_WIDTH + 4, 5))
+
+def paint_roof_and_entrance(cap, x, end):
+    paint_roof(cap, x, end)
+    entrance_width = 20
+    entrance_height = 15
+    pygame.draw.rect(cap, BLACK, (x + (PIPE_WIDTH - entrance_width) // 2, end - entrance_height,
+                                  entrance_width, entrance_height))
+
+def paint_tree_top(cap, x, end):
+    pygame.draw.circle(cap, DARK_GREEN, (x + PIPE_WIDTH//2, end - 20), 30)
+
+def paint_snow_cap(cap, x, end):
+    pygame.draw.rect(cap, WHITE, (x - 5, end - 15, PIPE_WIDTH + 10, 15))
+
+PIPE_PATTERNS = {
+    'windows': paint_windows,
+    'cactus': paint_cactus,
+    'lights': paint_lights,
+}
+PIPE_CAPS = {
+    'roof': paint_roof,
+    'roof_and_entrance': paint_roof_and_entrance,
+    'tree_top': paint_tree_top,
+    'snow_cap': paint_snow_cap,
+}
+
+pipe_sprites = PipeSpriteCache(PIPE_STYLES, PIPE_PATTERNS, PIPE_CAPS, PIPE_WIDTH, SCREEN_HEIGHT)
+
 class Pipe:
     def __init__(self, x, theme="city"):
         self.x = x
@@ -400,145 +500,15 @@ class Pipe:
         self.top_height = self.gap_y - PIPE_GAP // 2
         self.bottom_height = SCREEN_HEIGHT - (self.gap_y + PIPE_GAP // 2)
         self.passed = False
-        
+        self.variant = random.randrange(PIPE_VARIANTS)
+
     def update(self):
         self.x -= PIPE_SPEED
-        
+
     def draw(self, screen, theme):
-        if theme == "city":
-            self.draw_city_pipe(screen)
-        elif theme == "forest":
-            self.draw_forest_pipe(screen)
-        elif theme == "mountains":
-            self.draw_mountain_pipe(screen)
-        elif theme == "desert":
-            self.draw_desert_pipe(screen)
-        elif theme == "space":
-            self.draw_space_pipe(screen)
-            
-    def draw_city_pipe(self, screen):
-        # Building-like pipes with more realistic city style
-        building_colors = [DARK_GRAY, GRAY, LIGHT_GRAY, (100, 100, 100)]
-        color = random.choice(building_colors)
-        
-        # Top building
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-        
-        # Bottom building
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-        
-        # Building details - windows with different patterns
-        window_colors = [YELLOW, LIGHT_BLUE, WHITE, (255, 255, 200)]
-        
-        # Top building windows (more realistic pattern)
-        for row in range(3, (self.top_height - 20) // 25):
-            for col in range(2):
-                window_x = self.x + 10 + col * 25
-                window_y = 15 + row * 25
-                if window_y < self.top_height - 15:
-                    # Random window colors for variety
-                    window_color = random.choice(window_colors)
-                    pygame.draw.rect(screen, window_color, (window_x, window_y, 15, 12))
-                    pygame.draw.rect(screen, BLACK, (window_x, window_y, 15, 12), 1)
-        
-        # Bottom building windows
-        for row in range(3, (self.bottom_height - 20) // 25):
-            for col in range(2):
-                window_x = self.x + 10 + col * 25
-                window_y = bottom_y + 15 + row * 25
-                if window_y < bottom_y + self.bottom_height - 15:
-                    window_color = random.choice(window_colors)
-                    pygame.draw.rect(screen, window_color, (window_x, window_y, 15, 12))
-                    pygame.draw.rect(screen, BLACK, (window_x, window_y, 15, 12), 1)
-        
-        # Building tops (roofs)
-        pygame.draw.rect(screen, BLACK, (self.x - 2, self.top_height - 5, PIPE_WIDTH + 4, 5))
-        pygame.draw.rect(screen, BLACK, (self.x - 2, bottom_y, PIPE_WIDTH + 4, 5))
-        
-        # Building entrances (bottom of buildings)
-        entrance_width = 20
-        entrance_height = 15
-        pygame.draw.rect(screen, BLACK, (self.x + (PIPE_WIDTH - entrance_width) // 2, 
-                                       self.top_height - entrance_height, 
-                                       entrance_width, entrance_height))
-        pygame.draw.rect(screen, BLACK, (self.x + (PIPE_WIDTH - entrance_width) // 2, 
-                                       bottom_y + self.bottom_height, 
-                                       entrance_width, entrance_height))
-            
-    def draw_forest_pipe(self, screen):
-        # Tree-like pipes
-        # Top pipe
-        pygame.draw.rect(screen, BROWN, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-        
-        # Tree top
-        pygame.draw.circle(screen, DARK_GREEN, (self.x + PIPE_WIDTH//2, self.top_height - 20), 30)
-        
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, BROWN, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-        
-        # Tree top
-        pygame.draw.circle(screen, DARK_GREEN, (self.x + PIPE_WIDTH//2, bottom_y + 20), 30)
-        
-    def draw_mountain_pipe(self, screen):
-        # Rock-like pipes
-        color = DARK_GRAY
-        # Top pipe
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-        
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-        
-        # Snow caps
-        pygame.draw.rect(screen, WHITE, (self.x - 5, self.top_height - 15, PIPE_WIDTH + 10, 15))
-        pygame.draw.rect(screen, WHITE, (self.x - 5, bottom_y, PIPE_WIDTH + 10, 15))
-        
-    def draw_desert_pipe(self, screen):
-        # Sand-like pipes
-        color = GOLD
-        # Top pipe
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, BLACK, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-        
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, BLACK, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-        
-        # Cactus details
-        for y in range(20, self.top_height - 20, 40):
-            pygame.draw.rect(screen, DARK_GREEN, (self.x + 15, y, 10, 20))
-        for y in range(bottom_y + 20, bottom_y + self.bottom_height - 20, 40):
-            pygame.draw.rect(screen, DARK_GREEN, (self.x + 15, y, 10, 20))
-            
-    def draw_space_pipe(self, screen):
-        # Space station-like pipes
-        color = SILVER
-        # Top pipe
-        pygame.draw.rect(screen, color, (self.x, 0, PIPE_WIDTH, self.top_height))
-        pygame.draw.rect(screen, WHITE, (self.x, 0, PIPE_WIDTH, self.top_height), 3)
-        
-        # Bottom pipe
-        bottom_y = self.gap_y + PIPE_GAP // 2
-        pygame.draw.rect(screen, color, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height))
-        pygame.draw.rect(screen, WHITE, (self.x, bottom_y, PIPE_WIDTH, self.bottom_height), 3)
-        
-        # Lights
-        for y in range(10, self.top_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-        for y in range(bottom_y + 10, bottom_y + self.bottom_height - 10, 20):
-            pygame.draw.circle(screen, RED, (self.x + 10, y), 3)
-            pygame.draw.circle(screen, BLUE, (self.x + PIPE_WIDTH - 10, y), 3)
-        
+        sprites = pipe_sprites.get(theme, self.variant)
+        sprites.draw(screen, self.x, self.top_height, self.gap_y + PIPE_GAP // 2)
+
     def get_rects(self):
         top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.top_height)
         bottom_rect = pygame.Rect(self.x, self.gap_y + PIPE_GAP // 2, PIPE_WIDTH, self.bottom_height)
@@ -557,6 +527,16 @@ class Game:
         self.small_font = pygame.font.Font(None, 36)
         self.medium_font = pygame.font.Font(None, 48)
         
+        # Static start and game over text, rendered once
+        self.title_text = self.font.render("FLAPPY BIRD", True, YELLOW)
+        self.instruction_texts = [
+            self.medium_font.render("Press SPACE to start", True, WHITE),
+            self.small_font.render("Flap to fly through the gaps!", True, WHITE),
+            self.small_font.render("Watch the backgrounds change as you progress", True, WHITE)
+        ]
+        self.game_over_text = self.font.render("GAME OVER", True, RED)
+        self.restart_text = self.medium_font.render("Press SPACE to restart", True, WHITE)
+        
         # Add initial pipes
         for i in range(3):
             self.pipes.append(Pipe(SCREEN_WIDTH + i * 300, self.background.current_theme))
@@ -660,19 +640,15 @@ class Game:
         # Draw start screen
         if not self.game_started and not self.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             overlay.set_alpha(180)
-            overlay.fill(BLACK)
             screen.blit(overlay, (0, 0))
             
             # Title
-            title_text = self.font.render("FLAPPY BIRD", True, YELLOW)
+            title_text = self.title_text
             screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, SCREEN_HEIGHT // 2 - 120))
             
             # Instructions
-            instruction1 = self.medium_font.render("Press SPACE to start", True, WHITE)
-            instruction2 = self.small_font.render("Flap to fly through the gaps!", True, WHITE)
-            instruction3 = self.small_font.render("Watch the backgrounds change as you progress", True, WHITE)
+            instruction1, instruction2, instruction3 = self.instruction_texts
             
             screen.blit(instruction1, (SCREEN_WIDTH // 2 - instruction1.get_width() // 2, SCREEN_HEIGHT // 2 - 40))
             screen.blit(instruction2, (SCREEN_WIDTH // 2 - instruction2.get_width() // 2, SCREEN_HEIGHT // 2))
@@ -684,13 +660,11 @@ class Game:
         # Draw game over message
         elif self.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             overlay.set_alpha(128)
-            overlay.fill(BLACK)
             screen.blit(overlay, (0, 0))
             
-            game_over_text = self.font.render("GAME OVER", True, RED)
-            restart_text = self.medium_font.render("Press SPACE to restart", True, WHITE)
+            game_over_text = self.game_over_text
+            restart_text = self.restart_text
             final_score_text = self.medium_font.render(f"Score: {self.score}", True, WHITE)
             
             screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 80))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Shared Frame Scheduler
+Decides when a game loop polls, redraws and sleeps, so static screens stop costing a full frame 60 times a second.
+
+Animated states run exactly as before: poll, draw everything, flip, tick at full rate.
+Static states (menus, puzzles, pause and game-over screens) block in pygame.event.wait()
+until input arrives, redraw only when something was invalidated, and send only the
+invalidated regions to the display. An unfocused window ticks at BACKGROUND_FPS and a
+minimized one skips drawing altogether until it is restored.
+
+    scheduler = FrameScheduler(clock, FPS)
+    for event in scheduler.events(idle=state != PLAYING, state=state):
+        ...
+        scheduler.invalidate(changed_rect)  # Static states only; None repaints everything
+    if scheduler.begin_frame(screen):
+        ...draw the scene as usual; the screen is clipped to what changed...
+        scheduler.present(screen)
+    scheduler.tick()
+"""
+
+import pygame
+
+BACKGROUND_FPS = 10  # Tick rate while the window is unfocused or minimized
+IDLE_TIMEOUT = 1.0  # Seconds a static state sleeps in event.wait() before the loop runs anyway
+
+
+class FrameScheduler:
+    """Event-driven redraw for static states and throttling for background windows.
+
+    The whole screen is dirty whenever the idle flag or the caller's state changes,
+    when the window is exposed, restored or refocused, and on the first frame.
+    """
+
+    def __init__(self, clock, fps=60, background_fps=BACKGROUND_FPS, idle_timeout=IDLE_TIMEOUT):
+        self.clock = clock
+        self.fps = fps
+        self.background_fps = background_fps
+        self.idle_timeout = idle_timeout
+        self.idle = False
+        self.state = None
+        self.focused = True
+        self.minimized = False
+        self.full = True  # The whole screen needs drawing
+        self.dirty = []  # Otherwise, the regions that do
+
+    def events(self, idle=False, state=None):
+        """This frame's events; while idle, blocks until one arrives or idle_timeout passes"""
+        if idle != self.idle or state != self.state:
+            self.idle = idle
+            self.state = state
+            self.invalidate()
+        if idle:
+            first = pygame.event.wait(int(self.idle_timeout * 1000))
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+        else:
+            events = pygame.event.get()
+
+        for event in events:
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+                self.invalidate()
+            elif event.type == pygame.WINDOWMINIMIZED:
+                self.minimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED,
+                                pygame.WINDOWSIZECHANGED, pygame.VIDEOEXPOSE):
+                self.minimized = False
+                self.invalidate()
+        return events
+
+    def invalidate(self, rect=None):
+        """Mark a region for redrawing, or the whole screen if rect is None"""
+        if rect is None:
+            self.full = True
+            self.dirty.clear()
+        elif not self.full:
+            self.dirty.append(pygame.Rect(rect))
+
+    def begin_frame(self, screen):
+        """Whether to draw this frame; if so, clips screen to the regions that changed"""
+        if self.minimized:
+            return False
+        if not self.idle:
+            return True
+        if self.full:
+            screen.set_clip(None)
+            return True
+        if not self.dirty:
+            return False
+        screen.set_clip(self.dirty[0].unionall(self.dirty[1:]))
+        return True
+
+    def present(self, screen, show=None):
+        """Show what was drawn: the whole screen when animating, only the dirty regions when idle"""
+        screen.set_clip(None)
+        # A window drawn through a renderer rather than pygame.display (see texture_renderer.py) is shown by show()
+        if show:
+            show()
+        elif self.idle and not self.full:
+            pygame.display.update(self.dirty)
+        else:
+            pygame.display.flip()
+        self.full = False
+        self.dirty.clear()
+
+    def tick(self):
+        """Limit the frame rate; background windows drop to background_fps"""
+        if self.focused and not self.minimized:
+            return self.clock.tick(self.fps)
+        return self.clock.tick(self.background_fps)
@@ -252,8 +252,182 @@ class Level:
             self.required_score = 100
             self.background_color = CYAN
 
+# Cheetah pose atlas constants
+POSE_PHASES = 16  # Samples of the shared tail/ear cycle (2*pi / 0.1 frames)
+GLOW_CYCLE = 60  # BeautifulCheetah.glow_effect wraps on its own, so the glow is baked apart from the poses
+POSE_CYCLE = 2 * math.pi / 0.1
+CHEETAH_ROTATIONS = (-15, 0, 15)
+# Per-leg (dx, dy) offsets for each run-cycle frame and the mid-air pose
+RUN_CYCLE = (
+    ((0, 0), (0, 0), (0, 0), (0, 0)),
+    ((3, -2), (-3, 0), (3, -2), (-3, 0)),
+    ((0, 0), (0, 0), (0, 0), (0, 0)),
+    ((-3, 0), (3, -2), (-3, 0), (3, -2)),
+)
+JUMP_POSE = ((-4, -3), (-2, -4), (2, -4), (4, -3))
+
+class CheetahPoseAtlas:
+    def __init__(self):
+        self.frames = {}
+        for pose, legs in enumerate(RUN_CYCLE + (JUMP_POSE,)):
+            for phase in range(POSE_PHASES):
+                for blink in (False, True):
+                    cheetah_surface = self.paint_cheetah(legs, phase * POSE_CYCLE / POSE_PHASES, blink)
+                    rotations = {}
+                    for rotation in CHEETAH_ROTATIONS:
+                        rotated_surface = pygame.transform.rotate(cheetah_surface, rotation).convert_alpha()
+                        rotations[rotation] = (rotated_surface,
+                                               -rotated_surface.get_width()//2,
+                                               -rotated_surface.get_height()//2)
+                    self.frames[(pose, phase, blink)] = rotations
+        
+        # One glow layer per intensity the live glow cycle reaches, rotated like the poses
+        self.glows = {}
+        for glow_effect in range(GLOW_CYCLE):
+            intensity = self.glow_intensity(glow_effect)
+            if intensity not in self.glows:
+                glow_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
+                pygame.draw.ellipse(glow_surface, (255, 200, 100, intensity), (10, 15, 80, 50))
+                self.glows[intensity] = {rotation: pygame.transform.rotate(glow_surface, rotation).convert_alpha()
+                                         for rotation in CHEETAH_ROTATIONS}
+                    
+    def get(self, pose, timer, blink, rotation):
+        phase = int(timer * POSE_PHASES / POSE_CYCLE) % POSE_PHASES
+        return self.frames[(pose, phase, blink)][rotation]
+        
+    @staticmethod
+    def glow_intensity(glow_effect):
+        return int(20 + 10 * math.sin(glow_effect * 0.1))
+        
+    def glow(self, glow_effect, rotation):
+        # Same size as the poses before rotation, so the pose's centering offset fits it too
+        return self.glows[self.glow_intensity(glow_effect)][rotation]
+        
+    def paint_cheetah(self, legs, timer, blink):
+        # The glow around the cheetah is drawn underneath from its own layer, see glow()
+        cheetah_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
+        
+        # Body with gradient and shading
+        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (15, 20, 50, 30))
+        pygame.draw.ellipse(cheetah_surface, ORANGE, (18, 22, 44, 24))
+        pygame.draw.ellipse(cheetah_surface, LIGHT_ORANGE, (20, 24, 40, 20))
+        
+        # Muscle definition
+        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (25, 25, 15, 8))
+        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (35, 28, 12, 6))
+        
+        # Spots with realistic pattern
+        spots = [
+            (22, 28), (30, 26), (38, 30), (26, 32), (34, 30), (42, 28),
+            (20, 25), (28, 23), (36, 27), (24, 29), (32, 27), (40, 25)
+        ]
+        for spot in spots:
+            # Spot shadow
+            pygame.draw.circle(cheetah_surface, DARK_BROWN, (spot[0]+1, spot[1]+1), 4)
+            # Main spot
+            pygame.draw.circle(cheetah_surface, BLACK, spot, 3)
+            # Spot highlight
+            pygame.draw.circle(cheetah_surface, DARK_GRAY, (spot[0]-1, spot[1]-1), 1)
+        
+        # Head with detailed features
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (60, 30), 18)
+        pygame.draw.circle(cheetah_surface, ORANGE, (62, 32), 15)
+        pygame.draw.circle(cheetah_surface, LIGHT_ORANGE, (64, 34), 12)
+        
+        # Ears with realistic detail
+        ear_twitch = math.sin(timer * 0.1) * 2
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (70, 18 + ear_twitch), 8)
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (74, 22 + ear_twitch), 7)
+        pygame.draw.circle(cheetah_surface, PINK, (71, 19 + ear_twitch), 5)
+        pygame.draw.circle(cheetah_surface, PINK, (75, 23 + ear_twitch), 4)
+        pygame.draw.circle(cheetah_surface, WHITE, (72, 20 + ear_twitch), 2)
+        pygame.draw.circle(cheetah_surface, WHITE, (76, 24 + ear_twitch), 2)
+        
+        # Eyes with blinking animation
+        if not blink:
+            # Eye whites
+            pygame.draw.circle(cheetah_surface, WHITE, (65, 28), 6)
+            pygame.draw.circle(cheetah_surface, WHITE, (68, 28), 6)
+            # Iris
+            pygame.draw.circle(cheetah_surface, GOLD, (66, 29), 3)
+            pygame.draw.circle(cheetah_surface, GOLD, (69, 29), 3)
+            # Pupils
+            pygame.draw.circle(cheetah_surface, BLACK, (66, 30), 2)
+            pygame.draw.circle(cheetah_surface, BLACK, (69, 30), 2)
+            # Eye highlights
+            pygame.draw.circle(cheetah_surface, WHITE, (65.5, 28.5), 1)
+            pygame.draw.circle(cheetah_surface, WHITE, (68.5, 28.5), 1)
+        else:
+            # Blinking eyes
+            pygame.draw.ellipse(cheetah_surface, BLACK, (62, 26, 6, 2))
+            pygame.draw.ellipse(cheetah_surface, BLACK, (65, 26, 6, 2))
+        
+        # Nose with detail
+        pygame.draw.circle(cheetah_surface, BLACK, (78, 30), 3)
+        pygame.draw.circle(cheetah_surface, PINK, (79, 31), 1)
+        
+        # Mouth with expression
+        pygame.draw.arc(cheetah_surface, BLACK, (70, 30, 8, 6), 0, 3.14, 2)
+        pygame.draw.circle(cheetah_surface, PINK, (74, 33), 1)
+        
+        # Whiskers
+        whisker_points = [(75, 28), (85, 26), (75, 29), (85, 29), (75, 30), (85, 32)]
+        for i in range(0, len(whisker_points), 2):
+            pygame.draw.line(cheetah_surface, WHITE, whisker_points[i], whisker_points[i+1], 1)
+        
+        # Legs with muscle definition
+        leg_positions = [(22, 40), (32, 40), (42, 40), (52, 40)]
+        leg_positions = [(x + dx, y + dy) for (x, y), (dx, dy) in zip(leg_positions, legs)]
+        for i, pos in enumerate(leg_positions):
+            # Upper leg
+            pygame.draw.rect(cheetah_surface, DARK_ORANGE, (pos[0], pos[1], 6, 15))
+            pygame.draw.rect(cheetah_surface, ORANGE, (pos[0]+1, pos[1]+1, 4, 13))
+            # Lower leg
+            pygame.draw.rect(cheetah_surface, DARK_ORANGE, (pos[0]+1, pos[1]+15, 4, 8))
+            pygame.draw.rect(cheetah_surface, ORANGE, (pos[0]+2, pos[1]+16, 2, 6))
+        
+        # Paws with detail
+        paw_positions = [(x + 2, y + 13) for (x, y) in leg_positions]
+        for pos in paw_positions:
+            pygame.draw.circle(cheetah_surface, BLACK, pos, 3)
+            pygame.draw.circle(cheetah_surface, DARK_GRAY, (pos[0]-1, pos[1]-1), 1)
+        
+        # Tail with wagging animation
+        tail_wag = math.sin(timer * 0.2) * 5
+        tail_base = (18, 30)
+        tail_mid = (10, 25 + tail_wag)
+        tail_tip = (2, 30 + tail_wag * 2)
+        
+        # Tail shadow
+        pygame.draw.polygon(cheetah_surface, DARK_BROWN, [
+            (tail_base[0]+2, tail_base[1]+2), 
+            (tail_mid[0]+2, tail_mid[1]+2), 
+            (tail_tip[0]+2, tail_tip[1]+2),
+            (tail_mid[0]+2, tail_base[1]+2)
+        ])
+        
+        # Main tail
+        pygame.draw.polygon(cheetah_surface, DARK_ORANGE, [tail_base, tail_mid, tail_tip, (tail_mid[0], tail_base[1])])
+        pygame.draw.polygon(cheetah_surface, ORANGE, [
+            (tail_base[0]+2, tail_base[1]+2), 
+            (tail_mid[0]+2, tail_mid[1]+2), 
+            (tail_tip[0]+2, tail_tip[1]+2),
+            (tail_mid[0]+2, tail_base[1]+2)
+        ])
+        
+        # Tail spots
+        tail_spots = [(12, 27), (8, 28), (4, 29)]
+        for spot in tail_spots:
+            pygame.draw.circle(cheetah_surface, BLACK, (spot[0] + tail_wag//2, spot[1]), 2)
+        
+        # Tail tip
+        pygame.draw.circle(cheetah_surface, BLACK, (tail_tip[0], tail_tip[1]), 3)
+        pygame.draw.circle(cheetah_surface, WHITE, (tail_tip[0]-1, tail_tip[1]-1), 1)
+        
+        return cheetah_surface
+
 class BeautifulCheetah:
-    def __init__(self, x, y, audio_manager):
+    def __init__(self, x, y, audio_manager, pose_atlas):
         self.x = x
         self.y = y
         self.velocity_y = 0
@@ -268,6 +442,7 @@ class BeautifulCheetah:
         self.invincible_timer = 0
         self.current_platform = None
         self.audio_manager = audio_manager
+        self.pose_atlas = pose_atlas
         self.was_on_platform = False
         self.eye_blink_timer = 0
         self.tail_wag_timer = 0
@@ -396,141 +571,20 @@ class BeautifulCheetah:
             pygame.draw.circle(screen, (255, 200, 100, alpha//2), (int(particle['x']), int(particle['y'])), 6)
             pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), 3)
         
-        # Draw BEAUTIFUL cheetah with enhanced graphics
-        cheetah_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
-        
-        # Glow effect around cheetah
-        glow_intensity = int(20 + 10 * math.sin(self.glow_effect * 0.1))
-        pygame.draw.ellipse(cheetah_surface, (255, 200, 100, glow_intensity), (10, 15, 80, 50))
-        
-        # Body with gradient and shading
-        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (15, 20, 50, 30))
-        pygame.draw.ellipse(cheetah_surface, ORANGE, (18, 22, 44, 24))
-        pygame.draw.ellipse(cheetah_surface, LIGHT_ORANGE, (20, 24, 40, 20))
-        
-        # Muscle definition
-        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (25, 25, 15, 8))
-        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (35, 28, 12, 6))
-        
-        # Spots with realistic pattern
-        spots = [
-            (22, 28), (30, 26), (38, 30), (26, 32), (34, 30), (42, 28),
-            (20, 25), (28, 23), (36, 27), (24, 29), (32, 27), (40, 25)
-        ]
-        for spot in spots:
-            # Spot shadow
-            pygame.draw.circle(cheetah_surface, DARK_BROWN, (spot[0]+1, spot[1]+1), 4)
-            # Main spot
-            pygame.draw.circle(cheetah_surface, BLACK, spot, 3)
-            # Spot highlight
-            pygame.draw.circle(cheetah_surface, DARK_GRAY, (spot[0]-1, spot[1]-1), 1)
-        
-        # Head with detailed features
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (60, 30), 18)
-        pygame.draw.circle(cheetah_surface, ORANGE, (62, 32), 15)
-        pygame.draw.circle(cheetah_surface, LIGHT_ORANGE, (64, 34), 12)
-        
-        # Ears with realistic detail
-        ear_twitch = math.sin(self.ear_twitch_timer * 0.1) * 2
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (70, 18 + ear_twitch), 8)
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (74, 22 + ear_twitch), 7)
-        pygame.draw.circle(cheetah_surface, PINK, (71, 19 + ear_twitch), 5)
-        pygame.draw.circle(cheetah_surface, PINK, (75, 23 + ear_twitch), 4)
-        pygame.draw.circle(cheetah_surface, WHITE, (72, 20 + ear_twitch), 2)
-        pygame.draw.circle(cheetah_surface, WHITE, (76, 24 + ear_twitch), 2)
-        
-        # Eyes with blinking animation
-        blink = self.eye_blink_timer > 100 and self.eye_blink_timer < 105
-        if not blink:
-            # Eye whites
-            pygame.draw.circle(cheetah_surface, WHITE, (65, 28), 6)
-            pygame.draw.circle(cheetah_surface, WHITE, (68, 28), 6)
-            # Iris
-            pygame.draw.circle(cheetah_surface, GOLD, (66, 29), 3)
-            pygame.draw.circle(cheetah_surface, GOLD, (69, 29), 3)
-            # Pupils
-            pygame.draw.circle(cheetah_surface, BLACK, (66, 30), 2)
-            pygame.draw.circle(cheetah_surface, BLACK, (69, 30), 2)
-            # Eye highlights
-            pygame.draw.circle(cheetah_surface, WHITE, (65.5, 28.5), 1)
-            pygame.draw.circle(cheetah_surface, WHITE, (68.5, 28.5), 1)
-        else:
-            # Blinking eyes
-            pygame.draw.ellipse(cheetah_surface, BLACK, (62, 26, 6, 2))
-            pygame.draw.ellipse(cheetah_surface, BLACK, (65, 26, 6, 2))
-        
-        # Nose with detail
-        pygame.draw.circle(cheetah_surface, BLACK, (78, 30), 3)
-        pygame.draw.circle(cheetah_surface, PINK, (79, 31), 1)
-        
-        # Mouth with expression
-        pygame.draw.arc(cheetah_surface, BLACK, (70, 30, 8, 6), 0, 3.14, 2)
-        pygame.draw.circle(cheetah_surface, PINK, (74, 33), 1)
-        
-        # Whiskers
-        whisker_points = [(75, 28), (85, 26), (75, 29), (85, 29), (75, 30), (85, 32)]
-        for i in range(0, len(whisker_points), 2):
-            pygame.draw.line(cheetah_surface, WHITE, whisker_points[i], whisker_points[i+1], 1)
-        
-        # Legs with muscle definition
-        leg_positions = [(22, 40), (32, 40), (42, 40), (52, 40)]
-        for i, pos in enumerate(leg_positions):
-            # Upper leg
-            pygame.draw.rect(cheetah_surface, DARK_ORANGE, (pos[0], pos[1], 6, 15))
-            pygame.draw.rect(cheetah_surface, ORANGE, (pos[0]+1, pos[1]+1, 4, 13))
-            # Lower leg
-            pygame.draw.rect(cheetah_surface, DARK_ORANGE, (pos[0]+1, pos[1]+15, 4, 8))
-            pygame.draw.rect(cheetah_surface, ORANGE, (pos[0]+2, pos[1]+16, 2, 6))
-        
-        # Paws with detail
-        paw_positions = [(24, 53), (34, 53), (44, 53), (54, 53)]
-        for pos in paw_positions:
-            pygame.draw.circle(cheetah_surface, BLACK, pos, 3)
-            pygame.draw.circle(cheetah_surface, DARK_GRAY, (pos[0]-1, pos[1]-1), 1)
-        
-        # Tail with wagging animation
-        tail_wag = math.sin(self.tail_wag_timer * 0.2) * 5
-        tail_base = (18, 30)
-        tail_mid = (10, 25 + tail_wag)
-        tail_tip = (2, 30 + tail_wag * 2)
-        
-        # Tail shadow
-        pygame.draw.polygon(cheetah_surface, DARK_BROWN, [
-            (tail_base[0]+2, tail_base[1]+2), 
-            (tail_mid[0]+2, tail_mid[1]+2), 
-            (tail_tip[0]+2, tail_tip[1]+2),
-            (tail_mid[0]+2, tail_base[1]+2)
-        ])
-        
-        # Main tail
-        pygame.draw.polygon(cheetah_surface, DARK_ORANGE, [tail_base, tail_mid, tail_tip, (tail_mid[0], tail_base[1])])
-        pygame.draw.polygon(cheetah_surface, ORANGE, [
-            (tail_base[0]+2, tail_base[1]+2), 
-            (tail_mid[0]+2, tail_mid[1]+2), 
-            (tail_tip[0]+2, tail_tip[1]+2),
-            (tail_mid[0]+2, tail_base[1]+2)
-        ])
-        
-        # Tail spots
-        tail_spots = [(12, 27), (8, 28), (4, 29)]
-        for spot in tail_spots:
-            pygame.draw.circle(cheetah_surface, BLACK, (spot[0] + tail_wag//2, spot[1]), 2)
-        
-        # Tail tip
-        pygame.draw.circle(cheetah_surface, BLACK, (tail_tip[0], tail_tip[1]), 3)
-        pygame.draw.circle(cheetah_surface, WHITE, (tail_tip[0]-1, tail_tip[1]-1), 1)
-        
-        # Rotate the cheetah
-        rotated_surface = pygame.transform.rotate(cheetah_surface, self.rotation)
-        
         # Apply invincibility effect
         if self.invincible and self.invincible_timer % 10 < 5:
             # Make cheetah flash when invincible
-            pass  # Skip drawing to create flash effect
+            return  # Skip drawing to create flash effect
+            
+        # Look up the pre-rendered pose: run-cycle frame on the ground, jump pose in the air
+        if self.is_on_ground or self.is_on_platform:
+            pose = int(self.animation_frame) % len(RUN_CYCLE)
         else:
-            # Draw to screen
-            screen.blit(rotated_surface, (self.x - rotated_surface.get_width()//2, 
-                                         self.y - rotated_surface.get_height()//2))
+            pose = len(RUN_CYCLE)
+        blink = self.eye_blink_timer > 100 and self.eye_blink_timer < 105
+        cheetah_surface, offset_x, offset_y = self.pose_atlas.get(pose, self.tail_wag_timer, blink, self.rotation)
+        screen.blit(self.pose_atlas.glow(self.glow_effect, self.rotation), (self.x + offset_x, self.y + offset_y))
+        screen.blit(cheetah_surface, (self.x + offset_x, self.y + offset_y))
 
 # Rest of the classes remain the same as in the audio version
 # Platform, Obstacle, Background classes would be included here
@@ -547,6 +601,9 @@ class Game:
         # Initialize audio manager
         self.audio_manager = AudioManager()
         
+        # Pre-render the cheetah poses once the display exists
+        self.pose_atlas = CheetahPoseAtlas()
+        
         # Initialize levels
         self.levels = [
             Level(1, "Tutorial", "Easy level to get started", BLUE),
@@ -562,7 +619,7 @@ class Game:
         self.reset_game()
         
     def reset_game(self):
-        self.cheetah = BeautifulCheetah(100, GROUND_Y - 40, self.audio_manager)
+        self.cheetah = BeautifulCheetah(100, GROUND_Y - 40, self.audio_manager, self.pose_atlas)
         self.obstacles = []
         self.platforms = []
         self.background = Background(self.levels[self.current_level - 1].background_color)
@@ -1331,8 +1331,11 @@ class EnhancedBackground:
                 'height': random.randint(20, 60),
                 'color': (random.randint(0, 255), random.randint(100, 255), random.randint(100, 255)),
                 'speed': random.uniform(0.1, 0.3),
-                'opacity': random.randint(30, 100)
+                'opacity': random.randint(30, 100),
+                'surface': None
             })
+        for aurora in self.aurora_effect:
+            self.bake_aurora(aurora)
         
         # Generate floating particles
         for _ in range(30):
@@ -1346,6 +1349,28 @@ class EnhancedBackground:
                 'life': random.randint(100, 300)
             })
         
+        # Reusable full-screen flash and the ground gradient, drawn once instead of every frame
+        self.flash_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.flash_overlay.fill(WHITE)
+        self.ground_gradient = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y))
+        for y in range(SCREEN_HEIGHT - GROUND_Y):
+            ratio = y / (SCREEN_HEIGHT - GROUND_Y)
+            r = int(50 * (1 - ratio * 0.5))
+            g = int(200 * (1 - ratio * 0.3))
+            b = int(50 * (1 - ratio * 0.5))
+            pygame.draw.line(self.ground_gradient, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        
+    def bake_aurora(self, aurora):
+        # Paint the fading band into its own surface, reusing it when the opacity changes
+        if aurora['surface'] is None:
+            aurora['surface'] = pygame.Surface((aurora['width'], aurora['height']), pygame.SRCALPHA)
+        aurora_surface = aurora['surface']
+        aurora_surface.fill((0, 0, 0, 0))
+        for i in range(aurora['height']):
+            alpha = int(aurora['opacity'] * (1 - i / aurora['height']))
+            color = (*aurora['color'], alpha)
+            pygame.draw.line(aurora_surface, color, (0, i), (aurora['width'], i))
+        
     def update(self):
         # Update parallax offset
         self.parallax_offset += 1
@@ -1390,6 +1415,7 @@ class EnhancedBackground:
             if aurora['x'] + aurora['width'] < -aurora['width']:
                 aurora['x'] = SCREEN_WIDTH + aurora['width']
                 aurora['opacity'] = random.randint(30, 100)
+                self.bake_aurora(aurora)
         
         # Update particles
         for particle in self.particles:
@@ -1436,12 +1462,7 @@ class EnhancedBackground:
         
         # Draw aurora effect
         for aurora in self.aurora_effect:
-            aurora_surface = pygame.Surface((aurora['width'], aurora['height']), pygame.SRCALPHA)
-            for i in range(aurora['height']):
-                alpha = int(aurora['opacity'] * (1 - i / aurora['height']))
-                color = (*aurora['color'], alpha)
-                pygame.draw.line(aurora_surface, color, (0, i), (aurora['width'], i))
-            screen.blit(aurora_surface, (aurora['x'], aurora['y']))
+            screen.blit(aurora['surface'], (aurora['x'], aurora['y']))
         
         # Draw stars with twinkling
         for star in self.stars:
@@ -1506,20 +1527,11 @@ class EnhancedBackground:
         
         # Lightning effect
         for flash in self.lightning_flashes:
-            lightning_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            lightning_color = (255, 255, 255, flash['intensity'])
-            lightning_surface.fill(lightning_color)
-            screen.blit(lightning_surface, (0, 0))
+            self.flash_overlay.set_alpha(flash['intensity'])
+            screen.blit(self.flash_overlay, (0, 0))
         
         # Draw ground with detailed texture
-        ground_gradient = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y))
-        for y in range(SCREEN_HEIGHT - GROUND_Y):
-            ratio = y / (SCREEN_HEIGHT - GROUND_Y)
-            r = int(50 * (1 - ratio * 0.5))
-            g = int(200 * (1 - ratio * 0.3))
-            b = int(50 * (1 - ratio * 0.5))
-            pygame.draw.line(ground_gradient, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        screen.blit(ground_gradient, (0, GROUND_Y))
+        screen.blit(self.ground_gradient, (0, GROUND_Y))
         
         # Draw detailed grass texture
         for i in range(0, SCREEN_WIDTH, 15):
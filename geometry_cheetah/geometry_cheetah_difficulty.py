@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Geometry Cheetah Difficulty Analyzer
+Monte Carlo sweep of the ultimate edition's levels, played by a scripted reference bot.
+
+Every game is a seeded, offscreen run of the real Game.update(), so the numbers follow
+any change to spawning or to the Level settings. Games are spread over a process pool
+and aggregated into a per-level report of completion rates, score distributions and
+the worst obstacle densities seen. Any game can be reproduced from its level and seed.
+
+    python geometry_cheetah_difficulty.py --games 2000
+"""
+
+import os
+import json
+import time
+import argparse
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# The game module opens a window and the mixer when it is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import geometry_cheetah_ultimate as ultimate
+from geometry_cheetah_ultimate import GameState, FPS, INPUT_JUMP
+
+BOT_LEAD_FRAMES = 8  # The bot jumps this many frames before an obstacle reaches it
+MAX_FRAMES = 10 * 60 * FPS  # Games still running after ten simulated minutes are cut off
+SEEDS_PER_TASK = 20  # Games handed to a worker at a time
+
+game = None  # Each worker process keeps one offscreen Game and resets it between runs
+
+
+def init_worker():
+    global game
+    game = ultimate.Game()
+
+
+def reference_bot(game):
+    """Jump when the next obstacle at the cheetah's height is BOT_LEAD_FRAMES away"""
+    cheetah = game.cheetah
+    speed = game.levels[game.current_level - 1].obstacle_speed
+    hit_top = cheetah.y - 20
+    ahead = [rect for rect in (obstacle.get_rect() for obstacle in game.obstacles)
+             if rect.right > cheetah.x - 20 and rect.bottom > hit_top]
+    if not ahead:
+        return False
+    gap = min(rect.left for rect in ahead) - (cheetah.x + 20)
+    return gap <= BOT_LEAD_FRAMES * speed
+
+
+def play_game(level, seed):
+    # The bot's inputs are fed through a replay, so the run is reproducible and no file is written
+    game.replay = ultimate.Replay(seed, level)
+    game.current_level = level
+    game.reset_game(seed)
+    game.game_state = GameState.PLAYING
+    speed = game.levels[level - 1].obstacle_speed
+    peak_obstacles = 0
+    tightest_gap = None
+    obstacle_count = 0
+
+    while game.game_state == GameState.PLAYING and game.frame < MAX_FRAMES:
+        game.replay.inputs.append(INPUT_JUMP if reference_bot(game) else 0)
+        game.step()
+
+        # Density only changes when an obstacle spawns, since they all scroll together
+        if len(game.obstacles) > obstacle_count:
+            peak_obstacles = max(peak_obstacles, len(game.obstacles))
+            lineup = sorted((obstacle.x, obstacle.width) for obstacle in game.obstacles)
+            for (x, width), (next_x, _) in zip(lineup, lineup[1:]):
+                if tightest_gap is None or next_x - x - width < tightest_gap:
+                    tightest_gap = next_x - x - width
+        obstacle_count = len(game.obstacles)
+
+    killer = None
+    if game.game_state == GameState.GAME_OVER:
+        for obstacle in game.obstacles:
+            if game.cheetah_rect.colliderect(obstacle.get_rect()):
+                killer = obstacle.obstacle_type
+                break
+    return {
+        "level": level,
+        "seed": seed,
+        "completed": game.game_state == GameState.LEVEL_COMPLETE,
+        "score": game.score,
+        "frames": game.frame,
+        "lives_left": game.cheetah.lives if game.game_state == GameState.LEVEL_COMPLETE else 0,
+        "killer": killer,
+        "peak_obstacles": peak_obstacles,
+        "tightest_gap": tightest_gap,
+        "tightest_gap_frames": None if tightest_gap is None else tightest_gap / speed,
+    }
+
+
+def play_games(level, seeds):
+    return [play_game(level, seed) for seed in seeds]
+
+
+def summarize(level, results):
+    """Aggregate one level's game results into a report entry"""
+    scores = np.array([result["score"] for result in results])
+    gaps = [result for result in results if result["tightest_gap"] is not None]
+    hardest = min(results, key=lambda result: (result["completed"], result["score"]))
+    killers = Counter(result["killer"] for result in results if result["killer"])
+    deaths = sum(killers.values())
+    return {
+        "level": level.level_num,
+        "name": level.name,
+        "obstacle_speed": level.obstacle_speed,
+        "obstacle_spawn_rate": level.obstacle_spawn_rate,
+        "platform_spawn_rate": level.platform_spawn_rate,
+        "power_up_spawn_rate": level.power_up_spawn_rate,
+        "required_score": level.required_score,
+        "games": len(results),
+        "completion_rate": float(np.mean([result["completed"] for result in results])),
+        "score_percentiles": {str(p): float(np.percentile(scores, p)) for p in (10, 25, 50, 75, 90)},
+        "mean_frames": float(np.mean([result["frames"] for result in results])),
+        "peak_obstacles_on_screen": max(result["peak_obstacles"] for result in results),
+        "tightest_gap": min((result["tightest_gap"] for result in gaps), default=None),
+        "tightest_gap_frames": min((result["tightest_gap_frames"] for result in gaps), default=None),
+        "deaths_by_obstacle": {name: count / deaths for name, count in killers.most_common()},
+        "hardest_seed": hardest["seed"],
+    }
+
+
+def print_report(report):
+    for entry in report:
+        print(f"Level {entry['level']}: {entry['name']} (speed {entry['obstacle_speed']}, "
+              f"spawn rates {entry['obstacle_spawn_rate']}/{entry['platform_spawn_rate']}/"
+              f"{entry['power_up_spawn_rate']}, needs {entry['required_score']})")
+        percentiles = "/".join(f"{value:.0f}" for value in entry["score_percentiles"].values())
+        print(f"  {entry['games']} games, {entry['completion_rate']:.1%} completed, "
+              f"score p10/p25/p50/p75/p90 {percentiles}, {entry['mean_frames'] / FPS:.0f}s average run")
+        if entry["tightest_gap"] is not None:
+            print(f"  up to {entry['peak_obstacles_on_screen']} obstacles on screen at once, tightest gap "
+                  f"{entry['tightest_gap']}px ({entry['tightest_gap_frames']:.1f} frames)")
+        if entry["deaths_by_obstacle"]:
+            killers = ", ".join(f"{name} {share:.0%}" for name, share in entry["deaths_by_obstacle"].items())
+            print(f"  deaths by obstacle: {killers}; hardest seed {entry['hardest_seed']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo difficulty report for Geometry Cheetah's levels")
+    parser.add_argument("--games", type=int, default=1000, help="seeded games per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3, 4, 5, 6], choices=range(1, 7))
+    parser.add_argument("--first-seed", type=int, default=0, help="games use seeds first-seed, first-seed + 1, ...")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--save-replays", metavar="DIR", help="save each level's hardest game as a .gcr replay")
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    tasks = [(level, seeds[i:i + SEEDS_PER_TASK]) for level in args.levels for i in range(0, len(seeds), SEEDS_PER_TASK)]
+    results = {level: [] for level in args.levels}
+
+    # Workers are spawned rather than forked so none of them inherits this process's SDL state
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, multiprocessing.get_context("spawn"), init_worker) as executor:
+        for batch in executor.map(play_games, *zip(*tasks)):
+            results[batch[0]["level"]].extend(batch)
+    elapsed = time.perf_counter() - start_time
+
+    # The main process gets its own Game too, for the level settings and for re-recording replays
+    init_worker()
+    report = [summarize(game.levels[level - 1], results[level]) for level in args.levels]
+    print_report(report)
+    total_frames = sum(result["frames"] for level_results in results.values() for result in level_results)
+    print(f"{args.games * len(args.levels)} games ({total_frames:,} frames) in {elapsed:.1f}s "
+          f"on {args.workers} worker(s)")
+    if args.json:
+        with open(args.json, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+    if args.save_replays:
+        os.makedirs(args.save_replays, exist_ok=True)
+        for entry in report:
+            # Runs are deterministic, so playing the seed again records the same game
+            result = play_game(entry["level"], entry["hardest_seed"])
+            game.replay.score = result["score"]
+            path = os.path.join(args.save_replays, f"level{entry['level']}_seed{entry['hardest_seed']}.gcr")
+            game.replay.save(path)
+            print(f"Saved {path}")
+    ultimate.pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
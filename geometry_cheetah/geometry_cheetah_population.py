@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Geometry Cheetah Population Simulator
+Runs a whole population of cheetahs headless against one shared obstacle/cloud stream.
+
+The world is the ultimate edition's own Game.update_world(), stepped once per tick, so
+spawning and scrolling are exactly the game's. Each cheetah's jump, double-jump, landing,
+power-up and hit physics mirror Cheetah.update() / Game.update(), but as NumPy arrays over
+the whole population, so one obstacle timeline is evaluated for every agent per tick.
+
+    population = CheetahPopulation(level=3, size=500, seed=0)
+    policy = reflex_policy(np.linspace(20, 200, 500))
+    while not population.done:
+        population.step(policy(population))
+    print(population.survival_curve())
+"""
+
+import os
+import time
+import argparse
+import numpy as np
+
+# The game module opens a window and the mixer when it is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import geometry_cheetah_ultimate as ultimate
+from geometry_cheetah_ultimate import GRAVITY, JUMP_FORCE, GROUND_Y, FPS, PowerUpType
+
+CHEETAH_X = 100
+LANDING_HALF_SIZE = 25  # Cheetah.check_cloud_collision uses a 50x50 box around the cheetah
+HIT_HALF_SIZE = 20  # Game.cheetah_rect is 40x40
+MAX_FRAMES = 10 * 60 * FPS  # Give up on a level after ten simulated minutes
+SURVIVAL_POINTS = 10  # Survival is reported at every tenth of the level's required score
+
+
+def pixel(values):
+    # Assigning a float to a Rect attribute (such as center) rounds it, halves away from zero;
+    # the Rect() constructor instead truncates, which np.trunc matches
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5))
+
+
+class CheetahPopulation:
+    """size cheetahs playing one seeded run of a level side by side.
+
+    Obstacles and clouds are shared, since nothing about them depends on the cheetah.
+    Power-ups stay in the shared world until they scroll away and every cheetah can
+    collect its own copy, so with power-ups enabled the power-up stream can drift from
+    a single-player run where collecting one frees up spawn spacing.
+    """
+
+    def __init__(self, level=1, size=100, seed=None, game=None):
+        self.game = game or ultimate.Game()
+        self.game.current_level = level
+        self.game.reset_game(seed)
+        self.level = self.game.levels[level - 1]
+        self.size = size
+
+        # Per-cheetah state, one slot per agent
+        self.y = np.full(size, float(GROUND_Y - 40))
+        self.velocity_y = np.zeros(size)
+        self.on_ground = np.ones(size, dtype=bool)
+        self.on_platform = np.zeros(size, dtype=bool)
+        self.on_bouncy_cloud = np.zeros(size, dtype=bool)
+        self.lives = np.full(size, 3)
+        self.invincible_timer = np.zeros(size, dtype=np.int64)
+        self.shield_timer = np.zeros(size, dtype=np.int64)
+        self.double_jump_timer = np.zeros(size, dtype=np.int64)
+        self.alive = np.ones(size, dtype=bool)
+        self.death_frame = np.full(size, -1)
+        self.death_score = np.full(size, -1)
+
+        # Power-up -> which cheetahs have already collected it
+        self.collected = {}
+        self.completed = False
+
+    @property
+    def done(self):
+        return self.completed or not self.alive.any() or self.game.frame >= MAX_FRAMES
+
+    def hit_top(self):
+        return pixel(self.y) - HIT_HALF_SIZE
+
+    def step(self, jumps):
+        """Advance one frame; jumps is a bool per cheetah, ignored for dead ones"""
+        game = self.game
+        game.frame += 1
+        alive = self.alive
+
+        # Cheetah.jump(): any jump uses up a pending double jump
+        jumping = alive & np.asarray(jumps, dtype=bool) & (self.on_ground | self.on_platform | (self.double_jump_timer > 0))
+        self.velocity_y[jumping] = np.where(self.on_bouncy_cloud[jumping], JUMP_FORCE * 1.3, JUMP_FORCE)
+        self.on_ground[jumping] = False
+        self.double_jump_timer[jumping] = 0
+
+        # Cheetah.update(): gravity, then land on the first cloud in query order while falling
+        self.velocity_y[alive] += GRAVITY
+        self.y[alive] += self.velocity_y[alive]
+        self.on_platform[:] = False
+        self.on_bouncy_cloud[:] = False
+        landing = alive & (self.velocity_y > 0)
+        if landing.any():
+            landing_top = np.trunc(self.y - LANDING_HALF_SIZE)
+            for cloud in game.cloud_grid.query(CHEETAH_X - LANDING_HALF_SIZE, CHEETAH_X + LANDING_HALF_SIZE):
+                rect = cloud.get_rect()
+                if not (rect.left < CHEETAH_X + LANDING_HALF_SIZE and CHEETAH_X - LANDING_HALF_SIZE < rect.right):
+                    continue
+                lands = landing & (landing_top < rect.bottom) & (rect.top < landing_top + 2 * LANDING_HALF_SIZE)
+                self.y[lands] = cloud.y - 40
+                self.velocity_y[lands] = 0
+                self.on_ground[lands] = True
+                self.on_platform[lands] = True
+                self.on_bouncy_cloud[lands] = cloud.cloud_type == "bouncy_cloud"
+                landing &= ~lands
+        grounded = alive & ~self.on_platform & (self.y >= GROUND_Y - 40)
+        self.y[grounded] = GROUND_Y - 40
+        self.velocity_y[grounded] = 0
+        self.on_ground[alive & ~self.on_platform] = grounded[alive & ~self.on_platform]
+        for timer in (self.invincible_timer, self.shield_timer, self.double_jump_timer):
+            timer[alive & (timer > 0)] -= 1
+
+        # The shared world moves on
+        game.update_world()
+        self.collected = {power_up: self.collected.get(power_up) for power_up in game.power_ups}
+
+        # Game.check_power_up_collision(): at most one power-up per cheetah per frame
+        hit_top = self.hit_top()
+        collecting = alive.copy()
+        for power_up in game.power_up_grid.query(CHEETAH_X - HIT_HALF_SIZE, CHEETAH_X + HIT_HALF_SIZE):
+            rect = power_up.get_rect()
+            if not (rect.left < CHEETAH_X + HIT_HALF_SIZE and CHEETAH_X - HIT_HALF_SIZE < rect.right):
+                continue
+            taken = self.collected[power_up]
+            if taken is None:
+                taken = self.collected[power_up] = np.zeros(self.size, dtype=bool)
+            gets = collecting & ~taken & (hit_top < rect.bottom) & (rect.top < hit_top + 2 * HIT_HALF_SIZE)
+            if gets.any():
+                self.activate_power_up(power_up.power_type, gets)
+                taken |= gets
+                collecting &= ~gets
+
+        # Game.check_collision(): a hit costs a life, the last one ends that cheetah's run
+        vulnerable = alive & (self.invincible_timer <= 0) & (self.shield_timer <= 0)
+        hit = np.zeros(self.size, dtype=bool)
+        for obstacle in game.obstacle_grid.query(CHEETAH_X - HIT_HALF_SIZE, CHEETAH_X + HIT_HALF_SIZE):
+            rect = obstacle.get_rect()
+            if rect.left < CHEETAH_X + HIT_HALF_SIZE and CHEETAH_X - HIT_HALF_SIZE < rect.right:
+                hit |= vulnerable & (hit_top < rect.bottom) & (rect.top < hit_top + 2 * HIT_HALF_SIZE)
+        dies = hit & (self.lives <= 1)
+        survives = hit & ~dies
+        self.lives[survives] -= 1
+        self.invincible_timer[survives] = 120
+        self.alive &= ~dies
+        self.death_frame[dies] = game.frame
+        self.death_score[dies] = game.score
+
+        if game.score >= self.level.required_score:
+            self.completed = True
+        return dies
+
+    def activate_power_up(self, power_type, agents):
+        # Only the effects that change physics or survival; the rest are cosmetic here
+        if power_type == PowerUpType.FLYING:
+            self.velocity_y[agents] = -5
+        elif power_type == PowerUpType.EXTRA_LIFE:
+            self.lives[agents] += 1
+        elif power_type == PowerUpType.INVINCIBILITY:
+            self.invincible_timer[agents] = 180
+        elif power_type == PowerUpType.DOUBLE_JUMP:
+            self.double_jump_timer[agents] = 240
+        elif power_type == PowerUpType.SHIELD:
+            self.shield_timer[agents] = 360
+
+    def next_obstacle(self):
+        """Rect of the closest obstacle whose right edge is still ahead of the cheetahs, or None"""
+        ahead = [obstacle.get_rect() for obstacle in self.game.obstacles
+                 if obstacle.x + obstacle.width > CHEETAH_X - HIT_HALF_SIZE]
+        return min(ahead, key=lambda rect: rect.left, default=None)
+
+    def survival_curve(self):
+        """(score, fraction of the population still alive) at every tenth of the required score"""
+        required = self.level.required_score
+        death_score = np.where(self.alive, np.iinfo(np.int64).max, self.death_score)
+        return [(required * i // SURVIVAL_POINTS, float(np.mean(death_score >= required * i // SURVIVAL_POINTS)))
+                for i in range(SURVIVAL_POINTS + 1)]
+
+
+def reflex_policy(reaction):
+    """Policy that jumps when the next obstacle is within each cheetah's reaction distance.
+
+    reaction holds one distance in pixels per cheetah, so a single population can span
+    everything from early, cautious jumpers to late, risky ones.
+    """
+    def policy(population):
+        rect = population.next_obstacle()
+        if rect is None:
+            return np.zeros(population.size, dtype=bool)
+        gap = rect.left - (CHEETAH_X + HIT_HALF_SIZE)
+        # Never jump into obstacles that hang above the cheetah, such as lasers and flying bushes
+        return (gap < reaction) & (rect.bottom > population.hit_top())
+    return policy
+
+
+def simulate_level(level, size, seed=None, game=None, policy=None):
+    """Run one level to the end for a whole population; returns the finished population"""
+    population = CheetahPopulation(level, size, seed, game)
+    if policy is None:
+        policy = reflex_policy(np.random.default_rng(seed).uniform(20, 200, size))
+    while not population.done:
+        population.step(policy(population))
+    return population
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Survival curves for a population of Geometry Cheetahs")
+    parser.add_argument("--population", type=int, default=500, help="cheetahs per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3, 4, 5, 6], choices=range(1, 7))
+    parser.add_argument("--seed", type=int, default=0, help="seed for the shared obstacle stream")
+    args = parser.parse_args()
+
+    game = ultimate.Game()
+    for level in args.levels:
+        start_time = time.perf_counter()
+        population = simulate_level(level, args.population, args.seed, game)
+        elapsed = time.perf_counter() - start_time
+        frames = population.game.frame
+
+        print(f"Level {level}: {population.level.name} (speed {population.level.obstacle_speed}, "
+              f"needs {population.level.required_score})")
+        for score, surviving in population.survival_curve():
+            print(f"  score {score:4d}  {surviving:6.1%}  {'#' * round(surviving * 40)}")
+        print(f"  completed by {population.alive.mean():.1%} after {frames} frames; "
+              f"{frames * args.population / elapsed:,.0f} cheetah-frames/s")
+    ultimate.pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
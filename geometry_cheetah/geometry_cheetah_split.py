@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Geometry Cheetah Split Simulation
+The ultimate edition with its simulation in a second process, so slow frames never slow the physics.
+
+The simulation process runs the real Game.update() headless at a fixed FPS tick and,
+after every tick, writes a fixed-layout snapshot of the world into shared memory. The
+window process keeps the menus, input and all drawing: it reads the newest two
+snapshots and interpolates between them, so motion stays smooth at any frame rate
+while jumps, spawns and collisions keep the simulation's exact frame timing. The two
+processes run on separate cores, and a frame that takes 25ms only drops frames.
+
+The shared block holds the window's jump counter and two snapshot slots. The writer
+fills the older slot, bumping its sequence number to odd before writing and to the
+next even number after, so the newer slot is always complete; a reader copies a slot
+and keeps it only if its sequence number was even and unchanged across the copy.
+
+    python geometry_cheetah_split.py
+    python geometry_cheetah_split.py --frame-load 25  # Every frame takes 25ms longer; the physics doesn't notice
+"""
+
+import os
+import time
+import struct
+import argparse
+import multiprocessing
+from multiprocessing import shared_memory
+
+# The simulation process never shows its window; its sounds still play
+if multiprocessing.parent_process() is not None:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+import geometry_cheetah_ultimate as ultimate
+from geometry_cheetah_ultimate import (GameState, PowerUpType, ScoreStore, CLOUD_TYPES, CHEETAH_X, GROUND_Y,
+                                       FPS, INPUT_JUMP, LEADERBOARD)
+
+TICK_SECONDS = 1 / FPS
+MAX_CATCH_UP_TICKS = 5  # A simulation further behind than this drops the backlog instead of racing through it
+MAX_ENTITIES = 96  # Obstacles, clouds and power-ups per snapshot; more are left out
+MAX_PARTICLES = 160
+
+OBSTACLE_TYPES = ["thorny_bush", "rock", "flying_bush", "double_bush", "moving_rock", "laser"]
+POWER_UP_TYPES = list(PowerUpType)
+
+# Shared memory layout: the jump counter, then two slots of a sequence number and a snapshot
+JUMPS = struct.Struct("<I")  # Jumps pressed so far, written by the window process
+SEQUENCE = struct.Struct("<I")
+# run, tick, time, late ticks, state, level, lives, cheetah flags, score, cheetah y, rotation, glow timer,
+# then the obstacle, cloud, power-up and particle counts
+HEADER = struct.Struct("<IIdIBBBBIdfIHHHH")
+ENTITY = struct.Struct("<IBBdddI")  # serial, type index, flags, x, y, animation, age
+PARTICLE = struct.Struct("<hddBBBB")  # owner, x, y, life, r, g, b
+SNAPSHOT_SIZE = HEADER.size + MAX_ENTITIES * ENTITY.size + MAX_PARTICLES * PARTICLE.size
+SLOT_OFFSETS = (JUMPS.size, JUMPS.size + SEQUENCE.size + SNAPSHOT_SIZE)
+BLOCK_SIZE = SLOT_OFFSETS[1] + SEQUENCE.size + SNAPSHOT_SIZE
+
+# Cheetah flags
+FLYING, SHIELD, HIDDEN, DOUBLE_JUMP, SLOW_TIME = 1, 2, 4, 8, 16
+# Cloud flags
+VISIBLE, LIGHTNING = 1, 2
+# Particle owners; clouds' trail particles are owned by the cloud's index in the snapshot
+POWER_UP_PARTICLE, TRAIL_PARTICLE = -1, -2
+
+
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
+
+
+class SnapshotChannel:
+    """The shared memory block between the two processes; name=None creates it"""
+
+    def __init__(self, name=None):
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=BLOCK_SIZE)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.name = self.memory.name
+        self.buf = self.memory.buf
+        self.published = 0
+        self.jumps_pressed = 0
+
+    def publish(self, snapshot, length):
+        """Copy the first length bytes of snapshot into the older slot"""
+        self.published += 1
+        offset = SLOT_OFFSETS[self.published % 2]
+        SEQUENCE.pack_into(self.buf, offset, 2 * self.published - 1)
+        self.buf[offset + SEQUENCE.size:offset + SEQUENCE.size + length] = snapshot[:length]
+        SEQUENCE.pack_into(self.buf, offset, 2 * self.published)
+
+    def read(self):
+        """(sequence, bytes) of each slot holding a complete snapshot, newest first"""
+        snapshots = []
+        for offset in SLOT_OFFSETS:
+            sequence = SEQUENCE.unpack_from(self.buf, offset)[0]
+            if sequence == 0 or sequence % 2:
+                continue
+            data = bytes(self.buf[offset + SEQUENCE.size:offset + SEQUENCE.size + SNAPSHOT_SIZE])
+            if SEQUENCE.unpack_from(self.buf, offset)[0] == sequence:
+                snapshots.append((sequence, data))
+        snapshots.sort(reverse=True)
+        return snapshots
+
+    def press_jump(self):
+        self.jumps_pressed += 1
+        JUMPS.pack_into(self.buf, 0, self.jumps_pressed & 0xFFFFFFFF)
+
+    def jumps(self):
+        return JUMPS.unpack_from(self.buf, 0)[0]
+
+    def close(self, unlink=False):
+        self.buf.release()
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+class Snapshot:
+    """One decoded snapshot; entities are ENTITY tuples and particles PARTICLE tuples"""
+    __slots__ = ('run', 'tick', 'time', 'late', 'state', 'level', 'lives', 'flags', 'score', 'cheetah_y',
+                 'rotation', 'glow_timer', 'obstacles', 'clouds', 'power_ups', 'particles')
+
+    def __init__(self, data):
+        (self.run, self.tick, self.time, self.late, self.state, self.level, self.lives, self.flags, self.score,
+         self.cheetah_y, self.rotation, self.glow_timer, obstacles, clouds, power_ups,
+         particles) = HEADER.unpack_from(data)
+        view = memoryview(data)
+        start = HEADER.size
+        sections = []
+        for count in (obstacles, clouds, power_ups):
+            sections.append(list(ENTITY.iter_unpack(view[start:start + count * ENTITY.size])))
+            start += count * ENTITY.size
+        self.obstacles, self.clouds, self.power_ups = sections
+        self.particles = list(PARTICLE.iter_unpack(view[start:start + particles * PARTICLE.size]))
+
+
+class SimulationGame(ultimate.Game):
+    """The offscreen Game in the simulation process, which numbers its spawns and packs snapshots"""
+
+    def __init__(self):
+        super().__init__()
+        self.serials = {}  # id(entity) -> spawn number, so the window can pair up an entity across snapshots
+        self.spawned = 0
+        self.snapshot = bytearray(SNAPSHOT_SIZE)
+
+    def spawn_scheduled(self):
+        # Pools append what they hand out, so anything past the old lengths is new
+        counts = [len(self.obstacles), len(self.clouds), len(self.power_ups)]
+        super().spawn_scheduled()
+        for entities, count in zip((self.obstacles, self.clouds, self.power_ups), counts):
+            for entity in entities[count:]:
+                self.spawned += 1
+                self.serials[id(entity)] = self.spawned
+
+    def pack(self, run, tick, late):
+        """Write this tick's snapshot into self.snapshot; returns its length"""
+        cheetah = self.cheetah
+        flags = ((FLYING if cheetah.flying else 0) | (SHIELD if cheetah.shield else 0)
+                 | (DOUBLE_JUMP if cheetah.double_jump_available else 0) | (SLOW_TIME if cheetah.slow_time else 0))
+        # The invincibility flash is decided here, where the timer lives
+        if cheetah.invincible and cheetah.timers.remaining(cheetah.effect_timers.get("invincible")) % 10 < 5:
+            flags |= HIDDEN
+
+        snapshot = self.snapshot
+        offset = HEADER.size
+        room = MAX_ENTITIES
+        obstacles = self.obstacles[:room]
+        for obstacle in obstacles:
+            ENTITY.pack_into(snapshot, offset, self.serials[id(obstacle)], OBSTACLE_TYPES.index(obstacle.obstacle_type),
+                             0, obstacle.x, getattr(obstacle, 'y_offset', 0), obstacle.animation_frame,
+                             obstacle.movement_timer)
+            offset += ENTITY.size
+        room -= len(obstacles)
+        clouds = self.clouds[:room]
+        for cloud in clouds:
+            cloud_flags = (VISIBLE if cloud.visible else 0) | (LIGHTNING if getattr(cloud, 'lightning_active', False) else 0)
+            ENTITY.pack_into(snapshot, offset, self.serials[id(cloud)], CLOUD_TYPES.index(cloud.cloud_type),
+                             cloud_flags, cloud.x, cloud.y, 0, cloud.movement_timer)
+            offset += ENTITY.size
+        room -= len(clouds)
+        power_ups = self.power_ups[:room]
+        for power_up in power_ups:
+            ENTITY.pack_into(snapshot, offset, self.serials[id(power_up)], POWER_UP_TYPES.index(power_up.power_type),
+                             0, power_up.x, power_up.y, power_up.float_offset, power_up.glow_timer)
+            offset += ENTITY.size
+
+        owned = [(POWER_UP_PARTICLE, cheetah.power_up_particles), (TRAIL_PARTICLE, cheetah.trail_particles)]
+        owned.extend(enumerate(cloud.trail_particles for cloud in clouds))
+        particles = 0
+        for owner, owner_particles in owned:
+            for particle in owner_particles[:MAX_PARTICLES - particles]:
+                PARTICLE.pack_into(snapshot, offset, owner, particle['x'], particle['y'], particle['life'],
+                                   *particle['color'][:3])
+                offset += PARTICLE.size
+                particles += 1
+
+        HEADER.pack_into(snapshot, 0, run, tick, time.perf_counter(), late, self.game_state.value,
+                         self.current_level, min(cheetah.lives, 255), flags, self.score, cheetah.y,
+                         cheetah.rotation, cheetah.glow_timer, len(obstacles), len(clouds), len(power_ups), particles)
+        return offset
+
+
+def simulate(name, connection):
+    """Simulation process: plays each run the window starts at a fixed tick, publishing every tick"""
+    channel = SnapshotChannel(name)
+    game = SimulationGame()
+    run = tick = late = jumps_seen = 0
+    next_tick = 0.0
+    try:
+        while True:
+            # Between runs the process sleeps until the window starts one
+            if game.game_state != GameState.PLAYING or connection.poll():
+                message = connection.recv()
+                if message[0] == "quit":
+                    break
+                _, game.current_level, run = message
+                game.start_run()
+                tick = late = 0
+                jumps_seen = channel.jumps()
+                next_tick = time.perf_counter()
+
+            jumps = channel.jumps()
+            if jumps != jumps_seen:
+                game.pending_input |= INPUT_JUMP
+                jumps_seen = jumps
+            game.update()
+            tick += 1
+            channel.publish(game.snapshot, game.pack(run, tick, late))
+
+            next_tick += TICK_SECONDS
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                late += 1
+                if delay < -MAX_CATCH_UP_TICKS * TICK_SECONDS:
+                    next_tick = time.perf_counter()
+    except (EOFError, KeyboardInterrupt):
+        pass  # The window has gone
+    finally:
+        channel.close()
+        ultimate.pygame.quit()
+
+
+class SplitGame(ultimate.Game):
+    """The window process: menus, input and drawing, with every run simulated by simulate()"""
+
+    def __init__(self, scores=None, frame_load=0.0):
+        super().__init__(scores=scores)
+        self.frame_load = frame_load  # Seconds of busy work added to every gameplay frame
+        self.channel = SnapshotChannel()
+        # Spawned rather than forked so the simulation doesn't inherit this process's window
+        context = multiprocessing.get_context("spawn")
+        self.connection, child_connection = context.Pipe()
+        self.simulation = context.Process(target=simulate, args=(self.channel.name, child_connection), daemon=True)
+        self.simulation.start()
+        child_connection.close()
+        self.run_id = 0
+        self.decoded = {}  # Sequence -> Snapshot, for the snapshots still in the slots
+        self.previous = None  # Newest snapshot of the run seen so far, in case the older slot is mid-write
+        self.frames = 0
+        self.last_run = None  # Final snapshot of the last run, for its tick counts
+
+    def start_run(self):
+        self.run_id += 1
+        self.connection.send(("start", self.current_level, self.run_id))
+        self.cheetah.reset(CHEETAH_X, GROUND_Y - 40)
+        self.obstacle_pool.release_all()
+        self.cloud_pool.release_all()
+        self.power_up_pool.release_all()
+        self.score = 0
+        self.pending_input = 0
+        self.previous = None
+        self.frames = 0
+        self.game_state = GameState.PLAYING
+
+    def update(self):
+        if self.game_state != GameState.PLAYING:
+            return
+        if self.pending_input & INPUT_JUMP:
+            self.channel.press_jump()
+            self.pending_input = 0
+
+        snapshots = []
+        for sequence, data in self.channel.read():
+            snapshot = self.decoded.get(sequence)
+            if snapshot is None:
+                snapshot = Snapshot(data)
+            if snapshot.run == self.run_id:
+                snapshots.append((sequence, snapshot))
+        self.decoded = dict(snapshots)
+        if not snapshots:
+            return  # The simulation hasn't published this run's first tick yet
+        current = snapshots[0][1]
+        previous = snapshots[1][1] if len(snapshots) > 1 else self.previous
+        if previous is not None and previous.tick >= current.tick:
+            previous = None
+        self.previous = current
+        self.frames += 1
+
+        # Show the world between the last two ticks, as far along as time has got since the newest
+        alpha = min(max((time.perf_counter() - current.time) / TICK_SECONDS, 0.0), 1.0)
+        self.show(current, previous, alpha)
+        if current.state != GameState.PLAYING.value:
+            self.end_run(current)
+
+    def show(self, current, previous, alpha):
+        """Rebuild the cheetah and the entities to draw from two snapshots"""
+        level_settings = self.levels[current.level - 1]
+        self.score = current.score
+        cheetah = self.cheetah
+        cheetah.y = lerp(previous.cheetah_y, current.cheetah_y, alpha) if previous else current.cheetah_y
+        cheetah.rotation = current.rotation
+        cheetah.lives = current.lives
+        cheetah.glow_timer = current.glow_timer
+        cheetah.flying = bool(current.flags & FLYING)
+        cheetah.shield = bool(current.flags & SHIELD)
+        cheetah.double_jump_available = bool(current.flags & DOUBLE_JUMP)
+        cheetah.slow_time = bool(current.flags & SLOW_TIME)
+        # With no timer running in this process the cheetah's draw() treats invincible as its flash-off frame
+        cheetah.invincible = bool(current.flags & HIDDEN)
+
+        def placed(records, earlier):
+            # Entities in both snapshots are interpolated; new ones appear where they spawned
+            before = {record[0]: record for record in earlier or ()}
+            for serial, kind, flags, x, y, animation, age in records:
+                old = before.get(serial)
+                if old:
+                    x, y, animation = lerp(old[3], x, alpha), lerp(old[4], y, alpha), lerp(old[5], animation, alpha)
+                yield kind, flags, x, y, animation, age
+
+        self.obstacle_pool.release_all()
+        for kind, flags, x, y, animation, age in placed(current.obstacles, previous and previous.obstacles):
+            obstacle = self.obstacle_pool.acquire(x, OBSTACLE_TYPES[kind], level_settings)
+            obstacle.y_offset = y
+            obstacle.animation_frame = animation
+            obstacle.movement_timer = age
+        self.cloud_pool.release_all()
+        for kind, flags, x, y, animation, age in placed(current.clouds, previous and previous.clouds):
+            cloud = self.cloud_pool.acquire(x, y, CLOUD_TYPES[kind], level_settings)
+            cloud.visible = bool(flags & VISIBLE)
+            cloud.lightning_active = bool(flags & LIGHTNING)
+            cloud.movement_timer = age
+        self.power_up_pool.release_all()
+        for kind, flags, x, y, animation, age in placed(current.power_ups, previous and previous.power_ups):
+            power_up = self.power_up_pool.acquire(x, y, POWER_UP_TYPES[kind], level_settings)
+            power_up.float_offset = animation
+            power_up.glow_timer = age
+
+        # Particles live a few ticks and are drawn as of the newest snapshot
+        cheetah.power_up_particles.clear()
+        cheetah.trail_particles.clear()
+        for owner, x, y, life, r, g, b in current.particles:
+            particle = {'x': x, 'y': y, 'life': life, 'color': (r, g, b)}
+            if owner == POWER_UP_PARTICLE:
+                cheetah.power_up_particles.append(particle)
+            elif owner == TRAIL_PARTICLE:
+                cheetah.trail_particles.append(particle)
+            else:
+                self.clouds[owner].trail_particles.append(particle)
+
+    def end_run(self, final):
+        # The simulation saved the replay; scores are kept here, where the leaderboard is open
+        self.game_state = GameState(final.state)
+        self.last_run = final
+        current_level_data = self.levels[final.level - 1]
+        if self.game_state == GameState.GAME_OVER and final.score > current_level_data.best_score:
+            current_level_data.best_score = final.score
+        elif self.game_state == GameState.LEVEL_COMPLETE:
+            current_level_data.completed = True
+        if self.scores:
+            self.scores.submit(LEADERBOARD, final.score, final.level)
+
+    def draw_game(self):
+        if self.frame_load:
+            # Stand-in for an expensive background layer
+            end = time.perf_counter() + self.frame_load
+            while time.perf_counter() < end:
+                pass
+        super().draw_game()
+
+    def run(self):
+        try:
+            super().run()
+        finally:
+            try:
+                self.connection.send(("quit",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.simulation.join(2)
+            if self.simulation.is_alive():
+                self.simulation.terminate()
+            self.channel.close(unlink=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Geometry Cheetah - Ultimate Edition, simulated in its own process")
+    parser.add_argument("--frame-load", type=float, default=0, metavar="MS",
+                        help="busy-wait this long in every gameplay frame and report how the simulation kept time")
+    args = parser.parse_args()
+
+    game = SplitGame(ScoreStore(), args.frame_load / 1000)
+    game.run()
+    if args.frame_load and game.last_run:
+        final = game.last_run
+        print(f"Last run: {final.tick} ticks simulated, {final.late} started late; "
+              f"{game.frames} frames drawn at {args.frame_load:.0f}ms of extra load each")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,26 @@ import pygame
 import random
 import math
 import os
+import sys
+import struct
+import argparse
+import time
 import numpy as np
 from enum import Enum
 
+# The leaderboard store, frame scheduler, timer wheel, render scale and texture renderer are shared by every game in the collection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from score_store import ScoreStore
+from frame_scheduler import FrameScheduler
+from timer_wheel import TimerWheel
+from render_scale import ScaledDisplay, render_scale
+from texture_renderer import TextureRenderer
+
+# Headless replay playback needs SDL's dummy drivers chosen before pygame starts
+if __name__ == "__main__" and "--headless" in sys.argv:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 # Initialize Pygame and mixer
 pygame.init()
 pygame.mixer.init()
@@ -37,6 +54,27 @@ GRAVITY = 0.8
 JUMP_FORCE = -18
 GROUND_Y = SCREEN_HEIGHT - 100
 MIN_OBSTACLE_SPACING = 250
+CHEETAH_X = 100  # The cheetah runs in place at this screen x while the level scrolls past
+GRID_CELL_WIDTH = 200  # World-x bucket size for the obstacle/cloud/power-up grids
+GLOW_ALPHA_LEVELS = 16  # Pulsing glows are baked at this many opacities
+CHEETAH_ROTATION_STEP = 5  # The cheetah's body is baked at tilts this many degrees apart
+TEXT_CACHE_LIMIT = 256  # Rendered HUD strings kept before the cache is emptied
+SPRITE_MARGIN = 40  # Room around an entity's rect, when it is baked into a texture, for what it draws outside it
+
+# Determinism and replays
+RNG_STREAMS = ("obstacles", "clouds", "power_ups", "effects")  # One seeded stream per subsystem
+INPUT_JUMP = 1  # Bit in a replay frame's input mask
+REPLAY_MAGIC = b"GCR2"  # Bumped whenever spawning changes, so older replays are rejected instead of diverging
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+LEADERBOARD = "geometry_cheetah"  # This game's name in the shared score store, with one board per level
+
+# Spawn schedule
+SCHEDULE_CHUNK_FRAMES = 2 * FPS  # Spawns are rolled and checked this many frames at a time
+SCHEDULE_RETRIES = 8  # Re-rolls of an unsurvivable chunk before it is left empty
+CLOUD_TYPES = ["small_cloud", "medium_cloud", "large_cloud", "moving_cloud", "disappearing_cloud", "bouncy_cloud", "storm_cloud"]
+
+# Game-time timers
+SLOW_TIME_SCALE = 0.5  # Simulation frames per displayed frame while slow time is active
 
 # Power-up types
 class PowerUpType(Enum):
@@ -96,35 +134,246 @@ class Background:
                 star['x'] = SCREEN_WIDTH
                 star['y'] = random.randint(0, 300)
     
-    def draw(self, screen):
-        # Draw gradient sky
-        for y in range(300):
-            color_ratio = y / 300
-            r = int(100 + color_ratio * 50)
-            g = int(150 + color_ratio * 100)
-            b = int(255 - color_ratio * 100)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+    def draw(self, screen, scale=1.0):
+        # Positions are in window pixels; scale maps them onto a smaller render surface (see render_scale.py)
+        self.draw_sky(screen, scale)
         
         # Draw stars
         for star in self.stars:
             color = (star['brightness'], star['brightness'], star['brightness'])
-            pygame.draw.circle(screen, color, (int(star['x']), int(star['y'])), 1)
+            pygame.draw.circle(screen, color, (int(star['x'] * scale), int(star['y'] * scale)), 1)
         
         # Draw clouds
         for cloud in self.clouds:
-            pygame.draw.circle(screen, WHITE, (int(cloud['x']), int(cloud['y'])), cloud['size'])
-            pygame.draw.circle(screen, WHITE, (int(cloud['x'] - 20), int(cloud['y'])), cloud['size'] - 10)
-            pygame.draw.circle(screen, WHITE, (int(cloud['x'] + 20), int(cloud['y'])), cloud['size'] - 10)
+            self.draw_cloud(screen, cloud['x'], cloud['y'], cloud['size'], scale)
         
+        self.draw_ground(screen, scale)
+    
+    def draw_textured(self, sprites):
+        # The sky and ground don't overlap the stars or clouds, so they are one texture under them
+        textures = sprites.textures
+        textures.copy(textures.sprite("backdrop", self.bake_backdrop), (0, 0))
+        for star in self.stars:
+            brightness = star['brightness']
+            dot = sprites.dot(1, (brightness, brightness, brightness))
+            textures.copy(dot, (int(star['x']) - 1, int(star['y']) - 1))
+        for cloud in self.clouds:
+            size = cloud['size']
+            texture = textures.sprite(("cloud", size), lambda: self.bake_cloud(size))
+            textures.copy(texture, (cloud['x'] - size - 20, cloud['y'] - size))
+    
+    @staticmethod
+    def draw_sky(screen, scale=1.0):
+        # Draw gradient sky
+        width = screen.get_width()
+        sky_height = int(300 * scale)
+        for y in range(sky_height):
+            color_ratio = y / sky_height
+            r = int(100 + color_ratio * 50)
+            g = int(150 + color_ratio * 100)
+            b = int(255 - color_ratio * 100)
+            pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
+    
+    @staticmethod
+    def draw_cloud(screen, x, y, size, scale=1.0):
+        x, y = x * scale, int(y * scale)
+        pygame.draw.circle(screen, WHITE, (int(x), y), int(size * scale))
+        pygame.draw.circle(screen, WHITE, (int(x - 20 * scale), y), int((size - 10) * scale))
+        pygame.draw.circle(screen, WHITE, (int(x + 20 * scale), y), int((size - 10) * scale))
+    
+    @staticmethod
+    def draw_ground(screen, scale=1.0):
         # Draw ground
-        pygame.draw.rect(screen, GREEN, (0, GROUND_Y, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_Y))
+        width = screen.get_width()
+        ground_y = int(GROUND_Y * scale)
+        pygame.draw.rect(screen, GREEN, (0, ground_y, width, screen.get_height() - ground_y))
         
         # Draw grass texture
         for i in range(0, SCREEN_WIDTH, 20):
-            pygame.draw.line(screen, (50, 200, 50), (i, GROUND_Y), (i + 10, GROUND_Y - 5), 2)
+            pygame.draw.line(screen, (50, 200, 50), (int(i * scale), ground_y),
+                             (int((i + 10) * scale), int((GROUND_Y - 5) * scale)), max(1, int(2 * scale)))
+    
+    @classmethod
+    def bake_backdrop(cls):
+        backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        cls.draw_sky(backdrop)
+        cls.draw_ground(backdrop)
+        return backdrop
+    
+    @classmethod
+    def bake_cloud(cls, size):
+        cloud = pygame.Surface((size * 2 + 41, size * 2 + 1), pygame.SRCALPHA)
+        cls.draw_cloud(cloud, size + 20, size, size)
+        return cloud
+
+class EffectCache:
+    """Translucent glow sprites baked once per (color, size) at every alpha level"""
+    def __init__(self):
+        self.glows = {}
+        
+    def glow(self, color, size, alpha):
+        levels = self.glows.get((color, size))
+        if levels is None:
+            levels = []
+            for level in range(GLOW_ALPHA_LEVELS):
+                glow_surface = pygame.Surface(size, pygame.SRCALPHA)
+                level_alpha = level * 255 // (GLOW_ALPHA_LEVELS - 1)
+                pygame.draw.ellipse(glow_surface, (*color, level_alpha), (0, 0, *size))
+                levels.append(glow_surface)
+            self.glows[(color, size)] = levels
+        return levels[min(max(alpha, 0) * GLOW_ALPHA_LEVELS // 256, GLOW_ALPHA_LEVELS - 1)]
+
+effect_cache = EffectCache()
+
+class CheetahAtlas:
+    """The cheetah's body, painted once and baked at each tilt the first time it is drawn at it"""
+    def __init__(self):
+        self.rotations = {}
+        
+    def get(self, rotation):
+        rotation = round(rotation / CHEETAH_ROTATION_STEP) * CHEETAH_ROTATION_STEP
+        rotated_surface = self.rotations.get(rotation)
+        if rotated_surface is None:
+            rotated_surface = self.rotations[rotation] = pygame.transform.rotate(self.paint(), rotation)
+        return rotated_surface
+        
+    def paint(self):
+        # Draw ULTIMATE cheetah with realistic graphics
+        cheetah_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
+        
+        # Enhanced body with gradient and muscle definition
+        # Main body
+        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (20, 25, 50, 30))
+        pygame.draw.ellipse(cheetah_surface, ORANGE, (23, 27, 44, 24))
+        
+        # Muscle definition
+        pygame.draw.ellipse(cheetah_surface, (200, 120, 0), (30, 30, 15, 8))
+        pygame.draw.ellipse(cheetah_surface, (200, 120, 0), (45, 30, 15, 8))
+        
+        # Enhanced spots with realistic pattern
+        spots = [
+            (25, 30), (35, 28), (45, 32), (55, 30),  # Upper row
+            (30, 35), (40, 33), (50, 35),            # Middle row
+            (35, 40), (45, 38)                       # Lower row
+        ]
+        for spot in spots:
+            # Main spot
+            pygame.draw.circle(cheetah_surface, BLACK, spot, 4)
+            # Spot highlight
+            pygame.draw.circle(cheetah_surface, DARK_GRAY, (spot[0]-1, spot[1]-1), 2)
+        
+        # Enhanced head with better proportions
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (65, 30), 18)
+        pygame.draw.circle(cheetah_surface, ORANGE, (67, 32), 15)
+        
+        # Enhanced ears with detail
+        # Left ear
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (72, 18), 8)
+        pygame.draw.circle(cheetah_surface, PINK, (73, 19), 5)
+        pygame.draw.circle(cheetah_surface, WHITE, (74, 20), 2)
+        
+        # Right ear
+        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (78, 22), 7)
+        pygame.draw.circle(cheetah_surface, PINK, (79, 23), 4)
+        pygame.draw.circle(cheetah_surface, WHITE, (80, 24), 2)
+        
+        # Enhanced eyes with depth
+        # Left eye
+        pygame.draw.circle(cheetah_surface, WHITE, (68, 28), 5)
+        pygame.draw.circle(cheetah_surface, BLACK, (69, 29), 3)
+        pygame.draw.circle(cheetah_surface, WHITE, (69.5, 28.5), 1.5)
+        
+        # Right eye
+        pygame.draw.circle(cheetah_surface, WHITE, (73, 28), 5)
+        pygame.draw.circle(cheetah_surface, BLACK, (74, 29), 3)
+        pygame.draw.circle(cheetah_surface, WHITE, (74.5, 28.5), 1.5)
+        
+        # Enhanced nose
+        pygame.draw.circle(cheetah_surface, BLACK, (80, 30), 3)
+        pygame.draw.circle(cheetah_surface, PINK, (81, 31), 1)
+        
+        # Enhanced mouth with expression
+        pygame.draw.arc(cheetah_surface, BLACK, (75, 30, 8, 6), 0, 3.14, 2)
+        pygame.draw.line(cheetah_surface, BLACK, (77, 33), (79, 33), 1)
+        
+        # Enhanced legs with muscle definition
+        # Front legs
+        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (25, 40, 6, 15))
+        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (35, 40, 6, 15))
+        # Back legs
+        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (45, 40, 6, 15))
+        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (55, 40, 6, 15))
+        
+        # Enhanced paws with detail
+        pygame.draw.circle(cheetah_surface, BLACK, (28, 55), 3)
+        pygame.draw.circle(cheetah_surface, BLACK, (38, 55), 3)
+        pygame.draw.circle(cheetah_surface, BLACK, (48, 55), 3)
+        pygame.draw.circle(cheetah_surface, BLACK, (58, 55), 3)
+        
+        # Enhanced tail with realistic curve
+        tail_points = [(20, 30), (12, 25), (6, 30), (12, 35), (20, 33)]
+        pygame.draw.polygon(cheetah_surface, DARK_ORANGE, tail_points)
+        pygame.draw.polygon(cheetah_surface, ORANGE, [(17, 30), (12, 27), (9, 30), (12, 33)])
+        
+        # Tail tip with detail
+        pygame.draw.circle(cheetah_surface, BLACK, (7, 30), 3)
+        pygame.draw.circle(cheetah_surface, WHITE, (8, 29), 1)
+        
+        return cheetah_surface
+
+cheetah_atlas = CheetahAtlas()
+
+class EntityTextures:
+    """Textures for --renderer texture, each painted once by the same drawing code as the surface renderer"""
+    def __init__(self, textures):
+        self.textures = textures
+        self.baked = {}  # Key -> (texture, its top-left on the surface it was painted on)
+        
+    def bake(self, key, entity, paint, size, **state):
+        # paint(surface) draws the entity with the attributes in state swapped in, then the drawing is cropped
+        baked = self.baked.get(key)
+        if baked is None:
+            saved = {name: getattr(entity, name) for name in state}
+            for name, value in state.items():
+                setattr(entity, name, value)
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            try:
+                paint(surface)
+            finally:
+                for name, value in saved.items():
+                    setattr(entity, name, value)
+            bounds = surface.get_bounding_rect()
+            baked = self.baked[key] = (self.textures.upload(surface.subsurface(bounds)), bounds.topleft)
+        return baked
+        
+    def draw(self, key, entity, paint, size, pos, **state):
+        """Copy key's texture as it was painted, with the top-left of the surface it was painted on at pos"""
+        texture, (x, y) = self.bake(key, entity, paint, size, **state)
+        self.textures.copy(texture, (pos[0] + x, pos[1] + y))
+        
+    def dot(self, radius, color):
+        return self.textures.sprite(("dot", radius, color), lambda: self.paint_circle(radius, color))
+        
+    def glow(self, color, size):
+        # One opaque glow per (color, size); SDL fades it with the texture's alpha
+        return self.textures.sprite(("glow", color, size), lambda: effect_cache.glow(color, size, 255))
+        
+    @staticmethod
+    def paint_circle(radius, color, width=0):
+        circle = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(circle, color, (radius, radius), radius, width)
+        return circle
 
 class PowerUp:
+    __slots__ = ('x', 'y', 'power_type', 'level_settings', 'width', 'height', 'animation_frame',
+                 'collected', 'float_offset', 'glow_timer', 'color', 'duration', 'icon',
+                 'grid_cells', 'pool_index')
+    
     def __init__(self, x, y, power_type, level_settings=None):
+        self.reset(x, y, power_type, level_settings)
+        
+    def reset(self, x, y, power_type, level_settings=None):
+        # Called again when the power-up is recycled from its pool
         self.x = x
         self.y = y
         self.power_type = power_type
@@ -178,16 +427,18 @@ class PowerUp:
         # Floating animation
         self.float_offset = math.sin(self.animation_frame) * 5
     
-    def draw(self, screen):
+    def draw_effects(self, screen, scale=1.0):
+        # Draw glow effect, on the render-scaled layer under the sprites
         if self.collected:
             return
-        
-        # Draw glow effect
         glow_alpha = int(127 + 127 * math.sin(self.glow_timer * 0.1))
-        glow_surface = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.color, glow_alpha), 
-                          (self.width//2 + 10, self.height//2 + 10), self.width//2 + 10)
-        screen.blit(glow_surface, (self.x - 10, self.y + self.float_offset - 10))
+        size = (int((self.width + 20) * scale), int((self.height + 20) * scale))
+        glow_surface = effect_cache.glow(self.color, size, glow_alpha)
+        screen.blit(glow_surface, (int((self.x - 10) * scale), int((self.y + self.float_offset - 10) * scale)))
+    
+    def draw(self, screen):
+        if self.collected:
+            return
         
         # Draw main power-up
         power_y = self.y + self.float_offset
@@ -230,12 +481,28 @@ class PowerUp:
             # Draw shield
             pygame.draw.ellipse(screen, WHITE, (self.x + 8, power_y + 8, 14, 14))
     
+    def draw_effects_textured(self, sprites):
+        if self.collected:
+            return
+        glow_alpha = int(127 + 127 * math.sin(self.glow_timer * 0.1))
+        glow = sprites.glow(self.color, (self.width + 20, self.height + 20))
+        sprites.textures.copy(glow, (self.x - 10, self.y + self.float_offset - 10), alpha=glow_alpha)
+    
+    def draw_textured(self, sprites):
+        if self.collected:
+            return
+        sprites.draw(("power_up", self.power_type), self, self.draw,
+                     (self.width + 2 * SPRITE_MARGIN, self.height + 2 * SPRITE_MARGIN),
+                     (self.x - SPRITE_MARGIN, self.y + self.float_offset - SPRITE_MARGIN),
+                     x=SPRITE_MARGIN, y=SPRITE_MARGIN, float_offset=0)
+    
     def get_rect(self):
         return pygame.Rect(self.x, self.y + self.float_offset, self.width, self.height)
 
 class AudioManager:
     def __init__(self):
         self.sounds = {}
+        self.music_tracks = {}  # Level -> its synthesized background track, kept for the session
         self.music_playing = False
         self.load_sounds()
         
@@ -375,6 +642,12 @@ class AudioManager:
     
     def create_background_music(self, level_num=1):
         """Create level-specific background music"""
+        # Tracks take seconds to synthesize, so each level's is only made the first time
+        if level_num in self.music_tracks:
+            self.background_music = self.music_tracks[level_num]
+            self.background_music.play(0)
+            return
+        
         sample_rate = 44100
         duration = 8.0  # 8 second non-repeating track
         samples = int(sample_rate * duration)
@@ -591,6 +864,7 @@ class AudioManager:
         
         # Create the music sound and play it once (no loop)
         self.background_music = pygame.sndarray.make_sound(music_array)
+        self.music_tracks[level_num] = self.background_music
         self.background_music.play(0)  # 0 means play once, no loop
     
     def stop_music(self):
@@ -673,7 +947,15 @@ class Level:
             self.power_up_spawn_rate = 0.05
 
 class Cheetah:
-    def __init__(self, x, y, audio_manager):
+    def __init__(self, x, y, audio_manager, rng=None, timers=None):
+        self.audio_manager = audio_manager
+        self.animation_speed = 0.3
+        self.trail_particles = []
+        self.power_up_particles = []
+        self.reset(x, y, rng, timers)
+        
+    def reset(self, x, y, rng=None, timers=None):
+        # The Game keeps one cheetah for the session and resets it for every run
         self.x = x
         self.y = y
         self.velocity_y = 0
@@ -681,33 +963,27 @@ class Cheetah:
         self.is_on_ground = True
         self.is_on_platform = False
         self.animation_frame = 0
-        self.animation_speed = 0.3
         self.rotation = 0
-        self.trail_particles = []
+        self.trail_particles.clear()
         self.invincible = False
-        self.invincible_timer = 0
         self.current_platform = None
-        self.audio_manager = audio_manager
+        self.rng = rng or random
+        self.timers = timers or TimerWheel()
         self.was_on_platform = False  # Track platform state for sound effects
         
         # Power-up states
         self.lives = 3
         self.flying = False
-        self.flying_timer = 0
         self.double_jump_available = False
-        self.double_jump_timer = 0
         self.slow_time = False
-        self.slow_time_timer = 0
         self.magnet = False
-        self.magnet_timer = 0
         self.speed_boost = False
-        self.speed_boost_timer = 0
         self.shield = False
-        self.shield_timer = 0
+        self.effect_timers = {}  # Effect flag -> the timer that clears it
         
         # Enhanced visual effects
         self.glow_timer = 0
-        self.power_up_particles = []
+        self.power_up_particles.clear()
         
     def update(self, clouds):  # Changed from platforms to clouds
         # Apply gravity
@@ -761,12 +1037,6 @@ class Cheetah:
         else:
             self.rotation = 0
             
-        # Update invincibility
-        if self.invincible:
-            self.invincible_timer -= 1
-            if self.invincible_timer <= 0:
-                self.invincible = False
-            
         # Update trail particles
         for particle in self.trail_particles[:]:
             particle['life'] -= 1
@@ -775,7 +1045,7 @@ class Cheetah:
                 self.trail_particles.remove(particle)
                 
         # Add trail particles when moving
-        if not self.is_on_ground and not self.is_on_platform and random.random() < 0.3:
+        if not self.is_on_ground and not self.is_on_platform and self.rng.random() < 0.3:
             self.trail_particles.append({
                 'x': self.x - 20,
                 'y': self.y + 20,
@@ -783,37 +1053,6 @@ class Cheetah:
                 'color': ORANGE
             })
         
-        # Update power-up timers
-        if self.flying:
-            self.flying_timer -= 1
-            if self.flying_timer <= 0:
-                self.flying = False
-        
-        if self.double_jump_timer > 0:
-            self.double_jump_timer -= 1
-            if self.double_jump_timer <= 0:
-                self.double_jump_available = False
-        
-        if self.slow_time_timer > 0:
-            self.slow_time_timer -= 1
-            if self.slow_time_timer <= 0:
-                self.slow_time = False
-        
-        if self.magnet_timer > 0:
-            self.magnet_timer -= 1
-            if self.magnet_timer <= 0:
-                self.magnet = False
-        
-        if self.speed_boost_timer > 0:
-            self.speed_boost_timer -= 1
-            if self.speed_boost_timer <= 0:
-                self.speed_boost = False
-        
-        if self.shield_timer > 0:
-            self.shield_timer -= 1
-            if self.shield_timer <= 0:
-                self.shield = False
-        
         # Update power-up particles
         for particle in self.power_up_particles[:]:
             particle['life'] -= 1
@@ -859,144 +1098,69 @@ class Cheetah:
             # Use double jump if available
             if self.double_jump_available and not (self.is_on_ground or self.is_on_platform):
                 self.double_jump_available = False
-                self.double_jump_timer = 0
+                self.timers.cancel(self.effect_timers.get("double_jump_available"))
             
+    def start_effect(self, flag, duration):
+        # Set the effect's flag and (re)start the timer that clears it, duration frames from now
+        setattr(self, flag, True)
+        self.timers.cancel(self.effect_timers.get(flag))
+        self.effect_timers[flag] = self.timers.schedule(duration, setattr, self, flag, False)
+    
     def make_invincible(self, duration=60):
-        self.invincible = True
-        self.invincible_timer = duration
+        self.start_effect("invincible", duration)
     
     def activate_power_up(self, power_type):
         """Activate a power-up effect"""
         if power_type == PowerUpType.FLYING:
-            self.flying = True
-            self.flying_timer = 300  # 5 seconds
+            self.start_effect("flying", 300)  # 5 seconds
             self.velocity_y = -5  # Start flying upward
         elif power_type == PowerUpType.EXTRA_LIFE:
             self.lives += 1
         elif power_type == PowerUpType.INVINCIBILITY:
-            self.invincible = True
-            self.invincible_timer = 180  # 3 seconds
+            self.start_effect("invincible", 180)  # 3 seconds
         elif power_type == PowerUpType.DOUBLE_JUMP:
-            self.double_jump_available = True
-            self.double_jump_timer = 240  # 4 seconds
+            self.start_effect("double_jump_available", 240)  # 4 seconds
         elif power_type == PowerUpType.SLOW_TIME:
-            self.slow_time = True
-            self.slow_time_timer = 180  # 3 seconds
+            self.start_effect("slow_time", 180)  # 3 seconds of game time, shown over 6
         elif power_type == PowerUpType.MAGNET:
-            self.magnet = True
-            self.magnet_timer = 300  # 5 seconds
+            self.start_effect("magnet", 300)  # 5 seconds
         elif power_type == PowerUpType.SPEED_BOOST:
-            self.speed_boost = True
-            self.speed_boost_timer = 240  # 4 seconds
+            self.start_effect("speed_boost", 240)  # 4 seconds
         elif power_type == PowerUpType.SHIELD:
-            self.shield = True
-            self.shield_timer = 360  # 6 seconds
+            self.start_effect("shield", 360)  # 6 seconds
         
         # Add power-up particles
         for _ in range(10):
             self.power_up_particles.append({
-                'x': self.x + random.randint(-20, 20),
-                'y': self.y + random.randint(-20, 20),
+                'x': self.x + self.rng.randint(-20, 20),
+                'y': self.y + self.rng.randint(-20, 20),
                 'life': 20,
                 'color': (255, 255, 0)  # Yellow glow
             })
             
-    def draw(self, screen):
+    def draw_effects(self, screen, scale=1.0):
+        # Particles and the shield glow go on the render-scaled layer under the sprites
         # Draw power-up particles
         for particle in self.power_up_particles:
             alpha = int((particle['life'] / 20) * 255)
             color = (*particle['color'][:3], alpha)
-            pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), 4)
+            pygame.draw.circle(screen, color, (int(particle['x'] * scale), int(particle['y'] * scale)), max(1, int(4 * scale)))
         
         # Draw trail particles
         for particle in self.trail_particles:
             alpha = int((particle['life'] / 10) * 255)
             color = (*particle['color'][:3], alpha)
-            pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), 3)
-        
-        # Draw ULTIMATE cheetah with realistic graphics
-        cheetah_surface = pygame.Surface((100, 60), pygame.SRCALPHA)
-        
-        # Enhanced body with gradient and muscle definition
-        # Main body
-        pygame.draw.ellipse(cheetah_surface, DARK_ORANGE, (20, 25, 50, 30))
-        pygame.draw.ellipse(cheetah_surface, ORANGE, (23, 27, 44, 24))
-        
-        # Muscle definition
-        pygame.draw.ellipse(cheetah_surface, (200, 120, 0), (30, 30, 15, 8))
-        pygame.draw.ellipse(cheetah_surface, (200, 120, 0), (45, 30, 15, 8))
-        
-        # Enhanced spots with realistic pattern
-        spots = [
-            (25, 30), (35, 28), (45, 32), (55, 30),  # Upper row
-            (30, 35), (40, 33), (50, 35),            # Middle row
-            (35, 40), (45, 38)                       # Lower row
-        ]
-        for spot in spots:
-            # Main spot
-            pygame.draw.circle(cheetah_surface, BLACK, spot, 4)
-            # Spot highlight
-            pygame.draw.circle(cheetah_surface, DARK_GRAY, (spot[0]-1, spot[1]-1), 2)
+            pygame.draw.circle(screen, color, (int(particle['x'] * scale), int(particle['y'] * scale)), max(1, int(3 * scale)))
         
-        # Enhanced head with better proportions
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (65, 30), 18)
-        pygame.draw.circle(cheetah_surface, ORANGE, (67, 32), 15)
-        
-        # Enhanced ears with detail
-        # Left ear
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (72, 18), 8)
-        pygame.draw.circle(cheetah_surface, PINK, (73, 19), 5)
-        pygame.draw.circle(cheetah_surface, WHITE, (74, 20), 2)
-        
-        # Right ear
-        pygame.draw.circle(cheetah_surface, DARK_ORANGE, (78, 22), 7)
-        pygame.draw.circle(cheetah_surface, PINK, (79, 23), 4)
-        pygame.draw.circle(cheetah_surface, WHITE, (80, 24), 2)
-        
-        # Enhanced eyes with depth
-        # Left eye
-        pygame.draw.circle(cheetah_surface, WHITE, (68, 28), 5)
-        pygame.draw.circle(cheetah_surface, BLACK, (69, 29), 3)
-        pygame.draw.circle(cheetah_surface, WHITE, (69.5, 28.5), 1.5)
-        
-        # Right eye
-        pygame.draw.circle(cheetah_surface, WHITE, (73, 28), 5)
-        pygame.draw.circle(cheetah_surface, BLACK, (74, 29), 3)
-        pygame.draw.circle(cheetah_surface, WHITE, (74.5, 28.5), 1.5)
-        
-        # Enhanced nose
-        pygame.draw.circle(cheetah_surface, BLACK, (80, 30), 3)
-        pygame.draw.circle(cheetah_surface, PINK, (81, 31), 1)
-        
-        # Enhanced mouth with expression
-        pygame.draw.arc(cheetah_surface, BLACK, (75, 30, 8, 6), 0, 3.14, 2)
-        pygame.draw.line(cheetah_surface, BLACK, (77, 33), (79, 33), 1)
-        
-        # Enhanced legs with muscle definition
-        # Front legs
-        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (25, 40, 6, 15))
-        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (35, 40, 6, 15))
-        # Back legs
-        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (45, 40, 6, 15))
-        pygame.draw.rect(cheetah_surface, DARK_ORANGE, (55, 40, 6, 15))
-        
-        # Enhanced paws with detail
-        pygame.draw.circle(cheetah_surface, BLACK, (28, 55), 3)
-        pygame.draw.circle(cheetah_surface, BLACK, (38, 55), 3)
-        pygame.draw.circle(cheetah_surface, BLACK, (48, 55), 3)
-        pygame.draw.circle(cheetah_surface, BLACK, (58, 55), 3)
-        
-        # Enhanced tail with realistic curve
-        tail_points = [(20, 30), (12, 25), (6, 30), (12, 35), (20, 33)]
-        pygame.draw.polygon(cheetah_surface, DARK_ORANGE, tail_points)
-        pygame.draw.polygon(cheetah_surface, ORANGE, [(17, 30), (12, 27), (9, 30), (12, 33)])
-        
-        # Tail tip with detail
-        pygame.draw.circle(cheetah_surface, BLACK, (7, 30), 3)
-        pygame.draw.circle(cheetah_surface, WHITE, (8, 29), 1)
-        
-        # Rotate the cheetah
-        rotated_surface = pygame.transform.rotate(cheetah_surface, self.rotation)
+        if self.shield:
+            # Draw shield effect
+            shield_alpha = int(127 + 127 * math.sin(self.glow_timer * 0.2))
+            shield_surface = effect_cache.glow((0, 255, 0), (int(120 * scale), int(80 * scale)), shield_alpha)
+            screen.blit(shield_surface, (int((self.x - 60) * scale), int((self.y - 40) * scale)))
+    
+    def draw(self, screen):
+        # The body is painted and rotated once per tilt, see CheetahAtlas
+        rotated_surface = cheetah_atlas.get(self.rotation)
         
         # Apply power-up effects
         if self.flying:
@@ -1005,15 +1169,8 @@ class Cheetah:
             pygame.draw.ellipse(screen, wing_color, (self.x - 30, self.y - 10, 20, 15))
             pygame.draw.ellipse(screen, wing_color, (self.x + 10, self.y - 10, 20, 15))
         
-        if self.shield:
-            # Draw shield effect
-            shield_alpha = int(127 + 127 * math.sin(self.glow_timer * 0.2))
-            shield_surface = pygame.Surface((120, 80), pygame.SRCALPHA)
-            pygame.draw.ellipse(shield_surface, (0, 255, 0, shield_alpha), (0, 0, 120, 80))
-            screen.blit(shield_surface, (self.x - 60, self.y - 40))
-        
         # Apply invincibility effect
-        if self.invincible and self.invincible_timer % 10 < 5:
+        if self.invincible and self.timers.remaining(self.effect_timers.get("invincible")) % 10 < 5:
             # Make cheetah flash when invincible
             pass  # Skip drawing to create flash effect
         else:
@@ -1029,19 +1186,69 @@ class Cheetah:
             points = [(heart_x, heart_y), (heart_x - 8, heart_y + 8), 
                      (heart_x, heart_y + 16), (heart_x + 8, heart_y + 8)]
             pygame.draw.polygon(screen, RED, points)
+    
+    def draw_effects_textured(self, sprites):
+        textures = sprites.textures
+        for particle in self.power_up_particles:
+            textures.copy(sprites.dot(4, particle['color'][:3]), (int(particle['x']) - 4, int(particle['y']) - 4))
+        for particle in self.trail_particles:
+            textures.copy(sprites.dot(3, particle['color'][:3]), (int(particle['x']) - 3, int(particle['y']) - 3))
+        if self.shield:
+            shield_alpha = int(127 + 127 * math.sin(self.glow_timer * 0.2))
+            textures.copy(sprites.glow((0, 255, 0), (120, 80)), (self.x - 60, self.y - 40), alpha=shield_alpha)
+    
+    def draw_textured(self, sprites):
+        textures = sprites.textures
+        if self.flying:
+            wing = textures.sprite("wing", self.paint_wing)
+            textures.copy(wing, (self.x - 30, self.y - 10))
+            textures.copy(wing, (self.x + 10, self.y - 10))
+        
+        if not (self.invincible and self.timers.remaining(self.effect_timers.get("invincible")) % 10 < 5):
+            # SDL rotates clockwise about the sprite's centre, pygame.transform.rotate counterclockwise
+            body = textures.sprite("cheetah", cheetah_atlas.paint)
+            textures.copy(body, (self.x - body.width // 2, self.y - body.height // 2), angle=-self.rotation)
+        
+        heart = textures.sprite("heart", self.paint_heart)
+        for i in range(self.lives):
+            textures.copy(heart, (50 + i * 30 - 8, 30))
+    
+    @staticmethod
+    def paint_wing():
+        wing = pygame.Surface((20, 15), pygame.SRCALPHA)
+        pygame.draw.ellipse(wing, (100, 200, 255), (0, 0, 20, 15))
+        return wing
+    
+    @staticmethod
+    def paint_heart():
+        heart = pygame.Surface((17, 17), pygame.SRCALPHA)
+        pygame.draw.polygon(heart, RED, [(8, 0), (0, 8), (8, 16), (16, 8)])
+        return heart
 
 class CloudPlatform:
-    def __init__(self, x, y, cloud_type="small_cloud", level_settings=None):
+    __slots__ = ('x', 'y', 'cloud_type', 'level_settings', 'movement_timer', 'original_y', 'visible',
+                 'bounce_timer', 'trail_particles', 'width', 'height', 'color', 'speed', 'movement_range',
+                 'bounce_strength', 'lightning_active', 'rng', 'timers', 'effect_timer', 'grid_cells', 'pool_index')
+    
+    def __init__(self, x, y, cloud_type="small_cloud", level_settings=None, rng=None, timers=None):
+        self.trail_particles = []
+        self.reset(x, y, cloud_type, level_settings, rng, timers)
+    
+    def reset(self, x, y, cloud_type="small_cloud", level_settings=None, rng=None, timers=None):
+        # Called again when the cloud is recycled from its pool. Without timers (as for the
+        # spawn schedule's stand-ins) storm and disappearing clouds keep still
         self.x = x
         self.y = y
         self.cloud_type = cloud_type
         self.level_settings = level_settings or Level(1, "Tutorial", "Easy level", BLUE)
+        self.rng = rng or random
+        self.timers = timers
+        self.effect_timer = None
         self.movement_timer = 0
         self.original_y = y
         self.visible = True
         self.bounce_timer = 0
-        self.lightning_timer = 0
-        self.trail_particles = []
+        self.trail_particles.clear()
         
         # Set properties based on cloud type
         if cloud_type == "small_cloud":
@@ -1070,8 +1277,8 @@ class CloudPlatform:
             self.height = 42
             self.color = YELLOW
             self.speed = 2
-            self.disappear_timer = 0
-            self.warning_timer = 0
+            if timers:
+                self.effect_timer = timers.schedule(180, self.disappear)  # Disappear after 3 seconds
         elif cloud_type == "bouncy_cloud":
             self.width = 95
             self.height = 45
@@ -1084,6 +1291,24 @@ class CloudPlatform:
             self.color = DARK_GRAY
             self.speed = 1.8
             self.lightning_active = False
+            if timers:
+                self.effect_timer = timers.schedule(120, self.strike_lightning)  # Lightning every 2 seconds
+    
+    def disappear(self):
+        self.visible = False
+    
+    def strike_lightning(self):
+        self.lightning_active = True
+        self.effect_timer = self.timers.schedule(11, self.end_lightning)
+    
+    def end_lightning(self):
+        self.lightning_active = False
+        self.effect_timer = self.timers.schedule(110, self.strike_lightning)
+    
+    def release_timers(self):
+        if self.timers:
+            self.timers.cancel(self.effect_timer)
+        self.effect_timer = None
         
     def update(self):
         self.x -= self.level_settings.obstacle_speed
@@ -1097,7 +1322,7 @@ class CloudPlatform:
                 self.trail_particles.remove(particle)
         
         # Add trail particles for moving clouds
-        if self.cloud_type == "moving_cloud" and random.random() < 0.3:
+        if self.cloud_type == "moving_cloud" and self.rng.random() < 0.3:
             self.trail_particles.append({
                 'x': self.x + self.width,
                 'y': self.y + self.height//2,
@@ -1109,27 +1334,11 @@ class CloudPlatform:
         if self.cloud_type == "moving_cloud":
             self.y = self.original_y + math.sin(self.movement_timer * 0.05) * self.movement_range
         
-        # Disappearing cloud logic
-        elif self.cloud_type == "disappearing_cloud":
-            self.disappear_timer += 1
-            self.warning_timer += 1
-            if self.disappear_timer > 180:  # Disappear after 3 seconds
-                self.visible = False
-        
         # Bouncy cloud animation
         elif self.cloud_type == "bouncy_cloud":
             self.bounce_timer += 1
             bounce_offset = math.sin(self.bounce_timer * 0.2) * 3
             self.y = self.original_y + bounce_offset
-        
-        # Storm cloud lightning
-        elif self.cloud_type == "storm_cloud":
-            self.lightning_timer += 1
-            if self.lightning_timer > 120:  # Lightning every 2 seconds
-                self.lightning_active = True
-                self.lightning_timer = 0
-            elif self.lightning_timer > 10:
-                self.lightning_active = False
     
     def draw_small_cloud(self, screen):
         # Draw small fluffy cloud
@@ -1200,8 +1409,8 @@ class CloudPlatform:
         self.draw_small_cloud(screen)
         
         # Warning effect when about to disappear
-        if self.warning_timer > 150:
-            if self.warning_timer % 30 < 15:
+        if self.movement_timer > 150:
+            if self.movement_timer % 30 < 15:
                 pygame.draw.circle(screen, RED, (self.x + self.width//2, self.y + self.height//2), 25, 3)
     
     def draw_bouncy_cloud(self, screen):
@@ -1256,11 +1465,41 @@ class CloudPlatform:
         elif self.cloud_type == "storm_cloud":
             self.draw_storm_cloud(screen)
     
+    def draw_textured(self, sprites):
+        if not self.visible:
+            return
+        
+        # The cloud itself is baked once per type, and twice for storm clouds, with and without lightning
+        key, paint = self.cloud_type, self.draw
+        if self.cloud_type == "moving_cloud":
+            paint = self.draw_medium_cloud
+        elif self.cloud_type == "disappearing_cloud":
+            paint = self.draw_small_cloud
+        elif self.cloud_type == "storm_cloud":
+            key = ("storm_cloud", self.lightning_active)
+        sprites.draw(key, self, paint, (self.width + 2 * SPRITE_MARGIN, self.height + 2 * SPRITE_MARGIN),
+                     (self.x - SPRITE_MARGIN, self.y - SPRITE_MARGIN), x=SPRITE_MARGIN, y=SPRITE_MARGIN)
+        
+        textures = sprites.textures
+        if self.cloud_type == "moving_cloud":
+            for particle in self.trail_particles:
+                textures.copy(sprites.dot(3, particle['color']), (int(particle['x']) - 3, int(particle['y']) - 3))
+        elif self.cloud_type == "disappearing_cloud" and self.movement_timer > 150 and self.movement_timer % 30 < 15:
+            ring = textures.sprite("warning_ring", lambda: sprites.paint_circle(25, RED, 3))
+            textures.copy(ring, (self.x + self.width//2 - 25, self.y + self.height//2 - 25))
+    
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
 class Obstacle:
+    __slots__ = ('x', 'obstacle_type', 'level_settings', 'width', 'height', 'color', 'movement_timer',
+                 'original_y', 'y_offset', 'animation_frame', 'grid_cells', 'pool_index')
+    
     def __init__(self, x, obstacle_type="thorny_bush", level_settings=None):
+        self.reset(x, obstacle_type, level_settings)
+        
+    def reset(self, x, obstacle_type="thorny_bush", level_settings=None):
+        # Called again when the obstacle is recycled from its pool
         self.x = x
         self.obstacle_type = obstacle_type
         self.level_settings = level_settings or Level(1, "Tutorial", "Easy level", BLUE)
@@ -1442,6 +1681,19 @@ class Obstacle:
         pygame.draw.circle(screen, (200, 200, 200), (center_x - 8, center_y - 10), 3)
         pygame.draw.circle(screen, (180, 180, 180), (center_x + 8, center_y - 8), 2)
         
+    def draw_textured(self, sprites):
+        # One texture per type, which the bush's sway and the rock's bobbing only move; the rock's cracks are keyed too
+        key, dx, dy, state = self.obstacle_type, 0, 0, {"x": SPRITE_MARGIN}
+        if self.obstacle_type == "thorny_bush":
+            dx = math.sin(self.animation_frame) * 3
+            state["animation_frame"] = 0
+        elif self.obstacle_type == "moving_rock":
+            key = ("moving_rock", int(math.sin(self.movement_timer * 0.2) * 2))
+            dy = self.y_offset
+            state["y_offset"] = 0
+        sprites.draw(key, self, self.draw, (self.width + 2 * SPRITE_MARGIN, SCREEN_HEIGHT),
+                     (self.x - SPRITE_MARGIN + dx, dy), **state)
+        
     def get_rect(self):
         if self.obstacle_type == "thorny_bush":
             return pygame.Rect(self.x, GROUND_Y - self.height, self.width, self.height)
@@ -1456,17 +1708,328 @@ class Obstacle:
         elif self.obstacle_type == "laser":
             return pygame.Rect(self.x, GROUND_Y + self.y_offset, self.width, self.height)
 
+class SpatialGrid:
+    """Uniform grid over world x for entities that scroll with the level"""
+    def __init__(self, cell_width=GRID_CELL_WIDTH):
+        self.cell_width = cell_width
+        self.cells = {}
+        self.scroll = 0  # How far the world has moved left since the grid was created
+        
+    def clear(self):
+        self.cells.clear()
+        self.scroll = 0
+        
+    def advance(self, distance):
+        # Every entity moves left by the same distance each frame, so their
+        # world x (screen x + scroll) never changes and nothing is re-bucketed
+        self.scroll += distance
+        
+    def cell_range(self, left, right):
+        return range(int((left + self.scroll) // self.cell_width),
+                     int((right + self.scroll) // self.cell_width) + 1)
+        
+    def insert(self, entity):
+        entity.grid_cells = self.cell_range(entity.x, entity.x + entity.width)
+        for cell in entity.grid_cells:
+            self.cells.setdefault(cell, []).append(entity)
+            
+    def remove(self, entity):
+        for cell in entity.grid_cells:
+            bucket = self.cells[cell]
+            bucket.remove(entity)
+            if not bucket:
+                del self.cells[cell]
+                
+    def query(self, left, right):
+        # Entities spanning several cells are only reported from the first cell both ranges share
+        cells = self.cell_range(left, right)
+        for cell in cells:
+            for entity in self.cells.get(cell, ()):
+                if cell == max(entity.grid_cells.start, cells.start):
+                    yield entity
+
+class EntityPool:
+    """Recycles entities of one class; active holds the live ones in no particular order"""
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.active = []
+        self.free = []
+        
+    def acquire(self, *args):
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args)
+        else:
+            entity = self.entity_class(*args)
+        entity.pool_index = len(self.active)
+        self.active.append(entity)
+        return entity
+        
+    def release(self, entity):
+        # Swap-remove: the last live entity takes over the released slot
+        last = self.active.pop()
+        if last is not entity:
+            self.active[entity.pool_index] = last
+            last.pool_index = entity.pool_index
+        self.free.append(entity)
+        
+    def release_all(self):
+        self.free.extend(self.active)
+        self.active.clear()
+
+class SpawnSchedule:
+    """Ahead-of-time spawn timeline for one run of a level.
+    
+    Spawns are rolled with the level's usual rates, start delays and spacing, one chunk
+    ahead of the camera. A chunk is only accepted if a search over the cheetah's jump
+    arcs finds a hit-free way through everything spawned so far; otherwise it is rolled
+    again, and after SCHEDULE_RETRIES it is left empty, which is always survivable.
+    Power-ups are never dangerous, so the search ignores them and their effects.
+    """
+    def __init__(self, level_settings, rngs):
+        self.level = level_settings
+        self.rngs = rngs
+        self.speed = level_settings.obstacle_speed
+        self.events = []  # (frame, kind, entity type, y), in frame order
+        self.cursor = 0
+        self.next_frame = 1  # First frame of the next chunk to roll
+        self.last_spawn = {"obstacle": None, "cloud": None, "power_up": None}
+        # Frame -> (obstacle (top, bottom) bands, cloud (top, bottom, y, bouncy) bands) level with the cheetah
+        self.bands = {}
+        # Every cheetah state reachable after frontier_frame that can still get through everything known
+        self.frontier_frame = 0
+        self.frontier = (np.array([GROUND_Y - 40.0]), np.zeros(1), np.ones(1, dtype=np.int8))
+        # Anything spawned at frame f reaches the cheetah no sooner than f + reach_delay,
+        # and has passed it by f + clear_delay (the widest entity is a 160px large cloud)
+        self.reach_delay = (SCREEN_WIDTH + 50 - (CHEETAH_X + 25)) // self.speed
+        self.clear_delay = (SCREEN_WIDTH + 50 + 160 - (CHEETAH_X - 25)) // self.speed + 2
+    
+    def due(self, frame):
+        """Spawns for this frame, rolling the next chunk whenever less than one is left ahead"""
+        while self.next_frame <= frame + SCHEDULE_CHUNK_FRAMES:
+            self.add_chunk()
+        start = self.cursor
+        while self.cursor < len(self.events) and self.events[self.cursor][0] <= frame:
+            self.cursor += 1
+        return self.events[start:self.cursor]
+    
+    def add_chunk(self):
+        start = self.next_frame
+        end = start + SCHEDULE_CHUNK_FRAMES
+        for attempt in range(SCHEDULE_RETRIES + 1):
+            last_spawn = dict(self.last_spawn)
+            events = self.roll(start, end, last_spawn) if attempt < SCHEDULE_RETRIES else []
+            bands = self.bands_for(events)
+            frontier = self.search(end, bands)
+            if frontier is not None:
+                break
+        self.events.extend(events)
+        self.last_spawn = last_spawn
+        for frame, (obstacle_bands, cloud_bands) in bands.items():
+            known = self.bands.setdefault(frame, ([], []))
+            known[0].extend(obstacle_bands)
+            known[1].extend(cloud_bands)
+        self.frontier_frame, self.frontier = frontier
+        for frame in [frame for frame in self.bands if frame <= self.frontier_frame]:
+            del self.bands[frame]
+        self.next_frame = end
+    
+    def spaced(self, frame, last_frame, spacing):
+        # Everything scrolls at the same speed, so the old "is anything still within spacing
+        # of the right edge" scan is just the number of frames since the last spawn
+        return last_frame is None or SCREEN_WIDTH + 50 - self.speed * (frame - last_frame) <= SCREEN_WIDTH - spacing
+    
+    def roll(self, start, end, last_spawn):
+        # The same per-frame rolls the spawn functions used to make live
+        level = self.level
+        events = []
+        for frame in range(start, end):
+            rng = self.rngs["obstacles"]
+            if frame >= 2 * FPS and self.spaced(frame, last_spawn["obstacle"], MIN_OBSTACLE_SPACING):
+                if rng.random() < level.obstacle_spawn_rate:
+                    events.append((frame, "obstacle", rng.choice(level.obstacle_types), None))
+                    last_spawn["obstacle"] = frame
+            rng = self.rngs["clouds"]
+            if frame >= 3 * FPS and self.spaced(frame, last_spawn["cloud"], 400):
+                if rng.random() < level.platform_spawn_rate:
+                    cloud_type = rng.choice(CLOUD_TYPES)
+                    events.append((frame, "cloud", cloud_type, rng.randint(GROUND_Y - 300, GROUND_Y - 100)))
+                    last_spawn["cloud"] = frame
+            rng = self.rngs["power_ups"]
+            if frame >= 5 * FPS and self.spaced(frame, last_spawn["power_up"], 300):
+                if rng.random() < level.power_up_spawn_rate:
+                    power_type = rng.choice(level.power_up_types)
+                    events.append((frame, "power_up", power_type, rng.randint(GROUND_Y - 250, GROUND_Y - 50)))
+                    last_spawn["power_up"] = frame
+        return events
+    
+    def bands_for(self, events):
+        # Step a stand-in for each new obstacle and cloud to find the frames it is level with the cheetah
+        bands = {}
+        for spawn_frame, kind, entity_type, y in events:
+            if kind == "obstacle":
+                # Game.check_collision() sees obstacles after their update on each frame
+                obstacle = Obstacle(SCREEN_WIDTH + 50, entity_type, self.level)
+                frame = spawn_frame
+                while True:
+                    obstacle.update()
+                    rect = obstacle.get_rect()
+                    if rect.right <= CHEETAH_X - 20:
+                        break
+                    if rect.left < CHEETAH_X + 20:
+                        bands.setdefault(frame, ([], []))[0].append((rect.top, rect.bottom))
+                    frame += 1
+            elif kind == "cloud":
+                # Cheetah.update() lands on clouds where they were before the frame's world update
+                cloud = CloudPlatform(SCREEN_WIDTH + 50, y, entity_type, self.level, random.Random(0))
+                frame = spawn_frame + 1
+                while True:
+                    cloud.update()
+                    rect = cloud.get_rect()
+                    if rect.right <= CHEETAH_X - 25:
+                        break
+                    if rect.left < CHEETAH_X + 25:
+                        bands.setdefault(frame, ([], []))[1].append((rect.top, rect.bottom, cloud.y, entity_type == "bouncy_cloud"))
+                    frame += 1
+        return bands
+    
+    def search(self, end, new_bands):
+        """Step every reachable cheetah state until everything spawned before end has passed.
+        
+        Returns (frame, states) for the next chunk to start from, keeping only states after
+        end + reach_delay - 1 that survive to the end of the search, or None if none do.
+        """
+        keep_frame = end + self.reach_delay - 1
+        states = self.frontier
+        links = []
+        for frame in range(self.frontier_frame + 1, end + self.clear_delay):
+            obstacle_bands, cloud_bands = self.bands.get(frame, ((), ()))
+            if frame in new_bands:
+                obstacle_bands = list(obstacle_bands) + new_bands[frame][0]
+                cloud_bands = list(cloud_bands) + new_bands[frame][1]
+            count = len(states[0])
+            states, parent, child = self.step_states(states, obstacle_bands, cloud_bands)
+            if not len(states[0]):
+                return None
+            if frame > keep_frame:
+                links.append((count, parent, child))
+            elif frame == keep_frame:
+                kept = states
+        
+        # Walk back from the survivors to the states after keep_frame they came from
+        good = np.ones(len(states[0]), dtype=bool)
+        for count, parent, child in reversed(links):
+            good_parent = np.zeros(count, dtype=bool)
+            good_parent[parent[good[child]]] = True
+            good = good_parent
+        good = np.flatnonzero(good)
+        return keep_frame, tuple(array[good] for array in kept)
+    
+    def step_states(self, states, obstacle_bands, cloud_bands):
+        """One frame of Cheetah.jump(), Cheetah.update() and Game.check_collision() for a set of states.
+        
+        Support is 0 in the air, 1 on the ground, 2 on a cloud and 3 on a bouncy cloud.
+        Returns the merged surviving states plus, per surviving branch, the index of the
+        state it came from and of the merged state it became.
+        """
+        y, velocity_y, support = states
+        count = len(y)
+        # Every state may do nothing; those standing on something may also jump
+        jumpers = np.flatnonzero(support > 0)
+        parent = np.concatenate((np.arange(count), jumpers))
+        y = y[parent]
+        velocity_y = velocity_y[parent]
+        velocity_y[count:] = np.where(support[jumpers] == 3, JUMP_FORCE * 1.3, JUMP_FORCE)
+        support = np.zeros(len(parent), dtype=np.int8)
+        
+        velocity_y += GRAVITY
+        y += velocity_y
+        if cloud_bands:
+            # Rect() truncates the landing box's float y
+            falling = velocity_y > 0
+            box_top = np.trunc(y - 25)
+            for rect_top, rect_bottom, cloud_y, bouncy in cloud_bands:
+                lands = falling & (box_top < rect_bottom) & (rect_top < box_top + 50)
+                y[lands] = cloud_y - 40
+                velocity_y[lands] = 0
+                support[lands] = 3 if bouncy else 2
+                falling &= ~lands
+        grounded = (support == 0) & (y >= GROUND_Y - 40)
+        y[grounded] = GROUND_Y - 40
+        velocity_y[grounded] = 0
+        support[grounded] = 1
+        
+        if obstacle_bands:
+            # Setting Rect.center rounds the hit box's float y, halves away from zero
+            hit_top = np.where(y >= 0, np.floor(y + 0.5), np.ceil(y - 0.5)) - 20
+            safe = np.ones(len(y), dtype=bool)
+            for rect_top, rect_bottom in obstacle_bands:
+                safe &= (hit_top >= rect_bottom) | (rect_top >= hit_top + 40)
+            parent, y, velocity_y, support = parent[safe], y[safe], velocity_y[safe], support[safe]
+        
+        # Airborne branches never meet, but everything standing on the ground or on the same
+        # cloud is one and the same state, so only supported states need merging
+        count = len(y)
+        supported = np.flatnonzero(support)
+        if len(supported) < 2:
+            return (y, velocity_y, support), parent, np.arange(count)
+        representative = np.arange(count)
+        merged = {}
+        for index, key in zip(supported.tolist(), zip(y[supported].tolist(), support[supported].tolist())):
+            representative[index] = merged.setdefault(key, index)
+        keep = representative == np.arange(count)
+        child = (np.cumsum(keep) - 1)[representative]
+        return (y[keep], velocity_y[keep], support[keep]), parent, child
+
+class Replay:
+    """A recorded run: seed, level and one input bitmask byte per simulated frame"""
+    HEADER = struct.Struct("<4sQBII")  # magic, seed, level, final score, frame count
+    
+    def __init__(self, seed, level, inputs=None, score=0):
+        self.seed = seed
+        self.level = level
+        self.inputs = inputs if inputs is not None else bytearray()
+        self.score = score
+    
+    def save(self, path):
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.HEADER.pack(REPLAY_MAGIC, self.seed, self.level, self.score, len(self.inputs)))
+            replay_file.write(self.inputs)
+    
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as replay_file:
+            magic, seed, level, score, frames = cls.HEADER.unpack(replay_file.read(cls.HEADER.size))
+            if magic != REPLAY_MAGIC:
+                raise ValueError(f"{path} is not a Geometry Cheetah replay")
+            inputs = bytearray(replay_file.read(frames))
+        if len(inputs) != frames:
+            raise ValueError(f"{path} is truncated")
+        return cls(seed, level, inputs, score)
+
 # Rest of the classes (Platform, Obstacle, Background) remain the same as in improved version
 # but with audio integration added to the Game class
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, replay=None, scores=None, scale=None, textures=None):
+        self.textures = textures  # TextureRenderer to draw gameplay with, or None for the display surface
+        if textures:
+            # The renderer owns the window; menus and end screens are drawn offscreen and shown by present_textured()
+            self.display = None
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.sprites = EntityTextures(textures)
+        else:
+            # The background and effects can be drawn below window resolution and upscaled; sprites and the HUD always draw at full size
+            self.display = ScaledDisplay((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale() if scale is None else scale)
+            self.screen = self.display.window
         pygame.display.set_caption("Geometry Cheetah - Ultimate Edition")
         self.clock = pygame.time.Clock()
+        # Menus and end screens are static, so they only redraw on input
+        self.scheduler = FrameScheduler(self.clock, FPS)
         self.font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 72)
+        self.text_cache = {}  # (font, string, color) -> rendered HUD text, see render_text()
         
         # Initialize audio manager
         self.audio_manager = AudioManager()
@@ -1484,134 +2047,185 @@ class Game:
         self.current_level = 1
         self.selected_level = 1
         
-        self.reset_game()
-        
-    def reset_game(self):
-        self.cheetah = Cheetah(100, GROUND_Y - 40, self.audio_manager)
-        self.obstacles = []
-        self.clouds = []  # Changed from platforms to clouds
-        self.power_ups = []  # Add power-ups list
+        # Shared ScoreStore for live runs, or None (as in the analysis tools) to keep no scores
+        self.scores = scores
+        if scores:
+            for level in self.levels:
+                level.best_score = scores.best(LEADERBOARD, level.level_num)
+        
+        # Entity pools and spatial indexes live for the whole session and are emptied on reset
+        self.obstacle_pool = EntityPool(Obstacle)
+        self.cloud_pool = EntityPool(CloudPlatform)
+        self.power_up_pool = EntityPool(PowerUp)
+        self.obstacles = self.obstacle_pool.active
+        self.clouds = self.cloud_pool.active  # Changed from platforms to clouds
+        self.power_ups = self.power_up_pool.active  # Add power-ups list
+        # Spatial indexes so collision and spacing checks only look at nearby entities
+        self.obstacle_grid = SpatialGrid()
+        self.cloud_grid = SpatialGrid()
+        self.power_up_grid = SpatialGrid()
+        self.cheetah_rect = pygame.Rect(0, 0, 40, 40)
         self.background = Background()
+        self.cheetah = Cheetah(CHEETAH_X, GROUND_Y - 40, self.audio_manager)
+        
+        # Replay being played back, or None while recording live input
+        self.replay = replay
+        self.recording = None
+        self.pending_input = 0
+        
+        self.reset_game()
+    
+    def reset_game(self, seed=None):
+        # Only per-run state is reset here; fonts, sounds, the background, the pools and the
+        # cheetah itself are built once in __init__ and reused, so a retry starts instantly.
+        # Every simulation random draw comes from a stream derived from this seed
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rngs = {name: random.Random(f"{self.seed}:{name}") for name in RNG_STREAMS}
+        self.frame = 0
+        self.sim_clock = 0  # Simulation frames owed to the display, see update()
+        self.timers = TimerWheel()
+        self.schedule = SpawnSchedule(self.levels[self.current_level - 1], self.rngs)
+        self.cheetah.reset(CHEETAH_X, GROUND_Y - 40, self.rngs["effects"], self.timers)
+        self.obstacle_pool.release_all()
+        self.cloud_pool.release_all()
+        self.power_up_pool.release_all()
+        self.obstacle_grid.clear()
+        self.cloud_grid.clear()
+        self.power_up_grid.clear()
         self.score = 0
         self.game_state = GameState.MENU
-        self.game_start_time = 0
         self.last_score = 0  # Track score changes for sound effects
-        
-    def spawn_obstacle(self):
-        current_level_data = self.levels[self.current_level - 1]
-        
-        # Don't spawn obstacles for the first 2 seconds of gameplay
-        if hasattr(self, 'game_start_time'):
-            time_since_start = pygame.time.get_ticks() - self.game_start_time
-            if time_since_start < 2000:  # 2 seconds delay
-                return
-        
-        # Check if we can spawn a new obstacle (respect minimum spacing)
-        can_spawn = True
-        for obstacle in self.obstacles:
-            if obstacle.x > SCREEN_WIDTH - MIN_OBSTACLE_SPACING:
-                can_spawn = False
-                break
-        
-        if can_spawn and random.random() < current_level_data.obstacle_spawn_rate:
-            obstacle_type = random.choice(current_level_data.obstacle_types)
-            self.obstacles.append(Obstacle(SCREEN_WIDTH + 50, obstacle_type, current_level_data))
     
-    def spawn_cloud(self):  # Changed from spawn_platform
-        current_level_data = self.levels[self.current_level - 1]
-        
-        # Don't spawn clouds for the first 3 seconds of gameplay
-        if hasattr(self, 'game_start_time'):
-            time_since_start = pygame.time.get_ticks() - self.game_start_time
-            if time_since_start < 3000:  # 3 seconds delay
-                return
-        
-        # Check if we can spawn a new cloud
-        can_spawn = True
-        for cloud in self.clouds:
-            if cloud.x > SCREEN_WIDTH - 400:  # More spacing for clouds
-                can_spawn = False
-                break
-        
-        if can_spawn and random.random() < current_level_data.platform_spawn_rate:
-            cloud_type = random.choice(["small_cloud", "medium_cloud", "large_cloud", "moving_cloud", "disappearing_cloud", "bouncy_cloud", "storm_cloud"])
-            cloud_y = random.randint(GROUND_Y - 300, GROUND_Y - 100)
-            self.clouds.append(CloudPlatform(SCREEN_WIDTH + 50, cloud_y, cloud_type, current_level_data))
+    def start_run(self):
+        # Replays restart from their recorded seed; live runs record a fresh one
+        if self.replay:
+            self.current_level = self.replay.level
+            self.reset_game(self.replay.seed)
+        else:
+            self.reset_game()
+            self.recording = Replay(self.seed, self.current_level)
+        self.pending_input = 0
+        self.game_state = GameState.PLAYING
+        self.audio_manager.start_music(self.current_level)
     
-    def spawn_power_up(self):
+    def finish_run(self):
+        # Only live runs reach the leaderboard; the store writes them in the background
+        if self.recording and self.scores:
+            self.scores.submit(LEADERBOARD, self.score, self.current_level)
+        if self.recording:
+            self.recording.score = self.score
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            self.recording.save(os.path.join(REPLAY_DIR, "last_run.gcr"))
+            self.recording = None
+
+    def spawn_scheduled(self):
+        # Spawns were rolled and checked for survivability ahead of time; release the ones due now
         current_level_data = self.levels[self.current_level - 1]
-        
-        # Don't spawn power-ups for the first 5 seconds of gameplay
-        if hasattr(self, 'game_start_time'):
-            time_since_start = pygame.time.get_ticks() - self.game_start_time
-            if time_since_start < 5000:  # 5 seconds delay
-                return
-        
-        # Check if we can spawn a new power-up
-        can_spawn = True
-        for power_up in self.power_ups:
-            if power_up.x > SCREEN_WIDTH - 300:  # Spacing for power-ups
-                can_spawn = False
-                break
-        
-        if can_spawn and random.random() < current_level_data.power_up_spawn_rate:
-            power_type = random.choice(current_level_data.power_up_types)
-            power_y = random.randint(GROUND_Y - 250, GROUND_Y - 50)
-            self.power_ups.append(PowerUp(SCREEN_WIDTH + 50, power_y, power_type, current_level_data))
-    
+        for frame, kind, entity_type, y in self.schedule.due(self.frame):
+            if kind == "obstacle":
+                obstacle = self.obstacle_pool.acquire(SCREEN_WIDTH + 50, entity_type, current_level_data)
+                self.obstacle_grid.insert(obstacle)
+            elif kind == "cloud":
+                cloud = self.cloud_pool.acquire(SCREEN_WIDTH + 50, y, entity_type, current_level_data, self.rngs["effects"], self.timers)
+                self.cloud_grid.insert(cloud)
+            else:
+                power_up = self.power_up_pool.acquire(SCREEN_WIDTH + 50, y, entity_type, current_level_data)
+                self.power_up_grid.insert(power_up)
+
     def check_collision(self):
         if self.cheetah.invincible or self.cheetah.shield:
             return False
             
-        cheetah_rect = pygame.Rect(self.cheetah.x - 20, self.cheetah.y - 20, 40, 40)
+        cheetah_rect = self.cheetah_rect
+        cheetah_rect.center = (self.cheetah.x, self.cheetah.y)
         
-        for obstacle in self.obstacles:
+        for obstacle in self.obstacle_grid.query(cheetah_rect.left, cheetah_rect.right):
             if cheetah_rect.colliderect(obstacle.get_rect()):
                 return True
         return False
     
     def check_power_up_collision(self):
         """Check for power-up collection"""
-        cheetah_rect = pygame.Rect(self.cheetah.x - 20, self.cheetah.y - 20, 40, 40)
+        cheetah_rect = self.cheetah_rect
+        cheetah_rect.center = (self.cheetah.x, self.cheetah.y)
         
-        for power_up in self.power_ups[:]:
+        for power_up in self.power_up_grid.query(cheetah_rect.left, cheetah_rect.right):
             if not power_up.collected and cheetah_rect.colliderect(power_up.get_rect()):
                 power_up.collected = True
                 self.cheetah.activate_power_up(power_up.power_type)
                 self.audio_manager.play_sound('score')  # Play collection sound
-                self.power_ups.remove(power_up)
+                self.power_up_grid.remove(power_up)
+                self.power_up_pool.release(power_up)
                 return True
         return False
     
+    def update_world(self):
+        """Spawn, scroll and score the level's entities for one frame; nothing here depends on the cheetah"""
+        # Timed effects due this frame fire first
+        self.timers.advance()
+        
+        # Spawn obstacles, clouds, and power-ups
+        self.spawn_scheduled()
+
+        # Update obstacles (back to front, so a swap-removed slot is refilled by one already updated)
+        for i in range(len(self.obstacles) - 1, -1, -1):
+            obstacle = self.obstacles[i]
+            obstacle.update()
+            if obstacle.x + obstacle.width < 0:
+                self.obstacle_grid.remove(obstacle)
+                self.obstacle_pool.release(obstacle)
+                self.score += 1
+        
+        # Update clouds
+        for i in range(len(self.clouds) - 1, -1, -1):
+            cloud = self.clouds[i]
+            cloud.update()
+            if cloud.x + cloud.width < 0:
+                self.cloud_grid.remove(cloud)
+                cloud.release_timers()
+                self.cloud_pool.release(cloud)
+                self.score += 1
+        
+        # Update power-ups
+        for i in range(len(self.power_ups) - 1, -1, -1):
+            power_up = self.power_ups[i]
+            power_up.update()
+            if power_up.x + power_up.width < 0:
+                self.power_up_grid.remove(power_up)
+                self.power_up_pool.release(power_up)
+        
+        # Keep the grids in step with the entities that just scrolled
+        scroll_speed = self.levels[self.current_level - 1].obstacle_speed
+        self.obstacle_grid.advance(scroll_speed)
+        self.cloud_grid.advance(scroll_speed)
+        self.power_up_grid.advance(scroll_speed)
+    
     def update(self):
+        # Slow time runs the whole simulation at SLOW_TIME_SCALE frames per displayed frame, so
+        # physics, spawns and every timer keep their frame counts and replays stay exact
         if self.game_state == GameState.PLAYING:
-            self.cheetah.update(self.clouds)  # Changed from platforms to clouds
-            self.background.update()
-            
-            # Spawn obstacles, clouds, and power-ups
-            self.spawn_obstacle()
-            self.spawn_cloud()  # Changed from spawn_platform
-            self.spawn_power_up()
-            
-            # Update obstacles
-            for obstacle in self.obstacles[:]:
-                obstacle.update()
-                if obstacle.x + obstacle.width < 0:
-                    self.obstacles.remove(obstacle)
-                    self.score += 1
-            
-            # Update clouds
-            for cloud in self.clouds[:]:
-                cloud.update()
-                if cloud.x + cloud.width < 0:
-                    self.clouds.remove(cloud)
-                    self.score += 1
+            self.sim_clock += SLOW_TIME_SCALE if self.cheetah.slow_time else 1
+            while self.sim_clock >= 1 and self.game_state == GameState.PLAYING:
+                self.sim_clock -= 1
+                self.step()
+    
+    def step(self):
+        """Advance a running game by one simulation frame"""
+        if self.game_state == GameState.PLAYING:
+            # Apply this frame's input, either from the replay or recorded from the keyboard
+            if self.replay:
+                frame_input = self.replay.inputs[self.frame] if self.frame < len(self.replay.inputs) else 0
+            else:
+                frame_input = self.pending_input
+                self.recording.inputs.append(frame_input)
+            self.pending_input = 0
+            self.frame += 1
+            if frame_input & INPUT_JUMP:
+                self.cheetah.jump()
             
-            # Update power-ups
-            for power_up in self.power_ups[:]:
-                power_up.update()
-                if power_up.x + power_up.width < 0:
-                    self.power_ups.remove(power_up)
+            # Only clouds under the cheetah's landing box can be landed on
+            self.cheetah.update(self.cloud_grid.query(self.cheetah.x - 25, self.cheetah.x + 25))
+            self.update_world()
             
             # Check power-up collection
             self.check_power_up_collision()
@@ -1635,6 +2249,7 @@ class Game:
                     # Game over
                     self.audio_manager.play_sound('death')
                     self.game_state = GameState.GAME_OVER
+                    self.finish_run()
                     current_level_data = self.levels[self.current_level - 1]
                     if self.score > current_level_data.best_score:
                         current_level_data.best_score = self.score
@@ -1645,9 +2260,10 @@ class Game:
                 current_level_data.completed = True
                 self.audio_manager.play_sound('level_complete')
                 self.game_state = GameState.LEVEL_COMPLETE
+                self.finish_run()
     
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.scheduler.events(self.game_state != GameState.PLAYING, self.game_state):
             if event.type == pygame.QUIT:
                 return False
             
@@ -1659,26 +2275,18 @@ class Game:
                     elif self.game_state == GameState.LEVEL_SELECT:
                         self.audio_manager.play_sound('menu_select')
                         self.current_level = self.selected_level
-                        self.reset_game()
-                        self.game_state = GameState.PLAYING
-                        self.game_start_time = pygame.time.get_ticks()
-                        self.audio_manager.start_music(self.current_level)
+                        self.start_run()
                     elif self.game_state == GameState.PLAYING:
-                        self.cheetah.jump()
+                        # Jumps are applied in update() so they land on a recorded frame
+                        self.pending_input |= INPUT_JUMP
                     elif self.game_state == GameState.GAME_OVER:
                         self.audio_manager.play_sound('menu_select')
-                        self.reset_game()
-                        self.game_state = GameState.PLAYING
-                        self.game_start_time = pygame.time.get_ticks()
-                        self.audio_manager.start_music(self.current_level)
+                        self.start_run()
                     elif self.game_state == GameState.LEVEL_COMPLETE:
                         if self.current_level < len(self.levels):
                             self.audio_manager.play_sound('menu_select')
                             self.current_level += 1
-                            self.reset_game()
-                            self.game_state = GameState.PLAYING
-                            self.game_start_time = pygame.time.get_ticks()
-                            self.audio_manager.start_music(self.current_level)
+                            self.start_run()
                         else:
                             self.game_state = GameState.LEVEL_SELECT
                 
@@ -1693,10 +2301,28 @@ class Game:
                     else:
                         self.selected_level = min(len(self.levels), self.selected_level + 1)
                     self.audio_manager.play_sound('menu_select')
+                    # Only the level list changes colour
+                    self.scheduler.invalidate((SCREEN_WIDTH//2 - 200, 150, 520, 80 * len(self.levels)))
         
         return True
     
+    def render_text(self, font, string, color):
+        """Rendered text, cached so the HUD only renders a label again when its text changes"""
+        key = (font, string, color)
+        text = self.text_cache.get(key)
+        if text is None:
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            text = self.text_cache[key] = font.render(string, True, color)
+        return text
+    
     def draw(self):
+        if not self.scheduler.begin_frame(self.screen):
+            return
+        if self.textures and self.game_state == GameState.PLAYING:
+            self.draw_game_textured(self.textures)
+            self.scheduler.present(self.screen, self.textures.present)
+            return
         self.screen.fill(BLACK)
         if self.game_state == GameState.MENU:
             self.draw_menu()
@@ -1708,29 +2334,49 @@ class Game:
             self.draw_game_over()
         elif self.game_state == GameState.LEVEL_COMPLETE:
             self.draw_level_complete()
-        pygame.display.flip()
+        self.scheduler.present(self.screen, self.present_textured if self.textures else None)
+    
+    def present_textured(self):
+        # Static screens only redraw on input, so uploading the whole offscreen surface is rare
+        screen_texture = self.textures.upload(self.screen)
+        self.textures.copy(screen_texture, (0, 0))
+        self.textures.present()
 
     def run(self):
+        # A loaded replay skips the menus and starts playing back straight away
+        if self.replay:
+            self.start_run()
         running = True
         while running:
             running = self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self.scheduler.tick()
+        if self.scores:
+            self.scores.close()
         pygame.quit()
-
+    
+    def run_headless(self):
+        """Play the loaded replay back as fast as possible; returns (frames, score, seconds)"""
+        self.start_run()
+        start_time = time.perf_counter()
+        while self.game_state == GameState.PLAYING and self.frame < len(self.replay.inputs):
+            self.step()
+            self.draw()
+        return self.frame, self.score, time.perf_counter() - start_time
+    
     def draw_menu(self):
         self.background.draw(self.screen)
         
         # Title with shadow
-        title_shadow = self.title_font.render("GEOMETRY CHEETAH", True, BLACK)
-        title_text = self.title_font.render("GEOMETRY CHEETAH", True, WHITE)
+        title_shadow = self.render_text(self.title_font, "GEOMETRY CHEETAH", BLACK)
+        title_text = self.render_text(self.title_font, "GEOMETRY CHEETAH", WHITE)
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - 298, 102))
         self.screen.blit(title_text, (SCREEN_WIDTH//2 - 300, 100))
         
         # Subtitle with shadow
-        subtitle_shadow = self.font.render("ULTIMATE EDITION", True, BLACK)
-        subtitle_text = self.font.render("ULTIMATE EDITION", True, CYAN)
+        subtitle_shadow = self.render_text(self.font, "ULTIMATE EDITION", BLACK)
+        subtitle_text = self.render_text(self.font, "ULTIMATE EDITION", CYAN)
         self.screen.blit(subtitle_shadow, (SCREEN_WIDTH//2 - 148, 182))
         self.screen.blit(subtitle_text, (SCREEN_WIDTH//2 - 150, 180))
         
@@ -1746,14 +2392,14 @@ class Game:
         ]
         
         for i, feature in enumerate(features):
-            feature_shadow = self.small_font.render(feature, True, BLACK)
-            feature_text = self.small_font.render(feature, True, WHITE)
+            feature_shadow = self.render_text(self.small_font, feature, BLACK)
+            feature_text = self.render_text(self.small_font, feature, WHITE)
             self.screen.blit(feature_shadow, (SCREEN_WIDTH//2 - 198, 252 + i * 30))
             self.screen.blit(feature_text, (SCREEN_WIDTH//2 - 200, 250 + i * 30))
         
         # Instructions with shadow
-        instruction_shadow = self.font.render("Press SPACE to Start", True, BLACK)
-        instruction_text = self.font.render("Press SPACE to Start", True, YELLOW)
+        instruction_shadow = self.render_text(self.font, "Press SPACE to Start", BLACK)
+        instruction_text = self.render_text(self.font, "Press SPACE to Start", YELLOW)
         self.screen.blit(instruction_shadow, (SCREEN_WIDTH//2 - 148, SCREEN_HEIGHT - 98))
         self.screen.blit(instruction_text, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT - 100))
 
@@ -1761,8 +2407,8 @@ class Game:
         self.background.draw(self.screen)
         
         # Title with shadow
-        title_shadow = self.title_font.render("SELECT LEVEL", True, BLACK)
-        title_text = self.title_font.render("SELECT LEVEL", True, WHITE)
+        title_shadow = self.render_text(self.title_font, "SELECT LEVEL", BLACK)
+        title_text = self.render_text(self.title_font, "SELECT LEVEL", WHITE)
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - 198, 52))
         self.screen.blit(title_text, (SCREEN_WIDTH//2 - 200, 50))
         
@@ -1772,79 +2418,65 @@ class Game:
             color = WHITE if i + 1 == self.selected_level else GRAY
             
             # Level number and name with shadow
-            level_shadow = self.font.render(f"Level {level.level_num}: {level.name}", True, BLACK)
-            level_text = self.font.render(f"Level {level.level_num}: {level.name}", True, color)
+            level_shadow = self.render_text(self.font, f"Level {level.level_num}: {level.name}", BLACK)
+            level_text = self.render_text(self.font, f"Level {level.level_num}: {level.name}", color)
             self.screen.blit(level_shadow, (SCREEN_WIDTH//2 - 198, y_pos + 2))
             self.screen.blit(level_text, (SCREEN_WIDTH//2 - 200, y_pos))
             
             # Description with shadow
-            desc_shadow = self.small_font.render(level.description, True, BLACK)
-            desc_text = self.small_font.render(level.description, True, color)
+            desc_shadow = self.render_text(self.small_font, level.description, BLACK)
+            desc_text = self.render_text(self.small_font, level.description, color)
             self.screen.blit(desc_shadow, (SCREEN_WIDTH//2 - 198, y_pos + 32))
             self.screen.blit(desc_text, (SCREEN_WIDTH//2 - 200, y_pos + 30))
             
             # Difficulty indicator with shadow
             if level.level_num <= 2:
-                diff_shadow = self.small_font.render("EASY", True, BLACK)
-                diff_text = self.small_font.render("EASY", True, GREEN)
+                diff_shadow = self.render_text(self.small_font, "EASY", BLACK)
+                diff_text = self.render_text(self.small_font, "EASY", GREEN)
             elif level.level_num <= 4:
-                diff_shadow = self.small_font.render("MEDIUM", True, BLACK)
-                diff_text = self.small_font.render("MEDIUM", True, YELLOW)
+                diff_shadow = self.render_text(self.small_font, "MEDIUM", BLACK)
+                diff_text = self.render_text(self.small_font, "MEDIUM", YELLOW)
             else:
-                diff_shadow = self.small_font.render("HARD", True, BLACK)
-                diff_text = self.small_font.render("HARD", True, RED)
+                diff_shadow = self.render_text(self.small_font, "HARD", BLACK)
+                diff_text = self.render_text(self.small_font, "HARD", RED)
             self.screen.blit(diff_shadow, (SCREEN_WIDTH//2 + 202, y_pos + 2))
             self.screen.blit(diff_text, (SCREEN_WIDTH//2 + 200, y_pos))
+            
+            # Best score with shadow
+            if level.best_score:
+                best_shadow = self.render_text(self.small_font, f"BEST {level.best_score}", BLACK)
+                best_text = self.render_text(self.small_font, f"BEST {level.best_score}", color)
+                self.screen.blit(best_shadow, (SCREEN_WIDTH//2 + 202, y_pos + 32))
+                self.screen.blit(best_text, (SCREEN_WIDTH//2 + 200, y_pos + 30))
         
         # Instructions with shadow
-        instruction_shadow = self.small_font.render("Use UP/DOWN arrows to select, SPACE to start", True, BLACK)
-        instruction_text = self.small_font.render("Use UP/DOWN arrows to select, SPACE to start", True, WHITE)
+        instruction_shadow = self.render_text(self.small_font, "Use UP/DOWN arrows to select, SPACE to start", BLACK)
+        instruction_text = self.render_text(self.small_font, "Use UP/DOWN arrows to select, SPACE to start", WHITE)
         self.screen.blit(instruction_shadow, (SCREEN_WIDTH//2 - 198, SCREEN_HEIGHT - 98))
         self.screen.blit(instruction_text, (SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT - 100))
 
+    def draw_world(self, effects=True):
+        # The render-scaled layers, put on the window in one scaled blit
+        surface, scale = (self.display.surface, self.display.scale) if self.display else (self.screen, 1.0)
+        if surface is not self.screen:
+            surface.fill(BLACK)  # draw() has only cleared the window
+        self.background.draw(surface, scale)
+        if effects:
+            for power_up in getattr(self, 'power_ups', []):
+                power_up.draw_effects(surface, scale)
+            self.cheetah.draw_effects(surface, scale)
+        if self.display:
+            self.display.present()
+    
     def draw_game(self):
-        self.background.draw(self.screen)
+        # The parallax background is purely visual, so it advances when drawn rather than in update()
+        self.background.update()
+        self.draw_world()
         
-        # Draw level info with shadow
-        current_level = self.levels[self.current_level - 1]
-        level_shadow = self.small_font.render(f"Level {self.current_level}: {current_level.name}", True, BLACK)
-        level_text = self.small_font.render(f"Level {self.current_level}: {current_level.name}", True, WHITE)
-        self.screen.blit(level_shadow, (22, 22))
-        self.screen.blit(level_text, (20, 20))
-        
-        # Draw score with shadow
-        score_shadow = self.small_font.render(f"Score: {self.score}", True, BLACK)
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_shadow, (22, 52))
-        self.screen.blit(score_text, (20, 50))
-        
-        # Draw required score with shadow
-        required_shadow = self.small_font.render(f"Required: {current_level.required_score}", True, BLACK)
-        required_text = self.small_font.render(f"Required: {current_level.required_score}", True, WHITE)
-        self.screen.blit(required_shadow, (22, 82))
-        self.screen.blit(required_text, (20, 80))
-        
-        # Draw power-up status with shadows
-        if self.cheetah.flying:
-            flying_shadow = self.small_font.render("FLYING!", True, BLACK)
-            flying_text = self.small_font.render("FLYING!", True, CYAN)
-            self.screen.blit(flying_shadow, (SCREEN_WIDTH - 148, 22))
-            self.screen.blit(flying_text, (SCREEN_WIDTH - 150, 20))
-        if self.cheetah.double_jump_available:
-            double_shadow = self.small_font.render("DOUBLE JUMP!", True, BLACK)
-            double_text = self.small_font.render("DOUBLE JUMP!", True, PURPLE)
-            self.screen.blit(double_shadow, (SCREEN_WIDTH - 148, 52))
-            self.screen.blit(double_text, (SCREEN_WIDTH - 150, 50))
-        if self.cheetah.slow_time:
-            slow_shadow = self.small_font.render("SLOW TIME!", True, BLACK)
-            slow_text = self.small_font.render("SLOW TIME!", True, BLUE)
-            self.screen.blit(slow_shadow, (SCREEN_WIDTH - 148, 82))
-            self.screen.blit(slow_text, (SCREEN_WIDTH - 150, 80))
-        if self.cheetah.shield:
-            shield_shadow = self.small_font.render("SHIELD!", True, BLACK)
-            shield_text = self.small_font.render("SHIELD!", True, GREEN)
-            self.screen.blit(shield_shadow, (SCREEN_WIDTH - 148, 112))
-            self.screen.blit(shield_text, (SCREEN_WIDTH - 150, 110))
+        # Draw level info, score and power-up status with shadows
+        for string, color, (x, y) in self.hud_labels():
+            self.screen.blit(self.render_text(self.small_font, string, BLACK), (x + 2, y + 2))
+            self.screen.blit(self.render_text(self.small_font, string, color), (x, y))
         
         self.cheetah.draw(self.screen)
         
@@ -1859,45 +2491,82 @@ class Game:
             if hasattr(power_up, 'draw'):
                 power_up.draw(self.screen)
 
+    def hud_labels(self):
+        """The gameplay HUD as (text, color, position), each label drawn over a shadow 2 pixels down and right"""
+        current_level = self.levels[self.current_level - 1]
+        labels = [(f"Level {self.current_level}: {current_level.name}", WHITE, (20, 20)),
+                  (f"Score: {self.score}", WHITE, (20, 50)),
+                  (f"Required: {current_level.required_score}", WHITE, (20, 80))]
+        if self.cheetah.flying:
+            labels.append(("FLYING!", CYAN, (SCREEN_WIDTH - 150, 20)))
+        if self.cheetah.double_jump_available:
+            labels.append(("DOUBLE JUMP!", PURPLE, (SCREEN_WIDTH - 150, 50)))
+        if self.cheetah.slow_time:
+            labels.append(("SLOW TIME!", BLUE, (SCREEN_WIDTH - 150, 80)))
+        if self.cheetah.shield:
+            labels.append(("SHIELD!", GREEN, (SCREEN_WIDTH - 150, 110)))
+        return labels
+    
+    def draw_game_textured(self, textures):
+        # The same frame as draw_game(), as copies of textures baked once (see EntityTextures)
+        self.background.update()
+        sprites = self.sprites
+        self.background.draw_textured(sprites)
+        for power_up in self.power_ups:
+            power_up.draw_effects_textured(sprites)
+        self.cheetah.draw_effects_textured(sprites)
+        
+        for string, color, (x, y) in self.hud_labels():
+            textures.copy(textures.text(self.small_font, string, BLACK), (x + 2, y + 2))
+            textures.copy(textures.text(self.small_font, string, color), (x, y))
+        
+        self.cheetah.draw_textured(sprites)
+        for obstacle in self.obstacles:
+            obstacle.draw_textured(sprites)
+        for cloud in self.clouds:
+            cloud.draw_textured(sprites)
+        for power_up in self.power_ups:
+            power_up.draw_textured(sprites)
+    
     def draw_game_over(self):
-        self.background.draw(self.screen)
+        self.draw_world(effects=False)
         
         # Game over text with shadow
-        game_over_shadow = self.title_font.render("GAME OVER", True, BLACK)
-        game_over_text = self.title_font.render("GAME OVER", True, RED)
+        game_over_shadow = self.render_text(self.title_font, "GAME OVER", BLACK)
+        game_over_text = self.render_text(self.title_font, "GAME OVER", RED)
         self.screen.blit(game_over_shadow, (SCREEN_WIDTH//2 - 148, SCREEN_HEIGHT//2 - 48))
         self.screen.blit(game_over_text, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 - 50))
         
         # Final score with shadow
-        final_score_shadow = self.font.render(f"Final Score: {self.score}", True, BLACK)
-        final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
+        final_score_shadow = self.render_text(self.font, f"Final Score: {self.score}", BLACK)
+        final_score_text = self.render_text(self.font, f"Final Score: {self.score}", WHITE)
         self.screen.blit(final_score_shadow, (SCREEN_WIDTH//2 - 148, SCREEN_HEIGHT//2 + 20))
         self.screen.blit(final_score_text, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 18))
         
         # Instructions with shadow
-        instruction_shadow = self.small_font.render("Press SPACE to restart, ESC for level select", True, BLACK)
-        instruction_text = self.small_font.render("Press SPACE to restart, ESC for level select", True, WHITE)
+        instruction_shadow = self.render_text(self.small_font, "Press SPACE to restart, ESC for level select", BLACK)
+        instruction_text = self.render_text(self.small_font, "Press SPACE to restart, ESC for level select", WHITE)
         self.screen.blit(instruction_shadow, (SCREEN_WIDTH//2 - 198, SCREEN_HEIGHT//2 + 80))
         self.screen.blit(instruction_text, (SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 + 78))
 
     def draw_level_complete(self):
-        self.background.draw(self.screen)
+        self.draw_world(effects=False)
         
         # Level complete text with shadow
-        complete_shadow = self.title_font.render("LEVEL COMPLETE!", True, BLACK)
-        complete_text = self.title_font.render("LEVEL COMPLETE!", True, GREEN)
+        complete_shadow = self.render_text(self.title_font, "LEVEL COMPLETE!", BLACK)
+        complete_text = self.render_text(self.title_font, "LEVEL COMPLETE!", GREEN)
         self.screen.blit(complete_shadow, (SCREEN_WIDTH//2 - 198, SCREEN_HEIGHT//2 - 48))
         self.screen.blit(complete_text, (SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 - 50))
         
         # Score achieved with shadow
-        score_shadow = self.font.render(f"Score: {self.score}", True, BLACK)
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_shadow = self.render_text(self.font, f"Score: {self.score}", BLACK)
+        score_text = self.render_text(self.font, f"Score: {self.score}", WHITE)
         self.screen.blit(score_shadow, (SCREEN_WIDTH//2 - 148, SCREEN_HEIGHT//2 + 20))
         self.screen.blit(score_text, (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 18))
         
         # Instructions with shadow
-        instruction_shadow = self.small_font.render("Press SPACE to continue to next level", True, BLACK)
-        instruction_text = self.small_font.render("Press SPACE to continue to next level", True, WHITE)
+        instruction_shadow = self.render_text(self.small_font, "Press SPACE to continue to next level", BLACK)
+        instruction_text = self.render_text(self.small_font, "Press SPACE to continue to next level", WHITE)
         self.screen.blit(instruction_shadow, (SCREEN_WIDTH//2 - 198, SCREEN_HEIGHT//2 + 80))
         self.screen.blit(instruction_text, (SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 + 78))
 
@@ -1905,5 +2574,31 @@ class Game:
 # They would be the same as in the improved version
 
 if __name__ == "__main__":
-    game = Game()
-    game.run() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Geometry Cheetah - Ultimate Edition")
+    parser.add_argument("--replay", help="play back a recorded .gcr replay (runs are saved to replays/last_run.gcr)")
+    parser.add_argument("--headless", action="store_true", help="play the replay offscreen at maximum speed and print timings")
+    parser.add_argument("--render-scale", type=float, default=render_scale(),
+                        help="draw the background and effects at this fraction of the window's resolution, e.g. 0.5 (default: $RENDER_SCALE or 1)")
+    parser.add_argument("--renderer", choices=["surface", "texture"], default="surface",
+                        help="draw on the display surface, or copy GPU textures with pygame._sdl2 (default: surface)")
+    parser.add_argument("--software-renderer", action="store_true",
+                        help="with --renderer texture, use SDL's software renderer even if a GPU one is available")
+    args = parser.parse_args()
+    
+    textures = None
+    if args.renderer == "texture":
+        textures = TextureRenderer("Geometry Cheetah - Ultimate Edition", (SCREEN_WIDTH, SCREEN_HEIGHT),
+                                   software=args.software_renderer)
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = Game(replay, scale=args.render_scale, textures=textures)
+        if args.headless:
+            frames, score, elapsed = game.run_headless()
+            print(f"{frames} frames in {elapsed:.2f}s ({elapsed * 1000 / max(frames, 1):.2f} ms/frame)")
+            print(f"Score {score}, recorded {replay.score}")
+            pygame.quit()
+            sys.exit(0 if score == replay.score and frames == len(replay.inputs) else 1)
+        game.run()
+    else:
+        game = Game(scores=ScoreStore(), scale=args.render_scale, textures=textures)
+        game.run() 
\ No newline at end of file
@@ -65,8 +65,8 @@ def main():
     
     # Import and run the game
     try:
-        from geometry_cheetah_ultimate import Game
-        game = Game()
+        from geometry_cheetah_ultimate import Game, ScoreStore
+        game = Game(scores=ScoreStore())
         game.run()
     except Exception as e:
         print(f"Error running game: {e}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for Geometry Cheetah Ultimate's world-x spatial grid
+"""
+
+import os
+import random
+
+# The game module opens pygame and the mixer when it is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from geometry_cheetah_ultimate import SpatialGrid
+
+
+class Entity:
+    def __init__(self, x, width):
+        self.x = x
+        self.width = width
+
+
+def overlapping(grid, entities, left, right):
+    """Entities whose x span shares a grid cell with [left, right], found without the grid"""
+    cells = grid.cell_range(left, right)
+    return {entity for entity in entities
+            if set(grid.cell_range(entity.x, entity.x + entity.width)) & set(cells)}
+
+
+def test_query_finds_every_nearby_entity_once():
+    rng = random.Random(11)
+    grid = SpatialGrid(cell_width=50)
+    entities = []
+    for frame in range(2000):
+        # Spawn at the right edge, scroll everything left, despawn past the left edge
+        if rng.random() < 0.3:
+            entity = Entity(1250 + rng.randrange(0, 40), rng.choice((5, 40, 80, 100, 160, 300)))
+            grid.insert(entity)
+            entities.append(entity)
+        speed = rng.randrange(4, 10)
+        for entity in entities[:]:
+            entity.x -= speed
+            if entity.x + entity.width < 0:
+                grid.remove(entity)
+                entities.remove(entity)
+        grid.advance(speed)
+
+        left = rng.uniform(-100, 1300)
+        right = left + rng.choice((0, 1, 40, 50, 400))
+        found = list(grid.query(left, right))
+        assert len(found) == len(set(found)), "an entity was reported twice"
+        assert set(found) == overlapping(grid, entities, left, right)
+        # Everything that actually overlaps the range is among the candidates
+        assert {entity for entity in entities if entity.x <= right and entity.x + entity.width >= left} <= set(found)
+
+
+def test_removed_entities_leave_no_empty_cells():
+    grid = SpatialGrid(cell_width=100)
+    entities = [Entity(x, 250) for x in range(0, 1000, 70)]
+    for entity in entities:
+        grid.insert(entity)
+    for entity in entities:
+        grid.remove(entity)
+    assert grid.cells == {}
+    assert list(grid.query(-1000, 2000)) == []
+
+
+def test_clear_resets_the_scroll():
+    grid = SpatialGrid(cell_width=100)
+    grid.insert(Entity(120, 40))
+    grid.advance(500)
+    grid.clear()
+    assert grid.scroll == 0
+    assert grid.cells == {}
+    entity = Entity(120, 40)
+    grid.insert(entity)
+    assert list(grid.query(100, 200)) == [entity]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests that Geometry Cheetah Ultimate's spawn schedule only ever rolls survivable levels
+"""
+
+import os
+from types import SimpleNamespace
+
+# The game module opens pygame and the mixer when it is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pytest
+
+import geometry_cheetah_ultimate
+from geometry_cheetah_ultimate import (CHEETAH_X, GROUND_Y, SCHEDULE_CHUNK_FRAMES, SCHEDULE_RETRIES, FPS, Game,
+                                       SpawnSchedule)
+
+RUN_FRAMES = 20 * FPS
+CROWDED_SPAWN_RATE = 0.2  # With no spacing, most runs rolled at this rate and left unchecked have no way through
+BOUNCY = SimpleNamespace(cloud_type="bouncy_cloud")
+CLOUD = SimpleNamespace(cloud_type="small_cloud")
+
+
+class Silent:
+    def play_sound(self, sound_name):
+        pass
+
+
+@pytest.fixture(scope="module")
+def game():
+    game = Game()
+    game.cheetah.audio_manager = Silent()
+    return game
+
+
+def restore(cheetah, state):
+    y, velocity_y, on_ground, on_platform, bouncy = state
+    cheetah.y = y
+    cheetah.velocity_y = velocity_y
+    cheetah.is_on_ground = on_ground
+    cheetah.is_on_platform = on_platform
+    cheetah.current_platform = (BOUNCY if bouncy else CLOUD) if on_platform else None
+    cheetah.trail_particles.clear()
+    cheetah.power_up_particles.clear()
+
+
+def snapshot(cheetah):
+    bouncy = cheetah.current_platform is not None and cheetah.current_platform.cloud_type == "bouncy_cloud"
+    return cheetah.y, cheetah.velocity_y, cheetah.is_on_ground, cheetah.is_on_platform, bouncy
+
+
+def play_every_input(game, level, seed, frames):
+    """Play the real world forward, trying both inputs on every frame from every hit-free cheetah state.
+
+    Power-ups are never collected, so no shield, invincibility or double jump helps along the way.
+    Returns the number of obstacles the run spawned.
+    """
+    game.current_level = level
+    game.reset_game(seed)
+    cheetah = game.cheetah
+    states = {(GROUND_Y - 40, 0, True, False, False)}
+    obstacles = 0
+    for frame in range(1, frames + 1):
+        game.frame = frame
+        clouds = list(game.cloud_grid.query(CHEETAH_X - 25, CHEETAH_X + 25))
+        moved = set()
+        for state in states:
+            for jump in (False, True):
+                restore(cheetah, state)
+                if jump:
+                    if not (cheetah.is_on_ground or cheetah.is_on_platform):
+                        continue
+                    cheetah.jump()
+                cheetah.update(clouds)
+                moved.add(snapshot(cheetah))
+        spawned = len(game.obstacles)
+        game.update_world()
+        obstacles += len(game.obstacles) > spawned
+        states = set()
+        for state in moved:
+            restore(cheetah, state)
+            if not game.check_collision():
+                states.add(state)
+        assert states, f"level {level}, seed {seed}: every way through is hit at frame {frame}"
+    return obstacles
+
+
+@pytest.fixture
+def crowded(game, monkeypatch):
+    # The real levels are sparse enough to survive unchecked; crowd them so the search has to reroll
+    monkeypatch.setattr(geometry_cheetah_ultimate, "MIN_OBSTACLE_SPACING", 0)
+    for level in game.levels:
+        monkeypatch.setattr(level, "obstacle_spawn_rate", CROWDED_SPAWN_RATE)
+    return game
+
+
+@pytest.mark.parametrize("level", range(1, 7))
+@pytest.mark.parametrize("seed", [1, 2024])
+def test_every_run_has_a_hit_free_way_through(game, level, seed):
+    assert play_every_input(game, level, seed, RUN_FRAMES) > 0
+
+
+@pytest.mark.parametrize("level", range(1, 7))
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_crowded_runs_have_a_hit_free_way_through(crowded, level, seed):
+    assert play_every_input(crowded, level, seed, RUN_FRAMES) > 0
+
+
+def test_crowded_runs_need_the_search(crowded, monkeypatch):
+    # Accepting every roll as it comes lets through runs the reference can't get past
+    def accept(self, end, new_bands):
+        return end, (np.array([GROUND_Y - 40.0]), np.zeros(1), np.ones(1, dtype=np.int8))
+
+    monkeypatch.setattr(SpawnSchedule, "search", accept)
+    stuck = 0
+    for seed in (1, 2, 3):
+        try:
+            play_every_input(crowded, 6, seed, RUN_FRAMES)
+        except AssertionError:
+            stuck += 1
+    assert stuck
+
+
+def test_unsurvivable_chunks_are_rerolled_then_left_empty(game, monkeypatch):
+    game.current_level = 6
+    game.reset_game(7)
+    schedule = SpawnSchedule(game.levels[5], game.rngs)
+    rolls = []
+
+    def wall(events):
+        # A full-height obstacle level with the cheetah for a frame of the chunk
+        rolls.append(events)
+        return {schedule.next_frame + 10: ([(-1000, 1000)], [])} if events else {}
+
+    monkeypatch.setattr(schedule, "bands_for", wall)
+    schedule.next_frame = 5 * FPS
+    schedule.add_chunk()
+    assert len(rolls) == SCHEDULE_RETRIES + 1
+    assert all(rolls[:-1]) and rolls[-1] == []
+    assert schedule.events == []
+    assert schedule.next_frame == 5 * FPS + SCHEDULE_CHUNK_FRAMES
@@ -1,15 +1,24 @@
+import os
+import sys
+import argparse
 import pygame
 import random
 import noise
 from enum import Enum
 from typing import Tuple
 
+# The frame scheduler and render scale are shared by every game in the collection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from frame_scheduler import FrameScheduler
+from render_scale import ScaledDisplay, render_scale
+
 # Initialize Pygame
 pygame.init()
 
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
+FPS = 60
 TILE_SIZE = 32
 WORLD_WIDTH = 100
 WORLD_HEIGHT = 50
@@ -17,6 +26,12 @@ PLAYER_SPEED = 5
 GRAVITY = 0.8
 JUMP_FORCE = -15
 
+# HUD layout, shared by draw_ui and the regions a paused redraw repaints
+HUD_X = 10
+HUD_WIDTH = 200
+INVENTORY_TOP = 105  # First inventory row, below the health and hunger bars
+INVENTORY_ROW_HEIGHT = 20
+
 # Colors
 SKY_BLUE = (135, 206, 235)
 GRASS_GREEN = (34, 139, 34)
@@ -252,10 +267,14 @@ class World:
 
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, scale=None):
+        # The world can be drawn below window resolution and upscaled; the UI always draws at full size
+        self.display = ScaledDisplay((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale() if scale is None else scale)
+        self.screen = self.display.window
         pygame.display.set_caption("Minecraft 2D")
         self.clock = pygame.time.Clock()
+        # While paused the world is frozen, so the loop sleeps until there is input
+        self.scheduler = FrameScheduler(self.clock, FPS)
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
 
@@ -267,29 +286,42 @@ class Game:
         self.paused = False
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.scheduler.events(self.paused, self.paused):
+            changed = []  # Screen regions this event changed
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.paused = not self.paused
                 elif event.key == pygame.K_1:
-                    self.player.selected_block = BlockType.DIRT
+                    changed = self.select_block(BlockType.DIRT)
                 elif event.key == pygame.K_2:
-                    self.player.selected_block = BlockType.STONE
+                    changed = self.select_block(BlockType.STONE)
                 elif event.key == pygame.K_3:
-                    self.player.selected_block = BlockType.WOOD
+                    changed = self.select_block(BlockType.WOOD)
                 elif event.key == pygame.K_4:
-                    self.player.selected_block = BlockType.LEAVES
+                    changed = self.select_block(BlockType.LEAVES)
                 elif event.key == pygame.K_5:
-                    self.player.selected_block = BlockType.SAND
+                    changed = self.select_block(BlockType.SAND)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click - break block
-                    self.break_block()
+                    changed = self.break_block()
                 elif event.button == 3:  # Right click - place block
-                    self.place_block()
+                    changed = self.place_block()
+            if self.paused:
+                # Block selection, breaking and placing still work while paused; only what they touched is redrawn
+                for rect in changed:
+                    self.scheduler.invalidate(rect)
+
+    def select_block(self, block_type):
+        """Select block_type for placing; returns the screen regions that changed"""
+        if self.player.selected_block == block_type:
+            return []
+        self.player.selected_block = block_type
+        return [self.selected_rect()]
 
     def break_block(self):
+        """Hit the block under the mouse; returns the screen regions that changed"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
         world_x = int((mouse_x + self.camera_x) // TILE_SIZE)
         world_y = int(mouse_y // TILE_SIZE)
@@ -303,8 +335,11 @@ class Game:
                     self.player.inventory[block.type] += 1
                     # Replace with air
                     self.world.blocks[world_x][world_y] = Block(BlockType.AIR, world_x, world_y)
+                    return [self.tile_rect(world_x, world_y), self.inventory_row_rect(block.type)]
+        return []
 
     def place_block(self):
+        """Place the selected block under the mouse; returns the screen regions that changed"""
         if self.player.inventory[self.player.selected_block] > 0:
             mouse_x, mouse_y = pygame.mouse.get_pos()
             world_x = int((mouse_x + self.camera_x) // TILE_SIZE)
@@ -314,6 +349,22 @@ class Game:
                 if self.world.blocks[world_x][world_y].type == BlockType.AIR:
                     self.world.blocks[world_x][world_y] = Block(self.player.selected_block, world_x, world_y)
                     self.player.inventory[self.player.selected_block] -= 1
+                    return [self.tile_rect(world_x, world_y), self.inventory_row_rect(self.player.selected_block)]
+        return []
+
+    def tile_rect(self, world_x, world_y):
+        # A pixel of slack each side covers the tile border and rounding in the upscale
+        return pygame.Rect(int(world_x * TILE_SIZE - self.camera_x), world_y * TILE_SIZE,
+                           TILE_SIZE, TILE_SIZE).inflate(2, 2)
+
+    def inventory_row_rect(self, block_type):
+        """Where draw_ui lists block_type's count"""
+        index = list(self.player.inventory).index(block_type)
+        return pygame.Rect(HUD_X, INVENTORY_TOP + index * INVENTORY_ROW_HEIGHT, HUD_WIDTH, INVENTORY_ROW_HEIGHT)
+
+    def selected_rect(self):
+        """Where draw_ui names the selected block"""
+        return pygame.Rect(HUD_X, SCREEN_HEIGHT - 50, HUD_WIDTH, 25)
 
     def update(self):
         if not self.paused:
@@ -325,7 +376,12 @@ class Game:
             self.camera_x = max(0, min(target_camera_x, WORLD_WIDTH * TILE_SIZE - SCREEN_WIDTH))
 
     def draw(self):
-        self.screen.fill(SKY_BLUE)
+        if not self.scheduler.begin_frame(self.screen):
+            return
+        # Window pixels map to world-surface pixels by the render scale
+        world_surface = self.display.surface
+        scale = self.display.scale
+        world_surface.fill(SKY_BLUE)
 
         # Draw world
         start_x = max(0, int(self.camera_x // TILE_SIZE))
@@ -340,19 +396,28 @@ class Game:
 
                     if 0 <= screen_x < SCREEN_WIDTH and 0 <= screen_y < SCREEN_HEIGHT:
                         color = block.get_color()
-                        rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-                        pygame.draw.rect(self.screen, color, rect)
-                        pygame.draw.rect(self.screen, (0, 0, 0), rect, 1)  # Border
+                        rect = self.scaled_rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE, scale)
+                        pygame.draw.rect(world_surface, color, rect)
+                        pygame.draw.rect(world_surface, (0, 0, 0), rect, 1)  # Border
 
         # Draw player
-        player_rect = pygame.Rect(self.player.x - self.camera_x, self.player.y,
-                                self.player.width, self.player.height)
-        pygame.draw.rect(self.screen, (255, 0, 0), player_rect)
+        player_rect = self.scaled_rect(self.player.x - self.camera_x, self.player.y,
+                                       self.player.width, self.player.height, scale)
+        pygame.draw.rect(world_surface, (255, 0, 0), player_rect)
+
+        # One scaled blit puts the world on the window
+        self.display.present()
 
         # Draw UI
         self.draw_ui()
 
-        pygame.display.flip()
+        self.scheduler.present(self.screen)
+
+    @staticmethod
+    def scaled_rect(x, y, width, height, scale):
+        # Edges are scaled rather than sizes, so neighbouring tiles still meet without gaps
+        left, top = int(x * scale), int(y * scale)
+        return pygame.Rect(left, top, int((x + width) * scale) - left, int((y + height) * scale) - top)
 
     def draw_ui(self):
         # Health bar
@@ -388,22 +453,21 @@ class Game:
         inventory_text = self.font.render("Inventory:", True, (0, 0, 0))
         self.screen.blit(inventory_text, (health_x, inventory_y))
 
-        y_offset = inventory_y + 25
-        for i, (block_type, count) in enumerate(self.player.inventory.items()):
+        for block_type, count in self.player.inventory.items():
             if count > 0:
+                row = self.inventory_row_rect(block_type)
                 color = Block(block_type, 0, 0).get_color()
-                pygame.draw.rect(self.screen, color, (health_x, y_offset + i * 20, 15, 15))
-                pygame.draw.rect(self.screen, (0, 0, 0), (health_x, y_offset + i * 20, 15, 15), 1)
+                pygame.draw.rect(self.screen, color, (row.x, row.y, 15, 15))
+                pygame.draw.rect(self.screen, (0, 0, 0), (row.x, row.y, 15, 15), 1)
 
                 text = self.small_font.render(f"{block_type.name}: {count}", True, (0, 0, 0))
-                self.screen.blit(text, (health_x + 20, y_offset + i * 20))
+                self.screen.blit(text, (row.x + 20, row.y))
 
         # Selected block
-        selected_y = SCREEN_HEIGHT - 50
         selected_text = self.font.render(
             f"Selected: {self.player.selected_block.name}", True, (0, 0, 0)
         )
-        self.screen.blit(selected_text, (10, selected_y))
+        self.screen.blit(selected_text, self.selected_rect())
 
         # Controls
         controls_text = self.small_font.render(
@@ -422,10 +486,14 @@ class Game:
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(60)
+            self.scheduler.tick()
 
         pygame.quit()
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Minecraft 2D")
+    parser.add_argument("--render-scale", type=float, default=render_scale(),
+                        help="draw the world at this fraction of the window's resolution, e.g. 0.5 (default: $RENDER_SCALE or 1)")
+    args = parser.parse_args()
+    game = Game(args.render_scale)
     game.run()
\ No newline at end of file
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Ninja Slime K-in-a-Row Engine
+Bitboard rules and a time-boxed alpha-beta player for N x N boards, k in a row to win.
+
+Each side's stones are one int with a bit per cell, and every winning line is a
+precomputed mask, so a win check is a few ANDs over the lines through the last move.
+The computer searches with negamax alpha-beta and a transposition table, deepening
+one ply at a time until its time budget runs out; the table is kept between moves,
+so later moves start from what earlier searches learned.
+
+    rules = KInARow(5, 4)
+    player = AlphaBetaPlayer(rules)
+    cell = player.choose(o_bits, x_bits, budget=0.008)   # O to move
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+WIN = 1_000_000  # Win scores count down by one per ply, so faster wins score higher
+SOLVED = WIN // 2  # Anything above this is a forced win or loss
+LINE_WEIGHTS = [0, 1, 8, 64, 512, 4096, 32768]  # Heuristic value of an open line holding n stones
+TABLE_LIMIT = 1 << 20  # Transposition table entries before it is cleared
+CHECK_EVERY = 15  # Nodes between clock checks, as a mask
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def farther(value: int) -> int:
+    """A parent's score bound as seen from its child, undoing the one-ply win decay"""
+    if value > SOLVED:
+        return value + 1
+    if value < -SOLVED:
+        return value - 1
+    return value
+
+
+class KInARow:
+    """Board geometry and win detection for an N x N board with k in a row to win"""
+
+    def __init__(self, size: int = 3, k: int = 3):
+        self.size = size
+        self.k = k
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+
+        # Every run of k cells in a row, column or diagonal, as a bitmask
+        self.lines = []
+        for row in range(size):
+            for col in range(size):
+                for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        mask = 0
+                        for i in range(k):
+                            mask |= 1 << ((row + d_row * i) * size + col + d_col * i)
+                        self.lines.append(mask)
+        self.lines_through = [[mask for mask in self.lines if mask >> cell & 1] for cell in range(self.cells)]
+
+        # Cells on more lines are tried first; ties go to the centre
+        centre = (size - 1) / 2
+        self.move_order = sorted(range(self.cells), key=lambda cell: (
+            -len(self.lines_through[cell]), abs(cell // size - centre) + abs(cell % size - centre)))
+
+    def wins(self, stones: int, cell: int) -> bool:
+        """Whether stones, which include cell, complete a line through cell"""
+        for mask in self.lines_through[cell]:
+            if stones & mask == mask:
+                return True
+        return False
+
+    def winning_line(self, stones: int) -> Optional[int]:
+        for mask in self.lines:
+            if stones & mask == mask:
+                return mask
+        return None
+
+
+class AlphaBetaPlayer:
+    """Negamax alpha-beta with a transposition table and iterative deepening under a time budget"""
+
+    def __init__(self, rules: KInARow):
+        self.rules = rules
+        self.table: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}  # (me, them) -> depth, value, flag, move
+        self.deadline = 0.0
+        self.nodes = 0
+        self.depth_reached = 0
+        self.value = 0
+
+    def choose(self, me: int, them: int, budget: float = 0.008) -> int:
+        """Best cell for the side owning me to play, decided within budget seconds"""
+        rules = self.rules
+        empty = rules.full & ~(me | them)
+        moves = [cell for cell in rules.move_order if empty >> cell & 1]
+        if not moves:
+            raise ValueError("the board is full")
+        if len(self.table) > TABLE_LIMIT:
+            self.table.clear()
+
+        # Take a win or block a loss without searching, so even a starved search plays sensibly
+        for stones in (me, them):
+            for cell in moves:
+                if rules.wins(stones | 1 << cell, cell):
+                    self.depth_reached, self.value = 1, WIN if stones == me else 0
+                    return cell
+
+        self.deadline = time.perf_counter() + budget
+        self.nodes = 0
+        best = moves[0]
+        for depth in range(1, len(moves) + 1):
+            try:
+                self.value = self.negamax(me, them, depth, -WIN - 1, WIN + 1)
+            except SearchTimeout:
+                break
+            best = self.table[(me, them)][3]
+            self.depth_reached = depth
+            if abs(self.value) > SOLVED:
+                break
+        return best
+
+    def evaluate(self, me: int, them: int) -> int:
+        # Open lines only: a line holding stones of both sides can never be won
+        score = 0
+        for mask in self.rules.lines:
+            mine = me & mask
+            theirs = them & mask
+            if mine and not theirs:
+                score += LINE_WEIGHTS[bin(mine).count("1")]
+            elif theirs and not mine:
+                score -= LINE_WEIGHTS[bin(theirs).count("1")]
+        return max(-SOLVED, min(SOLVED, score))
+
+    def negamax(self, me: int, them: int, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if not self.nodes & CHECK_EVERY and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+        rules = self.rules
+        empty = rules.full & ~(me | them)
+        if not empty:
+            return 0
+        if depth == 0:
+            return self.evaluate(me, them)
+
+        key = (me, them)
+        entry = self.table.get(key)
+        table_move = -1
+        if entry:
+            entry_depth, value, flag, table_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value >= beta:
+                    return value
+                if flag == UPPER and value <= alpha:
+                    return value
+
+        original_alpha = alpha
+        best_value = -WIN - 1
+        best_move = -1
+        moves = [cell for cell in rules.move_order if empty >> cell & 1]
+        if table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+        for cell in moves:
+            stones = me | 1 << cell
+            if rules.wins(stones, cell):
+                value = WIN
+            else:
+                value = -self.negamax(them, stones, depth - 1, -farther(beta), -farther(alpha))
+                # Scores are relative to this node: a win one ply further away is worth one less
+                if value > SOLVED:
+                    value -= 1
+                elif value < -SOLVED:
+                    value += 1
+            if value > best_value:
+                best_value, best_move = value, cell
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        flag = UPPER if best_value <= original_alpha else LOWER if best_value >= beta else EXACT
+        self.table[key] = (depth, best_value, flag, best_move)
+        return best_value
@@ -1,8 +1,15 @@
 import pygame
+import os
 import random
 import sys
 import time
 from typing import List, Tuple, Optional
+from wordle_engine import WordleEngine
+from k_in_a_row import KInARow, AlphaBetaPlayer
+
+# The frame scheduler is shared by every game in the collection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from frame_scheduler import FrameScheduler
 
 # Initialize Pygame
 pygame.init()
@@ -34,6 +41,46 @@ WORDLE_PUZZLE = "wordle"
 TIC_TAC_TOE_PUZZLE = "tictactoe"
 GAME_OVER = "game_over"
 VICTORY = "victory"
+IDLE_STATES = (MENU, WORDLE_PUZZLE, TIC_TAC_TOE_PUZZLE, GAME_OVER, VICTORY)  # Nothing animates; redrawn only on input
+PUZZLE_PANEL = pygame.Rect(200, 100, 800, 600)
+
+# Wordle answers; guesses can be any word in wordle_words.txt
+WORDLE_ANSWERS = [
+    "slime", "ninja", "sword", "blade", "shade", "storm", "tower", "guard", "quest", "magic",
+    "steal", "trick", "stone", "flame", "ghost", "spear", "crane", "tiger", "swift", "sneak",
+    "scout", "thief", "realm", "rogue", "forge", "spike", "torch", "vault", "crown", "jewel",
+    "knife", "armor", "arrow", "charm", "brave", "skill", "ember", "frost", "haunt", "lunar", "cloud",
+]
+
+# Tic tac toe rooms as (board size, stones in a row to win), and the computer's thinking time per move
+TIC_TAC_TOE_ROOMS = [(3, 3), (4, 4), (5, 4)]
+AI_MOVE_BUDGET = 0.010  # Seconds; well inside one frame
+
+# Platform index
+PLATFORM_CELL_SIZE = 128
+
+class PlatformIndex:
+    """Static uniform grid of platform rects, built once per level"""
+    def __init__(self, rects: List[pygame.Rect], cell_size: int = PLATFORM_CELL_SIZE):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+        self.cells = {}
+        for i, rect in enumerate(self.rects):
+            for cell in self.cells_covering(rect.left, rect.top, rect.right, rect.bottom):
+                self.cells.setdefault(cell, []).append(i)
+                
+    def cells_covering(self, left: float, top: float, right: float, bottom: float):
+        size = self.cell_size
+        for cell_x in range(int(left // size), int(right // size) + 1):
+            for cell_y in range(int(top // size), int(bottom // size) + 1):
+                yield cell_x, cell_y
+                
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[pygame.Rect]:
+        # Platforms spanning several cells are only reported once
+        found = set()
+        for cell in self.cells_covering(left, top, right, bottom):
+            found.update(self.cells.get(cell, ()))
+        return [self.rects[i] for i in sorted(found)]
 
 class NinjaSlime:
     def __init__(self, x: int, y: int):
@@ -50,48 +97,98 @@ class NinjaSlime:
         self.keys_collected = 0
         self.master_rescued = False
         
-    def update(self, platforms: List[pygame.Rect], gravity: float = 0.8):
+    def update(self, platforms: PlatformIndex, gravity: float = 0.8, dt: float = 1.0):
+        # dt is measured in frames, so 1.0 is one tick at FPS
         # Horizontal movement
         keys = pygame.key.get_pressed()
+        dx = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.x -= self.speed
+            dx -= self.speed * dt
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.x += self.speed
+            dx += self.speed * dt
             
+        # Keep slime on screen
+        dx = max(-self.x, min(SCREEN_WIDTH - self.width - self.x, dx))
+        
         # Jumping
         if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
             self.vel_y = self.jump_speed
             self.on_ground = False
             
-        # Apply gravity
-        self.vel_y += gravity
-        self.y += self.vel_y
-        
-        # Platform collision
+        # Apply gravity. The displacement is the exact sum of dt one-frame steps (each adds
+        # gravity, then moves), so a long frame follows the same jump arc as several short ones
+        dy = (self.vel_y + 0.5 * gravity * (dt + 1)) * dt
+        self.vel_y += gravity * dt
+        
+        # Platform collision: sweep x first, then y from the new x, stopping at the first platform hit.
+        # On a hit the slime is snapped flush to the platform so float error can't carry it inside
+        hit = self.sweep_x(dx, platforms)
+        if hit is None:
+            self.x += dx
+        else:
+            self.x = hit.left - self.width if dx > 0 else hit.right
+            
+        hit = self.sweep_y(dy, platforms)
         self.on_ground = False
-        slime_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        
-        for platform in platforms:
-            if slime_rect.colliderect(platform):
-                if self.vel_y > 0:  # Falling
-                    self.y = platform.top - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
-                elif self.vel_y < 0:  # Jumping
-                    self.y = platform.bottom
-                    self.vel_y = 0
-                    
-        # Keep slime on screen
-        if self.x < 0:
-            self.x = 0
-        elif self.x > SCREEN_WIDTH - self.width:
-            self.x = SCREEN_WIDTH - self.width
+        if hit is None:
+            self.y += dy
+        elif dy > 0:  # Landed
+            self.y = hit.top - self.height
+            self.vel_y = 0
+            self.on_ground = True
+        else:  # Bumped head
+            self.y = hit.bottom
+            self.vel_y = 0
             
         if self.y > SCREEN_HEIGHT - self.height:
             self.y = SCREEN_HEIGHT - self.height
             self.vel_y = 0
             self.on_ground = True
             
+    def sweep_x(self, dx: float, platforms: PlatformIndex) -> Optional[pygame.Rect]:
+        # The first platform the slime's leading side meets while moving dx, if any
+        if dx == 0:
+            return None
+        top = self.y
+        bottom = self.y + self.height
+        front = self.x + self.width if dx > 0 else self.x
+        toi = 1.0
+        hit = None
+        for rect in platforms.query(min(front, front + dx), top, max(front, front + dx), bottom):
+            if rect.top >= bottom or rect.bottom <= top:
+                continue
+            if dx > 0 and rect.left >= front:
+                impact = (rect.left - front) / dx
+            elif dx < 0 and rect.right <= front:
+                impact = (rect.right - front) / dx
+            else:
+                continue
+            if impact <= toi and (hit is None or impact < toi):
+                toi, hit = impact, rect
+        return hit
+        
+    def sweep_y(self, dy: float, platforms: PlatformIndex) -> Optional[pygame.Rect]:
+        # The first platform the slime's feet or head meets while moving dy, if any
+        if dy == 0:
+            return None
+        left = self.x
+        right = self.x + self.width
+        front = self.y + self.height if dy > 0 else self.y
+        toi = 1.0
+        hit = None
+        for rect in platforms.query(left, min(front, front + dy), right, max(front, front + dy)):
+            if rect.left >= right or rect.right <= left:
+                continue
+            if dy > 0 and rect.top >= front:
+                impact = (rect.top - front) / dy
+            elif dy < 0 and rect.bottom <= front:
+                impact = (rect.bottom - front) / dy
+            else:
+                continue
+            if impact <= toi and (hit is None or impact < toi):
+                toi, hit = impact, rect
+        return hit
+        
     def draw(self, screen):
         # Draw slime body (green blob)
         pygame.draw.ellipse(screen, LIGHT_GREEN, (self.x, self.y, self.width, self.height))
@@ -165,14 +262,20 @@ class Master:
             pygame.draw.circle(screen, BLACK, (self.x + 35, self.y + 15), 1)
 
 class WordlePuzzle:
-    def __init__(self):
-        self.words = ["SLIME", "NINJA", "MASTER", "DUNGEON", "RESCUE", "PUZZLE", "GAME", "ADVENTURE"]
-        self.target_word = random.choice(self.words)
+    def __init__(self, engine: WordleEngine):
+        self.engine = engine
+        self.target_word = random.choice(engine.answers).upper()
         self.guesses = []
         self.max_guesses = 6
         self.current_guess = ""
         self.game_won = False
         self.game_over = False
+        self.message = ""
+        
+        # Answers still consistent with every guess so far, and the best next guess for them
+        self.candidates = engine.all_answers()
+        self.hint, _ = engine.hint(self.candidates)
+        self.show_hint = False
         
     def add_letter(self, letter: str):
         if len(self.current_guess) < len(self.target_word) and not self.game_over:
@@ -184,7 +287,14 @@ class WordlePuzzle:
             
     def submit_guess(self):
         if len(self.current_guess) == len(self.target_word) and not self.game_over:
+            if not self.engine.is_word(self.current_guess):
+                self.message = f"{self.current_guess} is not in the word list"
+                return
+            self.message = ""
             self.guesses.append(self.current_guess)
+            pattern = self.engine.feedback(self.current_guess, self.target_word)
+            self.candidates = self.engine.filter(self.candidates, self.current_guess, pattern)
+            self.hint, _ = self.engine.hint(self.candidates)
             if self.current_guess == self.target_word:
                 self.game_won = True
                 self.game_over = True
@@ -192,26 +302,12 @@ class WordlePuzzle:
                 self.game_over = True
             self.current_guess = ""
             
+    def toggle_hint(self):
+        self.show_hint = not self.show_hint
+        
     def get_feedback(self, guess: str) -> List[str]:
-        feedback = []
-        target_letters = list(self.target_word)
-        guess_letters = list(guess)
-        
-        # Check for correct letters in correct positions
-        for i in range(len(guess_letters)):
-            if i < len(target_letters) and guess_letters[i] == target_letters[i]:
-                feedback.append("green")
-                target_letters[i] = None
-            else:
-                feedback.append("gray")
-                
-        # Check for correct letters in wrong positions
-        for i in range(len(guess_letters)):
-            if feedback[i] == "gray" and guess_letters[i] in target_letters:
-                feedback[i] = "yellow"
-                target_letters[target_letters.index(guess_letters[i])] = None
-                
-        return feedback
+        # A lookup in the engine's precomputed feedback matrix
+        return self.engine.colors(self.engine.feedback(guess, self.target_word))
         
     def draw(self, screen):
         # Draw background
@@ -272,12 +368,22 @@ class WordlePuzzle:
             "Type letters to guess the word",
             "Press ENTER to submit",
             "Press BACKSPACE to delete",
+            "Press TAB for a hint",
             "Press ESC to exit puzzle"
         ]
         
         for i, instruction in enumerate(instructions):
             text = font_small.render(instruction, True, WHITE)
-            screen.blit(text, (250, 500 + i * 30))
+            screen.blit(text, (650, 220 + i * 30))
+            
+        # Draw hint and messages
+        if self.show_hint and not self.game_over and self.hint:
+            words_left = len(self.candidates)
+            hint_text = font_small.render(f"Hint: try {self.hint.upper()} ({words_left} possible word{'s' if words_left != 1 else ''})", True, YELLOW)
+            screen.blit(hint_text, (650, 400))
+        if self.message:
+            message_text = font_small.render(self.message, True, RED)
+            screen.blit(message_text, (650, 430))
             
         # Draw game over message
         if self.game_over:
@@ -289,16 +395,27 @@ class WordlePuzzle:
             screen.blit(message, (350, 650))
 
 class TicTacToePuzzle:
-    def __init__(self):
-        self.board = [["" for _ in range(3)] for _ in range(3)]
+    def __init__(self, size: int = 3, k: int = 3):
+        self.size = size
+        self.k = k
+        self.rules = KInARow(size, k)
+        self.ai = AlphaBetaPlayer(self.rules)
+        self.board = [["" for _ in range(size)] for _ in range(size)]
+        self.stones = {"X": 0, "O": 0}  # Bitboards, one bit per cell
         self.current_player = "X"
         self.game_won = False
         self.game_over = False
         self.winner = None
         
+        # The board always fills the same 300px square
+        self.board_x = 400
+        self.board_y = 200
+        self.cell_size = 300 // size
+        
     def make_move(self, row: int, col: int):
         if self.board[row][col] == "" and not self.game_over:
             self.board[row][col] = self.current_player
+            self.stones[self.current_player] |= 1 << (row * self.size + col)
             
             # Check for win
             if self.check_winner(row, col):
@@ -312,26 +429,22 @@ class TicTacToePuzzle:
                 
     def check_winner(self, row: int, col: int) -> bool:
         player = self.board[row][col]
-        
-        # Check row
-        if all(self.board[row][i] == player for i in range(3)):
-            return True
-            
-        # Check column
-        if all(self.board[i][col] == player for i in range(3)):
-            return True
-            
-        # Check diagonals
-        if row == col and all(self.board[i][i] == player for i in range(3)):
-            return True
-            
-        if row + col == 2 and all(self.board[i][2-i] == player for i in range(3)):
-            return True
-            
-        return False
+        return self.rules.wins(self.stones[player], row * self.size + col)
         
     def is_board_full(self) -> bool:
-        return all(self.board[i][j] != "" for i in range(3) for j in range(3))
+        return self.stones["X"] | self.stones["O"] == self.rules.full
+        
+    def computer_move(self) -> Tuple[int, int]:
+        # Iterative deepening stops when the budget runs out, so this never holds up a frame
+        cell = self.ai.choose(self.stones["O"], self.stones["X"], AI_MOVE_BUDGET)
+        return divmod(cell, self.size)
+        
+    def cell_at(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        col = (pos[0] - self.board_x) // self.cell_size
+        row = (pos[1] - self.board_y) // self.cell_size
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row, col
+        return None
         
     def draw(self, screen):
         # Draw background
@@ -340,16 +453,19 @@ class TicTacToePuzzle:
         
         # Draw title
         font_large = pygame.font.Font(None, 48)
-        title = font_large.render("TIC TAC TOE PUZZLE", True, WHITE)
+        if (self.size, self.k) == (3, 3):
+            title = font_large.render("TIC TAC TOE PUZZLE", True, WHITE)
+        else:
+            title = font_large.render(f"{self.size}x{self.size} PUZZLE: {self.k} IN A ROW", True, WHITE)
         screen.blit(title, (400, 120))
         
         # Draw board
-        board_x = 400
-        board_y = 200
-        cell_size = 100
+        board_x = self.board_x
+        board_y = self.board_y
+        cell_size = self.cell_size
         
-        for i in range(3):
-            for j in range(3):
+        for i in range(self.size):
+            for j in range(self.size):
                 x = board_x + j * cell_size
                 y = board_y + i * cell_size
                 
@@ -359,7 +475,7 @@ class TicTacToePuzzle:
                 
                 # Draw X or O
                 if self.board[i][j]:
-                    font_large = pygame.font.Font(None, 72)
+                    font_large = pygame.font.Font(None, 72 * 3 // self.size)
                     color = BLUE if self.board[i][j] == "X" else RED
                     text = font_large.render(self.board[i][j], True, color)
                     text_rect = text.get_rect(center=(x + cell_size//2, y + cell_size//2))
@@ -375,7 +491,7 @@ class TicTacToePuzzle:
         instructions = [
             "Click on a cell to make a move",
             "You are X, computer is O",
-            "Get 3 in a row to win!",
+            f"Get {self.k} in a row to win!",
             "Press ESC to exit puzzle"
         ]
         
@@ -400,6 +516,7 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Ninja Slime Adventure")
         self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler(self.clock, FPS)
         self.font = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 72)
         
@@ -416,6 +533,7 @@ class Game:
             Platform(450, 200, 200, 20),
             Platform(750, 150, 200, 20),
         ]
+        self.platform_index = PlatformIndex([p.rect for p in self.platforms])
         
         # Create keys
         self.keys = [
@@ -429,18 +547,24 @@ class Game:
         # Create master
         self.master = Master(800, 120)
         
-        # Create puzzles
-        self.wordle_puzzle = WordlePuzzle()
+        # Create puzzles; the Wordle engine's feedback matrix is cached on disk after the first run
+        self.wordle_engine = WordleEngine.load(answers=WORDLE_ANSWERS)
+        self.wordle_puzzle = WordlePuzzle(self.wordle_engine)
         self.tictactoe_puzzle = TicTacToePuzzle()
         
         # Puzzle triggers
         self.puzzle_triggers = [
             pygame.Rect(400, 580, 100, 20),  # Wordle trigger
             pygame.Rect(700, 480, 100, 20),  # Tic Tac Toe trigger
+            pygame.Rect(1000, 380, 100, 20),  # 4x4 room trigger
+            pygame.Rect(250, 280, 100, 20),  # 5x5 room trigger
         ]
+        self.solved_triggers = set()  # Puzzles already won, which never open again
+        self.occupied_triggers = set()  # Triggers the slime stood on last frame; it must step off before they fire again
+        self.active_trigger = None  # The trigger whose puzzle is open
         
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.scheduler.events(self.game_state in IDLE_STATES, self.game_state):
             if event.type == pygame.QUIT:
                 return False
                 
@@ -452,50 +576,50 @@ class Game:
                         return False
                         
                 if self.game_state == WORDLE_PUZZLE:
+                    # Typing only changes the row being guessed; anything else can change the whole panel
+                    guess_row = pygame.Rect(350, 220 + 60 * len(self.wordle_puzzle.guesses), 250, 40)
                     if event.key == pygame.K_RETURN:
                         self.wordle_puzzle.submit_guess()
                         if self.wordle_puzzle.game_won:
                             self.slime.keys_collected += 1
+                            self.solved_triggers.add(self.active_trigger)
                             self.game_state = PLAYING
+                        self.scheduler.invalidate(PUZZLE_PANEL)
                     elif event.key == pygame.K_BACKSPACE:
                         self.wordle_puzzle.remove_letter()
+                        self.scheduler.invalidate(guess_row)
+                    elif event.key == pygame.K_TAB:
+                        self.wordle_puzzle.toggle_hint()
+                        self.scheduler.invalidate(PUZZLE_PANEL)
                     elif event.unicode.isalpha():
                         self.wordle_puzzle.add_letter(event.unicode)
+                        self.scheduler.invalidate(guess_row)
                         
                 elif self.game_state == TIC_TAC_TOE_PUZZLE:
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = PLAYING
                         
             if event.type == pygame.MOUSEBUTTONDOWN and self.game_state == TIC_TAC_TOE_PUZZLE:
-                mouse_pos = pygame.mouse.get_pos()
-                board_x = 400
-                board_y = 200
-                cell_size = 100
-                
-                for i in range(3):
-                    for j in range(3):
-                        x = board_x + j * cell_size
-                        y = board_y + i * cell_size
-                        if x <= mouse_pos[0] <= x + cell_size and y <= mouse_pos[1] <= y + cell_size:
-                            if self.tictactoe_puzzle.board[i][j] == "":
-                                self.tictactoe_puzzle.make_move(i, j)
-                                if not self.tictactoe_puzzle.game_over:
-                                    # Computer move
-                                    self.make_computer_move()
+                cell = self.tictactoe_puzzle.cell_at(pygame.mouse.get_pos())
+                if cell and self.tictactoe_puzzle.board[cell[0]][cell[1]] == "":
+                    self.tictactoe_puzzle.make_move(*cell)
+                    if not self.tictactoe_puzzle.game_over:
+                        # Computer move
+                        self.make_computer_move()
+                    self.scheduler.invalidate(PUZZLE_PANEL)
+                    if self.tictactoe_puzzle.winner == "X":
+                        self.slime.keys_collected += 1
+                        self.solved_triggers.add(self.active_trigger)
+                        self.game_state = PLAYING
                                     
         return True
         
     def make_computer_move(self):
-        # Simple AI: find first empty cell
-        for i in range(3):
-            for j in range(3):
-                if self.tictactoe_puzzle.board[i][j] == "":
-                    self.tictactoe_puzzle.make_move(i, j)
-                    return
+        self.tictactoe_puzzle.make_move(*self.tictactoe_puzzle.computer_move())
                     
     def update(self):
         if self.game_state == PLAYING:
-            self.slime.update([p.rect for p in self.platforms])
+            self.slime.update(self.platform_index)
             
             # Check key collection
             slime_rect = pygame.Rect(self.slime.x, self.slime.y, self.slime.width, self.slime.height)
@@ -506,15 +630,18 @@ class Game:
                         key.collected = True
                         self.slime.keys_collected += 1
                         
-            # Check puzzle triggers
-            for i, trigger in enumerate(self.puzzle_triggers):
-                if slime_rect.colliderect(trigger):
-                    if i == 0:  # Wordle
-                        self.game_state = WORDLE_PUZZLE
-                        self.wordle_puzzle = WordlePuzzle()  # Reset puzzle
-                    elif i == 1:  # Tic Tac Toe
-                        self.game_state = TIC_TAC_TOE_PUZZLE
-                        self.tictactoe_puzzle = TicTacToePuzzle()  # Reset puzzle
+            # Check puzzle triggers; a trigger fires as the slime steps onto it, not while it stands there
+            occupied = {i for i, trigger in enumerate(self.puzzle_triggers) if slime_rect.colliderect(trigger)}
+            entered = occupied - self.occupied_triggers - self.solved_triggers
+            self.occupied_triggers = occupied
+            if entered:
+                i = self.active_trigger = min(entered)
+                if i == 0:  # Wordle
+                    self.game_state = WORDLE_PUZZLE
+                    self.wordle_puzzle = WordlePuzzle(self.wordle_engine)  # Reset puzzle
+                else:  # Tic tac toe rooms
+                    self.game_state = TIC_TAC_TOE_PUZZLE
+                    self.tictactoe_puzzle = TicTacToePuzzle(*TIC_TAC_TOE_ROOMS[i - 1])  # Reset puzzle
                         
             # Check master rescue
             master_rect = pygame.Rect(self.master.x, self.master.y, self.master.width, self.master.height)
@@ -524,6 +651,8 @@ class Game:
                 self.game_state = VICTORY
                 
     def draw(self):
+        if not self.scheduler.begin_frame(self.screen):
+            return
         self.screen.fill(BLACK)
         
         if self.game_state == MENU:
@@ -537,7 +666,7 @@ class Game:
         elif self.game_state == VICTORY:
             self.draw_victory()
             
-        pygame.display.flip()
+        self.scheduler.present(self.screen)
         
     def draw_menu(self):
         # Draw title
@@ -637,7 +766,7 @@ class Game:
             running = self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self.scheduler.tick()
             
         pygame.quit()
         sys.exit()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the bitboard k-in-a-row rules and the alpha-beta player
+"""
+
+import itertools
+import random
+import time
+
+import pytest
+
+from k_in_a_row import AlphaBetaPlayer, KInARow
+
+SOLVE_BUDGET = 5.0  # Enough for a full 3x3 search; the search stops as soon as the game is solved
+
+
+def brute_force_wins(rules, stones):
+    """Whether stones hold k in a row anywhere, by walking the board"""
+    size, k = rules.size, rules.k
+    for row, col in itertools.product(range(size), repeat=2):
+        for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            cells = [(row + d_row * i, col + d_col * i) for i in range(k)]
+            if all(0 <= r < size and 0 <= c < size and stones >> (r * size + c) & 1 for r, c in cells):
+                return True
+    return False
+
+
+@pytest.mark.parametrize("size, k, lines", [(3, 3, 8), (4, 4, 10), (5, 4, 28)])
+def test_winning_lines(size, k, lines):
+    rules = KInARow(size, k)
+    assert len(rules.lines) == lines
+    assert rules.full == (1 << size * size) - 1
+    rng = random.Random(size * 10 + k)
+    for _ in range(2000):
+        stones = rng.getrandbits(rules.cells) & rng.getrandbits(rules.cells)
+        cell = rng.randrange(rules.cells)
+        stones |= 1 << cell
+        expected = brute_force_wins(rules, stones)
+        assert (rules.winning_line(stones) is not None) == expected
+        # A win through the last move is a win on the board, and every win has a line
+        if rules.wins(stones, cell):
+            assert expected
+
+
+def play_out(rules, player, computer_first):
+    """Every game against a player who tries every possible move; returns the winners seen"""
+    results = set()
+
+    def step(x, o, computer_to_move):
+        if computer_to_move:
+            cell = player.choose(o, x, SOLVE_BUDGET)
+            assert not (x | o) >> cell & 1
+            o |= 1 << cell
+            if rules.wins(o, cell):
+                results.add("O")
+            elif x | o == rules.full:
+                results.add("tie")
+            else:
+                step(x, o, False)
+            return
+        for cell in range(rules.cells):
+            if (x | o) >> cell & 1:
+                continue
+            stones = x | 1 << cell
+            if rules.wins(stones, cell):
+                results.add("X")
+            elif stones | o == rules.full:
+                results.add("tie")
+            else:
+                step(stones, o, True)
+
+    step(0, 0, computer_first)
+    return results
+
+
+@pytest.mark.parametrize("computer_first", [False, True])
+def test_3x3_never_loses(computer_first):
+    rules = KInARow(3, 3)
+    results = play_out(rules, AlphaBetaPlayer(rules), computer_first)
+    assert "X" not in results
+    assert "tie" in results
+
+
+def test_takes_a_win_before_blocking():
+    rules = KInARow(3, 3)
+    player = AlphaBetaPlayer(rules)
+    me = 1 << 0 | 1 << 1  # Top row, one short
+    them = 1 << 3 | 1 << 4  # Middle row, one short
+    assert player.choose(me, them) == 2
+    assert player.choose(1 << 8, them) == 5  # No win, so block
+
+
+def test_full_board_is_an_error():
+    rules = KInARow(3, 3)
+    with pytest.raises(ValueError):
+        AlphaBetaPlayer(rules).choose(0b101011100, 0b010100011)
+
+
+@pytest.mark.parametrize("size, k", [(4, 4), (5, 4)])
+def test_moves_stay_within_budget(size, k):
+    rules = KInARow(size, k)
+    player = AlphaBetaPlayer(rules)
+    rng = random.Random(size)
+    budget = 0.02
+    slowest = 0.0
+    for _ in range(5):
+        x = o = 0
+        while x | o != rules.full:
+            empty = [cell for cell in range(rules.cells) if not (x | o) >> cell & 1]
+            cell = rng.choice(empty)
+            x |= 1 << cell
+            if rules.wins(x, cell) or x | o == rules.full:
+                break
+            start = time.perf_counter()
+            cell = player.choose(o, x, budget)
+            slowest = max(slowest, time.perf_counter() - start)
+            assert not (x | o) >> cell & 1
+            o |= 1 << cell
+            if rules.wins(o, cell):
+                break
+    # The clock is checked every few nodes, so a move overruns its budget by at most a node or two
+    assert slowest < budget + 0.05
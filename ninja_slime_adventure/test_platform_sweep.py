@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the slime's swept platform collision against a stepped reference
+"""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from ninja_slime_adventure import SCREEN_HEIGHT, SCREEN_WIDTH, NinjaSlime, PlatformIndex
+
+STEPS = 400  # Sub-steps per move in the reference
+
+
+def overlapping(rects, left, top, width, height):
+    """Rects whose inside overlaps the box; touching edges don't count"""
+    return [rect for rect in rects
+            if rect.left < left + width and left < rect.right and rect.top < top + height and top < rect.bottom]
+
+
+def stepped_contact(rects, slime, dx, dy):
+    """Move the slime's box in STEPS small steps; returns (step, rects it first overlaps), or (None, [])"""
+    rects = overlapping(rects, min(slime.x, slime.x + dx), min(slime.y, slime.y + dy),
+                        slime.width + abs(dx), slime.height + abs(dy))
+    for step in range(1, STEPS + 1):
+        t = step / STEPS
+        hits = overlapping(rects, slime.x + dx * t, slime.y + dy * t, slime.width, slime.height)
+        if hits:
+            return step, hits
+    return None, []
+
+
+def random_level(rng):
+    rects = [pygame.Rect(rng.randrange(0, SCREEN_WIDTH), rng.randrange(0, SCREEN_HEIGHT),
+                         rng.randrange(10, 300), rng.randrange(10, 60)) for _ in range(40)]
+    return rects, PlatformIndex(rects, cell_size=rng.choice((32, 128, 500)))
+
+
+def free_slime(rng, rects):
+    while True:
+        slime = NinjaSlime(rng.uniform(0, SCREEN_WIDTH - 40), rng.uniform(0, SCREEN_HEIGHT - 40))
+        if not overlapping(rects, slime.x, slime.y, slime.width, slime.height):
+            return slime
+
+
+def check_sweep(slime, rects, hit, dx, dy):
+    """The sweep's hit must be a platform the stepped reference reaches, at the step it reaches it"""
+    step, hits = stepped_contact(rects, slime, dx, dy)
+    if hit is None:
+        assert step is None
+        return
+    if dx:
+        resolved = hit.left - slime.width if dx > 0 else hit.right
+        toi = (resolved - slime.x) / dx
+    else:
+        resolved = hit.top - slime.height if dy > 0 else hit.bottom
+        toi = (resolved - slime.y) / dy
+    if step is None:
+        # Ending flush against a platform is reported as a hit with nothing left to move
+        assert toi == pytest.approx(1.0)
+        return
+    assert hit in hits
+    assert (step - 1) / STEPS - 1e-9 <= toi <= step / STEPS + 1e-9
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_x_matches_stepped_reference(seed):
+    rng = random.Random(seed)
+    rects, platforms = random_level(rng)
+    hits = 0
+    for _ in range(500):
+        slime = free_slime(rng, rects)
+        dx = rng.choice((-1, 1)) * rng.uniform(0, 120)
+        hit = slime.sweep_x(dx, platforms)
+        hits += hit is not None
+        check_sweep(slime, rects, hit, dx, 0)
+    assert hits > 20
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_y_matches_stepped_reference(seed):
+    rng = random.Random(100 + seed)
+    rects, platforms = random_level(rng)
+    hits = 0
+    for _ in range(500):
+        slime = free_slime(rng, rects)
+        dy = rng.choice((-1, 1)) * rng.uniform(0, 120)
+        hit = slime.sweep_y(dy, platforms)
+        hits += hit is not None
+        check_sweep(slime, rects, hit, 0, dy)
+    assert hits > 20
+
+
+def test_no_move_never_hits():
+    rects = [pygame.Rect(100, 100, 50, 50)]
+    slime = NinjaSlime(60, 100)  # Flush against the platform's left side
+    platforms = PlatformIndex(rects)
+    assert slime.sweep_x(0, platforms) is None
+    assert slime.sweep_y(0, platforms) is None
+    assert slime.sweep_x(1, platforms) == rects[0]
+    assert slime.sweep_x(-1, platforms) is None
+
+
+class Keys:
+    def __init__(self, pressed):
+        self.pressed = pressed
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+@pytest.mark.parametrize("dt", [1.0, 2.5, 4.0])
+def test_update_never_ends_inside_a_platform(monkeypatch, dt):
+    rng = random.Random(int(dt * 10))
+    rects, platforms = random_level(rng)
+    choices = [set(), {pygame.K_LEFT}, {pygame.K_RIGHT}, {pygame.K_SPACE}, {pygame.K_RIGHT, pygame.K_SPACE},
+               {pygame.K_LEFT, pygame.K_SPACE}]
+    for _ in range(20):
+        slime = free_slime(rng, rects)
+        for _ in range(200):
+            keys = Keys(rng.choice(choices))
+            monkeypatch.setattr(pygame.key, "get_pressed", lambda: keys)
+            slime.update(platforms, dt=dt)
+            assert not overlapping(rects, slime.x, slime.y, slime.width, slime.height)
+            assert 0 <= slime.x <= SCREEN_WIDTH - slime.width
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the Wordle engine's feedback matrix and entropy hints
+"""
+
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from wordle_engine import ALL_GREEN, DICTIONARY_PATH, WordleEngine, word_code
+
+# Repeated letters are where feedback gets subtle
+TRICKY_WORDS = ["slime", "ninja", "speed", "erase", "geese", "eerie", "abbey", "babes", "llama",
+                "allay", "mamma", "sassy", "steel", "sleet", "leets", "tenet", "eaten", "crane"]
+
+
+def reference_feedback(guess, answer):
+    """Plain two-pass Wordle scoring: greens first, then yellows left to right from the leftover letters"""
+    pattern = [0] * len(guess)
+    leftover = Counter(a for g, a in zip(guess, answer) if g != a)
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            pattern[i] = 2
+        elif leftover[g]:
+            pattern[i] = 1
+            leftover[g] -= 1
+    return sum(color * 3 ** i for i, color in enumerate(pattern))
+
+
+def reference_entropy(engine, candidates, guess):
+    counts = Counter(reference_feedback(guess, engine.answers[i]) for i in candidates)
+    total = len(candidates)
+    return -sum(c / total * math.log2(c / total) for c in counts.values())
+
+
+@pytest.fixture(scope="module")
+def words():
+    with open(DICTIONARY_PATH, encoding="utf-8") as dictionary:
+        words = [line.strip().lower() for line in dictionary if word_code(line.strip()) is not None]
+    return sorted(set(random.Random(3).sample(words, min(300, len(words)))) | set(TRICKY_WORDS))
+
+
+@pytest.fixture(scope="module")
+def engine(words):
+    # Answers are a subset of the allowed guesses, as in the game
+    return WordleEngine(words, answers=words[::2] + TRICKY_WORDS, cache_dir=None)
+
+
+def test_matrix_matches_reference_scorer(engine):
+    for row, answer in enumerate(engine.answers):
+        expected = [reference_feedback(guess, answer) for guess in engine.words]
+        assert engine.matrix[row].tolist() == expected, answer
+
+
+def test_feedback_and_colors(engine):
+    assert engine.feedback("slime", "slime") == ALL_GREEN
+    assert engine.colors(engine.feedback("speed", "erase")) == ["yellow", "gray", "yellow", "yellow", "gray"]
+    assert engine.colors(engine.feedback("llama", "allay")) == ["yellow", "green", "yellow", "gray", "yellow"]
+
+
+def test_is_word(engine):
+    assert engine.is_word("slime")
+    assert engine.is_word("SLIME")
+    assert not engine.is_word("zzzzz")
+    assert not engine.is_word("slim")
+    assert not engine.is_word("slim3")
+
+
+def test_filter_keeps_exactly_the_consistent_answers(engine):
+    for answer in ("slime", "geese", "mamma"):
+        candidates = engine.all_answers()
+        for guess in ("crane", "speed", "llama"):
+            pattern = engine.feedback(guess, answer)
+            expected = [i for i in candidates if reference_feedback(guess, engine.answers[i]) == pattern]
+            candidates = engine.filter(candidates, guess, pattern)
+            assert candidates.tolist() == expected
+            assert engine.answer_index(answer) in candidates
+
+
+@pytest.mark.parametrize("size", [3, 40, 150])  # Below and above the incremental histogram cutoff
+def test_entropies_match_reference(engine, size):
+    candidates = np.array(sorted(random.Random(size).sample(range(len(engine.answers)), size)))
+    entropies = engine.entropies(candidates)
+    for guess in random.Random(size + 1).sample(engine.words, 25):
+        assert entropies[engine.column(guess)] == pytest.approx(reference_entropy(engine, candidates, guess), abs=1e-9)
+
+
+def test_opening_entropies_match_reference(engine):
+    opening = engine.entropies(engine.all_answers())
+    for guess in TRICKY_WORDS:
+        assert opening[engine.column(guess)] == pytest.approx(
+            reference_entropy(engine, engine.all_answers(), guess), abs=1e-9)
+
+
+def test_hints_solve_every_answer(engine):
+    assert engine.hint(engine.all_answers()[:0]) == (None, 0.0)
+    for answer in TRICKY_WORDS:
+        candidates = engine.all_answers()
+        guess, _ = engine.hint(candidates)
+        for _ in range(10):
+            pattern = engine.feedback(guess, answer)
+            if pattern == ALL_GREEN:
+                break
+            candidates = engine.filter(candidates, guess, pattern)
+            guess, _ = engine.hint(candidates)
+        assert guess == answer
+
+
+def test_matrix_cache_round_trip(words, tmp_path):
+    built = WordleEngine(words[:60], cache_dir=str(tmp_path))
+    loaded = WordleEngine(words[:60], cache_dir=str(tmp_path))
+    assert isinstance(loaded.matrix, np.memmap)
+    assert np.array_equal(built.matrix, loaded.matrix)
+    assert np.array_equal(built.opening, loaded.opening)
+    assert not list(tmp_path.glob("*.tmp*"))
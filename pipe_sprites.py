@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Shared Pipe Sprites
+Baked pipe bodies and gap-end caps for the Flappy games, composed into a pipe pair of any gap height.
+
+Each game passes in its own style table and the painters it names, and the cache bakes
+a body column and both caps per (theme, body color) the first time they are drawn.
+After that a pipe pair is four blits however busy its pattern is.
+
+    pipes = PipeSpriteCache(PIPE_STYLES, patterns={'windows': paint_windows},
+                            caps={'snow_cap': paint_snow_cap}, width=PIPE_WIDTH, height=SCREEN_HEIGHT)
+    pipes.get(theme, variant).draw(screen, x, top_height, bottom_y)
+
+A style is a dict with 'colors' (one is picked per pipe), 'border', and optionally a
+repeating body 'pattern', a ('top', 'bottom') pair of 'caps' and a plain 'band' kept
+free of pattern at the gap end. Pattern painters are called as paint(body, height) on a
+full-height column starting at x = 0; cap painters as paint(cap, x, end) around the
+gap end of a top pipe, which bottom pipes use flipped.
+"""
+
+import pygame
+
+# Caps reach CAP_MARGIN px past the pipe sides, CAP_DEPTH px into the pipe and
+# CAP_OVERHANG px into the gap
+CAP_MARGIN = 10
+CAP_DEPTH = 100
+CAP_OVERHANG = 15
+
+
+class PipeSprites:
+    """Baked pieces of one pipe style, composed into a pipe pair of any gap height"""
+
+    def __init__(self, body, top_cap, bottom_cap):
+        self.body = body  # Full-height column, pattern anchored at the screen top
+        self.flipped_body = pygame.transform.flip(body, False, True)  # Anchored at the screen bottom
+        self.top_cap = top_cap
+        self.bottom_cap = bottom_cap
+
+    def draw(self, screen, x, top_height, bottom_y):
+        width, height = self.body.get_size()
+        bottom_height = height - bottom_y
+        screen.blit(self.body, (x, 0), (0, 0, width, top_height))
+        screen.blit(self.flipped_body, (x, bottom_y),
+                    (0, height - bottom_height, width, bottom_height))
+        screen.blit(self.top_cap, (x - CAP_MARGIN, top_height - CAP_DEPTH))
+        screen.blit(self.bottom_cap, (x - CAP_MARGIN, bottom_y - CAP_OVERHANG))
+
+
+class PipeSpriteCache:
+    """Pipe sprites per theme and body color, baked the first time they are drawn"""
+
+    def __init__(self, styles, patterns, caps, width, height):
+        self.styles = styles
+        self.patterns = patterns
+        self.caps = caps
+        self.width = width
+        self.height = height
+        self.sprites = {}
+
+    def get(self, theme, variant):
+        style = self.styles[theme]
+        color = style['colors'][variant % len(style['colors'])]
+        sprites = self.sprites.get((theme, color))
+        if sprites is None:
+            sprites = self.bake(style, color)
+            self.sprites[(theme, color)] = sprites
+        return sprites
+
+    def bake(self, style, color):
+        border = style['border']
+        body = pygame.Surface((self.width, self.height))
+        body.fill(color)
+        pygame.draw.rect(body, border, (0, 0, self.width, self.height + 3), 3)
+        if 'pattern' in style:
+            self.patterns[style['pattern']](body, self.height)
+
+        top_cap, bottom_cap = style.get('caps', (None, None))
+        return PipeSprites(body.convert(),
+                           self.bake_cap(style, color, top_cap),
+                           pygame.transform.flip(self.bake_cap(style, color, bottom_cap), False, True))
+
+    def bake_cap(self, style, color, name):
+        """Paint the gap end of a top pipe; bottom pipes use it flipped"""
+        border = style['border']
+        width = self.width
+        cap = pygame.Surface((width + 2 * CAP_MARGIN, CAP_DEPTH + CAP_OVERHANG), pygame.SRCALPHA)
+        band = style.get('band', 0)
+        if band:
+            pygame.draw.rect(cap, color, (CAP_MARGIN, CAP_DEPTH - band, width, band))
+            pygame.draw.rect(cap, border, (CAP_MARGIN, CAP_DEPTH - band, 3, band))
+            pygame.draw.rect(cap, border, (CAP_MARGIN + width - 3, CAP_DEPTH - band, 3, band))
+        pygame.draw.rect(cap, border, (CAP_MARGIN, CAP_DEPTH - 3, width, 3))
+        if name:
+            self.caps[name](cap, CAP_MARGIN, CAP_DEPTH)
+        return cap.convert_alpha()
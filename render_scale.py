@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared Render Scale
+Draws a game's world into an internal surface below window resolution and upscales it in one blit.
+
+Fill-rate-heavy layers cost in proportion to their pixel count, so at a render scale
+of 0.5 the world touches a quarter of the pixels it would at full size. The upscale is
+a single transform.scale into the window, and anything drawn on the window afterwards
+(HUD text, menus) stays sharp. The window keeps the game's logical size, so mouse
+positions and every HUD coordinate stay in window pixels.
+
+    display = ScaledDisplay((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale())
+    ...draw the world on display.surface, in internal pixels (display.scale per window pixel)...
+    display.present()  # Upscale onto display.window, then draw the HUD there and flip
+
+    RENDER_SCALE=0.5 python run_game.py  # Every game using this module honours the variable
+"""
+
+import os
+import pygame
+
+MIN_SCALE = 0.25
+SCALE_VARIABLE = "RENDER_SCALE"  # Environment variable cabinets set once for every game
+
+
+def render_scale(default=1.0):
+    """The render scale set in $RENDER_SCALE, or default"""
+    try:
+        return float(os.environ.get(SCALE_VARIABLE, default))
+    except ValueError:
+        return default
+
+
+class ScaledDisplay:
+    """The game window plus the surface its world is drawn on.
+
+    At scale 1 the surface is the window itself and present() does nothing, so a
+    game pays nothing for the option when it is off.
+    """
+
+    def __init__(self, size, scale=1.0, smooth=False):
+        self.window = pygame.display.set_mode(size)
+        self.size = size
+        self.scale = max(MIN_SCALE, min(1.0, scale))
+        self.smooth = smooth  # Bilinear upscaling; softer edges for a little more work per frame
+        if self.scale == 1.0:
+            self.surface = self.window
+        else:
+            internal = (round(size[0] * self.scale), round(size[1] * self.scale))
+            self.surface = pygame.Surface(internal).convert()
+
+    def present(self):
+        """Upscale the internal surface onto the window"""
+        if self.surface is not self.window:
+            if self.smooth:
+                pygame.transform.smoothscale(self.surface, self.size, self.window)
+            else:
+                pygame.transform.scale(self.surface, self.size, self.window)
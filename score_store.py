@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Shared Score Store
+SQLite leaderboards for every game in the collection, written behind the game loop.
+
+Each game keeps a top-N table per level in one scores.db (WAL mode, so games running
+side by side can read while another writes). Reads come from an in-memory cache
+loaded when the store opens; submit() only updates that cache and queues the row for
+a background writer thread, so nothing on the frame path ever waits on the disk.
+Files that go with a score, like a replay of the run, can be handed to the same thread.
+
+    scores = ScoreStore()
+    scores.submit("geometry_cheetah", 42, level=3)
+    best = scores.best("geometry_cheetah", level=3)
+    scores.write_file("runs/best.gcr", replay_bytes)
+    scores.close()  # Flushes anything still queued
+
+    python score_store.py  # Print every leaderboard
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scores.db")
+TOP_N = 10  # Scores kept per game and level
+BUSY_TIMEOUT = 5.0  # Seconds the writer waits for another game's write lock
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    player TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_rank ON scores (game, level, score DESC, id);
+"""
+
+FileWrite = namedtuple("FileWrite", "path data")  # Queued by write_file(), alongside the score rows
+
+
+class ScoreStore:
+    """Per-game, per-level top-N leaderboards with write-behind persistence.
+
+    Leaderboard entries are (score, player, created) tuples, best first; ties keep
+    the earlier score ahead. All public methods are safe to call from any thread.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, top_n=TOP_N):
+        self.path = path
+        self.top_n = top_n
+        self.lock = threading.Lock()
+        self.cache = {}  # (game, level) -> leaderboard
+        self.pending = queue.Queue()
+        self.closed = False  # Set by close(); nothing is queued after that
+
+        # Opening the store is the only synchronous disk access: create the schema and load the cache
+        connection = self.connect()
+        with connection:
+            connection.executescript(SCHEMA)
+        rows = connection.execute(
+            "SELECT game, level, score, player, created FROM scores ORDER BY game, level, score DESC, id")
+        for game, level, score, player, created in rows:
+            board = self.cache.setdefault((game, level), [])
+            if len(board) < top_n:
+                board.append((score, player, created))
+        connection.close()
+
+        self.writer = threading.Thread(target=self.write_behind, name="score-store-writer", daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last commit can be lost on power failure
+        return connection
+
+    def submit(self, game, score, level=0, player=""):
+        """Record a finished run; returns its 1-based rank, or None if it missed the top N"""
+        entry = (int(score), player, time.time())
+        with self.lock:
+            if self.closed:
+                raise ValueError("submit() on a closed ScoreStore")
+            board = self.cache.setdefault((game, level), [])
+            rank = next((i for i, (other, _, _) in enumerate(board) if entry[0] > other), len(board))
+            if rank >= self.top_n:
+                return None
+            board.insert(rank, entry)
+            del board[self.top_n:]
+            # Queued under the lock, so no row can land behind close()'s stop marker
+            self.pending.put((game, level) + entry)
+        return rank + 1
+
+    def write_file(self, path, data):
+        """Write data to path (creating its directory) on the writer thread, replacing the file in one step"""
+        with self.lock:
+            if self.closed:
+                raise ValueError("write_file() on a closed ScoreStore")
+            self.pending.put(FileWrite(path, bytes(data)))
+
+    def best(self, game, level=0):
+        """Best score on a leaderboard, or 0 if it is empty"""
+        with self.lock:
+            board = self.cache.get((game, level))
+            return board[0][0] if board else 0
+
+    def top(self, game, level=0):
+        """A copy of one leaderboard, best first"""
+        with self.lock:
+            return list(self.cache.get((game, level), ()))
+
+    def leaderboards(self):
+        """Every leaderboard, keyed by (game, level)"""
+        with self.lock:
+            return {key: list(board) for key, board in sorted(self.cache.items())}
+
+    def flush(self):
+        """Block until every submitted score and file has been written; close() already did that"""
+        if not self.closed:
+            self.pending.join()
+
+    def close(self):
+        """Write out anything still queued and stop the writer thread; later submits raise ValueError"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.pending.put(None)
+        self.writer.join()
+
+    def write_behind(self):
+        connection = self.connect()
+        running = True
+        while running:
+            # Take everything queued so far and write it in one transaction
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            rows = [row for row in batch if row is not None and not isinstance(row, FileWrite)]
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO scores (game, level, score, player, created) VALUES (?, ?, ?, ?, ?)", rows)
+                    # Trim each touched leaderboard back to its top N
+                    for game, level in {row[:2] for row in rows}:
+                        connection.execute(
+                            "DELETE FROM scores WHERE game = ? AND level = ? AND id NOT IN "
+                            "(SELECT id FROM scores WHERE game = ? AND level = ? ORDER BY score DESC, id LIMIT ?)",
+                            (game, level, game, level, self.top_n))
+            except sqlite3.Error as e:
+                # Scores stay in the cache for this session even if the disk write fails
+                print(f"Could not save scores: {e}")
+            for row in batch:
+                if isinstance(row, FileWrite):
+                    self.save_file(row)
+            for _ in batch:
+                self.pending.task_done()
+        connection.close()
+
+    @staticmethod
+    def save_file(write):
+        # Written beside the target and renamed over it, so readers never see half a file
+        temp_path = write.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(write.path) or ".", exist_ok=True)
+            with open(temp_path, "wb") as out:
+                out.write(write.data)
+            os.replace(temp_path, write.path)
+        except OSError as e:
+            print(f"Could not save {write.path}: {e}")
+
+
+def main():
+    scores = ScoreStore()
+    boards = scores.leaderboards()
+    if not boards:
+        print(f"No scores in {scores.path} yet")
+    for (game, level), board in boards.items():
+        print(f"{game}" + (f" level {level}" if level else ""))
+        for rank, (score, player, created) in enumerate(board, 1):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(created))
+            print(f"  {rank:2d}. {score:6d}  {player or '-':12s} {when}")
+    scores.close()
+
+
+if __name__ == "__main__":
+    main()
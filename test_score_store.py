@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared write-behind score store
+"""
+
+import sqlite3
+
+import pytest
+
+from score_store import ScoreStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "scores.db")
+
+
+def rows(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT game, level, score, player FROM scores ORDER BY game, level, score DESC, id").fetchall()
+    finally:
+        connection.close()
+
+
+def test_best_and_ranks_come_from_the_cache(path):
+    scores = ScoreStore(path, top_n=3)
+    try:
+        assert scores.best("flappy") == 0
+        assert scores.submit("flappy", 10) == 1
+        assert scores.submit("flappy", 30) == 1
+        assert scores.submit("flappy", 20) == 2
+        assert scores.submit("flappy", 5) is None  # Below the top 3
+        assert scores.submit("flappy", 20, player="late") == 3  # Ties keep the earlier score ahead
+        assert scores.best("flappy") == 30
+        assert [score for score, _, _ in scores.top("flappy")] == [30, 20, 20]
+        assert scores.top("flappy")[2][1] == "late"
+        # Games and levels keep separate leaderboards
+        assert scores.best("flappy", level=2) == 0
+        assert scores.best("cheetah") == 0
+    finally:
+        scores.close()
+
+
+def test_flush_writes_every_submitted_score(path):
+    scores = ScoreStore(path, top_n=3)
+    try:
+        for score in (4, 8, 15, 16, 23, 42):
+            scores.submit("cheetah", score, level=1, player="bot")
+        scores.submit("cheetah", 7, level=2)
+        scores.flush()
+        # The writer trims each leaderboard to the top N on disk as well
+        assert rows(path) == [("cheetah", 1, 42, "bot"), ("cheetah", 1, 23, "bot"), ("cheetah", 1, 16, "bot"),
+                              ("cheetah", 2, 7, "")]
+    finally:
+        scores.close()
+
+
+def test_close_flushes_and_reopening_loads_the_cache(path):
+    scores = ScoreStore(path)
+    scores.submit("slime", 3)
+    scores.submit("slime", 9)
+    scores.close()
+    scores.flush()  # Returns at once after close()
+    scores.close()  # Closing twice is harmless
+    with pytest.raises(ValueError):
+        scores.submit("slime", 1)
+
+    reopened = ScoreStore(path)
+    try:
+        assert reopened.best("slime") == 9
+        assert [score for score, _, _ in reopened.top("slime")] == [9, 3]
+        assert list(reopened.leaderboards()) == [("slime", 0)]
+    finally:
+        reopened.close()
+
+
+def test_files_are_written_behind_and_flushed(path, tmp_path):
+    scores = ScoreStore(path)
+    target = tmp_path / "runs" / "best.log"
+    try:
+        data = bytearray(b"run")
+        scores.write_file(str(target), data)
+        data.extend(b" changed later")  # The store keeps its own copy
+        scores.flush()
+        assert target.read_bytes() == b"run"
+        scores.write_file(str(target), b"replaced")
+    finally:
+        scores.close()
+    assert target.read_bytes() == b"replaced"
+    assert [p.name for p in target.parent.iterdir()] == ["best.log"]
+    with pytest.raises(ValueError):
+        scores.write_file(str(target), b"late")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared timer wheel
+"""
+
+import random
+
+from timer_wheel import TimerWheel
+
+
+def test_timers_fire_on_their_due_frame_in_order():
+    timers = TimerWheel()
+    fired = []
+    for delay in (5, 1, 64, 3, 4096, 63, 65):
+        timers.schedule(delay, lambda delay=delay: fired.append((timers.now, delay)))
+    timers.advance(5000)
+    assert fired == [(delay, delay) for delay in sorted((5, 1, 64, 3, 4096, 63, 65))]
+
+
+def test_zero_or_negative_delay_fires_next_frame():
+    timers = TimerWheel()
+    fired = []
+    timers.schedule(0, fired.append, "zero")
+    timers.schedule(-3, fired.append, "negative")
+    assert fired == []
+    timers.advance()
+    assert sorted(fired) == ["negative", "zero"]
+
+
+def test_cancelled_timers_never_fire():
+    timers = TimerWheel()
+    fired = []
+    kept = timers.schedule(100, fired.append, "kept")
+    dropped = timers.schedule(100, fired.append, "dropped")
+    far = timers.schedule(300000, fired.append, "far")
+    timers.cancel(dropped)
+    timers.cancel(far)
+    timers.cancel(None)  # Cancelling nothing is allowed
+    timers.advance(300001)
+    assert fired == ["kept"]
+    assert timers.remaining(kept) == timers.remaining(dropped) == timers.remaining(far) == 0
+
+
+def test_remaining_counts_down():
+    timers = TimerWheel()
+    handle = timers.schedule(180, lambda: None)
+    assert timers.remaining(handle) == 180
+    timers.advance(100)
+    assert timers.remaining(handle) == 80
+    timers.advance(80)
+    assert timers.remaining(handle) == 0
+    assert timers.remaining(None) == 0
+
+
+def test_timers_scheduled_from_callbacks():
+    timers = TimerWheel()
+    fired = []
+
+    def repeat(count):
+        fired.append(timers.now)
+        if count:
+            timers.schedule(70, repeat, count - 1)
+
+    timers.schedule(10, repeat, 3)
+    timers.advance(1000)
+    assert fired == [10, 80, 150, 220]
+
+
+def test_matches_a_reference_scheduler():
+    # Random schedules and cancellations across every wheel level, checked against a plain list
+    rng = random.Random(7)
+    timers = TimerWheel(levels=3, bits=3)  # Small wheel so delays cross levels and laps often
+    fired = []
+    expected = []
+    handles = []
+    for step in range(3000):
+        for _ in range(rng.randrange(3)):
+            delay = rng.choice((rng.randrange(1, 10), rng.randrange(1, 600), rng.randrange(1, 5000)))
+            handle = timers.schedule(delay, fired.append, (timers.now + delay, step, len(handles)))
+            handles.append(handle)
+            expected.append([timers.now + delay, (timers.now + delay, step, len(handles) - 1), True])
+        if handles and rng.random() < 0.2:
+            index = rng.randrange(len(handles))
+            timers.cancel(handles[index])
+            if expected[index][0] > timers.now:
+                expected[index][2] = False
+        timers.advance()
+
+    timers.advance(6000)
+    reference = sorted(((due, tag) for due, tag, active in expected if active), key=lambda item: item[0])
+    assert [tag[0] for tag in fired] == [due for due, _ in reference]
+    assert sorted(fired) == sorted(tag for _, tag in reference)
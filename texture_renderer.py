@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Shared Texture Renderer
+An alternative to drawing on the display surface: sprites are uploaded once as textures
+and each frame becomes a list of texture copies, with rotation and alpha done by SDL.
+
+Built on pygame._sdl2.video. The accelerated renderer is used where the platform has
+one; otherwise, or when software=True, SDL's software renderer runs the same calls, so
+the path works (and can be tested) without a GPU. Sprites are painted by ordinary
+Surface code the first time they are asked for and never re-uploaded after that.
+
+    textures = TextureRenderer("My Game", (800, 600))
+    sky = textures.sprite("sky", paint_sky)  # paint_sky() -> Surface, called once
+    textures.clear(BLACK)
+    textures.copy(sky, (0, 0))
+    textures.copy(bird, (x, y), angle=30, alpha=128)
+    textures.present()
+"""
+
+import pygame
+from pygame._sdl2 import video
+
+BLENDMODE_NONE = 0
+BLENDMODE_BLEND = 1
+TEXT_CACHE_LIMIT = 256  # Rendered strings kept as textures before the cache is emptied
+
+
+class TextureRenderer:
+    """A window, its SDL renderer and every texture uploaded to it, by key.
+
+    The window replaces the display module's: pygame.display surfaces cannot share a
+    window with a renderer, so any existing display window is closed first.
+    """
+
+    def __init__(self, title, size, software=False, vsync=False):
+        if pygame.display.get_surface() is not None:
+            pygame.display.quit()
+        pygame.display.init()
+        self.window = video.Window(title, size)
+        self.size = size
+        self.renderer = None
+        if not software:
+            try:
+                self.renderer = video.Renderer(self.window, accelerated=1, vsync=vsync)
+            except pygame.error:
+                pass  # No GPU renderer here; fall back to software
+        self.accelerated = self.renderer is not None
+        if self.renderer is None:
+            self.renderer = video.Renderer(self.window, accelerated=0, vsync=vsync)
+        self.sprites = {}
+        self.text_cache = {}
+
+    def upload(self, surface):
+        return video.Texture.from_surface(self.renderer, surface)
+
+    def sprite(self, key, paint):
+        """The texture for key, uploading paint()'s Surface the first time it is asked for"""
+        texture = self.sprites.get(key)
+        if texture is None:
+            texture = self.sprites[key] = self.upload(paint())
+        return texture
+
+    def text(self, font, string, color):
+        """A texture of rendered text, cached so an unchanged score is not re-rendered every frame"""
+        # Keyed on the font itself, which the cache keeps alive: a freed font's id can be reused by a new one
+        key = (font, string, color)
+        texture = self.text_cache.get(key)
+        if texture is None:
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            texture = self.text_cache[key] = self.upload(font.render(string, True, color))
+        return texture
+
+    def clear(self, color):
+        self.renderer.draw_color = color
+        self.renderer.clear()
+
+    def copy(self, texture, pos, angle=0.0, alpha=255, area=None, size=None):
+        """Draw texture (or its area) with its top-left at pos, rotated clockwise about its centre"""
+        if alpha < 255 and texture.blend_mode == BLENDMODE_NONE:
+            texture.blend_mode = BLENDMODE_BLEND
+        texture.alpha = alpha
+        width, height = size or (area[2:] if area else (texture.width, texture.height))
+        texture.draw(srcrect=area, dstrect=(pos[0], pos[1], width, height), angle=angle)
+
+    def fill_rect(self, rect, color):
+        """Fill rect with color; a four-value color is blended by its alpha"""
+        self.renderer.draw_blend_mode = BLENDMODE_BLEND if len(color) == 4 else BLENDMODE_NONE
+        self.renderer.draw_color = color
+        self.renderer.fill_rect(rect)
+
+    def present(self):
+        self.renderer.present()
+
+    def to_surface(self):
+        """What has been drawn since the last clear(), read back into a Surface"""
+        return self.renderer.to_surface()
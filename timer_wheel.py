@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Shared Timer Wheel
+Game-time timers for every game in the collection, counted in simulation frames rather than seconds.
+
+Level 0 of the wheel has a slot per frame and every level above it a slot per lap of
+the level below; a slot's timers are handed down a level when it comes round. Waiting
+timers cost nothing per frame, since advance() only visits the slots that are due.
+Timers only move when the game advances the wheel, so pausing or slowing the
+simulation pauses or slows every timer with it, and replays see the same firings.
+
+    timers = TimerWheel()
+    handle = timers.schedule(180, setattr, player, "shield", False)  # Three seconds at 60 FPS
+    timers.remaining(handle)  # Frames until it fires
+    timers.cancel(handle)
+    timers.advance()  # Once per simulation frame
+"""
+
+WHEEL_BITS = 6  # Slots per wheel level, as a power of two
+WHEEL_LEVELS = 4  # Enough levels for 2**24 frames, about three days at 60 FPS
+
+
+class Timer:
+    __slots__ = ('due', 'callback', 'args', 'active')
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+
+class TimerWheel:
+    """Hierarchical timer wheel; timers due beyond the top level's lap wait in its slots until they come round"""
+
+    def __init__(self, levels=WHEEL_LEVELS, bits=WHEEL_BITS):
+        self.levels = levels
+        self.bits = bits
+        self.now = 0
+        self.slots = [[[] for _ in range(1 << bits)] for _ in range(levels)]
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) delay frames from now (at least one); returns a handle for cancel()"""
+        timer = Timer(self.now + max(1, delay), callback, args)
+        self.insert(timer)
+        return timer
+
+    def cancel(self, timer):
+        # Cancelled timers stay in their slot and are dropped when it comes round
+        if timer is not None:
+            timer.active = False
+
+    def remaining(self, timer):
+        """Frames until the timer fires, or 0 once it has fired or been cancelled"""
+        return timer.due - self.now if timer is not None and timer.active else 0
+
+    def insert(self, timer):
+        # The lowest level whose current lap the due frame falls in; the top level takes the rest
+        bits = self.bits
+        for level in range(self.levels):
+            shift = level * bits
+            if (timer.due ^ self.now) >> (shift + bits) == 0 or level == self.levels - 1:
+                self.slots[level][(timer.due >> shift) & ((1 << bits) - 1)].append(timer)
+                return
+
+    def take(self, level):
+        slots = self.slots[level]
+        index = (self.now >> (level * self.bits)) & ((1 << self.bits) - 1)
+        timers = slots[index]
+        slots[index] = []
+        return timers
+
+    def advance(self, frames=1):
+        """Move time on by frames, firing every timer that comes due"""
+        for _ in range(frames):
+            self.now += 1
+
+            # Levels whose lap just started hand their current slot down, highest first
+            top = 0
+            while top + 1 < self.levels and self.now & ((1 << ((top + 1) * self.bits)) - 1) == 0:
+                top += 1
+            for level in range(top, 0, -1):
+                for timer in self.take(level):
+                    if timer.active:
+                        self.insert(timer)
+
+            for timer in self.take(0):
+                if timer.active:
+                    timer.active = False
+                    timer.callback(*timer.args)